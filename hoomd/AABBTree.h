@@ -77,6 +77,9 @@ struct PYBIND11_EXPORT AABBNode
                an update will only increase the volume of nodes. The tree should be rebuilt periodically instead of
                continually updated.
     - buildTree : build an efficiently arranged tree given a complete set of AABBs, one for each particle.
+    - Refit : Recompute the AABBs of all nodes bottom-up from a new set of particle AABBs, keeping the tree topology.
+              Runs in O(N) time. Queries on a refit tree are exact, but the tree quality degrades as particles move
+              away from their original neighbors. Use getNormalizedSurfaceArea() to decide when to rebuild.
 
     **Implementation details**
 
@@ -167,6 +170,18 @@ class PYBIND11_EXPORT AABBTree
         //! Update the AABB of a particle
         inline void update(unsigned int idx, const AABB& aabb);
 
+        //! Update the AABBs of all particles without changing the tree topology
+        inline void refit(const AABB *aabbs, unsigned int N);
+
+        //! Get the surface area of all nodes, relative to the surface area of the root node
+        inline Scalar getNormalizedSurfaceArea() const;
+
+        //! Get the number of particles in the tree
+        inline unsigned int getNumParticles() const
+            {
+            return m_mapping.size();
+            }
+
         //! Get the height of a given particle's leaf node
         inline unsigned int height(unsigned int idx);
 
@@ -350,6 +365,63 @@ inline void AABBTree::update(unsigned int idx, const AABB& aabb)
         }
     }
 
+/*! \param aabbs List of AABBs for each particle, indexed by particle
+    \param N Number of AABBs in the list
+
+    refit() visits the nodes in reverse order. buildNode() allocates every node before its children, so all children
+    are refit before their parent. \a N must equal the number of particles the tree was built with.
+*/
+inline void AABBTree::refit(const AABB *aabbs, unsigned int N)
+    {
+    assert(N == m_mapping.size());
+
+    for (unsigned int i = m_num_nodes; i-- > 0; )
+        {
+        AABBNode& node = m_nodes[i];
+
+        if (node.left == INVALID_NODE)
+            {
+            // leaf node, merge the AABBs of the contained particles
+            node.aabb = aabbs[node.particles[0]];
+            node.particle_tags[0] = aabbs[node.particles[0]].tag;
+            for (unsigned int j = 1; j < node.num_particles; j++)
+                {
+                node.aabb = merge(node.aabb, aabbs[node.particles[j]]);
+                node.particle_tags[j] = aabbs[node.particles[j]].tag;
+                }
+            }
+        else
+            {
+            node.aabb = merge(m_nodes[node.left].aabb, m_nodes[node.right].aabb);
+            }
+        }
+    }
+
+/*! \returns The sum of the surface areas of all nodes, divided by the surface area of the root node
+
+    This is the surface area heuristic cost of a query, up to a constant. It is invariant under isotropic scaling of
+    the particle positions, and increases when nodes of a refit tree grow and overlap.
+*/
+inline Scalar AABBTree::getNormalizedSurfaceArea() const
+    {
+    if (m_num_nodes == 0)
+        return Scalar(0.0);
+
+    Scalar total_area(0.0);
+    for (unsigned int i = 0; i < m_num_nodes; i++)
+        {
+        vec3<Scalar> L = m_nodes[i].aabb.getUpper() - m_nodes[i].aabb.getLower();
+        total_area += L.x*L.y + L.y*L.z + L.z*L.x;
+        }
+
+    vec3<Scalar> L_root = m_nodes[m_root].aabb.getUpper() - m_nodes[m_root].aabb.getLower();
+    Scalar root_area = L_root.x*L_root.y + L_root.y*L_root.z + L_root.z*L_root.x;
+    if (root_area == Scalar(0.0))
+        return Scalar(0.0);
+
+    return total_area / root_area;
+    }
+
 /*! \param idx Particle to get height for
     \returns Height of the node
 */
@@ -303,6 +303,197 @@ void BondedGroupData<group_size, Group, name, has_type_mapping>::initializeFromS
         }
     }
 
+/*! \param snapshot Groups held by this rank
+    \param tags Global tags of the groups in \a snapshot
+    \param nglobal Global number of groups
+
+    Every rank holds an arbitrary subset of the groups, and the subsets of all ranks together hold each
+    of the tags [0, \a nglobal) exactly once. The owners of the member particles are looked up with
+    ParticleData::getOwnerRanks(), and each group is sent directly to all ranks owning one of its members,
+    so that the groups never have to be collected on a single rank. The type mapping of \a snapshot must
+    be the same on all ranks.
+
+    Without a domain decomposition, \a snapshot must hold all of the groups.
+
+    \pre The particle data has been initialized.
+ */
+template<unsigned int group_size, typename Group, const char *name, bool has_type_mapping>
+void BondedGroupData<group_size, Group, name, has_type_mapping>::initializeFromDistributedSnapshot(
+    const Snapshot& snapshot,
+    const std::vector<unsigned int>& tags,
+    unsigned int nglobal)
+    {
+    // check that all fields in the snapshot have correct length
+    if (! snapshot.validate() || tags.size() != snapshot.groups.size())
+        {
+        m_exec_conf->msg->error() << "init.*: invalid " << name << " data snapshot."
+                                << std::endl << std::endl;
+        throw std::runtime_error(std::string("Error initializing ") + name + std::string(" data."));
+        }
+
+    for (unsigned int group_idx = 0; group_idx < tags.size(); ++group_idx)
+        {
+        if (tags[group_idx] >= nglobal)
+            {
+            m_exec_conf->msg->error() << name << ".*: " << name << " tag " << tags[group_idx] << " out of bounds!"
+                << " The number of " << name << "s is " << nglobal << std::endl;
+            throw std::runtime_error(std::string("Error initializing ") + name + std::string(" data."));
+            }
+        }
+
+    #ifdef ENABLE_MPI
+    if (!m_pdata->getDomainDecomposition())
+    #endif
+        {
+        if (snapshot.groups.size() != nglobal)
+            {
+            m_exec_conf->msg->error() << "init.*: distributed " << name << " data must be held by a single rank "
+                                      << "without a domain decomposition." << std::endl;
+            throw std::runtime_error(std::string("Error initializing ") + name + std::string(" data."));
+            }
+
+        // order the groups by tag
+        Snapshot ordered(nglobal);
+        ordered.type_mapping = snapshot.type_mapping;
+        for (unsigned int group_idx = 0; group_idx < tags.size(); ++group_idx)
+            {
+            const unsigned int tag = tags[group_idx];
+            ordered.groups[tag] = snapshot.groups[group_idx];
+            if (has_type_mapping)
+                ordered.type_id[tag] = snapshot.type_id[group_idx];
+            else
+                ordered.val[tag] = snapshot.val[group_idx];
+            }
+        initializeFromSnapshot(ordered);
+        return;
+        }
+
+    #ifdef ENABLE_MPI
+    const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
+    const unsigned int n_ranks = m_exec_conf->getNRanks();
+    const unsigned int n = snapshot.groups.size();
+
+    // find the owners of the members
+    std::vector<unsigned int> members(n*group_size);
+    for (unsigned int i = 0; i < n*group_size; ++i)
+        members[i] = snapshot.groups[i / group_size].tag[i % group_size];
+    std::vector<unsigned int> owners;
+    m_pdata->getOwnerRanks(members, owners);
+
+    // send each group once to every rank owning one of its members, in tag order
+    std::vector< std::pair<unsigned int, unsigned int> > dest_tag;
+    std::vector<unsigned int> group_of_tag;
+    for (unsigned int group_idx = 0; group_idx < n; ++group_idx)
+        {
+        for (unsigned int j = 0; j < group_size; ++j)
+            {
+            unsigned int dest = owners[group_idx*group_size + j];
+            if (dest >= n_ranks)
+                {
+                m_exec_conf->msg->error() << name << ".*: Particle tag out of bounds in " << name << " " << tags[group_idx] << std::endl;
+                throw std::runtime_error(std::string("Error initializing ") + name + std::string(" data."));
+                }
+
+            bool duplicate = false;
+            for (unsigned int k = 0; k < j; ++k)
+                if (owners[group_idx*group_size + k] == dest)
+                    duplicate = true;
+            if (!duplicate)
+                dest_tag.push_back(std::make_pair(dest, group_idx));
+            }
+        }
+    std::sort(dest_tag.begin(), dest_tag.end(),
+        [&tags](const std::pair<unsigned int, unsigned int>& a, const std::pair<unsigned int, unsigned int>& b)
+            {
+            return a.first < b.first || (a.first == b.first && tags[a.second] < tags[b.second]);
+            });
+
+    std::vector<unsigned int> send_counts(n_ranks, 0);
+    std::vector<members_t> groups_send(dest_tag.size());
+    std::vector<typeval_t> typeval_send(dest_tag.size());
+    std::vector<unsigned int> tags_send(dest_tag.size());
+    for (unsigned int k = 0; k < dest_tag.size(); ++k)
+        {
+        const unsigned int group_idx = dest_tag[k].second;
+        send_counts[dest_tag[k].first]++;
+        groups_send[k] = snapshot.groups[group_idx];
+        if (has_type_mapping)
+            typeval_send[k].type = snapshot.type_id[group_idx];
+        else
+            typeval_send[k].val = snapshot.val[group_idx];
+        tags_send[k] = tags[group_idx];
+        }
+
+    std::vector<members_t> groups_recv;
+    std::vector<typeval_t> typeval_recv;
+    std::vector<unsigned int> tags_recv, recv_counts;
+    all_to_all_v(groups_send, send_counts, groups_recv, recv_counts, mpi_comm);
+    all_to_all_v(typeval_send, send_counts, typeval_recv, recv_counts, mpi_comm);
+    all_to_all_v(tags_send, send_counts, tags_recv, recv_counts, mpi_comm);
+
+    // re-initialize data structures
+    initialize();
+    m_type_mapping = snapshot.type_mapping;
+
+    m_group_rtag.resize(nglobal);
+        {
+        ArrayHandle<unsigned int> h_group_rtag(m_group_rtag, access_location::host, access_mode::overwrite);
+        std::fill(h_group_rtag.data, h_group_rtag.data + nglobal, GROUP_NOT_LOCAL);
+        }
+
+    for (unsigned int group_idx = 0; group_idx < groups_recv.size(); ++group_idx)
+        {
+        const members_t& member_tags = groups_recv[group_idx];
+        const typeval_t& typeval = typeval_recv[group_idx];
+        const unsigned int tag = tags_recv[group_idx];
+
+        if (has_type_mapping && typeval.type >= m_type_mapping.size())
+            {
+            m_exec_conf->msg->error() << name << ".*: Invalid " << name << " type " << typeval.type
+                << "! The number of types is " << m_type_mapping.size() << std::endl;
+            throw std::runtime_error(std::string("Error initializing ") + name + std::string(" data."));
+            }
+
+        bool is_local = false;
+        for (unsigned int i = 0; i < group_size; ++i)
+            if (m_pdata->isParticleLocal(member_tags.tag[i]))
+                is_local = true;
+
+        if (!is_local)
+            continue;
+
+        ArrayHandle<unsigned int> h_group_rtag(m_group_rtag, access_location::host, access_mode::readwrite);
+        if (h_group_rtag.data[tag] != GROUP_NOT_LOCAL)
+            {
+            m_exec_conf->msg->error() << name << ".*: " << name << " " << tag << " was given more than once" << std::endl;
+            throw std::runtime_error(std::string("Error initializing ") + name + std::string(" data."));
+            }
+        h_group_rtag.data[tag] = m_n_groups;
+
+        m_groups.push_back(member_tags);
+        m_group_typeval.push_back(typeval);
+        m_group_tag.push_back(tag);
+
+        ranks_t r;
+        for (unsigned int i = 0; i < group_size; ++i)
+            r.idx[i] = 0;
+        m_group_ranks.push_back(r);
+
+        m_n_groups++;
+        }
+
+    // all groups are active
+    for (unsigned int tag = 0; tag < nglobal; ++tag)
+        m_tag_set.insert(tag);
+    m_invalid_cached_tags = true;
+    m_nglobal = nglobal;
+
+    // notify observers
+    m_group_num_change_signal.emit();
+    notifyGroupReorder();
+    #endif
+    }
+
 template<unsigned int group_size, typename Group, const char *name, bool has_type_mapping>
 unsigned int BondedGroupData<group_size, Group, name, has_type_mapping>::addBondedGroup(Group g)
     {
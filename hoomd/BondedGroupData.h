@@ -246,6 +246,11 @@ class BondedGroupData
         //! Initialize from a snapshot
         virtual void initializeFromSnapshot(const Snapshot& snapshot);
 
+        //! Initialize from the groups held by this rank
+        void initializeFromDistributedSnapshot(const Snapshot& snapshot,
+                                               const std::vector<unsigned int>& tags,
+                                               unsigned int nglobal);
+
         //! Take a snapshot
         virtual std::map<unsigned int, unsigned int> takeSnapshot(Snapshot& snapshot) const;
 
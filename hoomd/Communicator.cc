@@ -1085,10 +1085,15 @@ Communicator::Communicator(std::shared_ptr<SystemDefinition> sysdef,
             m_netforce_reverse_recvbuf(m_exec_conf),
             m_r_ghost_max(Scalar(0.0)),
             m_r_extra_ghost_max(Scalar(0.0)),
+            m_direct(false),
+            m_direct_active(false),
+            m_n_direct(0),
+            m_direct_copy_ghosts(m_exec_conf),
             m_ghosts_added(0),
             m_has_ghost_particles(false),
             m_last_flags(0),
             m_comm_pending(false),
+            m_ghost_update_dir(0),
             m_bond_comm(*this, m_sysdef->getBondData()),
             m_angle_comm(*this, m_sysdef->getAngleData()),
             m_dihedral_comm(*this, m_sysdef->getDihedralData()),
@@ -1264,6 +1269,20 @@ void Communicator::initializeNeighborArrays()
                 unsigned int neighbor = h_cart_ranks.data[di(i,j,k)];
                 h_neighbors.data[m_nneigh] = neighbor;
                 h_adj_mask.data[m_nneigh] = mask;
+
+                // a ghost is sent directly to this neighbor if it lies in the ghost layers of all faces
+                // shared with it
+                unsigned int plan_mask = 0;
+                if (ix == 1) plan_mask |= send_east;
+                else if (ix == -1) plan_mask |= send_west;
+                if (iy == 1) plan_mask |= send_north;
+                else if (iy == -1) plan_mask |= send_south;
+                if (iz == 1) plan_mask |= send_up;
+                else if (iz == -1) plan_mask |= send_down;
+
+                m_direct_rank[m_nneigh] = neighbor;
+                m_direct_offset[m_nneigh] = dir;
+                m_direct_mask[m_nneigh] = plan_mask;
                 m_nneigh++;
                 }
             }
@@ -1286,6 +1305,7 @@ void Communicator::initializeNeighborArrays()
         }
 
     m_n_unique_neigh = neigh_map.size();
+    m_n_direct = m_nneigh;
 
     n = 0;
     for (std::map<unsigned int, unsigned int>::iterator it = neigh_map.begin(); it != neigh_map.end(); ++it)
@@ -1297,11 +1317,14 @@ void Communicator::initializeNeighborArrays()
     }
 
 //! Interface to the communication methods.
-void Communicator::communicate(unsigned int timestep)
+void Communicator::communicate(unsigned int timestep, bool defer_ghost_update)
     {
     // Guard to prevent recursive triggering of migration
     m_is_communicating = true;
 
+    // complete a ghost update left pending since the last call
+    finishUpdateGhosts(timestep);
+
     // update ghost communication flags
     m_flags = CommFlags(0);
     m_requested_flags.emit_accumulate( [&](CommFlags f)
@@ -1342,7 +1365,9 @@ void Communicator::communicate(unsigned int timestep)
         {
         beginUpdateGhosts(timestep);
 
-        finishUpdateGhosts(timestep);
+        // the caller may finish the update on the CPU after computing the forces on the interior particles
+        if (!defer_ghost_update || m_exec_conf->isCUDAEnabled())
+            finishUpdateGhosts(timestep);
         }
 
     // Check if migration of particles is requested
@@ -1381,6 +1406,15 @@ void Communicator::migrateParticles()
     // remove ghost particles from system
     m_pdata->removeAllGhostParticles();
 
+    if (useDirectExchange())
+        {
+        migrateParticlesDirect();
+
+        if (m_prof)
+            m_prof->pop();
+        return;
+        }
+
     // get box dimensions
     const BoxDim& box = m_pdata->getBox();
 
@@ -1667,13 +1701,23 @@ void Communicator::exchangeGhosts()
     // constraints
     m_constraint_comm.markGhostParticles(m_plan, mask);
 
+    // ghost particle flags
+    CommFlags flags = getFlags();
+
+    m_direct_active = useDirectExchange();
+    if (m_direct_active)
+        {
+        exchangeGhostsDirect();
+
+        if (m_prof)
+            m_prof->pop();
+        return;
+        }
+
     /*
      * Fill send buffers, exchange particles according to plans
      */
 
-    // ghost particle flags
-    CommFlags flags = getFlags();
-
     for (unsigned int dir = 0; dir < 6; dir ++)
         {
         if (! isCommunicating(dir) ) continue;
@@ -2304,168 +2348,227 @@ void Communicator::beginUpdateGhosts(unsigned int timestep)
 
     m_exec_conf->msg->notice(7) << "Communicator: update ghosts" << std::endl;
 
-    // update data in these arrays
+    if (m_direct_active)
+        {
+        // all ghosts are sent by their owners, so the whole update can be posted at once
+        postDirectGhostUpdate();
+        m_comm_pending = true;
 
-    unsigned int num_tot_recv_ghosts = 0; // total number of ghosts received
+        if (m_prof)
+            m_prof->pop();
+        return;
+        }
 
-    for (unsigned int dir = 0; dir < 6; dir ++)
+    // the ghosts received in one direction may be forwarded in the next ones, so only the first
+    // direction can be posted before the update is finished
+    m_ghost_update_dir = 0;
+    while (m_ghost_update_dir < 6 && !isCommunicating(m_ghost_update_dir))
+        m_ghost_update_dir++;
+
+    if (m_ghost_update_dir < 6)
         {
-        if (! isCommunicating(dir) ) continue;
+        postGhostUpdate(m_ghost_update_dir, m_pdata->getN());
+        m_comm_pending = true;
+        }
 
-        CommFlags flags = getFlags();
+    if (m_prof)
+        m_prof->pop();
+    }
 
-        if (flags[comm_flag::position])
-            {
-            ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
-            ArrayHandle<Scalar4> h_pos_copybuf(m_pos_copybuf, access_location::host, access_mode::overwrite);
-            ArrayHandle<unsigned int> h_copy_ghosts(m_copy_ghosts[dir], access_location::host, access_mode::read);
-            ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+/*! Completes the direction posted by beginUpdateGhosts(), then exchanges the remaining directions in order.
+ */
+void Communicator::finishUpdateGhosts(unsigned int timestep)
+    {
+    if (!m_comm_pending)
+        return;
 
-            // copy positions of ghost particles
-            for (unsigned int ghost_idx = 0; ghost_idx < m_num_copy_ghosts[dir]; ghost_idx++)
-                {
-                unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
+    m_comm_pending = false;
 
-                assert(idx < m_pdata->getN() + m_pdata->getNGhosts());
+    if (m_prof)
+        m_prof->push("comm_ghost_update");
 
-                // copy position into send buffer
-                h_pos_copybuf.data[ghost_idx] = h_pos.data[idx];
-                }
-            }
+    if (m_direct_active)
+        {
+        completeDirectGhostUpdate();
 
-        if (flags[comm_flag::velocity])
-            {
-            ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
-            ArrayHandle<Scalar4> h_velocity_copybuf(m_velocity_copybuf, access_location::host, access_mode::overwrite);
-            ArrayHandle<unsigned int> h_copy_ghosts(m_copy_ghosts[dir], access_location::host, access_mode::read);
-            ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+        if (m_prof)
+            m_prof->pop();
+        return;
+        }
 
-            // copy velocity of ghost particles
-            for (unsigned int ghost_idx = 0; ghost_idx < m_num_copy_ghosts[dir]; ghost_idx++)
-                {
-                unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
+    unsigned int start_idx = m_pdata->getN();
+    for (unsigned int dir = m_ghost_update_dir; dir < 6; dir++)
+        {
+        if (! isCommunicating(dir) ) continue;
 
-                assert(idx < m_pdata->getN() + m_pdata->getNGhosts());
+        if (dir != m_ghost_update_dir)
+            postGhostUpdate(dir, start_idx);
 
-                // copy velocity into send buffer
-                h_velocity_copybuf.data[ghost_idx] = h_vel.data[idx];
-                }
-            }
+        completeGhostUpdate(dir, start_idx);
+        start_idx += m_num_recv_ghosts[dir];
+        }
 
-        if (flags[comm_flag::orientation])
-            {
-            ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
-            ArrayHandle<Scalar4> h_orientation_copybuf(m_orientation_copybuf, access_location::host, access_mode::overwrite);
-            ArrayHandle<unsigned int> h_copy_ghosts(m_copy_ghosts[dir], access_location::host, access_mode::read);
-            ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+    if (m_prof)
+        m_prof->pop();
+    }
 
-            // copy orientation of ghost particles
-            for (unsigned int ghost_idx = 0; ghost_idx < m_num_copy_ghosts[dir]; ghost_idx++)
-                {
-                unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
+/*! \param dir Direction to post
+    \param start_idx Index of the first ghost received in this direction
 
-                assert(idx < m_pdata->getN() + m_pdata->getNGhosts());
+    Fills the send buffers of direction \a dir and posts the non-blocking sends and receives. The ghosts
+    are received directly into the particle data arrays.
+*/
+void Communicator::postGhostUpdate(unsigned int dir, unsigned int start_idx)
+    {
+    CommFlags flags = getFlags();
 
-                // copy orientation into send buffer
-                h_orientation_copybuf.data[ghost_idx] = h_orientation.data[idx];
-                }
-            }
+    if (flags[comm_flag::position])
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_pos_copybuf(m_pos_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<unsigned int> h_copy_ghosts(m_copy_ghosts[dir], access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
 
+        // copy positions of ghost particles
+        for (unsigned int ghost_idx = 0; ghost_idx < m_num_copy_ghosts[dir]; ghost_idx++)
+            {
+            unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
 
-        unsigned int send_neighbor = m_decomposition->getNeighborRank(dir);
+            assert(idx < m_pdata->getN() + m_pdata->getNGhosts());
 
-        // we receive from the direction opposite to the one we send to
-        unsigned int recv_neighbor;
-        if (dir % 2 == 0)
-            recv_neighbor = m_decomposition->getNeighborRank(dir+1);
-        else
-            recv_neighbor = m_decomposition->getNeighborRank(dir-1);
+            // copy position into send buffer
+            h_pos_copybuf.data[ghost_idx] = h_pos.data[idx];
+            }
+        }
 
+    if (flags[comm_flag::velocity])
+        {
+        ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_velocity_copybuf(m_velocity_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<unsigned int> h_copy_ghosts(m_copy_ghosts[dir], access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
 
-        unsigned int start_idx;
+        // copy velocity of ghost particles
+        for (unsigned int ghost_idx = 0; ghost_idx < m_num_copy_ghosts[dir]; ghost_idx++)
+            {
+            unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
 
-        if (m_prof)
-            m_prof->push("MPI send/recv");
+            assert(idx < m_pdata->getN() + m_pdata->getNGhosts());
 
-        start_idx = m_pdata->getN() + num_tot_recv_ghosts;
+            // copy velocity into send buffer
+            h_velocity_copybuf.data[ghost_idx] = h_vel.data[idx];
+            }
+        }
 
-        num_tot_recv_ghosts += m_num_recv_ghosts[dir];
+    if (flags[comm_flag::orientation])
+        {
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_orientation_copybuf(m_orientation_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<unsigned int> h_copy_ghosts(m_copy_ghosts[dir], access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
 
-        size_t sz = 0;
-        // only non-permanent fields (position, velocity, orientation) need to be considered here
-        // charge, body, image and diameter are not updated between neighbor list builds
-        if (flags[comm_flag::position])
+        // copy orientation of ghost particles
+        for (unsigned int ghost_idx = 0; ghost_idx < m_num_copy_ghosts[dir]; ghost_idx++)
             {
-            m_reqs.resize(2);
-            m_stats.resize(2);
+            unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
 
-            ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
-            ArrayHandle<Scalar4> h_pos_copybuf(m_pos_copybuf, access_location::host, access_mode::read);
+            assert(idx < m_pdata->getN() + m_pdata->getNGhosts());
 
-            // exchange particle data, write directly to the particle data arrays
-            MPI_Isend(h_pos_copybuf.data, m_num_copy_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, send_neighbor, 1, m_mpi_comm, &m_reqs[0]);
-            MPI_Irecv(h_pos.data + start_idx, m_num_recv_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, recv_neighbor, 1, m_mpi_comm, &m_reqs[1]);
-            MPI_Waitall(2, &m_reqs.front(), &m_stats.front());
-
-            sz += sizeof(Scalar4);
+            // copy orientation into send buffer
+            h_orientation_copybuf.data[ghost_idx] = h_orientation.data[idx];
             }
+        }
 
-        if (flags[comm_flag::velocity])
-            {
-            m_reqs.resize(2);
-            m_stats.resize(2);
+    unsigned int send_neighbor = m_decomposition->getNeighborRank(dir);
 
-            ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::readwrite);
-            ArrayHandle<Scalar4> h_vel_copybuf(m_velocity_copybuf, access_location::host, access_mode::read);
+    // we receive from the direction opposite to the one we send to
+    unsigned int recv_neighbor;
+    if (dir % 2 == 0)
+        recv_neighbor = m_decomposition->getNeighborRank(dir+1);
+    else
+        recv_neighbor = m_decomposition->getNeighborRank(dir-1);
 
-            // exchange particle data, write directly to the particle data arrays
-            MPI_Isend(h_vel_copybuf.data, m_num_copy_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, send_neighbor, 2, m_mpi_comm, &m_reqs[0]);
-            MPI_Irecv(h_vel.data + start_idx, m_num_recv_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, recv_neighbor, 2, m_mpi_comm, &m_reqs[1]);
-            MPI_Waitall(2, &m_reqs.front(), &m_stats.front());
+    // only non-permanent fields (position, velocity, orientation) need to be considered here
+    // charge, body, image and diameter are not updated between neighbor list builds
+    m_reqs.clear();
+    MPI_Request req;
+    if (flags[comm_flag::position])
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_pos_copybuf(m_pos_copybuf, access_location::host, access_mode::read);
 
-            sz += sizeof(Scalar4);
-            }
+        // exchange particle data, write directly to the particle data arrays
+        MPI_Isend(h_pos_copybuf.data, m_num_copy_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, send_neighbor, 1, m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        MPI_Irecv(h_pos.data + start_idx, m_num_recv_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, recv_neighbor, 1, m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        }
 
-        if (flags[comm_flag::orientation])
-            {
-            m_reqs.resize(2);
-            m_stats.resize(2);
+    if (flags[comm_flag::velocity])
+        {
+        ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_vel_copybuf(m_velocity_copybuf, access_location::host, access_mode::read);
 
-            ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::readwrite);
-            ArrayHandle<Scalar4> h_orientation_copybuf(m_orientation_copybuf, access_location::host, access_mode::read);
+        // exchange particle data, write directly to the particle data arrays
+        MPI_Isend(h_vel_copybuf.data, m_num_copy_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, send_neighbor, 2, m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        MPI_Irecv(h_vel.data + start_idx, m_num_recv_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, recv_neighbor, 2, m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        }
 
-            // exchange particle data, write directly to the particle data arrays
-            MPI_Isend(h_orientation_copybuf.data, m_num_copy_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, send_neighbor, 3, m_mpi_comm, &m_reqs[0]);
-            MPI_Irecv(h_orientation.data + start_idx, m_num_recv_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, recv_neighbor, 3, m_mpi_comm, &m_reqs[1]);
-            MPI_Waitall(2, &m_reqs.front(), &m_stats.front());
+    if (flags[comm_flag::orientation])
+        {
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_orientation_copybuf(m_orientation_copybuf, access_location::host, access_mode::read);
 
-            sz += sizeof(Scalar4);
-            }
+        // exchange particle data, write directly to the particle data arrays
+        MPI_Isend(h_orientation_copybuf.data, m_num_copy_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, send_neighbor, 3, m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        MPI_Irecv(h_orientation.data + start_idx, m_num_recv_ghosts[dir]*sizeof(Scalar4), MPI_BYTE, recv_neighbor, 3, m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        }
+    }
 
-        if (m_prof)
-            m_prof->pop(0, (m_num_recv_ghosts[dir]+m_num_copy_ghosts[dir])*sz);
+/*! \param dir Direction to complete
+    \param start_idx Index of the first ghost received in this direction
 
+    Waits for the messages posted by postGhostUpdate() and wraps the received ghost positions.
+*/
+void Communicator::completeGhostUpdate(unsigned int dir, unsigned int start_idx)
+    {
+    CommFlags flags = getFlags();
 
-        // wrap particle positions (only if copying positions)
-        if (flags[comm_flag::position])
-            {
-            ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
+    if (m_prof)
+        m_prof->push("MPI send/recv");
 
-            const BoxDim shifted_box = getShiftedBox();
-            for (unsigned int idx = start_idx; idx < start_idx + m_num_recv_ghosts[dir]; idx++)
-                {
-                Scalar4& pos = h_pos.data[idx];
+    m_stats.resize(m_reqs.size());
+    if (m_reqs.size())
+        MPI_Waitall(m_reqs.size(), &m_reqs.front(), &m_stats.front());
+    m_reqs.clear();
 
-                // wrap particles received across a global boundary
-                int3 img = make_int3(0,0,0);
-                shifted_box.wrap(pos, img);
-                }
-            }
+    size_t sz = 0;
+    if (flags[comm_flag::position]) sz += sizeof(Scalar4);
+    if (flags[comm_flag::velocity]) sz += sizeof(Scalar4);
+    if (flags[comm_flag::orientation]) sz += sizeof(Scalar4);
 
-        } // end dir loop
+    if (m_prof)
+        m_prof->pop(0, (m_num_recv_ghosts[dir]+m_num_copy_ghosts[dir])*sz);
 
-        if (m_prof)
-            m_prof->pop();
+    // wrap particle positions (only if copying positions)
+    if (flags[comm_flag::position])
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
+
+        const BoxDim shifted_box = getShiftedBox();
+        for (unsigned int idx = start_idx; idx < start_idx + m_num_recv_ghosts[dir]; idx++)
+            {
+            Scalar4& pos = h_pos.data[idx];
+
+            // wrap particles received across a global boundary
+            int3 img = make_int3(0,0,0);
+            shifted_box.wrap(pos, img);
+            }
+        }
     }
 
 void Communicator::updateNetForce(unsigned int timestep)
@@ -2500,6 +2603,15 @@ void Communicator::updateNetForce(unsigned int timestep)
 
     m_exec_conf->msg->notice(7) << oss.str() << std::endl;
 
+    if (m_direct_active)
+        {
+        updateNetForceDirect();
+
+        if (m_prof)
+            m_prof->pop();
+        return;
+        }
+
     // Set some global counters
     unsigned int num_tot_recv_ghosts = 0; // total number of ghosts received
     unsigned int num_tot_recv_ghosts_reverse = 0; // total number of ghosts received in reverse direction
@@ -2789,6 +2901,558 @@ void Communicator::updateNetForce(unsigned int timestep)
     }
 
 
+/*! The direct exchange needs the ghost lists to contain only local particles. Bonded groups and the
+    reverse net force rely on ghosts forwarded by the staged scheme, so they always use it.
+*/
+bool Communicator::useDirectExchange() const
+    {
+    if (!m_direct)
+        return false;
+
+    if (m_flags[comm_flag::reverse_net_force])
+        return false;
+
+    return m_sysdef->getBondData()->getNGlobal() == 0
+        && m_sysdef->getPairData()->getNGlobal() == 0
+        && m_sysdef->getAngleData()->getNGlobal() == 0
+        && m_sysdef->getDihedralData()->getNGlobal() == 0
+        && m_sysdef->getImproperData()->getNGlobal() == 0
+        && m_sysdef->getConstraintData()->getNGlobal() == 0;
+    }
+
+/*! \param send_buf Send buffer, grouped by neighbor
+    \param recv_buf Receive buffer for the ghosts (after the local particles)
+    \param field Index of the field, used to build unique message tags
+    \param width Number of elements per particle
+
+    The message sent to the neighbor at offset \a o is tagged with \a o, and the neighbor receives it from
+    the opposite offset, NEIGH_MAX - 1 - \a o.
+*/
+template<class T>
+void Communicator::postDirectMessages(const T *send_buf, T *recv_buf, unsigned int field, unsigned int width)
+    {
+    MPI_Request req;
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        {
+        MPI_Isend(send_buf + width*m_direct_send_begin[n],
+            width*m_direct_num_send[n]*sizeof(T),
+            MPI_BYTE,
+            m_direct_rank[n],
+            field*NEIGH_MAX + m_direct_offset[n],
+            m_mpi_comm,
+            &req);
+        m_reqs.push_back(req);
+        MPI_Irecv(recv_buf + width*m_direct_recv_begin[n],
+            width*m_direct_num_recv[n]*sizeof(T),
+            MPI_BYTE,
+            m_direct_rank[n],
+            field*NEIGH_MAX + NEIGH_MAX - 1 - m_direct_offset[n],
+            m_mpi_comm,
+            &req);
+        m_reqs.push_back(req);
+        }
+    }
+
+//! Send the particles that left the domain directly to their new domains
+void Communicator::migrateParticlesDirect()
+    {
+    const BoxDim& box = m_pdata->getBox();
+    const Index3D& di = m_decomposition->getDomainIndexer();
+
+    // neighbor of every offset
+    unsigned int neighbor[NEIGH_MAX];
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        neighbor[m_direct_offset[n]] = n;
+
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_comm_flag(m_pdata->getCommFlags(), access_location::host, access_mode::overwrite);
+
+        // the comm flag of a particle that leaves the domain is its destination neighbor plus one
+        for (unsigned int idx = 0; idx < m_pdata->getN(); ++idx)
+            {
+            const Scalar4& postype = h_pos.data[idx];
+            Scalar3 f = box.makeFraction(make_scalar3(postype.x, postype.y, postype.z));
+
+            int ix = 0, iy = 0, iz = 0;
+            if (di.getW() > 1)
+                ix = (f.x >= Scalar(1.0)) ? 1 : ((f.x < Scalar(0.0)) ? -1 : 0);
+            if (di.getH() > 1)
+                iy = (f.y >= Scalar(1.0)) ? 1 : ((f.y < Scalar(0.0)) ? -1 : 0);
+            if (di.getD() > 1)
+                iz = (f.z >= Scalar(1.0)) ? 1 : ((f.z < Scalar(0.0)) ? -1 : 0);
+
+            if (ix || iy || iz)
+                h_comm_flag.data[idx] = neighbor[((iz+1)*3+(iy+1))*3+(ix+1)] + 1;
+            else
+                h_comm_flag.data[idx] = 0;
+            }
+        }
+
+    std::vector<unsigned int> comm_flag_out;
+    m_pdata->removeParticles(m_sendbuf, comm_flag_out);
+
+    // group the particles by destination
+    unsigned int num_send[NEIGH_MAX];
+    unsigned int num_recv[NEIGH_MAX];
+    unsigned int send_begin[NEIGH_MAX];
+    unsigned int recv_begin[NEIGH_MAX];
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        num_send[n] = 0;
+    for (unsigned int i = 0; i < comm_flag_out.size(); ++i)
+        num_send[comm_flag_out[i]-1]++;
+
+    unsigned int offset = 0;
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        {
+        send_begin[n] = offset;
+        offset += num_send[n];
+        }
+
+    std::vector<pdata_element> sendbuf(m_sendbuf.size());
+        {
+        unsigned int pos[NEIGH_MAX];
+        std::copy(send_begin, send_begin + m_n_direct, pos);
+        for (unsigned int i = 0; i < comm_flag_out.size(); ++i)
+            sendbuf[pos[comm_flag_out[i]-1]++] = m_sendbuf[i];
+        }
+    m_sendbuf.swap(sendbuf);
+
+    if (m_prof)
+        m_prof->push("MPI send/recv");
+
+    // communicate the number of particles
+    m_reqs.clear();
+    MPI_Request req;
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        {
+        MPI_Isend(&num_send[n], 1, MPI_UNSIGNED, m_direct_rank[n], m_direct_offset[n], m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        MPI_Irecv(&num_recv[n], 1, MPI_UNSIGNED, m_direct_rank[n], NEIGH_MAX - 1 - m_direct_offset[n], m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        }
+    m_stats.resize(m_reqs.size());
+    if (m_reqs.size())
+        MPI_Waitall(m_reqs.size(), &m_reqs.front(), &m_stats.front());
+
+    offset = 0;
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        {
+        recv_begin[n] = offset;
+        offset += num_recv[n];
+        }
+    m_recvbuf.resize(offset);
+
+    // exchange particle data
+    m_reqs.clear();
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        {
+        MPI_Isend(m_sendbuf.data() + send_begin[n], num_send[n]*sizeof(pdata_element), MPI_BYTE,
+            m_direct_rank[n], NEIGH_MAX + m_direct_offset[n], m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        MPI_Irecv(m_recvbuf.data() + recv_begin[n], num_recv[n]*sizeof(pdata_element), MPI_BYTE,
+            m_direct_rank[n], NEIGH_MAX + NEIGH_MAX - 1 - m_direct_offset[n], m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        }
+    m_stats.resize(m_reqs.size());
+    if (m_reqs.size())
+        MPI_Waitall(m_reqs.size(), &m_reqs.front(), &m_stats.front());
+    m_reqs.clear();
+
+    if (m_prof)
+        m_prof->pop();
+
+    // wrap received particles across a global boundary back into global box
+    const BoxDim shifted_box = getShiftedBox();
+    for (unsigned int idx = 0; idx < m_recvbuf.size(); idx++)
+        {
+        pdata_element& p = m_recvbuf[idx];
+        shifted_box.wrap(p.pos, p.image);
+        }
+
+    m_pdata->addParticles(m_recvbuf);
+    }
+
+/*! The plans of the local particles must be current. A local particle is sent to every neighbor whose
+    faces with this domain all have the particle in their ghost layer, which is the same set of domains the
+    staged exchange forwards it to.
+*/
+void Communicator::exchangeGhostsDirect()
+    {
+    CommFlags flags = getFlags();
+    unsigned int N = m_pdata->getN();
+
+    // count the ghosts for every neighbor
+        {
+        ArrayHandle<unsigned int> h_plan(m_plan, access_location::host, access_mode::read);
+
+        for (unsigned int n = 0; n < m_n_direct; ++n)
+            m_direct_num_send[n] = 0;
+
+        for (unsigned int idx = 0; idx < N; ++idx)
+            {
+            unsigned int plan = h_plan.data[idx];
+            if (!plan) continue;
+
+            for (unsigned int n = 0; n < m_n_direct; ++n)
+                if ((plan & m_direct_mask[n]) == m_direct_mask[n])
+                    m_direct_num_send[n]++;
+            }
+        }
+
+    unsigned int n_send = 0;
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        {
+        m_direct_send_begin[n] = n_send;
+        n_send += m_direct_num_send[n];
+        }
+
+    m_direct_copy_ghosts.resize(n_send);
+    if (flags[comm_flag::position]) m_pos_copybuf.resize(n_send);
+    if (flags[comm_flag::charge]) m_charge_copybuf.resize(n_send);
+    if (flags[comm_flag::body]) m_body_copybuf.resize(n_send);
+    if (flags[comm_flag::image]) m_image_copybuf.resize(n_send);
+    if (flags[comm_flag::diameter]) m_diameter_copybuf.resize(n_send);
+    if (flags[comm_flag::velocity]) m_velocity_copybuf.resize(n_send);
+    if (flags[comm_flag::orientation]) m_orientation_copybuf.resize(n_send);
+
+    // fill the send buffers, grouped by neighbor
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_body(m_pdata->getBodies(), access_location::host, access_mode::read);
+        ArrayHandle<int3> h_image(m_pdata->getImages(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_plan(m_plan, access_location::host, access_mode::read);
+
+        ArrayHandle<unsigned int> h_copy_ghosts(m_direct_copy_ghosts, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_pos_copybuf(m_pos_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar> h_charge_copybuf(m_charge_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar> h_diameter_copybuf(m_diameter_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<unsigned int> h_body_copybuf(m_body_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<int3> h_image_copybuf(m_image_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_velocity_copybuf(m_velocity_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_orientation_copybuf(m_orientation_copybuf, access_location::host, access_mode::overwrite);
+
+        unsigned int pos[NEIGH_MAX];
+        std::copy(m_direct_send_begin, m_direct_send_begin + m_n_direct, pos);
+
+        for (unsigned int idx = 0; idx < N; ++idx)
+            {
+            unsigned int plan = h_plan.data[idx];
+            if (!plan) continue;
+
+            for (unsigned int n = 0; n < m_n_direct; ++n)
+                {
+                if ((plan & m_direct_mask[n]) != m_direct_mask[n]) continue;
+
+                unsigned int k = pos[n]++;
+                if (flags[comm_flag::position]) h_pos_copybuf.data[k] = h_pos.data[idx];
+                if (flags[comm_flag::charge]) h_charge_copybuf.data[k] = h_charge.data[idx];
+                if (flags[comm_flag::diameter]) h_diameter_copybuf.data[k] = h_diameter.data[idx];
+                if (flags[comm_flag::body]) h_body_copybuf.data[k] = h_body.data[idx];
+                if (flags[comm_flag::image]) h_image_copybuf.data[k] = h_image.data[idx];
+                if (flags[comm_flag::velocity]) h_velocity_copybuf.data[k] = h_vel.data[idx];
+                if (flags[comm_flag::orientation]) h_orientation_copybuf.data[k] = h_orientation.data[idx];
+                h_copy_ghosts.data[k] = h_tag.data[idx];
+                }
+            }
+        }
+
+    if (m_prof)
+        m_prof->push("MPI send/recv");
+
+    // communicate the number of ghosts
+    m_reqs.clear();
+    MPI_Request req;
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        {
+        MPI_Isend(&m_direct_num_send[n], 1, MPI_UNSIGNED, m_direct_rank[n], m_direct_offset[n], m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        MPI_Irecv(&m_direct_num_recv[n], 1, MPI_UNSIGNED, m_direct_rank[n], NEIGH_MAX - 1 - m_direct_offset[n], m_mpi_comm, &req);
+        m_reqs.push_back(req);
+        }
+    m_stats.resize(m_reqs.size());
+    if (m_reqs.size())
+        MPI_Waitall(m_reqs.size(), &m_reqs.front(), &m_stats.front());
+    m_reqs.clear();
+
+    if (m_prof)
+        m_prof->pop();
+
+    unsigned int n_recv = 0;
+    for (unsigned int n = 0; n < m_n_direct; ++n)
+        {
+        m_direct_recv_begin[n] = n_recv;
+        n_recv += m_direct_num_recv[n];
+        }
+
+    // append ghosts at the end of particle data array
+    unsigned int start_idx = N + m_pdata->getNGhosts();
+    m_pdata->addGhostParticles(n_recv);
+
+    // ghosts are never forwarded
+    m_plan.resize(m_pdata->getN() + m_pdata->getNGhosts());
+        {
+        ArrayHandle<unsigned int> h_plan(m_plan, access_location::host, access_mode::readwrite);
+        for (unsigned int idx = start_idx; idx < start_idx + n_recv; ++idx)
+            h_plan.data[idx] = 0;
+        }
+
+    if (m_prof)
+        m_prof->push("MPI send/recv");
+
+        {
+        // exchange all fields in one round, write directly to the particle data arrays
+        ArrayHandle<unsigned int> h_copy_ghosts(m_direct_copy_ghosts, access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_pos_copybuf(m_pos_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_charge_copybuf(m_charge_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_diameter_copybuf(m_diameter_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_body_copybuf(m_body_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<int3> h_image_copybuf(m_image_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_velocity_copybuf(m_velocity_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_orientation_copybuf(m_orientation_copybuf, access_location::host, access_mode::read);
+
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(), access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_body(m_pdata->getBodies(), access_location::host, access_mode::readwrite);
+        ArrayHandle<int3> h_image(m_pdata->getImages(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::readwrite);
+
+        m_reqs.clear();
+        postDirectMessages(h_copy_ghosts.data, h_tag.data + start_idx, 2);
+        if (flags[comm_flag::position])
+            postDirectMessages(h_pos_copybuf.data, h_pos.data + start_idx, 3);
+        if (flags[comm_flag::charge])
+            postDirectMessages(h_charge_copybuf.data, h_charge.data + start_idx, 4);
+        if (flags[comm_flag::diameter])
+            postDirectMessages(h_diameter_copybuf.data, h_diameter.data + start_idx, 5);
+        if (flags[comm_flag::velocity])
+            postDirectMessages(h_velocity_copybuf.data, h_vel.data + start_idx, 6);
+        if (flags[comm_flag::orientation])
+            postDirectMessages(h_orientation_copybuf.data, h_orientation.data + start_idx, 7);
+        if (flags[comm_flag::body])
+            postDirectMessages(h_body_copybuf.data, h_body.data + start_idx, 8);
+        if (flags[comm_flag::image])
+            postDirectMessages(h_image_copybuf.data, h_image.data + start_idx, 9);
+
+        m_stats.resize(m_reqs.size());
+        if (m_reqs.size())
+            MPI_Waitall(m_reqs.size(), &m_reqs.front(), &m_stats.front());
+        m_reqs.clear();
+        }
+
+    if (m_prof)
+        m_prof->pop();
+
+    // wrap particle positions
+    if (flags[comm_flag::position])
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
+        ArrayHandle<int3> h_image(m_pdata->getImages(), access_location::host, access_mode::readwrite);
+
+        const BoxDim shifted_box = getShiftedBox();
+        for (unsigned int idx = start_idx; idx < start_idx + n_recv; idx++)
+            shifted_box.wrap(h_pos.data[idx], h_image.data[idx]);
+        }
+
+        {
+        // set reverse-lookup tag -> idx
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::readwrite);
+
+        for (unsigned int idx = start_idx; idx < start_idx + n_recv; idx++)
+            {
+            assert(h_tag.data[idx] <= m_pdata->getMaximumTag());
+            assert(h_rtag.data[h_tag.data[idx]] == NOT_LOCAL);
+            h_rtag.data[h_tag.data[idx]] = idx;
+            }
+        }
+
+    m_ghosts_added = m_pdata->getNGhosts();
+    m_last_flags = flags;
+    }
+
+//! Post the ghost update of the direct exchange
+void Communicator::postDirectGhostUpdate()
+    {
+    CommFlags flags = getFlags();
+    unsigned int n_send = m_direct_copy_ghosts.size();
+    unsigned int N = m_pdata->getN();
+
+        {
+        ArrayHandle<unsigned int> h_copy_ghosts(m_direct_copy_ghosts, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_pos_copybuf(m_pos_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_velocity_copybuf(m_velocity_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_orientation_copybuf(m_orientation_copybuf, access_location::host, access_mode::overwrite);
+
+        for (unsigned int ghost_idx = 0; ghost_idx < n_send; ++ghost_idx)
+            {
+            unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
+            assert(idx < N);
+
+            if (flags[comm_flag::position]) h_pos_copybuf.data[ghost_idx] = h_pos.data[idx];
+            if (flags[comm_flag::velocity]) h_velocity_copybuf.data[ghost_idx] = h_vel.data[idx];
+            if (flags[comm_flag::orientation]) h_orientation_copybuf.data[ghost_idx] = h_orientation.data[idx];
+            }
+        }
+
+    // only non-permanent fields (position, velocity, orientation) need to be considered here
+    m_reqs.clear();
+    if (flags[comm_flag::position])
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_pos_copybuf(m_pos_copybuf, access_location::host, access_mode::read);
+        postDirectMessages(h_pos_copybuf.data, h_pos.data + N, 3);
+        }
+
+    if (flags[comm_flag::velocity])
+        {
+        ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_velocity_copybuf(m_velocity_copybuf, access_location::host, access_mode::read);
+        postDirectMessages(h_velocity_copybuf.data, h_vel.data + N, 6);
+        }
+
+    if (flags[comm_flag::orientation])
+        {
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_orientation_copybuf(m_orientation_copybuf, access_location::host, access_mode::read);
+        postDirectMessages(h_orientation_copybuf.data, h_orientation.data + N, 7);
+        }
+    }
+
+//! Complete the ghost update of the direct exchange
+void Communicator::completeDirectGhostUpdate()
+    {
+    CommFlags flags = getFlags();
+
+    if (m_prof)
+        m_prof->push("MPI send/recv");
+
+    m_stats.resize(m_reqs.size());
+    if (m_reqs.size())
+        MPI_Waitall(m_reqs.size(), &m_reqs.front(), &m_stats.front());
+    m_reqs.clear();
+
+    size_t sz = 0;
+    if (flags[comm_flag::position]) sz += sizeof(Scalar4);
+    if (flags[comm_flag::velocity]) sz += sizeof(Scalar4);
+    if (flags[comm_flag::orientation]) sz += sizeof(Scalar4);
+
+    if (m_prof)
+        m_prof->pop(0, (m_pdata->getNGhosts() + m_direct_copy_ghosts.size())*sz);
+
+    // wrap particle positions (only if copying positions)
+    if (flags[comm_flag::position])
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::readwrite);
+
+        const BoxDim shifted_box = getShiftedBox();
+        unsigned int N = m_pdata->getN();
+        for (unsigned int idx = N; idx < N + m_pdata->getNGhosts(); idx++)
+            {
+            int3 img = make_int3(0,0,0);
+            shifted_box.wrap(h_pos.data[idx], img);
+            }
+        }
+    }
+
+//! Communicate the net force, torque and virial of the ghosts in the direct exchange
+void Communicator::updateNetForceDirect()
+    {
+    CommFlags flags = getFlags();
+    unsigned int n_send = m_direct_copy_ghosts.size();
+    unsigned int N = m_pdata->getN();
+    unsigned int n_ghosts = m_pdata->getNGhosts();
+
+    if (flags[comm_flag::net_force])
+        m_netforce_copybuf.resize(n_send);
+    if (flags[comm_flag::net_torque])
+        m_nettorque_copybuf.resize(n_send);
+    if (flags[comm_flag::net_virial])
+        {
+        m_netvirial_copybuf.resize(6*n_send);
+        m_netvirial_recvbuf.resize(6*n_ghosts);
+        }
+
+    unsigned int pitch = m_pdata->getNetVirial().getPitch();
+
+        {
+        ArrayHandle<unsigned int> h_copy_ghosts(m_direct_copy_ghosts, access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_netforce(m_pdata->getNetForce(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_nettorque(m_pdata->getNetTorqueArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_netvirial(m_pdata->getNetVirial(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_netforce_copybuf(m_netforce_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_nettorque_copybuf(m_nettorque_copybuf, access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar> h_netvirial_copybuf(m_netvirial_copybuf, access_location::host, access_mode::overwrite);
+
+        for (unsigned int ghost_idx = 0; ghost_idx < n_send; ++ghost_idx)
+            {
+            unsigned int idx = h_rtag.data[h_copy_ghosts.data[ghost_idx]];
+            assert(idx < N);
+
+            if (flags[comm_flag::net_force]) h_netforce_copybuf.data[ghost_idx] = h_netforce.data[idx];
+            if (flags[comm_flag::net_torque]) h_nettorque_copybuf.data[ghost_idx] = h_nettorque.data[idx];
+            if (flags[comm_flag::net_virial])
+                {
+                // transpose the virial
+                for (unsigned int j = 0; j < 6; ++j)
+                    h_netvirial_copybuf.data[6*ghost_idx+j] = h_netvirial.data[j*pitch+idx];
+                }
+            }
+        }
+
+    if (m_prof)
+        m_prof->push("MPI send/recv");
+
+        {
+        ArrayHandle<Scalar4> h_netforce(m_pdata->getNetForce(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_nettorque(m_pdata->getNetTorqueArray(), access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar4> h_netforce_copybuf(m_netforce_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_nettorque_copybuf(m_nettorque_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_netvirial_copybuf(m_netvirial_copybuf, access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_netvirial_recvbuf(m_netvirial_recvbuf, access_location::host, access_mode::overwrite);
+
+        m_reqs.clear();
+        if (flags[comm_flag::net_force])
+            postDirectMessages(h_netforce_copybuf.data, h_netforce.data + N, 10);
+        if (flags[comm_flag::net_torque])
+            postDirectMessages(h_nettorque_copybuf.data, h_nettorque.data + N, 11);
+        if (flags[comm_flag::net_virial])
+            postDirectMessages(h_netvirial_copybuf.data, h_netvirial_recvbuf.data, 12, 6);
+
+        m_stats.resize(m_reqs.size());
+        if (m_reqs.size())
+            MPI_Waitall(m_reqs.size(), &m_reqs.front(), &m_stats.front());
+        m_reqs.clear();
+        }
+
+    if (m_prof)
+        m_prof->pop();
+
+    if (flags[comm_flag::net_virial])
+        {
+        // unpack virial
+        ArrayHandle<Scalar> h_netvirial_recvbuf(m_netvirial_recvbuf, access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_netvirial(m_pdata->getNetVirial(), access_location::host, access_mode::readwrite);
+
+        for (unsigned int i = 0; i < n_ghosts; ++i)
+            for (unsigned int j = 0; j < 6; ++j)
+                h_netvirial.data[j*pitch+N+i] = h_netvirial_recvbuf.data[6*i+j];
+        }
+    }
+
 void Communicator::removeGhostParticleTags()
     {
     // wipe out reverse-lookup tag -> idx for old ghost atoms
@@ -2891,6 +3555,8 @@ const BoxDim Communicator::getShiftedBox() const
 void export_Communicator(py::module& m)
     {
     py::class_<Communicator, std::shared_ptr<Communicator> >(m,"Communicator")
-    .def(py::init<std::shared_ptr<SystemDefinition>, std::shared_ptr<DomainDecomposition> >());
+    .def(py::init<std::shared_ptr<SystemDefinition>, std::shared_ptr<DomainDecomposition> >())
+    .def("setDirectExchange", &Communicator::setDirectExchange)
+    .def("getDirectExchange", &Communicator::getDirectExchange);
     }
 #endif // ENABLE_MPI
@@ -147,6 +147,14 @@ struct rank_element
  * In stage two and three, ghost atoms received from a neighboring processor are always included in the local
  * ghost atom lists, and they maybe replicated to more neighboring processors by the communication pattern
  * described above.
+ *
+ * <b>Direct exchange:</b>
+ *
+ * With setDirectExchange(), particles and ghosts are instead sent directly to the (up to 26) face, edge and
+ * corner neighbors in a single round of non-blocking messages, so that no particle is forwarded through an
+ * intermediate domain. The ghost lists of a direct exchange only contain local particles, and a ghost update
+ * completes in one round. Systems with bonded groups, or forces that request the reverse net force, need the
+ * forwarding lists of the staged scheme and always use it.
  * \ingroup communication
  */
 class PYBIND11_EXPORT Communicator
@@ -270,6 +278,27 @@ class PYBIND11_EXPORT Communicator
          */
         void setFlags(const CommFlags& flags) { m_flags = flags; }
 
+        //! Set the exchange mode
+        /*! \param direct If true, exchange particles directly with all neighboring domains
+         *
+         * The particles are migrated and the ghost lists rebuilt with the new mode on the next call to
+         * communicate().
+         */
+        void setDirectExchange(bool direct)
+            {
+            if (direct != m_direct)
+                {
+                m_direct = direct;
+                forceMigrate();
+                }
+            }
+
+        //! Get the exchange mode
+        bool getDirectExchange() const
+            {
+            return m_direct;
+            }
+
         //@}
 
         //! \name communication methods
@@ -278,8 +307,15 @@ class PYBIND11_EXPORT Communicator
         /*! Interface to the communication methods.
          * This method is supposed to be called every time step and automatically performs all necessary
          * communication steps.
+         *
+         * \param timestep The time step
+         * \param defer_ghost_update If true, the caller finishes the ghost update with finishUpdateGhosts()
+         *
+         * With \a defer_ghost_update, the ghost update of a step without migration is left pending on the
+         * CPU, so that forces on particles with only local neighbors can be computed while the ghost
+         * positions are in flight.
          */
-        void communicate(unsigned int timestep);
+        void communicate(unsigned int timestep, bool defer_ghost_update=false);
 
         //@}
 
@@ -310,10 +346,12 @@ class PYBIND11_EXPORT Communicator
          *
          * \param timestep The time step
          */
-        virtual void finishUpdateGhosts(unsigned int timestep)
+        virtual void finishUpdateGhosts(unsigned int timestep);
+
+        //! Returns true if a ghost update has been started but not finished
+        bool isGhostUpdatePending() const
             {
-            // the base class implementation is currently empty
-            m_comm_pending = false;
+            return m_comm_pending;
             }
 
         /*! Communicate the net particle force
@@ -519,6 +557,21 @@ class PYBIND11_EXPORT Communicator
         Scalar m_r_ghost_max;                    //!< Maximum ghost layer width
         Scalar m_r_extra_ghost_max;              //!< Maximum extra ghost layer width
 
+        bool m_direct;                           //!< True if the direct exchange is requested
+        bool m_direct_active;                    //!< True if the current ghost lists use the direct exchange
+        unsigned int m_n_direct;                 //!< Number of neighbors in the direct exchange
+        unsigned int m_direct_rank[NEIGH_MAX];   //!< Rank of every neighbor
+        unsigned int m_direct_offset[NEIGH_MAX]; //!< Offset index ((z+1)*3+(y+1))*3+(x+1) of every neighbor
+        unsigned int m_direct_mask[NEIGH_MAX];   //!< Plan flags a ghost needs to be sent to every neighbor
+        unsigned int m_direct_num_send[NEIGH_MAX];     //!< Number of ghosts sent to every neighbor
+        unsigned int m_direct_num_recv[NEIGH_MAX];     //!< Number of ghosts received from every neighbor
+        unsigned int m_direct_send_begin[NEIGH_MAX];   //!< First ghost sent to every neighbor in the send buffers
+        unsigned int m_direct_recv_begin[NEIGH_MAX];   //!< First ghost received from every neighbor (after the local particles)
+        GlobalVector<unsigned int> m_direct_copy_ghosts; //!< Tags of the ghosts sent, grouped by neighbor
+
+        //! Returns true if the particles can be exchanged directly with all neighbors
+        bool useDirectExchange() const;
+
         unsigned int m_ghosts_added;             //!< Number of ghosts added
         bool m_has_ghost_particles;              //!< True if we have a current copy of ghost particles
 
@@ -547,6 +600,7 @@ class PYBIND11_EXPORT Communicator
         CommFlags m_last_flags;                       //!< Flags of last ghost exchange
 
         bool m_comm_pending;                     //!< If true, a communication is in process
+        unsigned int m_ghost_update_dir;         //!< First direction of the pending ghost update
         std::vector<MPI_Request> m_reqs; //!< Container for all MPI communication requests
         std::vector<MPI_Status> m_stats; //!< Container for all MPI communication statuses
 
@@ -615,6 +669,31 @@ class PYBIND11_EXPORT Communicator
         std::vector<pdata_element> m_sendbuf;  //!< Buffer for particles that are sent
         std::vector<pdata_element> m_recvbuf;  //!< Buffer for particles that are received
 
+        //! Fill the send buffers of one direction and post the ghost update messages
+        void postGhostUpdate(unsigned int dir, unsigned int start_idx);
+
+        //! Wait for the ghost update messages of one direction
+        void completeGhostUpdate(unsigned int dir, unsigned int start_idx);
+
+        //! Migrate particles directly to all neighbors
+        void migrateParticlesDirect();
+
+        //! Exchange ghosts directly with all neighbors, using the current plans
+        void exchangeGhostsDirect();
+
+        //! Fill the send buffers and post the direct ghost update messages
+        void postDirectGhostUpdate();
+
+        //! Wait for the direct ghost update messages
+        void completeDirectGhostUpdate();
+
+        //! Communicate the net force, torque and virial directly with all neighbors
+        void updateNetForceDirect();
+
+        //! Post the messages of one field to all neighbors in the direct exchange
+        template<class T>
+        void postDirectMessages(const T *send_buf, T *recv_buf, unsigned int field, unsigned int width=1);
+
         /* Communication of bonded groups */
         GroupCommunicator<BondData> m_bond_comm;    //!< Communication helper for bonds
         friend class GroupCommunicator<BondData>;
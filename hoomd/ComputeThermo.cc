@@ -9,6 +9,7 @@
 */
 
 #include "ComputeThermo.h"
+#include "Integrator.h"
 #include "VectorMath.h"
 
 #ifdef ENABLE_MPI
@@ -28,7 +29,8 @@ using namespace std;
 ComputeThermo::ComputeThermo(std::shared_ptr<SystemDefinition> sysdef,
                              std::shared_ptr<ParticleGroup> group,
                              const std::string& suffix)
-    : Compute(sysdef), m_group(group), m_ndof(1), m_ndof_rot(0), m_logging_enabled(true)
+    : Compute(sysdef), m_group(group), m_ndof(1), m_ndof_rot(0), m_logging_enabled(true),
+      m_ndof_stale(false)
     {
     m_exec_conf->msg->notice(5) << "Constructing ComputeThermo" << endl;
 
@@ -68,11 +70,18 @@ ComputeThermo::ComputeThermo(std::shared_ptr<SystemDefinition> sysdef,
     #ifdef ENABLE_MPI
     m_properties_reduced = true;
     #endif
+
+    // count the degrees of freedom again when the members of a dynamic group change
+    if (m_group->isDynamic())
+        m_group->getMembershipChangeSignal().connect<ComputeThermo, &ComputeThermo::slotMembershipChange>(this);
     }
 
 ComputeThermo::~ComputeThermo()
     {
     m_exec_conf->msg->notice(5) << "Destroying ComputeThermo" << endl;
+
+    if (m_group->isDynamic())
+        m_group->getMembershipChangeSignal().disconnect<ComputeThermo, &ComputeThermo::slotMembershipChange>(this);
     }
 
 /*! \param ndof Number of degrees of freedom to set
@@ -97,6 +106,15 @@ void ComputeThermo::compute(unsigned int timestep)
     if (!shouldCompute(timestep))
         return;
 
+    // the members are the same on all ranks, so that all ranks count the degrees of freedom together
+    std::shared_ptr<Integrator> integrator = m_integrator.lock();
+    if (m_ndof_stale && integrator)
+        {
+        setNDOF(integrator->getNDOF(m_group));
+        setRotationalNDOF(integrator->getRotationalNDOF(m_group));
+        m_ndof_stale = false;
+        }
+
     computeProperties();
     }
 
@@ -450,6 +468,7 @@ void export_ComputeThermo(py::module& m)
     .def(py::init< std::shared_ptr<SystemDefinition>,std::shared_ptr<ParticleGroup>,const std::string& >())
     .def("setNDOF", &ComputeThermo::setNDOF)
     .def("setRotationalNDOF", &ComputeThermo::setRotationalNDOF)
+    .def("setIntegrator", &ComputeThermo::setIntegrator)
     .def("getTemperature", &ComputeThermo::getTemperature)
     .def("getPressure", &ComputeThermo::getPressure)
     .def("getKineticEnergy", &ComputeThermo::getKineticEnergy)
@@ -22,6 +22,8 @@
 
 #include <hoomd/extern/pybind/include/pybind11/pybind11.h>
 
+class Integrator;
+
 #ifndef __COMPUTE_THERMO_H__
 #define __COMPUTE_THERMO_H__
 
@@ -48,6 +50,10 @@
     the user desires (the default is one!). In standard usage, the python interface queries the number of degrees
     of freedom from the integrators and sets that value for each ComputeThermo so that it is always correct.
 
+    The members of a dynamic group change over the course of a run. When an integrator has been given with
+    setIntegrator(), ComputeThermo queries the number of degrees of freedom of a dynamic group again after each
+    change of its members.
+
     All quantities are made available for the logger. ComputerThermo can be given a suffix which it will append
     to each quantity provided to the logger. Typical usage is to provide _groupname as the suffix so that properties
     of different groups can be logged separately (e.g. temperature_group1 and temperature_group2).
@@ -89,6 +95,12 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
             return m_ndof_rot;
             }
 
+        //! Set the integrator that counts the degrees of freedom of a dynamic group
+        void setIntegrator(std::shared_ptr<Integrator> integrator)
+            {
+            m_integrator = integrator;
+            }
+
         //! Returns the overall temperature last computed by compute()
         /*! \returns Instantaneous overall temperature of the system
          */
@@ -309,10 +321,18 @@ class PYBIND11_EXPORT ComputeThermo : public Compute
         unsigned int m_ndof_rot;        //!< Stores the number of rotational degrees of freedom in the system
         std::vector<std::string> m_logname_list;  //!< Cache all generated logged quantities names
         bool m_logging_enabled;         //!< Set to false to disable communication with the logger
+        std::weak_ptr<Integrator> m_integrator; //!< Integrator that counts the degrees of freedom of a dynamic group
+        bool m_ndof_stale;              //!< True if the members of a dynamic group have changed since the last count
 
         //! Does the actual computation
         virtual void computeProperties();
 
+        //! Mark the number of degrees of freedom of a dynamic group for recounting
+        void slotMembershipChange()
+            {
+            m_ndof_stale = true;
+            }
+
         #ifdef ENABLE_MPI
         bool m_properties_reduced;      //!< True if properties have been reduced across MPI
 
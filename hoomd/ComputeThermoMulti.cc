@@ -0,0 +1,324 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+/*! \file ComputeThermoMulti.cc
+    \brief Contains code for the ComputeThermoMulti class
+*/
+
+#include "ComputeThermoMulti.h"
+#include "VectorMath.h"
+
+#ifdef ENABLE_MPI
+#include "Communicator.h"
+#include "HOOMDMPI.h"
+#endif
+
+#include <hoomd/extern/pybind/include/pybind11/numpy.h>
+#include <hoomd/extern/pybind/include/pybind11/stl.h>
+
+#include <limits>
+
+namespace py = pybind11;
+
+#include <iostream>
+using namespace std;
+
+/*! \param sysdef System for which to compute thermodynamic properties
+    \param partition Groups over which properties are calculated
+    \param suffix Suffix to append to all logged quantity names
+*/
+ComputeThermoMulti::ComputeThermoMulti(std::shared_ptr<SystemDefinition> sysdef,
+                                       std::shared_ptr<ParticlePartition> partition,
+                                       const std::string& suffix)
+    : Compute(sysdef), m_partition(partition)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing ComputeThermoMulti" << endl;
+
+    assert(m_pdata);
+    assert(m_partition);
+
+    m_logname_list.push_back(string("num_particles") + suffix);
+    m_logname_list.push_back(string("temperature") + suffix);
+    m_logname_list.push_back(string("kinetic_energy") + suffix);
+    m_logname_list.push_back(string("translational_kinetic_energy") + suffix);
+    m_logname_list.push_back(string("rotational_kinetic_energy") + suffix);
+    m_logname_list.push_back(string("potential_energy") + suffix);
+    m_logname_list.push_back(string("momentum") + suffix);
+    m_logname_list.push_back(string("pressure_tensor") + suffix);
+    }
+
+ComputeThermoMulti::~ComputeThermoMulti()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying ComputeThermoMulti" << endl;
+    }
+
+/*! Calls computeProperties if the properties need updating
+    \param timestep Current time step of the simulation
+*/
+void ComputeThermoMulti::compute(unsigned int timestep)
+    {
+    if (!shouldCompute(timestep))
+        return;
+
+    computeProperties();
+    }
+
+/*! \param index Index of the property in thermo_multi_index
+    \returns The property of each group
+
+    Properties that are not available with the current particle data flags are NaN.
+*/
+std::vector<double> ComputeThermoMulti::getProperty(unsigned int index)
+    {
+    if (index >= thermo_multi_index::num_quantities)
+        {
+        m_exec_conf->msg->error() << "compute.thermo_multi: Property " << index << " does not exist" << endl;
+        throw runtime_error("Error getting property");
+        }
+
+    PDataFlags flags = m_pdata->getFlags();
+    bool valid = true;
+    if (index == thermo_multi_index::rotational_kinetic_energy)
+        valid = flags[pdata_flag::rotational_kinetic_energy];
+    else if (index == thermo_multi_index::potential_energy)
+        valid = flags[pdata_flag::potential_energy];
+    else if (index >= thermo_multi_index::pressure_xx)
+        valid = flags[pdata_flag::pressure_tensor];
+
+    const unsigned int num_groups = getNumGroups();
+    std::vector<double> property(num_groups, std::numeric_limits<double>::quiet_NaN());
+    if (valid && m_properties.size() == num_groups*thermo_multi_index::num_quantities)
+        {
+        for (unsigned int i = 0; i < num_groups; ++i)
+            property[i] = m_properties[i*thermo_multi_index::num_quantities + index];
+        }
+    return property;
+    }
+
+/*! \returns The temperature of each group, from its translational kinetic energy with D degrees of freedom per
+    particle, or NaN for empty groups
+*/
+std::vector<double> ComputeThermoMulti::getTemperature()
+    {
+    std::vector<double> temperature = getProperty(thermo_multi_index::translational_kinetic_energy);
+    std::vector<double> N = getProperty(thermo_multi_index::num_particles);
+    double D = m_sysdef->getNDimensions();
+
+    for (unsigned int i = 0; i < temperature.size(); ++i)
+        {
+        if (N[i] > 0)
+            temperature[i] = 2.0 * temperature[i] / (D * N[i]);
+        else
+            temperature[i] = std::numeric_limits<double>::quiet_NaN();
+        }
+    return temperature;
+    }
+
+std::vector< std::string > ComputeThermoMulti::getProvidedLogMatrixQuantities()
+    {
+    return m_logname_list;
+    }
+
+/*! \param first Index of the first property in thermo_multi_index
+    \param count Number of consecutive properties
+    \returns An array with one row per group, and \a count columns if \a count is larger than 1
+*/
+py::array ComputeThermoMulti::getPropertyArray(unsigned int first, unsigned int count)
+    {
+    const unsigned int num_groups = getNumGroups();
+    std::vector<double> data(num_groups*count);
+    for (unsigned int j = 0; j < count; ++j)
+        {
+        std::vector<double> property = getProperty(first+j);
+        for (unsigned int i = 0; i < num_groups; ++i)
+            data[i*count + j] = property[i];
+        }
+
+    std::vector<ssize_t> shape(1, num_groups);
+    if (count > 1)
+        shape.push_back(count);
+    return py::array_t<double>(shape, data.data());
+    }
+
+py::array ComputeThermoMulti::getLogMatrix(const std::string& quantity, unsigned int timestep)
+    {
+    compute(timestep);
+    if (quantity == m_logname_list[0])
+        {
+        return getPropertyArray(thermo_multi_index::num_particles, 1);
+        }
+    else if (quantity == m_logname_list[1])
+        {
+        std::vector<double> temperature = getTemperature();
+        return py::array_t<double>(temperature.size(), temperature.data());
+        }
+    else if (quantity == m_logname_list[2])
+        {
+        std::vector<double> ke = getProperty(thermo_multi_index::translational_kinetic_energy);
+
+        // return only the translational component if the flags are not valid
+        if (m_pdata->getFlags()[pdata_flag::rotational_kinetic_energy])
+            {
+            std::vector<double> ke_rot = getProperty(thermo_multi_index::rotational_kinetic_energy);
+            for (unsigned int i = 0; i < ke.size(); ++i)
+                ke[i] += ke_rot[i];
+            }
+        return py::array_t<double>(ke.size(), ke.data());
+        }
+    else if (quantity == m_logname_list[3])
+        {
+        return getPropertyArray(thermo_multi_index::translational_kinetic_energy, 1);
+        }
+    else if (quantity == m_logname_list[4])
+        {
+        return getPropertyArray(thermo_multi_index::rotational_kinetic_energy, 1);
+        }
+    else if (quantity == m_logname_list[5])
+        {
+        return getPropertyArray(thermo_multi_index::potential_energy, 1);
+        }
+    else if (quantity == m_logname_list[6])
+        {
+        return getPropertyArray(thermo_multi_index::momentum_x, 3);
+        }
+    else if (quantity == m_logname_list[7])
+        {
+        return getPropertyArray(thermo_multi_index::pressure_xx, 6);
+        }
+    else
+        {
+        m_exec_conf->msg->error() << "compute.thermo_multi: " << quantity << " is not a valid log quantity" << endl;
+        throw runtime_error("Error getting log matrix");
+        }
+    }
+
+/*! Computes the properties of all groups in a single pass over the local particles, followed by a single reduction
+    over all ranks.
+*/
+void ComputeThermoMulti::computeProperties()
+    {
+    if (m_prof) m_prof->push("Thermo multi");
+
+    const unsigned int num_groups = getNumGroups();
+    const unsigned int num_quantities = thermo_multi_index::num_quantities;
+    m_properties.assign(num_groups*num_quantities, 0.0);
+
+    // the labels may be rebuilt from the tags, so get them before accessing the particle data
+    ArrayHandle<unsigned int> h_labels(m_partition->getLocalLabels(), access_location::host, access_mode::read);
+
+    // access the particle data
+    ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_body(m_pdata->getBodies(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_angmom(m_pdata->getAngularMomentumArray(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
+
+    // access the net force, pe, and virial
+    const GlobalArray< Scalar >& net_virial = m_pdata->getNetVirial();
+    ArrayHandle<Scalar4> h_net_force(m_pdata->getNetForce(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar> h_net_virial(net_virial, access_location::host, access_mode::read);
+    unsigned int virial_pitch = net_virial.getPitch();
+
+    PDataFlags flags = m_pdata->getFlags();
+    bool compute_rotational = flags[pdata_flag::rotational_kinetic_energy];
+    bool compute_potential = flags[pdata_flag::potential_energy];
+    bool compute_virial = flags[pdata_flag::pressure_tensor];
+
+    for (unsigned int j = 0; j < m_pdata->getN(); j++)
+        {
+        unsigned int label = h_labels.data[j];
+
+        // ignore particles in no group and rigid body constituent particles
+        if (label == ParticlePartition::NO_LABEL || !(h_body.data[j] >= MIN_FLOPPY || h_body.data[j] == h_tag.data[j]))
+            continue;
+
+        double *properties = &m_properties[label*num_quantities];
+        double mass = h_vel.data[j].w;
+        double vx = h_vel.data[j].x;
+        double vy = h_vel.data[j].y;
+        double vz = h_vel.data[j].z;
+
+        properties[thermo_multi_index::num_particles] += 1.0;
+        properties[thermo_multi_index::translational_kinetic_energy] += 0.5*mass*(vx*vx + vy*vy + vz*vz);
+        properties[thermo_multi_index::momentum_x] += mass*vx;
+        properties[thermo_multi_index::momentum_y] += mass*vy;
+        properties[thermo_multi_index::momentum_z] += mass*vz;
+
+        // kinetic part of the pressure tensor
+        properties[thermo_multi_index::pressure_xx] += mass*vx*vx;
+        properties[thermo_multi_index::pressure_xy] += mass*vx*vy;
+        properties[thermo_multi_index::pressure_xz] += mass*vx*vz;
+        properties[thermo_multi_index::pressure_yy] += mass*vy*vy;
+        properties[thermo_multi_index::pressure_yz] += mass*vy*vz;
+        properties[thermo_multi_index::pressure_zz] += mass*vz*vz;
+
+        if (compute_virial)
+            {
+            properties[thermo_multi_index::pressure_xx] += (double)h_net_virial.data[j+0*virial_pitch];
+            properties[thermo_multi_index::pressure_xy] += (double)h_net_virial.data[j+1*virial_pitch];
+            properties[thermo_multi_index::pressure_xz] += (double)h_net_virial.data[j+2*virial_pitch];
+            properties[thermo_multi_index::pressure_yy] += (double)h_net_virial.data[j+3*virial_pitch];
+            properties[thermo_multi_index::pressure_yz] += (double)h_net_virial.data[j+4*virial_pitch];
+            properties[thermo_multi_index::pressure_zz] += (double)h_net_virial.data[j+5*virial_pitch];
+            }
+
+        if (compute_potential)
+            properties[thermo_multi_index::potential_energy] += (double)h_net_force.data[j].w;
+
+        if (compute_rotational)
+            {
+            Scalar3 I = h_inertia.data[j];
+            quat<Scalar> q(h_orientation.data[j]);
+            quat<Scalar> p(h_angmom.data[j]);
+            quat<Scalar> s(Scalar(0.5)*conj(q)*p);
+
+            // only if the moment of inertia along one principal axis is non-zero, that axis carries angular momentum
+            double ke_rot = 0.0;
+            if (I.x >= EPSILON)
+                ke_rot += s.v.x*s.v.x/I.x;
+            if (I.y >= EPSILON)
+                ke_rot += s.v.y*s.v.y/I.y;
+            if (I.z >= EPSILON)
+                ke_rot += s.v.z*s.v.z/I.z;
+
+            properties[thermo_multi_index::rotational_kinetic_energy] += 0.5*ke_rot;
+            }
+        }
+
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+        if (m_prof) m_prof->push("MPI Allreduce");
+        // reduce the properties of all groups at once
+        MPI_Allreduce(MPI_IN_PLACE, m_properties.data(), m_properties.size(), MPI_DOUBLE, MPI_SUM,
+                      m_exec_conf->getMPICommunicator());
+        if (m_prof) m_prof->pop();
+        }
+    #endif
+
+    // the pressure tensor is the contribution of the group to the pressure of the system
+    BoxDim global_box = m_pdata->getGlobalBox();
+    Scalar3 L = global_box.getL();
+    double volume = (m_sysdef->getNDimensions() == 2) ? L.x * L.y : L.x * L.y * L.z;
+
+    for (unsigned int i = 0; i < num_groups; ++i)
+        {
+        for (unsigned int k = thermo_multi_index::pressure_xx; k <= thermo_multi_index::pressure_zz; ++k)
+            m_properties[i*num_quantities + k] /= volume;
+        }
+
+    if (m_prof) m_prof->pop();
+    }
+
+void export_ComputeThermoMulti(py::module& m)
+    {
+    py::class_<ComputeThermoMulti, std::shared_ptr<ComputeThermoMulti> >(m,"ComputeThermoMulti",py::base<Compute>())
+    .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<ParticlePartition>, const std::string& >())
+    .def("getNumGroups", &ComputeThermoMulti::getNumGroups)
+    .def("getProperty", &ComputeThermoMulti::getProperty)
+    .def("getTemperature", &ComputeThermoMulti::getTemperature)
+    .def("getLogMatrix", &ComputeThermoMulti::getLogMatrix)
+    ;
+    }
@@ -0,0 +1,116 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+#include "Compute.h"
+#include "ParticlePartition.h"
+
+#include <memory>
+#include <string>
+#include <vector>
+
+/*! \file ComputeThermoMulti.h
+    \brief Declares a class for computing thermodynamic quantities of many groups at once
+*/
+
+#ifdef NVCC
+#error This header cannot be compiled by nvcc
+#endif
+
+#include <hoomd/extern/pybind/include/pybind11/pybind11.h>
+
+#ifndef __COMPUTE_THERMO_MULTI_H__
+#define __COMPUTE_THERMO_MULTI_H__
+
+//! Enum for indexing the properties of each group computed by ComputeThermoMulti
+struct thermo_multi_index
+    {
+    //! The enum
+    enum Enum
+        {
+        num_particles=0,                //!< Number of particles, excluding rigid body constituents
+        translational_kinetic_energy,   //!< Translational kinetic energy
+        rotational_kinetic_energy,      //!< Rotational kinetic energy
+        potential_energy,               //!< Potential energy
+        momentum_x,                     //!< x component of the momentum
+        momentum_y,                     //!< y component of the momentum
+        momentum_z,                     //!< z component of the momentum
+        pressure_xx,                    //!< xx component of the pressure tensor
+        pressure_xy,                    //!< xy component of the pressure tensor
+        pressure_xz,                    //!< xz component of the pressure tensor
+        pressure_yy,                    //!< yy component of the pressure tensor
+        pressure_yz,                    //!< yz component of the pressure tensor
+        pressure_zz,                    //!< zz component of the pressure tensor
+        num_quantities                  // final element to count number of quantities
+        };
+    };
+
+//! Computes thermodynamic properties of all groups of a ParticlePartition
+/*! ComputeThermoMulti computes the properties of every group of a partition in one pass over the local particles,
+    reading the group of each particle from ParticlePartition::getLocalLabels(). The properties of all groups are
+    stored in a single contiguous array, with the thermo_multi_index quantities of group \a i starting at
+    \a i*thermo_multi_index::num_quantities, so that they are reduced over MPI with a single MPI_Allreduce.
+
+    The properties are provided to the logger as matrix quantities with one row per group:
+     - num_particles (number of particles)
+     - kinetic_energy, translational_kinetic_energy, rotational_kinetic_energy
+     - temperature (from the translational kinetic energy with D degrees of freedom per particle)
+     - potential_energy
+     - momentum (three columns)
+     - pressure_tensor (six columns, xx, xy, xz, yy, yz, and zz)
+
+    Each name is followed by the suffix given at construction. The pressure tensor of a group is its contribution to
+    the pressure tensor of the system, so it is divided by the volume of the box.
+
+    Like ComputeThermo, rigid body constituent particles are excluded from all sums.
+
+    \ingroup computes
+*/
+class PYBIND11_EXPORT ComputeThermoMulti : public Compute
+    {
+    public:
+        //! Constructs the compute
+        ComputeThermoMulti(std::shared_ptr<SystemDefinition> sysdef,
+                           std::shared_ptr<ParticlePartition> partition,
+                           const std::string& suffix = std::string(""));
+
+        //! Destructor
+        virtual ~ComputeThermoMulti();
+
+        //! Compute the properties
+        virtual void compute(unsigned int timestep);
+
+        //! Get the number of groups
+        unsigned int getNumGroups() const
+            {
+            return m_partition->getNumGroups();
+            }
+
+        //! Get a property of all groups
+        std::vector<double> getProperty(unsigned int index);
+
+        //! Get the temperature of all groups
+        std::vector<double> getTemperature();
+
+        //! Returns a list of log matrix quantities this compute calculates
+        virtual std::vector< std::string > getProvidedLogMatrixQuantities();
+
+        //! Calculates the requested log matrix and returns it
+        virtual pybind11::array getLogMatrix(const std::string& quantity, unsigned int timestep);
+
+    protected:
+        std::shared_ptr<ParticlePartition> m_partition;   //!< Groups to compute properties for
+        std::vector<double> m_properties;                 //!< Properties of all groups
+        std::vector<std::string> m_logname_list;          //!< Cache all generated logged quantities names
+
+        //! Does the actual computation
+        virtual void computeProperties();
+
+        //! Get the properties in a range of indices for all groups as an array
+        pybind11::array getPropertyArray(unsigned int first, unsigned int count);
+    };
+
+//! Exports the ComputeThermoMulti class to python
+void export_ComputeThermoMulti(pybind11::module& m);
+
+#endif
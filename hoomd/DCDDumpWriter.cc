@@ -73,6 +73,13 @@ DCDDumpWriter::DCDDumpWriter(std::shared_ptr<SystemDefinition> sysdef,
       m_overwrite(overwrite), m_is_initialized(false)
     {
     m_exec_conf->msg->notice(5) << "Constructing DCDDumpWriter: " << fname << " " << period << " " << overwrite << endl;
+
+    // the members are looked up on the root rank only
+    if (m_group->isDynamic())
+        {
+        m_exec_conf->msg->error() << "dump.dcd: Dynamic groups are not supported, use a static group" << endl;
+        throw runtime_error("Error initializing DCDDumpWriter");
+        }
     }
 
 //! Initializes the output file for writing
@@ -142,6 +142,14 @@ class PYBIND11_EXPORT ForceCompute : public Compute
             flags[comm_flag::net_force] = 1; // only used if constraints are present
             return flags;
             }
+
+        //! Returns true if this ForceCompute can be computed while a ghost update is pending
+        /*! Such a ForceCompute must finish the ghost update itself before it accesses the ghost particles.
+        */
+        virtual bool overlapsGhostUpdate()
+            {
+            return false;
+            }
         #endif
 
         //! Returns true if this ForceCompute requires anisotropic integration
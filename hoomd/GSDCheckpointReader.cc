@@ -0,0 +1,470 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+/*! \file GSDCheckpointReader.cc
+    \brief Defines the GSDCheckpointReader class
+*/
+
+#include "GSDCheckpointReader.h"
+#include "SnapshotSystemData.h"
+#include "SystemDefinition.h"
+#include <string.h>
+#include <errno.h>
+
+#include <algorithm>
+#include <stdexcept>
+
+using namespace std;
+namespace py = pybind11;
+
+namespace
+{
+//! Names of the bonded groups in the order they are written to a part
+const char *group_prefixes[] = {"bonds", "angles", "dihedrals", "impropers", "constraints", "pairs"};
+const unsigned int n_group_prefixes = 6;
+
+//! Append the elements of \a src to \a dst
+template<class T>
+void append(std::vector<T>& dst, const std::vector<T>& src)
+    {
+    dst.insert(dst.end(), src.begin(), src.end());
+    }
+}
+
+/*! \param exec_conf The execution configuration
+    \param fname Base name of the checkpoint
+*/
+GSDCheckpointReader::GSDCheckpointReader(std::shared_ptr<const ExecutionConfiguration> exec_conf,
+                                         const std::string &fname)
+    : m_exec_conf(exec_conf), m_fname(fname), m_timestep(0), m_nparts(0), m_slot(0)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing GSDCheckpointReader: " << fname << endl;
+
+    m_snapshot = std::shared_ptr< SnapshotSystemData<double> >(new SnapshotSystemData<double>);
+
+    // the root reads the index of the committed checkpoint and the header from its first part
+    std::shared_ptr<CheckpointPart> header;
+    unsigned int dimensions = 3;
+    double box[6] = {1.0, 1.0, 1.0, 0.0, 0.0, 0.0};
+    std::vector<std::string> particle_types;
+    std::vector< std::vector<std::string> > group_types(n_group_prefixes);
+    bool failed = false;
+    if (m_exec_conf->isRoot())
+        {
+        try
+            {
+            readIndex();
+            header = readPart(0, true);
+            dimensions = header->dimensions;
+            std::copy(header->box, header->box + 6, box);
+            particle_types = header->particles.type_mapping;
+            for (unsigned int i = 0; i < n_group_prefixes; ++i)
+                group_types[i] = header->groups[i].type_mapping;
+            }
+        catch (const std::exception&)
+            {
+            // the error has been reported
+            failed = true;
+            }
+        }
+    checkError(failed);
+
+    #ifdef ENABLE_MPI
+    const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
+    bcast(m_timestep, 0, mpi_comm);
+    bcast(m_nparts, 0, mpi_comm);
+    bcast(m_slot, 0, mpi_comm);
+    bcast(dimensions, 0, mpi_comm);
+    MPI_Bcast(box, 6, MPI_DOUBLE, 0, mpi_comm);
+    bcast(particle_types, 0, mpi_comm);
+    bcast(group_types, 0, mpi_comm);
+    #endif
+
+    m_snapshot->dimensions = dimensions;
+    m_snapshot->global_box = BoxDim(box[0], box[1], box[2]);
+    m_snapshot->global_box.setTiltFactors(box[3], box[4], box[5]);
+    m_snapshot->particle_data.type_mapping = particle_types;
+    m_snapshot->bond_data.type_mapping = group_types[0];
+    m_snapshot->angle_data.type_mapping = group_types[1];
+    m_snapshot->dihedral_data.type_mapping = group_types[2];
+    m_snapshot->improper_data.type_mapping = group_types[3];
+    m_snapshot->constraint_data.type_mapping = group_types[4];
+    m_snapshot->pair_data.type_mapping = group_types[5];
+
+    // each rank reads every n_ranks-th part
+    try
+        {
+        for (unsigned int p = m_exec_conf->getRank(); p < m_nparts; p += m_exec_conf->getNRanks())
+            {
+            std::shared_ptr<CheckpointPart> part = readPart(p, false);
+            if (part->nparts != m_nparts || part->part != p || part->timestep != m_timestep)
+                {
+                m_exec_conf->msg->error() << "init.read_checkpoint: "
+                                          << GSDCheckpointWriter::getPartName(m_fname, m_slot, p)
+                                          << " does not belong to the checkpoint at step " << m_timestep << endl;
+                throw runtime_error("Error reading checkpoint");
+                }
+            m_parts.push_back(part);
+            }
+        }
+    catch (const std::exception&)
+        {
+        // the error has been reported
+        failed = true;
+        }
+    checkError(failed);
+    }
+
+GSDCheckpointReader::~GSDCheckpointReader()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying GSDCheckpointReader" << endl;
+    }
+
+/*! \param failed True if this rank failed to read the checkpoint
+
+    The ranks read different parts, so an error on one rank would leave the others waiting in the next
+    collective call. Every rank throws when any rank failed.
+*/
+void GSDCheckpointReader::checkError(bool failed)
+    {
+    unsigned int any_failed = failed;
+    #ifdef ENABLE_MPI
+    MPI_Allreduce(MPI_IN_PLACE, &any_failed, 1, MPI_UNSIGNED, MPI_MAX, m_exec_conf->getMPICommunicator());
+    #endif
+
+    if (any_failed)
+        throw runtime_error("Error reading checkpoint");
+    }
+
+/*! \param handle Handle to the part file
+    \param fname Name of the part file
+    \param name Name of the data chunk
+    \param data Pointer to the data to read into
+    \param expected_size Expected size of the data chunk in bytes
+
+    The writer skips empty chunks, every other chunk must be present in the part.
+*/
+void GSDCheckpointReader::readChunk(gsd_handle& handle, const std::string& fname, const std::string& name,
+                                    void *data, size_t expected_size)
+    {
+    const struct gsd_index_entry* entry = gsd_find_chunk(&handle, 0, name.c_str());
+    if (entry == NULL)
+        {
+        if (expected_size == 0)
+            return;
+
+        m_exec_conf->msg->error() << "init.read_checkpoint: " << "Missing " << name << " in " << fname << endl;
+        throw runtime_error("Error reading checkpoint");
+        }
+
+    size_t actual_size = entry->N * entry->M * gsd_sizeof_type((enum gsd_type)entry->type);
+    if (actual_size != expected_size)
+        {
+        m_exec_conf->msg->error() << "init.read_checkpoint: " << "Expecting " << expected_size << " bytes in "
+                                  << name << " but found " << actual_size << " in " << fname << endl;
+        throw runtime_error("Error reading checkpoint");
+        }
+
+    int retval = gsd_read_chunk(&handle, data, entry);
+    if (retval == -1)
+        {
+        m_exec_conf->msg->error() << "init.read_checkpoint: " << strerror(errno) << " - " << fname << endl;
+        throw runtime_error("Error reading checkpoint");
+        }
+    else if (retval != 0)
+        {
+        m_exec_conf->msg->error() << "init.read_checkpoint: " << "Invalid checkpoint part " << fname << endl;
+        throw runtime_error("Error reading checkpoint");
+        }
+    }
+
+/*! \param handle Handle to the part file
+    \param fname Name of the part file
+    \param name Name of the data chunk
+*/
+std::vector<std::string> GSDCheckpointReader::readTypes(gsd_handle& handle, const std::string& fname, const std::string& name)
+    {
+    std::vector<std::string> type_mapping;
+    const struct gsd_index_entry* entry = gsd_find_chunk(&handle, 0, name.c_str());
+    if (entry == NULL)
+        return type_mapping;
+
+    std::vector<char> data(entry->N * entry->M);
+    readChunk(handle, fname, name, data.data(), data.size());
+    for (unsigned int i = 0; i < entry->N; i++)
+        {
+        size_t l = strnlen(&data[i*entry->M], entry->M);
+        type_mapping.push_back(std::string(&data[i*entry->M], l));
+        }
+    return type_mapping;
+    }
+
+/*! \param handle Handle to open
+    \param fname Name of the file
+    \param schema Expected schema of the file
+    \param description Description of the file in error messages
+*/
+void GSDCheckpointReader::openFile(gsd_handle& handle, const std::string& fname, const std::string& schema,
+                                   const std::string& description)
+    {
+    m_exec_conf->msg->notice(3) << "init.read_checkpoint: reading " << fname << endl;
+
+    int retval = gsd_open(&handle, fname.c_str(), GSD_OPEN_READONLY);
+    if (retval == -1)
+        {
+        m_exec_conf->msg->error() << "init.read_checkpoint: " << strerror(errno) << " - " << fname << endl;
+        throw runtime_error("Error reading checkpoint");
+        }
+    else if (retval != 0)
+        {
+        m_exec_conf->msg->error() << "init.read_checkpoint: " << fname << " is not a valid GSD file" << endl;
+        throw runtime_error("Error reading checkpoint");
+        }
+
+    if (string(handle.header.schema) != schema
+        || handle.header.schema_version >= gsd_make_version(2,0)
+        || gsd_get_nframes(&handle) == 0)
+        {
+        gsd_close(&handle);
+        m_exec_conf->msg->error() << "init.read_checkpoint: " << fname << " is not a " << description << endl;
+        throw runtime_error("Error reading checkpoint");
+        }
+    }
+
+/*! The index file references the slot of the last checkpoint whose parts were all complete. Called on
+    the root rank only.
+*/
+void GSDCheckpointReader::readIndex()
+    {
+    gsd_handle handle;
+    openFile(handle, m_fname, "hoomd-checkpoint-index", "checkpoint index");
+
+    try
+        {
+        readChunk(handle, m_fname, "configuration/step", &m_timestep, 8);
+        readChunk(handle, m_fname, "checkpoint/nparts", &m_nparts, 4);
+        readChunk(handle, m_fname, "checkpoint/slot", &m_slot, 4);
+        if (m_slot > 1 || m_nparts == 0)
+            {
+            m_exec_conf->msg->error() << "init.read_checkpoint: invalid checkpoint index " << m_fname << endl;
+            throw runtime_error("Error reading checkpoint");
+            }
+        }
+    catch (...)
+        {
+        gsd_close(&handle);
+        throw;
+        }
+
+    gsd_close(&handle);
+    }
+
+/*! \param part Index of the part
+    \param header_only If true, only read the header and the type names
+
+    \returns The part with the particles and bonded groups in the file
+*/
+std::shared_ptr<CheckpointPart> GSDCheckpointReader::readPart(unsigned int part, bool header_only)
+    {
+    const std::string fname = GSDCheckpointWriter::getPartName(m_fname, m_slot, part);
+
+    gsd_handle handle;
+    openFile(handle, fname, "hoomd-checkpoint", "checkpoint part");
+
+    std::shared_ptr<CheckpointPart> p(new CheckpointPart);
+    try
+        {
+        p->timestep = 0;
+        p->dimensions = 3;
+        std::fill(p->box, p->box + 6, 0.0);
+        p->nparts = 0;
+        p->part = 0;
+        readChunk(handle, fname, "configuration/step", &p->timestep, 8);
+        readChunk(handle, fname, "configuration/dimensions", &p->dimensions, 1);
+        readChunk(handle, fname, "configuration/box", p->box, 6*8);
+        readChunk(handle, fname, "checkpoint/nparts", &p->nparts, 4);
+        readChunk(handle, fname, "checkpoint/part", &p->part, 4);
+
+        SnapshotParticleData<double>& snap = p->particles;
+        snap.type_mapping = readTypes(handle, fname, "particles/types");
+
+        unsigned int N = 0;
+        if (!header_only)
+            readChunk(handle, fname, "particles/N", &N, 4);
+        snap.resize(N);
+        p->tags.resize(N);
+
+        uint8_t accel_set = 0;
+        readChunk(handle, fname, "particles/accel_set", &accel_set, 1);
+        snap.is_accel_set = accel_set;
+        readChunk(handle, fname, "particles/tag", p->tags.data(), N*4);
+        readChunk(handle, fname, "particles/typeid", snap.type.data(), N*4);
+        readChunk(handle, fname, "particles/mass", snap.mass.data(), N*8);
+        readChunk(handle, fname, "particles/charge", snap.charge.data(), N*8);
+        readChunk(handle, fname, "particles/diameter", snap.diameter.data(), N*8);
+        readChunk(handle, fname, "particles/body", snap.body.data(), N*4);
+        readChunk(handle, fname, "particles/moment_inertia", snap.inertia.data(), N*24);
+        readChunk(handle, fname, "particles/position", snap.pos.data(), N*24);
+        readChunk(handle, fname, "particles/orientation", snap.orientation.data(), N*32);
+        readChunk(handle, fname, "particles/velocity", snap.vel.data(), N*24);
+        readChunk(handle, fname, "particles/acceleration", snap.accel.data(), N*24);
+        readChunk(handle, fname, "particles/angmom", snap.angmom.data(), N*32);
+        readChunk(handle, fname, "particles/image", snap.image.data(), N*12);
+
+        for (unsigned int i = 0; i < n_group_prefixes; ++i)
+            {
+            const std::string prefix(group_prefixes[i]);
+            CheckpointPart::Groups groups;
+            groups.prefix = prefix;
+            groups.size = (prefix == "angles") ? 3 : (prefix == "dihedrals" || prefix == "impropers") ? 4 : 2;
+            groups.has_type = (prefix != "constraints");
+            groups.type_mapping = readTypes(handle, fname, prefix + "/types");
+
+            unsigned int n = 0;
+            if (!header_only)
+                readChunk(handle, fname, prefix + "/N", &n, 4);
+            groups.type_id.resize(groups.has_type ? n : 0);
+            groups.val.resize(groups.has_type ? 0 : n);
+            groups.members.resize(n*groups.size);
+            groups.tag.resize(n);
+
+            if (groups.has_type)
+                readChunk(handle, fname, prefix + "/typeid", groups.type_id.data(), n*4);
+            else
+                readChunk(handle, fname, prefix + "/value", groups.val.data(), n*8);
+            readChunk(handle, fname, prefix + "/group", groups.members.data(), n*groups.size*4);
+            readChunk(handle, fname, prefix + "/tag", groups.tag.data(), n*4);
+            p->groups.push_back(groups);
+            }
+        }
+    catch (...)
+        {
+        gsd_close(&handle);
+        throw;
+        }
+
+    gsd_close(&handle);
+    return p;
+    }
+
+/*! \param sysdef System definition to initialize
+
+    \a sysdef must be constructed from the snapshot of this reader. The particles and bonded groups of
+    the parts read by this rank are sent to the ranks owning them.
+*/
+void GSDCheckpointReader::readDistributed(std::shared_ptr<SystemDefinition> sysdef)
+    {
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+
+        {
+        unsigned int n = 0;
+        for (unsigned int i = 0; i < m_parts.size(); ++i)
+            n += m_parts[i]->particles.size;
+
+        SnapshotParticleData<double> snap;
+        snap.type_mapping = m_snapshot->particle_data.type_mapping;
+        snap.size = n;
+        std::vector<unsigned int> tags;
+        tags.reserve(n);
+        for (unsigned int i = 0; i < m_parts.size(); ++i)
+            {
+            const SnapshotParticleData<double>& src = m_parts[i]->particles;
+            append(snap.pos, src.pos);
+            append(snap.vel, src.vel);
+            append(snap.accel, src.accel);
+            append(snap.type, src.type);
+            append(snap.mass, src.mass);
+            append(snap.charge, src.charge);
+            append(snap.diameter, src.diameter);
+            append(snap.image, src.image);
+            append(snap.body, src.body);
+            append(snap.orientation, src.orientation);
+            append(snap.angmom, src.angmom);
+            append(snap.inertia, src.inertia);
+            snap.is_accel_set = snap.is_accel_set || src.is_accel_set;
+            append(tags, m_parts[i]->tags);
+            }
+
+        unsigned int nglobal = n;
+        #ifdef ENABLE_MPI
+        MPI_Allreduce(MPI_IN_PLACE, &nglobal, 1, MPI_UNSIGNED, MPI_SUM, m_exec_conf->getMPICommunicator());
+        #endif
+
+        pdata->initializeFromDistributedSnapshot(snap, tags, nglobal);
+        }
+
+    readGroups(sysdef->getBondData(), 0);
+    readGroups(sysdef->getAngleData(), 1);
+    readGroups(sysdef->getDihedralData(), 2);
+    readGroups(sysdef->getImproperData(), 3);
+    readGroups(sysdef->getConstraintData(), 4);
+    readGroups(sysdef->getPairData(), 5);
+
+    // release the parts
+    m_parts.clear();
+    }
+
+/*! \param group_data Bonded group data to initialize
+    \param i Index of the bonded groups in the parts
+*/
+template<class GroupData>
+void GSDCheckpointReader::readGroups(std::shared_ptr<GroupData> group_data, unsigned int i)
+    {
+    typedef typename GroupData::members_t members_t;
+    const unsigned int group_size = GroupData::size;
+
+    unsigned int n = 0;
+    for (unsigned int p = 0; p < m_parts.size(); ++p)
+        n += m_parts[p]->groups[i].tag.size();
+
+    unsigned int nglobal = n;
+    #ifdef ENABLE_MPI
+    MPI_Allreduce(MPI_IN_PLACE, &nglobal, 1, MPI_UNSIGNED, MPI_SUM, m_exec_conf->getMPICommunicator());
+    #endif
+    if (nglobal == 0)
+        return;
+
+    typename GroupData::Snapshot snap(n);
+    // the system definition already has the type names of the checkpoint
+    for (unsigned int t = 0; t < group_data->getNTypes(); ++t)
+        snap.type_mapping.push_back(group_data->getNameByType(t));
+    std::vector<unsigned int> tags;
+    tags.reserve(n);
+
+    unsigned int k = 0;
+    for (unsigned int p = 0; p < m_parts.size(); ++p)
+        {
+        const CheckpointPart::Groups& groups = m_parts[p]->groups[i];
+        if (groups.size != group_size)
+            {
+            m_exec_conf->msg->error() << "init.read_checkpoint: invalid " << groups.prefix << " in checkpoint" << endl;
+            throw runtime_error("Error reading checkpoint");
+            }
+
+        for (unsigned int j = 0; j < groups.tag.size(); ++j, ++k)
+            {
+            members_t members;
+            for (unsigned int m = 0; m < group_size; ++m)
+                members.tag[m] = groups.members[j*group_size + m];
+            snap.groups[k] = members;
+            if (GroupData::typemap_val)
+                snap.type_id[k] = groups.type_id[j];
+            else
+                snap.val[k] = Scalar(groups.val[j]);
+            }
+        append(tags, groups.tag);
+        }
+
+    group_data->initializeFromDistributedSnapshot(snap, tags, nglobal);
+    }
+
+void export_GSDCheckpointReader(py::module& m)
+    {
+    py::class_< GSDCheckpointReader, std::shared_ptr<GSDCheckpointReader> >(m,"GSDCheckpointReader")
+    .def(py::init<std::shared_ptr<const ExecutionConfiguration>, const string&>())
+    .def("getTimeStep", &GSDCheckpointReader::getTimeStep)
+    .def("getSnapshot", &GSDCheckpointReader::getSnapshot)
+    .def("readDistributed", &GSDCheckpointReader::readDistributed)
+    ;
+    }
@@ -0,0 +1,102 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+/*! \file GSDCheckpointReader.h
+    \brief Declares the GSDCheckpointReader class
+*/
+
+#ifdef NVCC
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "GSDCheckpointWriter.h"
+#include "hoomd/extern/gsd.h"
+
+#include <string>
+#include <memory>
+#include <vector>
+
+#include <hoomd/extern/pybind/include/pybind11/pybind11.h>
+
+#ifndef __GSD_CHECKPOINT_READER_H__
+#define __GSD_CHECKPOINT_READER_H__
+
+//! Forward declarations
+template <class Real> struct SnapshotSystemData;
+class SystemDefinition;
+
+//! Reads restart checkpoints written by GSDCheckpointWriter
+/*! The root rank reads the index file written by GSDCheckpointWriter, which references the slot of the
+    last complete checkpoint. Parts of an interrupted checkpoint in the other slot are never read. The
+    root rank then reads the box, dimensions and type names from the first part and broadcasts them, so
+    that the snapshot returned by getSnapshot() can construct the SystemDefinition and the domain
+    decomposition. Every rank reads a subset of the parts (part \a p is read by rank \a p modulo the
+    number of ranks), and readDistributed() sends the particles and bonded groups to their domains.
+    The checkpoint can be read on any number of ranks.
+
+    \ingroup data_structs
+*/
+class PYBIND11_EXPORT GSDCheckpointReader
+    {
+    public:
+        //! Read the header and the parts of this rank
+        GSDCheckpointReader(std::shared_ptr<const ExecutionConfiguration> exec_conf,
+                            const std::string &fname);
+
+        //! Destructor
+        ~GSDCheckpointReader();
+
+        //! Returns the timestep of the checkpoint
+        uint64_t getTimeStep() const
+            {
+            return m_timestep;
+            }
+
+        //! Get a snapshot with the box, dimensions and type names
+        std::shared_ptr< SnapshotSystemData<double> > getSnapshot() const
+            {
+            return m_snapshot;
+            }
+
+        //! Read the particles and bonded groups into the system
+        void readDistributed(std::shared_ptr<SystemDefinition> sysdef);
+
+    private:
+        std::shared_ptr<const ExecutionConfiguration> m_exec_conf;  //!< The execution configuration
+        std::string m_fname;                                        //!< Name of the index file
+        uint64_t m_timestep;                                        //!< Timestep of the checkpoint
+        unsigned int m_nparts;                                      //!< Number of parts in the checkpoint
+        unsigned int m_slot;                                        //!< Slot of the parts
+        std::shared_ptr< SnapshotSystemData<double> > m_snapshot;   //!< Snapshot with the header
+        std::vector< std::shared_ptr<CheckpointPart> > m_parts;     //!< Parts read by this rank
+
+        //! Open a file of the checkpoint with the given schema
+        void openFile(gsd_handle& handle, const std::string& fname, const std::string& schema,
+                      const std::string& description);
+
+        //! Read the index of the committed checkpoint
+        void readIndex();
+
+        //! Read a part from its file
+        std::shared_ptr<CheckpointPart> readPart(unsigned int part, bool header_only);
+
+        //! Read a data chunk of a part
+        void readChunk(gsd_handle& handle, const std::string& fname, const std::string& name,
+                       void *data, size_t expected_size);
+
+        //! Raise the error of any rank on all ranks
+        void checkError(bool failed);
+
+        //! Read a type list of a part
+        std::vector<std::string> readTypes(gsd_handle& handle, const std::string& fname, const std::string& name);
+
+        //! Send one kind of bonded groups to their domains
+        template<class GroupData>
+        void readGroups(std::shared_ptr<GroupData> group_data, unsigned int i);
+    };
+
+//! Exports GSDCheckpointReader to python
+void export_GSDCheckpointReader(pybind11::module& m);
+
+#endif
@@ -0,0 +1,647 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+/*! \file GSDCheckpointWriter.cc
+    \brief Defines the GSDCheckpointWriter class
+*/
+
+#include "GSDCheckpointWriter.h"
+#include "HOOMDVersion.h"
+#include "hoomd/extern/gsd.h"
+
+#include <algorithm>
+#include <cstdio>
+#include <sstream>
+#include <stdexcept>
+#include <string.h>
+#include <errno.h>
+
+using namespace std;
+namespace py = pybind11;
+
+/*! \param sysdef SystemDefinition containing the ParticleData to dump
+    \param fname Base name of the part files
+    \param async If true, write the parts in the background
+*/
+GSDCheckpointWriter::GSDCheckpointWriter(std::shared_ptr<SystemDefinition> sysdef,
+                                         const std::string &fname,
+                                         bool async)
+    : Analyzer(sysdef), m_fname(fname), m_async(async), m_slot(0), m_pending(false), m_pending_step(0)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing GSDCheckpointWriter: " << m_fname << " " << async << endl;
+
+    // never overwrite the slot of a checkpoint committed by a previous job first
+    unsigned int slot = 0;
+    if (m_exec_conf->isRoot() && readCommittedSlot(slot))
+        m_slot = 1 - slot;
+
+    #ifdef ENABLE_MPI
+    bcast(m_slot, 0, m_exec_conf->getMPICommunicator());
+    #endif
+    }
+
+GSDCheckpointWriter::~GSDCheckpointWriter()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying GSDCheckpointWriter" << endl;
+
+    // let a background write complete
+    if (m_thread.joinable())
+        m_thread.join();
+    }
+
+/*! \param fname Base name of the checkpoint
+    \param slot Slot of the checkpoint
+    \param part Index of the part
+    \returns The file name of the part
+*/
+std::string GSDCheckpointWriter::getPartName(const std::string& fname, unsigned int slot, unsigned int part)
+    {
+    std::ostringstream s;
+    s << fname << "." << slot << "." << part;
+    return s.str();
+    }
+
+/*! \param timestep Current time step of the simulation
+
+    Waits for the previous checkpoint to complete, copies the local data, and writes the part of this rank.
+    In synchronous mode, the checkpoint is committed when analyze() returns.
+*/
+void GSDCheckpointWriter::analyze(unsigned int timestep)
+    {
+    Analyzer::analyze(timestep);
+
+    // the previous checkpoint must be complete before the next one is written
+    wait();
+
+    if (m_prof)
+        m_prof->push("Dump checkpoint");
+
+    std::shared_ptr<CheckpointPart> part = collectPart(timestep);
+    const std::string fname = getPartName(m_fname, m_slot, part->part);
+    m_pending = true;
+    m_pending_step = timestep;
+
+    if (m_async)
+        {
+        m_thread = std::thread(&GSDCheckpointWriter::writePartNoThrow, this, part, fname);
+        }
+    else
+        {
+        writePartNoThrow(part, fname);
+        wait();
+        }
+
+    if (m_prof)
+        m_prof->pop();
+    }
+
+/*! Joins the thread writing the part in the background and reports any error it raised. In MPI
+    simulations, wait() is collective and returns once the parts of all ranks are complete. The root
+    rank then commits the checkpoint in the index file, and the next checkpoint is written to the other
+    slot.
+*/
+void GSDCheckpointWriter::wait()
+    {
+    if (m_thread.joinable())
+        m_thread.join();
+
+    if (!m_pending)
+        return;
+    m_pending = false;
+
+    // an incomplete checkpoint is not committed, the next one overwrites its slot
+    checkError(m_error);
+
+    std::string error;
+    if (m_exec_conf->isRoot())
+        {
+        try
+            {
+            writeIndex(m_pending_step, m_exec_conf->getNRanks());
+            }
+        catch (const std::exception& e)
+            {
+            error = e.what();
+            }
+        }
+    checkError(error);
+
+    m_slot = 1 - m_slot;
+    }
+
+/*! \param error Error message of this rank, empty if there was no error
+
+    The ranks write different parts, so every rank throws when any rank failed, and no rank is left
+    waiting on the others. \a error is cleared.
+*/
+void GSDCheckpointWriter::checkError(std::string& error)
+    {
+    unsigned int failed = !error.empty();
+    #ifdef ENABLE_MPI
+    if (m_comm)
+        MPI_Allreduce(MPI_IN_PLACE, &failed, 1, MPI_UNSIGNED, MPI_MAX, m_exec_conf->getMPICommunicator());
+    #endif
+
+    if (failed)
+        {
+        if (!error.empty())
+            m_exec_conf->msg->error() << "dump.checkpoint: " << error << endl;
+        error.clear();
+        throw runtime_error("Error writing checkpoint");
+        }
+    }
+
+/*! \param timestep Current time step
+    \returns A copy of the local data
+
+    When particles or groups have been removed, the tags are compacted to [0, N), see compactTags().
+*/
+std::shared_ptr<CheckpointPart> GSDCheckpointWriter::collectPart(unsigned int timestep)
+    {
+    std::shared_ptr<CheckpointPart> part(new CheckpointPart);
+    part->timestep = timestep;
+    part->dimensions = m_sysdef->getNDimensions();
+
+    const BoxDim& global_box = m_pdata->getGlobalBox();
+    Scalar3 L = global_box.getL();
+    part->box[0] = L.x;
+    part->box[1] = L.y;
+    part->box[2] = L.z;
+    part->box[3] = global_box.getTiltFactorXY();
+    part->box[4] = global_box.getTiltFactorXZ();
+    part->box[5] = global_box.getTiltFactorYZ();
+
+    part->nparts = m_exec_conf->getNRanks();
+    part->part = m_exec_conf->getRank();
+
+    const unsigned int N = m_pdata->getN();
+    SnapshotParticleData<double>& snap = part->particles;
+    snap.resize(N);
+    for (unsigned int i = 0; i < m_pdata->getNTypes(); ++i)
+        snap.type_mapping.push_back(m_pdata->getNameByType(i));
+    snap.is_accel_set = m_pdata->isAccelSet();
+    part->tags.resize(N);
+
+        {
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel(m_pdata->getVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar3> h_accel(m_pdata->getAccelerations(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(), access_location::host, access_mode::read);
+        ArrayHandle<int3> h_image(m_pdata->getImages(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_body(m_pdata->getBodies(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_angmom(m_pdata->getAngularMomentumArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar3> h_inertia(m_pdata->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+
+        for (unsigned int idx = 0; idx < N; ++idx)
+            {
+            part->tags[idx] = h_tag.data[idx];
+
+            const Scalar4 postype = h_pos.data[idx];
+            snap.pos[idx] = vec3<double>(postype.x, postype.y, postype.z);
+            snap.type[idx] = __scalar_as_int(postype.w);
+            const Scalar4 velmass = h_vel.data[idx];
+            snap.vel[idx] = vec3<double>(velmass.x, velmass.y, velmass.z);
+            snap.mass[idx] = velmass.w;
+            snap.accel[idx] = vec3<double>(h_accel.data[idx]);
+            snap.charge[idx] = h_charge.data[idx];
+            snap.diameter[idx] = h_diameter.data[idx];
+            snap.image[idx] = h_image.data[idx];
+            snap.body[idx] = h_body.data[idx];
+            snap.orientation[idx] = quat<double>(h_orientation.data[idx]);
+            snap.angmom[idx] = quat<double>(h_angmom.data[idx]);
+            snap.inertia[idx] = vec3<double>(h_inertia.data[idx]);
+            }
+        }
+
+    // compact tags of the members of the local groups that are owned by other ranks
+    std::map<unsigned int, unsigned int> remote_tags;
+
+    // the tags are the same on all ranks, so that all ranks compact them together
+    const unsigned int nglobal = m_pdata->getNGlobal();
+    const bool compact = nglobal > 0 && m_pdata->getMaximumTag() + 1 != nglobal;
+    if (compact)
+        {
+        compactTags(part->tags);
+
+        #ifdef ENABLE_MPI
+        if (m_exec_conf->getNRanks() > 1)
+            {
+            std::set<unsigned int> requests;
+            requestTags(m_sysdef->getBondData(), requests);
+            requestTags(m_sysdef->getAngleData(), requests);
+            requestTags(m_sysdef->getDihedralData(), requests);
+            requestTags(m_sysdef->getImproperData(), requests);
+            requestTags(m_sysdef->getConstraintData(), requests);
+            requestTags(m_sysdef->getPairData(), requests);
+            exchangeTags(part->tags, requests, remote_tags);
+            }
+        #endif
+        }
+
+    collectGroups(m_sysdef->getBondData(), "bonds", *part, compact, remote_tags);
+    collectGroups(m_sysdef->getAngleData(), "angles", *part, compact, remote_tags);
+    collectGroups(m_sysdef->getDihedralData(), "dihedrals", *part, compact, remote_tags);
+    collectGroups(m_sysdef->getImproperData(), "impropers", *part, compact, remote_tags);
+    collectGroups(m_sysdef->getConstraintData(), "constraints", *part, compact, remote_tags);
+    collectGroups(m_sysdef->getPairData(), "pairs", *part, compact, remote_tags);
+
+    return part;
+    }
+
+/*! \param tags Local tags, replaced by the compact tags
+
+    The compact tags number the tags of all ranks rank by rank, and in tag order on each rank. The offset of
+    each rank is the exclusive scan of the local counts, so that no rank needs the list of all active tags.
+
+    \note This method must be called collectively on all ranks.
+*/
+void GSDCheckpointWriter::compactTags(std::vector<unsigned int>& tags)
+    {
+    unsigned int n = tags.size();
+    unsigned int offset = 0;
+    #ifdef ENABLE_MPI
+    if (m_exec_conf->getNRanks() > 1)
+        {
+        MPI_Exscan(&n, &offset, 1, MPI_UNSIGNED, MPI_SUM, m_exec_conf->getMPICommunicator());
+
+        // the result of the scan is undefined on the first rank
+        if (m_exec_conf->getRank() == 0)
+            offset = 0;
+        }
+    #endif
+
+    std::vector<unsigned int> order(n);
+    for (unsigned int i = 0; i < n; ++i)
+        order[i] = i;
+    std::sort(order.begin(), order.end(),
+              [&tags](unsigned int a, unsigned int b) { return tags[a] < tags[b]; });
+
+    for (unsigned int i = 0; i < n; ++i)
+        tags[order[i]] = offset + i;
+    }
+
+#ifdef ENABLE_MPI
+/*! \param group_data Bonded group data
+    \param requests Set to add the tags of the members owned by other ranks to
+
+    Only the groups written by this rank are considered, see collectGroups().
+*/
+template<class GroupData>
+void GSDCheckpointWriter::requestTags(std::shared_ptr<GroupData> group_data, std::set<unsigned int>& requests)
+    {
+    typedef typename GroupData::members_t members_t;
+    const unsigned int group_size = GroupData::size;
+
+    ArrayHandle<members_t> h_members(group_data->getMembersArray(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+
+    const unsigned int N = m_pdata->getN();
+    for (unsigned int group_idx = 0; group_idx < group_data->getN(); ++group_idx)
+        {
+        const members_t members = h_members.data[group_idx];
+        if (h_rtag.data[members.tag[0]] >= N)
+            continue;
+
+        for (unsigned int j = 1; j < group_size; ++j)
+            {
+            if (h_rtag.data[members.tag[j]] >= N)
+                requests.insert(members.tag[j]);
+            }
+        }
+    }
+
+/*! \param compact_tags Compact tags of the local particles
+    \param requests Tags of the particles owned by other ranks
+    \param remote_tags Filled with the compact tags of the requested particles
+
+    The requests of all ranks are gathered, and every rank answers those for its local particles.
+
+    \note This method must be called collectively on all ranks.
+*/
+void GSDCheckpointWriter::exchangeTags(const std::vector<unsigned int>& compact_tags,
+                                       const std::set<unsigned int>& requests,
+                                       std::map<unsigned int, unsigned int>& remote_tags)
+    {
+    const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
+    const unsigned int n_ranks = m_exec_conf->getNRanks();
+
+    std::vector<unsigned int> local_requests(requests.begin(), requests.end());
+    std::vector< std::vector<unsigned int> > all_requests(n_ranks);
+    all_gather_v(local_requests, all_requests, mpi_comm);
+
+    // answer with pairs of tag and compact tag
+    std::vector<uint2> answers;
+    std::vector<unsigned int> send_counts(n_ranks, 0);
+        {
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+        const unsigned int N = m_pdata->getN();
+        for (unsigned int irank = 0; irank < n_ranks; ++irank)
+            {
+            for (unsigned int tag : all_requests[irank])
+                {
+                unsigned int idx = h_rtag.data[tag];
+                if (idx < N)
+                    {
+                    answers.push_back(make_uint2(tag, compact_tags[idx]));
+                    send_counts[irank]++;
+                    }
+                }
+            }
+        }
+
+    std::vector<uint2> recv_answers;
+    std::vector<unsigned int> recv_counts;
+    all_to_all_v(answers, send_counts, recv_answers, recv_counts, mpi_comm);
+
+    for (const uint2& answer : recv_answers)
+        remote_tags[answer.x] = answer.y;
+    }
+#endif
+
+/*! \param group_data Bonded group data to copy
+    \param prefix Name of the groups in the file
+    \param part Part to copy the groups into, with the compact tags of the local particles
+    \param compact True if the particle tags have been compacted
+    \param remote_tags Compact tags of the members owned by other ranks
+
+    Only the groups whose first member is owned by this rank are copied, so that every group is
+    written by exactly one rank.
+
+    \note This method must be called collectively on all ranks.
+*/
+template<class GroupData>
+void GSDCheckpointWriter::collectGroups(std::shared_ptr<GroupData> group_data,
+                                        const std::string& prefix,
+                                        CheckpointPart& part,
+                                        bool compact,
+                                        const std::map<unsigned int, unsigned int>& remote_tags)
+    {
+    typedef typename GroupData::members_t members_t;
+    const unsigned int group_size = GroupData::size;
+
+    CheckpointPart::Groups groups;
+    groups.prefix = prefix;
+    groups.size = group_size;
+    groups.has_type = GroupData::typemap_val;
+    for (unsigned int i = 0; i < group_data->getNTypes(); ++i)
+        groups.type_mapping.push_back(group_data->getNameByType(i));
+
+        {
+        ArrayHandle<members_t> h_members(group_data->getMembersArray(), access_location::host, access_mode::read);
+        ArrayHandle<typeval_t> h_typeval(group_data->getTypeValArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_group_tag(group_data->getTags(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+
+        const unsigned int N = m_pdata->getN();
+        for (unsigned int group_idx = 0; group_idx < group_data->getN(); ++group_idx)
+            {
+            const members_t members = h_members.data[group_idx];
+
+            // store the group on the rank owning its first member
+            if (h_rtag.data[members.tag[0]] >= N)
+                continue;
+
+            for (unsigned int j = 0; j < group_size; ++j)
+                {
+                unsigned int tag = members.tag[j];
+                if (compact)
+                    {
+                    unsigned int idx = h_rtag.data[tag];
+                    tag = (idx < N) ? part.tags[idx] : remote_tags.find(tag)->second;
+                    }
+                groups.members.push_back(tag);
+                }
+
+            if (groups.has_type)
+                groups.type_id.push_back(h_typeval.data[group_idx].type);
+            else
+                groups.val.push_back(h_typeval.data[group_idx].val);
+
+            groups.tag.push_back(h_group_tag.data[group_idx]);
+            }
+        }
+
+    // compact the group tags when groups have been removed
+    const unsigned int nglobal = group_data->getNGlobal();
+    if (nglobal > 0 && group_data->getMaximumTag() + 1 != nglobal)
+        compactTags(groups.tag);
+
+    part.groups.push_back(groups);
+    }
+
+namespace
+{
+//! Throw an exception for a gsd error code
+void check_gsd_error(int retval, const std::string& fname)
+    {
+    if (retval == -1)
+        throw runtime_error(std::string(strerror(errno)) + " - " + fname);
+    else if (retval != 0)
+        {
+        std::ostringstream s;
+        s << "Unknown error " << retval << " writing: " << fname;
+        throw runtime_error(s.str());
+        }
+    }
+
+//! Write a chunk, skipping empty ones
+void write_chunk(gsd_handle& handle, const std::string& fname, const char *name, enum gsd_type type,
+                 uint64_t N, uint32_t M, const void *data)
+    {
+    if (N == 0)
+        return;
+    check_gsd_error(gsd_write_chunk(&handle, name, type, N, M, 0, data), fname);
+    }
+
+//! Write a list of type names
+void write_types(gsd_handle& handle, const std::string& fname, const std::string& name,
+                 const std::vector<std::string>& type_mapping)
+    {
+    unsigned int max_len = 0;
+    for (unsigned int i = 0; i < type_mapping.size(); i++)
+        max_len = std::max(max_len, (unsigned int)type_mapping[i].size());
+    max_len += 1;  // for null
+
+    std::vector<char> types(max_len * type_mapping.size());
+    for (unsigned int i = 0; i < type_mapping.size(); i++)
+        strncpy(&types[max_len*i], type_mapping[i].c_str(), max_len);
+    write_chunk(handle, fname, name.c_str(), GSD_TYPE_UINT8, type_mapping.size(), max_len, types.data());
+    }
+}
+
+/*! \param part Part to write
+    \param fname File name of the part
+
+    The slot of the part is not referenced by the index file while it is written. writePart() does not
+    use the messenger or MPI, so that it can run in a background thread. Errors are thrown as exceptions
+    with the full error message.
+*/
+void GSDCheckpointWriter::writePart(std::shared_ptr<CheckpointPart> part, const std::string& fname)
+    {
+    std::ostringstream application;
+    application << "HOOMD-blue " << HOOMD_VERSION_LONG;
+
+    gsd_handle handle;
+    check_gsd_error(gsd_create_and_open(&handle,
+                                        fname.c_str(),
+                                        application.str().c_str(),
+                                        "hoomd-checkpoint",
+                                        gsd_make_version(1,0),
+                                        GSD_OPEN_APPEND,
+                                        0),
+                    fname);
+
+    try
+        {
+        write_chunk(handle, fname, "configuration/step", GSD_TYPE_UINT64, 1, 1, &part->timestep);
+        write_chunk(handle, fname, "configuration/dimensions", GSD_TYPE_UINT8, 1, 1, &part->dimensions);
+        write_chunk(handle, fname, "configuration/box", GSD_TYPE_DOUBLE, 6, 1, part->box);
+        write_chunk(handle, fname, "checkpoint/nparts", GSD_TYPE_UINT32, 1, 1, &part->nparts);
+        write_chunk(handle, fname, "checkpoint/part", GSD_TYPE_UINT32, 1, 1, &part->part);
+
+        const SnapshotParticleData<double>& snap = part->particles;
+        const uint64_t N = snap.size;
+        uint8_t accel_set = snap.is_accel_set;
+        check_gsd_error(gsd_write_chunk(&handle, "particles/N", GSD_TYPE_UINT32, 1, 1, 0, &snap.size), fname);
+        write_types(handle, fname, "particles/types", snap.type_mapping);
+        write_chunk(handle, fname, "particles/accel_set", GSD_TYPE_UINT8, 1, 1, &accel_set);
+        write_chunk(handle, fname, "particles/tag", GSD_TYPE_UINT32, N, 1, part->tags.data());
+        write_chunk(handle, fname, "particles/typeid", GSD_TYPE_UINT32, N, 1, snap.type.data());
+        write_chunk(handle, fname, "particles/mass", GSD_TYPE_DOUBLE, N, 1, snap.mass.data());
+        write_chunk(handle, fname, "particles/charge", GSD_TYPE_DOUBLE, N, 1, snap.charge.data());
+        write_chunk(handle, fname, "particles/diameter", GSD_TYPE_DOUBLE, N, 1, snap.diameter.data());
+        write_chunk(handle, fname, "particles/body", GSD_TYPE_UINT32, N, 1, snap.body.data());
+        write_chunk(handle, fname, "particles/moment_inertia", GSD_TYPE_DOUBLE, N, 3, snap.inertia.data());
+        write_chunk(handle, fname, "particles/position", GSD_TYPE_DOUBLE, N, 3, snap.pos.data());
+        write_chunk(handle, fname, "particles/orientation", GSD_TYPE_DOUBLE, N, 4, snap.orientation.data());
+        write_chunk(handle, fname, "particles/velocity", GSD_TYPE_DOUBLE, N, 3, snap.vel.data());
+        write_chunk(handle, fname, "particles/acceleration", GSD_TYPE_DOUBLE, N, 3, snap.accel.data());
+        write_chunk(handle, fname, "particles/angmom", GSD_TYPE_DOUBLE, N, 4, snap.angmom.data());
+        write_chunk(handle, fname, "particles/image", GSD_TYPE_INT32, N, 3, snap.image.data());
+
+        for (unsigned int i = 0; i < part->groups.size(); ++i)
+            {
+            const CheckpointPart::Groups& groups = part->groups[i];
+            const uint32_t n = groups.tag.size();
+            check_gsd_error(gsd_write_chunk(&handle, (groups.prefix + "/N").c_str(), GSD_TYPE_UINT32, 1, 1, 0, &n), fname);
+            write_types(handle, fname, groups.prefix + "/types", groups.type_mapping);
+            if (groups.has_type)
+                write_chunk(handle, fname, (groups.prefix + "/typeid").c_str(), GSD_TYPE_UINT32, n, 1, groups.type_id.data());
+            else
+                write_chunk(handle, fname, (groups.prefix + "/value").c_str(), GSD_TYPE_DOUBLE, n, 1, groups.val.data());
+            write_chunk(handle, fname, (groups.prefix + "/group").c_str(), GSD_TYPE_UINT32, n, groups.size, groups.members.data());
+            write_chunk(handle, fname, (groups.prefix + "/tag").c_str(), GSD_TYPE_UINT32, n, 1, groups.tag.data());
+            }
+
+        check_gsd_error(gsd_end_frame(&handle), fname);
+        }
+    catch (...)
+        {
+        gsd_close(&handle);
+        throw;
+        }
+
+    check_gsd_error(gsd_close(&handle), fname);
+    }
+
+/*! \param part Part to write
+    \param fname File name of the part
+*/
+void GSDCheckpointWriter::writePartNoThrow(std::shared_ptr<CheckpointPart> part, const std::string& fname)
+    {
+    try
+        {
+        writePart(part, fname);
+        }
+    catch (const std::exception& e)
+        {
+        m_error = e.what();
+        }
+    }
+
+/*! \param slot Set to the slot of the committed checkpoint
+    \returns True if the index file exists and is valid
+
+    Called on the root rank only. A missing or invalid index file is not an error, there is no committed
+    checkpoint to protect.
+*/
+bool GSDCheckpointWriter::readCommittedSlot(unsigned int& slot)
+    {
+    gsd_handle handle;
+    if (gsd_open(&handle, m_fname.c_str(), GSD_OPEN_READONLY) != 0)
+        return false;
+
+    bool found = false;
+    if (std::string(handle.header.schema) == std::string("hoomd-checkpoint-index"))
+        {
+        const struct gsd_index_entry* entry = gsd_find_chunk(&handle, 0, "checkpoint/slot");
+        uint32_t s = 0;
+        if (entry != NULL && entry->N == 1 && entry->M == 1 && entry->type == GSD_TYPE_UINT32
+            && gsd_read_chunk(&handle, &s, entry) == 0 && s < 2)
+            {
+            slot = s;
+            found = true;
+            }
+        }
+
+    gsd_close(&handle);
+    return found;
+    }
+
+/*! \param timestep Time step of the checkpoint
+    \param nparts Number of parts in the checkpoint
+
+    Called on the root rank once the parts of all ranks are complete. The index file is written to a
+    temporary file and renamed, so that it always references a complete checkpoint.
+*/
+void GSDCheckpointWriter::writeIndex(uint64_t timestep, unsigned int nparts)
+    {
+    const std::string tmp_fname = m_fname + ".tmp";
+
+    std::ostringstream application;
+    application << "HOOMD-blue " << HOOMD_VERSION_LONG;
+
+    gsd_handle handle;
+    check_gsd_error(gsd_create_and_open(&handle,
+                                        tmp_fname.c_str(),
+                                        application.str().c_str(),
+                                        "hoomd-checkpoint-index",
+                                        gsd_make_version(1,0),
+                                        GSD_OPEN_APPEND,
+                                        0),
+                    tmp_fname);
+
+    try
+        {
+        const uint32_t slot = m_slot;
+        write_chunk(handle, tmp_fname, "configuration/step", GSD_TYPE_UINT64, 1, 1, &timestep);
+        write_chunk(handle, tmp_fname, "checkpoint/nparts", GSD_TYPE_UINT32, 1, 1, &nparts);
+        write_chunk(handle, tmp_fname, "checkpoint/slot", GSD_TYPE_UINT32, 1, 1, &slot);
+        check_gsd_error(gsd_end_frame(&handle), tmp_fname);
+        }
+    catch (...)
+        {
+        gsd_close(&handle);
+        throw;
+        }
+
+    check_gsd_error(gsd_close(&handle), tmp_fname);
+
+    // replace the index of the previous checkpoint
+    if (std::rename(tmp_fname.c_str(), m_fname.c_str()) != 0)
+        throw runtime_error(std::string(strerror(errno)) + " - " + m_fname);
+    }
+
+void export_GSDCheckpointWriter(py::module& m)
+    {
+    py::class_<GSDCheckpointWriter, std::shared_ptr<GSDCheckpointWriter> >(m,"GSDCheckpointWriter",py::base<Analyzer>())
+        .def(py::init< std::shared_ptr<SystemDefinition>, std::string, bool>())
+        .def("wait", &GSDCheckpointWriter::wait)
+        .def("setAsync", &GSDCheckpointWriter::setAsync)
+        .def("getAsync", &GSDCheckpointWriter::getAsync)
+    ;
+    }
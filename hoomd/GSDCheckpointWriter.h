@@ -0,0 +1,161 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+#ifndef __GSDCHECKPOINTWRITER_H__
+#define __GSDCHECKPOINTWRITER_H__
+
+#include "Analyzer.h"
+#include "ParticleData.h"
+
+#include <map>
+#include <memory>
+#include <set>
+#include <string>
+#include <thread>
+#include <vector>
+
+/*! \file GSDCheckpointWriter.h
+    \brief Declares the GSDCheckpointWriter class
+*/
+
+#ifdef NVCC
+#error This header cannot be compiled by nvcc
+#endif
+
+#include <hoomd/extern/pybind/include/pybind11/pybind11.h>
+
+//! Local data of a checkpoint part
+/*! The particles and bonded groups are stored with compact tags in [0, N), in double precision. Each
+    bonded group is stored by the rank that owns its first member, so that every group is stored once.
+*/
+struct CheckpointPart
+    {
+    //! Bonded groups of one kind
+    struct Groups
+        {
+        std::string prefix;                     //!< Name of the groups in the file
+        unsigned int size;                      //!< Number of members in each group
+        bool has_type;                          //!< True if the groups have types, false for values
+        std::vector<std::string> type_mapping;  //!< Type names
+        std::vector<unsigned int> type_id;      //!< Type of each group
+        std::vector<double> val;                //!< Value of each group
+        std::vector<unsigned int> members;      //!< Tags of the members (size per group)
+        std::vector<unsigned int> tag;          //!< Tag of each group
+        };
+
+    uint64_t timestep;                          //!< Time step of the checkpoint
+    uint8_t dimensions;                         //!< Dimensionality of the system
+    double box[6];                              //!< Box lengths and tilt factors
+    unsigned int nparts;                        //!< Number of parts in the checkpoint
+    unsigned int part;                          //!< Index of this part
+    SnapshotParticleData<double> particles;     //!< Particles owned by this rank
+    std::vector<unsigned int> tags;             //!< Tags of the particles
+    std::vector<Groups> groups;                 //!< Bonded groups stored by this rank
+    };
+
+//! Writes restart checkpoints with all ranks in parallel
+/*! GSDCheckpointWriter writes a restart checkpoint without collecting the system on the root rank. Every
+    rank writes a GSD file (a part) holding the particles in its domain and the bonded groups whose first
+    member it owns. The parts use the hoomd-checkpoint schema and store the number of parts, so that
+    GSDCheckpointReader can restart on a different number of ranks.
+
+    The checkpoints alternate between two slots: part \a i in slot \a s of a checkpoint \a fname is
+    written to \a fname.s.i. Once the parts of all ranks are complete, wait() has the root rank commit the
+    checkpoint by replacing the index file \a fname, which stores the slot, time step and number of parts
+    of the last complete checkpoint. The next checkpoint is written to the other slot, so a job that is
+    interrupted while writing leaves the committed slot untouched. On construction, the writer starts in
+    the slot that is not referenced by an existing index file.
+
+    In asynchronous mode, analyze() only copies the local data and a separate thread writes the part,
+    so that the simulation continues while the file is written. The checkpoint is committed by the next
+    call to analyze() or wait().
+
+    \ingroup analyzers
+*/
+class PYBIND11_EXPORT GSDCheckpointWriter : public Analyzer
+    {
+    public:
+        //! Construct the writer
+        GSDCheckpointWriter(std::shared_ptr<SystemDefinition> sysdef,
+                            const std::string &fname,
+                            bool async=false);
+
+        //! Destructor
+        ~GSDCheckpointWriter();
+
+        //! Write a checkpoint at the current timestep
+        void analyze(unsigned int timestep);
+
+        //! Wait for a checkpoint written in the background to complete
+        void wait();
+
+        //! Set the asynchronous mode
+        void setAsync(bool async)
+            {
+            m_async = async;
+            }
+
+        //! Get the asynchronous mode
+        bool getAsync() const
+            {
+            return m_async;
+            }
+
+        //! Get the file name of a part
+        static std::string getPartName(const std::string& fname, unsigned int slot, unsigned int part);
+
+    private:
+        std::string m_fname;                //!< Name of the index file, and base name of the parts
+        bool m_async;                       //!< True if the parts are written in the background
+        std::thread m_thread;               //!< Thread writing the part in the background
+        std::string m_error;                //!< Error raised by the background thread
+        unsigned int m_slot;                //!< Slot the next checkpoint is written to
+        bool m_pending;                     //!< True if a checkpoint is written but not committed
+        uint64_t m_pending_step;            //!< Time step of the pending checkpoint
+
+        //! Copy the local data into a part
+        std::shared_ptr<CheckpointPart> collectPart(unsigned int timestep);
+
+        //! Copy the local bonded groups of one kind
+        template<class GroupData>
+        void collectGroups(std::shared_ptr<GroupData> group_data,
+                           const std::string& prefix,
+                           CheckpointPart& part,
+                           bool compact,
+                           const std::map<unsigned int, unsigned int>& remote_tags);
+
+        //! Compact the local tags over all ranks
+        void compactTags(std::vector<unsigned int>& tags);
+
+        #ifdef ENABLE_MPI
+        //! Collect the tags of the members of the local groups that are owned by other ranks
+        template<class GroupData>
+        void requestTags(std::shared_ptr<GroupData> group_data, std::set<unsigned int>& requests);
+
+        //! Look up the compact tags of particles owned by other ranks
+        void exchangeTags(const std::vector<unsigned int>& compact_tags,
+                          const std::set<unsigned int>& requests,
+                          std::map<unsigned int, unsigned int>& remote_tags);
+        #endif
+
+        //! Write a part to its file
+        void writePart(std::shared_ptr<CheckpointPart> part, const std::string& fname);
+
+        //! Write a part and store any error
+        void writePartNoThrow(std::shared_ptr<CheckpointPart> part, const std::string& fname);
+
+        //! Raise an error of any rank on all ranks
+        void checkError(std::string& error);
+
+        //! Read the slot of the committed checkpoint from the index file
+        bool readCommittedSlot(unsigned int& slot);
+
+        //! Commit the pending checkpoint in the index file
+        void writeIndex(uint64_t timestep, unsigned int nparts);
+    };
+
+//! Exports the GSDCheckpointWriter class to python
+void export_GSDCheckpointWriter(pybind11::module& m);
+
+#endif
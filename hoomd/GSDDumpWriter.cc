@@ -47,6 +47,13 @@ GSDDumpWriter::GSDDumpWriter(std::shared_ptr<SystemDefinition> sysdef,
                         m_group(group)
     {
     m_exec_conf->msg->notice(5) << "Constructing GSDDumpWriter: " << m_fname << " " << overwrite << " " << truncate << endl;
+
+    // the members are looked up on the root rank only
+    if (m_group->isDynamic())
+        {
+        m_exec_conf->msg->error() << "dump.gsd: Dynamic groups are not supported, use a static group" << endl;
+        throw runtime_error("Error initializing GSDDumpWriter");
+        }
     }
 
 void GSDDumpWriter::checkError(int retval)
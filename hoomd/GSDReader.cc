@@ -11,8 +11,14 @@
 #include "GSDReader.h"
 #include "SnapshotSystemData.h"
 #include "ExecutionConfiguration.h"
+#include "SystemDefinition.h"
 #include "hoomd/extern/gsd.h"
+#include <hoomd/extern/pybind/include/pybind11/numpy.h>
 #include <string.h>
+#include <unistd.h>
+#include <errno.h>
+
+#include <algorithm>
 
 #include <stdexcept>
 using namespace std;
@@ -23,100 +29,275 @@ namespace py = pybind11;
     \param name File name to read
     \param frame Frame index to read from the file
     \param from_end Count frames back from the end of the file
+    \param distributed Open the file on all ranks and read the particles in parallel with readDistributed()
 
     The GSDReader constructor opens the GSD file, initializes an empty snapshot, and reads the file into
-    memory (on the root rank).
+    memory (on the root rank). In distributed mode, all ranks open the file and only read the header and
+    type names into the snapshot.
 */
 GSDReader::GSDReader(std::shared_ptr<const ExecutionConfiguration> exec_conf,
                      const std::string &name,
                      const uint64_t frame,
-                     bool from_end)
-    : m_exec_conf(exec_conf), m_timestep(0), m_name(name), m_frame(frame)
+                     bool from_end,
+                     bool distributed)
+    : m_exec_conf(exec_conf), m_timestep(0), m_name(name), m_frame(frame), m_distributed(distributed), m_N(0),
+      m_open(false)
     {
     m_snapshot = std::shared_ptr< SnapshotSystemData<float> >(new SnapshotSystemData<float>);
 
     #ifdef ENABLE_MPI
-    // if we are not the root processor, do not perform file I/O
-    if (!m_exec_conf->isRoot())
+    // if we are not the root processor, do not perform file I/O unless reading in parallel
+    if (!m_exec_conf->isRoot() && !m_distributed)
         {
         return;
         }
     #endif
 
+    openFile();
+    selectFrame(from_end);
+    readSelectedFrame();
+    }
+
+/*! \param exec_conf The execution configuration
+    \param name File name to read
+    \param distributed Open the file on all ranks and read the particles in parallel with readDistributed()
+
+    Only open the file and map its index. The snapshot is empty until a frame is read with readFrame().
+*/
+GSDReader::GSDReader(std::shared_ptr<const ExecutionConfiguration> exec_conf,
+                     const std::string &name,
+                     bool distributed)
+    : m_exec_conf(exec_conf), m_timestep(0), m_name(name), m_frame(0), m_distributed(distributed), m_N(0),
+      m_open(false)
+    {
+    m_snapshot = std::shared_ptr< SnapshotSystemData<float> >(new SnapshotSystemData<float>);
+
+    #ifdef ENABLE_MPI
+    // if we are not the root processor, do not perform file I/O unless reading in parallel
+    if (!m_exec_conf->isRoot() && !m_distributed)
+        {
+        return;
+        }
+    #endif
+
+    openFile();
+    }
+
+/*! Opens the file and validates the schema.
+*/
+void GSDReader::openFile()
+    {
     // open the GSD file in read mode
-    m_exec_conf->msg->notice(3) << "data.gsd_snapshot: open gsd file " << name << endl;
-    int retval = gsd_open(&m_handle, name.c_str(), GSD_OPEN_READONLY);
+    m_exec_conf->msg->notice(3) << "data.gsd_snapshot: open gsd file " << m_name << endl;
+    int retval = gsd_open(&m_handle, m_name.c_str(), GSD_OPEN_READONLY);
     if (retval == -1)
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << strerror(errno) << " - " << name << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << strerror(errno) << " - " << m_name << endl;
         throw runtime_error("Error opening GSD file");
         }
     else if (retval == -2)
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << name << " is not a valid GSD file" << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << m_name << " is not a valid GSD file" << endl;
         throw runtime_error("Error opening GSD file");
         }
     else if (retval == -3)
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid GSD file version in " << name << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid GSD file version in " << m_name << endl;
         throw runtime_error("Error opening GSD file");
         }
     else if (retval == -4)
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Corrupt GSD file: " << name << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Corrupt GSD file: " << m_name << endl;
         throw runtime_error("Error opening GSD file");
         }
     else if (retval == -5)
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Out of memory opening: " << name << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Out of memory opening: " << m_name << endl;
         throw runtime_error("Error opening GSD file");
         }
     else if (retval != 0)
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Unknown error opening: " << name << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Unknown error opening: " << m_name << endl;
         throw runtime_error("Error opening GSD file");
         }
 
     // validate schema
     if (string(m_handle.header.schema) != string("hoomd"))
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid schema in " << name << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid schema in " << m_name << endl;
         throw runtime_error("Error opening GSD file");
         }
     if (m_handle.header.schema_version >= gsd_make_version(2,0))
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid schema version in " << name << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid schema version in " << m_name << endl;
         throw runtime_error("Error opening GSD file");
         }
 
+    m_open = true;
+    }
+
+/*! \param from_end Count frames back from the end of the file
+*/
+void GSDReader::selectFrame(bool from_end)
+    {
     // set frame from the end of the file if requested
     uint64_t nframes = gsd_get_nframes(&m_handle);
-    if (from_end && frame <= nframes)
-        m_frame = nframes - frame;
+    if (from_end && m_frame <= nframes)
+        m_frame = nframes - m_frame;
 
     // validate number of frames
     if (m_frame >= nframes)
         {
-        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Cannot read frame " << m_frame << " " << name << " only has " << gsd_get_nframes(&m_handle) << " frames" << endl;
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Cannot read frame " << m_frame << " " << m_name << " only has " << gsd_get_nframes(&m_handle) << " frames" << endl;
         throw runtime_error("Error opening GSD file");
         }
+    }
 
+/*! Read the header, and either the particles and bonded groups or only their type names in distributed mode.
+*/
+void GSDReader::readSelectedFrame()
+    {
     readHeader();
-    readParticles();
-    readTopology();
+    if (m_distributed)
+        {
+        m_snapshot->particle_data.type_mapping = readTypes(m_frame, "particles/types");
+        readTopologyTypes();
+        }
+    else
+        {
+        readParticles();
+        readTopology();
+        }
     }
 
 GSDReader::~GSDReader()
     {
+    if (m_open)
+        gsd_close(&m_handle);
+    }
+
+/*! \returns The number of frames in the file, on all ranks
+*/
+uint64_t GSDReader::getNFrames() const
+    {
+    uint64_t nframes = 0;
+    if (m_open)
+        nframes = gsd_get_nframes(const_cast<gsd_handle*>(&m_handle));
+
+    // the file is only open on the root unless it is read in parallel
     #ifdef ENABLE_MPI
-    // if we are not the root processor, do not perform file I/O
-    if (!m_exec_conf->isRoot())
+    if (!m_distributed)
+        bcast(nframes, 0, m_exec_conf->getMPICommunicator());
+    #endif
+
+    return nframes;
+    }
+
+/*! \param frame Frame index to read from the file
+    \param from_end Count frames back from the end of the file
+    \returns The snapshot of the frame
+
+    Reads the frame into a new snapshot using the index mapped when the file was opened. The snapshot
+    returned previously is not modified. In distributed mode, the snapshot only holds the box, dimensions
+    and type names, and readDistributed() reads the particles of the new frame.
+*/
+std::shared_ptr< SnapshotSystemData<float> > GSDReader::readFrame(uint64_t frame, bool from_end)
+    {
+    m_frame = frame;
+    m_timestep = 0;
+    m_N = 0;
+    m_snapshot = std::shared_ptr< SnapshotSystemData<float> >(new SnapshotSystemData<float>);
+
+    if (m_open)
         {
-        return;
+        selectFrame(from_end);
+        readSelectedFrame();
         }
-    #endif
 
-    gsd_close(&m_handle);
+    return m_snapshot;
+    }
+
+/*! \param frame Frame index to read from
+    \param name Name of the data chunk
+    \returns The chunk as a numpy array with N rows (and M columns if M > 1), or None on ranks that did not
+              open the file
+
+    If the chunk is not present at this frame, read it from frame 0, following the defaults of the
+    HOOMD schema.
+*/
+py::object GSDReader::readChunkPy(uint64_t frame, const std::string& name)
+    {
+    if (!m_open)
+        return py::none();
+
+    if (frame >= gsd_get_nframes(&m_handle))
+        {
+        m_exec_conf->msg->error() << "data.gsd_reader: " << "Cannot read frame " << frame << " " << m_name << " only has " << gsd_get_nframes(&m_handle) << " frames" << endl;
+        throw runtime_error("Error reading GSD file");
+        }
+
+    const struct gsd_index_entry* entry = gsd_find_chunk(&m_handle, frame, name.c_str());
+    if (entry == NULL && frame != 0)
+        entry = gsd_find_chunk(&m_handle, 0, name.c_str());
+
+    if (entry == NULL)
+        {
+        m_exec_conf->msg->error() << "data.gsd_reader: " << "Chunk " << name << " not found in " << m_name << endl;
+        throw runtime_error("Error reading GSD file");
+        }
+
+    py::dtype dtype;
+    switch (entry->type)
+        {
+        case GSD_TYPE_UINT8: dtype = py::dtype::of<uint8_t>(); break;
+        case GSD_TYPE_UINT16: dtype = py::dtype::of<uint16_t>(); break;
+        case GSD_TYPE_UINT32: dtype = py::dtype::of<uint32_t>(); break;
+        case GSD_TYPE_UINT64: dtype = py::dtype::of<uint64_t>(); break;
+        case GSD_TYPE_INT8: dtype = py::dtype::of<int8_t>(); break;
+        case GSD_TYPE_INT16: dtype = py::dtype::of<int16_t>(); break;
+        case GSD_TYPE_INT32: dtype = py::dtype::of<int32_t>(); break;
+        case GSD_TYPE_INT64: dtype = py::dtype::of<int64_t>(); break;
+        case GSD_TYPE_FLOAT: dtype = py::dtype::of<float>(); break;
+        case GSD_TYPE_DOUBLE: dtype = py::dtype::of<double>(); break;
+        default:
+            m_exec_conf->msg->error() << "data.gsd_reader: " << "Invalid type of chunk " << name << " in " << m_name << endl;
+            throw runtime_error("Error reading GSD file");
+        }
+
+    std::vector<ssize_t> shape(1, entry->N);
+    if (entry->M > 1)
+        shape.push_back(entry->M);
+    py::array data(dtype, shape);
+
+    m_exec_conf->msg->notice(7) << "data.gsd_reader: reading chunk " << name << endl;
+    checkRead(gsd_read_chunk(&m_handle, data.mutable_data(), entry));
+    return data;
+    }
+
+/*! \param retval Return value of gsd_read_chunk
+*/
+void GSDReader::checkRead(int retval)
+    {
+    if (retval == -1)
+        {
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << strerror(errno) << " - " << m_name << endl;
+        throw runtime_error("Error reading GSD file");
+        }
+    else if (retval == -2)
+        {
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Unknown error reading: " << m_name << endl;
+        throw runtime_error("Error reading GSD file");
+        }
+    else if (retval == -3)
+        {
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid GSD file " << m_name << endl;
+        throw runtime_error("Error reading GSD file");
+        }
+    else if (retval != 0)
+        {
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Unknown error reading: " << m_name << endl;
+        throw runtime_error("Error reading GSD file");
+        }
     }
 
 /*! \param data Pointer to data to read into
@@ -153,31 +334,78 @@ bool GSDReader::readChunk(void *data, uint64_t frame, const char *name, size_t e
             m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Expecting " << expected_size << " bytes in " << name << " but found " << actual_size << endl;
             throw runtime_error("Error reading GSD file");
             }
-        int retval = gsd_read_chunk(&m_handle, data, entry);
+        checkRead(gsd_read_chunk(&m_handle, data, entry));
+
+        return true;
+        }
+    }
+
+/*! \param data Pointer to data to read into
+    \param frame Frame index to read from
+    \param name Name of the data chunk
+    \param row_size Expected size of one row of the data chunk in bytes.
+    \param first First row to read
+    \param count Number of rows to read
+    \param cur_n N in the current frame.
+
+    Attempts to read the rows [first, first+count) of the data chunk of the given name at the given frame,
+    falling back to frame 0 in the same way as readChunk(). Only the requested byte range is read from
+    the file, so that each rank can read its own slice of a chunk.
+
+    Return true if data is actually read from the file.
+*/
+bool GSDReader::readChunkRange(void *data,
+                               uint64_t frame,
+                               const char *name,
+                               size_t row_size,
+                               uint64_t first,
+                               uint64_t count,
+                               uint64_t cur_n)
+    {
+    const struct gsd_index_entry* entry = gsd_find_chunk(&m_handle, frame, name);
+    if (entry == NULL && frame != 0)
+        entry = gsd_find_chunk(&m_handle, 0, name);
+
+    if (entry == NULL || entry->N != cur_n)
+        {
+        m_exec_conf->msg->notice(10) << "data.gsd_snapshot: chunk not found " << name << endl;
+        return false;
+        }
 
-        if (retval == -1)
+    m_exec_conf->msg->notice(7) << "data.gsd_snapshot: reading rows " << first << " to " << first+count << " of chunk " << name << endl;
+    size_t actual_size = entry->M * gsd_sizeof_type((enum gsd_type)entry->type);
+    if (actual_size != row_size)
+        {
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Expecting " << row_size << " bytes per row in " << name << " but found " << actual_size << endl;
+        throw runtime_error("Error reading GSD file");
+        }
+    if (entry->location == 0 || first + count > entry->N
+        || entry->location + (first+count)*row_size > (uint64_t)m_handle.file_size)
+        {
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid GSD file " << m_name << endl;
+        throw runtime_error("Error reading GSD file");
+        }
+
+    // read the byte range, retrying partial reads
+    char *ptr = (char *)data;
+    size_t remaining = count*row_size;
+    off_t offset = entry->location + first*row_size;
+    while (remaining > 0)
+        {
+        ssize_t bytes_read = pread(m_handle.fd, ptr, remaining, offset);
+        if (bytes_read == -1 && errno == EINTR)
+            continue;
+        if (bytes_read <= 0)
             {
             m_exec_conf->msg->error() << "data.gsd_snapshot: " << strerror(errno) << " - " << m_name << endl;
             throw runtime_error("Error reading GSD file");
             }
-        else if (retval == -2)
-            {
-            m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Unknown error reading: " << m_name << endl;
-            throw runtime_error("Error reading GSD file");
-            }
-        else if (retval == -3)
-            {
-            m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid GSD file " << m_name << endl;
-            throw runtime_error("Error reading GSD file");
-            }
-        else if (retval != 0)
-            {
-            m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Unknown error reading: " << m_name << endl;
-            throw runtime_error("Error reading GSD file");
-            }
-
-        return true;
+        ptr += bytes_read;
+        remaining -= bytes_read;
+        offset += bytes_read;
         }
+
+    return true;
     }
 
 /*! \param frame Frame index to read from
@@ -208,28 +436,7 @@ std::vector<std::string> GSDReader::readTypes(uint64_t frame, const char *name)
         {
         size_t actual_size = entry->N * entry->M * gsd_sizeof_type((enum gsd_type)entry->type);
         std::vector<char> data(actual_size);
-        int retval = gsd_read_chunk(&m_handle, &data[0], entry);
-
-        if (retval == -1)
-            {
-            m_exec_conf->msg->error() << "data.gsd_snapshot: " << strerror(errno) << " - " << m_name << endl;
-            throw runtime_error("Error reading GSD file");
-            }
-        else if (retval == -2)
-            {
-            m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Unknown error reading: " << m_name << endl;
-            throw runtime_error("Error reading GSD file");
-            }
-        else if (retval == -3)
-            {
-            m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Invalid GSD file " << m_name << endl;
-            throw runtime_error("Error reading GSD file");
-            }
-        else if (retval != 0)
-            {
-            m_exec_conf->msg->error() << "data.gsd_snapshot: " << "Unknown error reading: " << m_name << endl;
-            throw runtime_error("Error reading GSD file");
-            }
+        checkRead(gsd_read_chunk(&m_handle, &data[0], entry));
 
         type_mapping.clear();
         for (unsigned int i = 0; i < entry->N; i++)
@@ -264,7 +471,11 @@ void GSDReader::readHeader()
         m_exec_conf->msg->error() << "data.gsd_snapshot: " << "cannot read a file with 0 particles" << endl;
         throw runtime_error("Error reading GSD file");
         }
-    m_snapshot->particle_data.resize(N);
+    m_N = N;
+
+    // in distributed mode, the particles are only read in slices
+    if (!m_distributed)
+        m_snapshot->particle_data.resize(N);
     }
 
 /*! Read the same data chunks for particles
@@ -360,6 +571,165 @@ void GSDReader::readTopology()
         }
     }
 
+/*! Read the type names of the bonded groups for the snapshot of a distributed read
+*/
+void GSDReader::readTopologyTypes()
+    {
+    unsigned int N = 0;
+    readChunk(&N, m_frame, "bonds/N", 4);
+    if (N > 0)
+        m_snapshot->bond_data.type_mapping = readTypes(m_frame, "bonds/types");
+
+    N = 0;
+    readChunk(&N, m_frame, "angles/N", 4);
+    if (N > 0)
+        m_snapshot->angle_data.type_mapping = readTypes(m_frame, "angles/types");
+
+    N = 0;
+    readChunk(&N, m_frame, "dihedrals/N", 4);
+    if (N > 0)
+        m_snapshot->dihedral_data.type_mapping = readTypes(m_frame, "dihedrals/types");
+
+    N = 0;
+    readChunk(&N, m_frame, "impropers/N", 4);
+    if (N > 0)
+        m_snapshot->improper_data.type_mapping = readTypes(m_frame, "impropers/types");
+
+    if (m_handle.header.schema_version >= gsd_make_version(1,1))
+        {
+        N = 0;
+        readChunk(&N, m_frame, "pairs/N", 4);
+        if (N > 0)
+            m_snapshot->pair_data.type_mapping = readTypes(m_frame, "pairs/types");
+        }
+    }
+
+/*! \param sysdef System definition to initialize
+
+    Every rank reads a contiguous slice of the rows of each per-particle chunk. The particle data places
+    the particles of each slice into their domains and sends them to their owners. The bonded groups are
+    also read in slices, and each group is sent to the ranks owning its members.
+
+    \a sysdef must be constructed from the snapshot of this reader so that it has the box and type names
+    of the frame. Without a domain decomposition, the frame is read into the snapshot and \a sysdef is
+    initialized from it.
+*/
+void GSDReader::readDistributed(std::shared_ptr<SystemDefinition> sysdef)
+    {
+    if (!m_distributed)
+        {
+        m_exec_conf->msg->error() << "data.gsd_snapshot: " << m_name << " was not opened for distributed reads" << endl;
+        throw runtime_error("Error reading GSD file");
+        }
+
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+
+    #ifdef ENABLE_MPI
+    if (pdata->getDomainDecomposition())
+        {
+            {
+            uint64_t first, n;
+            getSlice(m_N, first, n);
+
+            SnapshotParticleData<float> snap(n);
+            snap.type_mapping = m_snapshot->particle_data.type_mapping;
+
+            // the snapshot already has default values, if a chunk is not found, the value
+            // is already at the default, and the failed read is not a problem
+            readChunkRange(snap.type.data(), m_frame, "particles/typeid", 4, first, n, m_N);
+            readChunkRange(snap.mass.data(), m_frame, "particles/mass", 4, first, n, m_N);
+            readChunkRange(snap.charge.data(), m_frame, "particles/charge", 4, first, n, m_N);
+            readChunkRange(snap.diameter.data(), m_frame, "particles/diameter", 4, first, n, m_N);
+            readChunkRange(snap.body.data(), m_frame, "particles/body", 4, first, n, m_N);
+            readChunkRange(snap.inertia.data(), m_frame, "particles/moment_inertia", 12, first, n, m_N);
+            readChunkRange(snap.pos.data(), m_frame, "particles/position", 12, first, n, m_N);
+            readChunkRange(snap.orientation.data(), m_frame, "particles/orientation", 16, first, n, m_N);
+            readChunkRange(snap.vel.data(), m_frame, "particles/velocity", 12, first, n, m_N);
+            readChunkRange(snap.angmom.data(), m_frame, "particles/angmom", 16, first, n, m_N);
+            readChunkRange(snap.image.data(), m_frame, "particles/image", 12, first, n, m_N);
+
+            std::vector<unsigned int> tags(n);
+            for (unsigned int i = 0; i < n; ++i)
+                tags[i] = first + i;
+            pdata->initializeFromDistributedSnapshot(snap, tags, m_N);
+            }
+
+        readGroupsDistributed(sysdef->getBondData(), "bonds", m_snapshot->bond_data.type_mapping);
+        readGroupsDistributed(sysdef->getAngleData(), "angles", m_snapshot->angle_data.type_mapping);
+        readGroupsDistributed(sysdef->getDihedralData(), "dihedrals", m_snapshot->dihedral_data.type_mapping);
+        readGroupsDistributed(sysdef->getImproperData(), "impropers", m_snapshot->improper_data.type_mapping);
+        readGroupsDistributed(sysdef->getConstraintData(), "constraints", m_snapshot->constraint_data.type_mapping);
+        if (m_handle.header.schema_version >= gsd_make_version(1,1))
+            readGroupsDistributed(sysdef->getPairData(), "pairs", m_snapshot->pair_data.type_mapping);
+        }
+    else
+    #endif
+        {
+        m_snapshot->particle_data.resize(m_N);
+        readParticles();
+        readTopology();
+        sysdef->initializeFromSnapshot(m_snapshot);
+        }
+    }
+
+/*! \param N Number of rows
+    \param first Set to the first row read by this rank
+    \param n Set to the number of rows read by this rank
+
+    The rows are split into equal contiguous slices, one per rank.
+*/
+void GSDReader::getSlice(uint64_t N, uint64_t& first, uint64_t& n) const
+    {
+    unsigned int n_ranks = m_exec_conf->getNRanks();
+    unsigned int rank = m_exec_conf->getRank();
+    first = N * rank / n_ranks;
+    n = N * (rank+1) / n_ranks - first;
+    }
+
+/*! \param group_data Bonded group data to initialize
+    \param prefix Name of the bonded groups in the file
+    \param type_mapping Type names of the bonded groups
+
+    Each rank reads a slice of the groups, and the bonded group data sends each group to the ranks
+    owning its members.
+*/
+template<class GroupData>
+void GSDReader::readGroupsDistributed(std::shared_ptr<GroupData> group_data,
+                                      const std::string& prefix,
+                                      const std::vector<std::string>& type_mapping)
+    {
+    typedef typename GroupData::members_t members_t;
+
+    unsigned int N = 0;
+    readChunk(&N, m_frame, (prefix + "/N").c_str(), 4);
+    if (N == 0)
+        return;
+
+    uint64_t first, n;
+    getSlice(N, first, n);
+
+    // read the slice of groups
+    typename GroupData::Snapshot snap(n);
+    snap.type_mapping = type_mapping;
+    if (GroupData::typemap_val)
+        {
+        readChunkRange(snap.type_id.data(), m_frame, (prefix + "/typeid").c_str(), 4, first, n, N);
+        }
+    else
+        {
+        std::vector<float> data(n);
+        readChunkRange(data.data(), m_frame, (prefix + "/value").c_str(), 4, first, n, N);
+        for (unsigned int i=0; i < n; i++)
+            snap.val[i] = Scalar(data[i]);
+        }
+    readChunkRange(snap.groups.data(), m_frame, (prefix + "/group").c_str(), sizeof(members_t), first, n, N);
+
+    std::vector<unsigned int> tags(n);
+    for (unsigned int i = 0; i < n; ++i)
+        tags[i] = first + i;
+    group_data->initializeFromDistributedSnapshot(snap, tags, N);
+    }
+
 pybind11::list GSDReader::readTypeShapesPy(uint64_t frame)
     {
     std::vector<std::string> type_mapping = this->readTypes(frame, "particles/type_shapes");
@@ -373,9 +743,16 @@ void export_GSDReader(py::module& m)
     {
     py::class_< GSDReader, std::shared_ptr<GSDReader> >(m,"GSDReader")
     .def(py::init<std::shared_ptr<const ExecutionConfiguration>, const string&, const uint64_t, bool>())
+    .def(py::init<std::shared_ptr<const ExecutionConfiguration>, const string&, const uint64_t, bool, bool>())
+    .def(py::init<std::shared_ptr<const ExecutionConfiguration>, const string&, bool>())
     .def("getTimeStep", &GSDReader::getTimeStep)
+    .def("getFrame", &GSDReader::getFrame)
+    .def("getNFrames", &GSDReader::getNFrames)
+    .def("readFrame", &GSDReader::readFrame)
+    .def("readChunkPy", &GSDReader::readChunkPy)
     .def("getSnapshot", &GSDReader::getSnapshot)
     .def("clearSnapshot", &GSDReader::clearSnapshot)
+    .def("readDistributed", &GSDReader::readDistributed)
     .def("readTypeShapesPy", &GSDReader::readTypeShapesPy)
     ;
     }
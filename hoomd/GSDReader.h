@@ -25,11 +25,22 @@
 
 //! Forward declarations
 template <class Real> struct SnapshotSystemData;
+class SystemDefinition;
 
 //! Reads a GSD input file
 /*! Read an input GSD file and generate a system snapshot. GSDReader can read any frame from a GSD
     file into the snapshot. For information on the GSD specification, see http://gsd.readthedocs.io/
 
+    In distributed mode, every rank opens the file and the snapshot only holds the box, dimensions and
+    type names. readDistributed() then reads the particles and bonded groups in parallel, with every
+    rank reading a slice of each chunk and sending the particles directly to their domains, so that the
+    full system is never held by a single rank.
+
+    The file stays open for the lifetime of the reader, and the GSD library maps its frame index into
+    memory when it is opened. A reader can therefore be reused to read many frames with readFrame(), or
+    individual chunks with readChunkPy(), without scanning the index of the file again. The constructor
+    that takes no frame only opens the file, and reads no frame until one is requested.
+
     \ingroup data_structs
 */
 class PYBIND11_EXPORT GSDReader
@@ -39,7 +50,13 @@ class PYBIND11_EXPORT GSDReader
         GSDReader(std::shared_ptr<const ExecutionConfiguration> exec_conf,
                   const std::string &name,
                   const uint64_t frame,
-                  bool from_end);
+                  bool from_end,
+                  bool distributed=false);
+
+        //! Opens the file without reading a frame
+        GSDReader(std::shared_ptr<const ExecutionConfiguration> exec_conf,
+                  const std::string &name,
+                  bool distributed);
 
         //! Destructor
         ~GSDReader();
@@ -70,6 +87,18 @@ class PYBIND11_EXPORT GSDReader
             return m_frame;
             }
 
+        //! Get the number of frames in the file
+        uint64_t getNFrames() const;
+
+        //! Read a different frame of the file into a new snapshot
+        std::shared_ptr< SnapshotSystemData<float> > readFrame(uint64_t frame, bool from_end);
+
+        //! Read a data chunk into a numpy array
+        pybind11::object readChunkPy(uint64_t frame, const std::string& name);
+
+        //! Read the particles and bonded groups directly into the system
+        void readDistributed(std::shared_ptr<SystemDefinition> sysdef);
+
         //! Helper function to read a quantity from the file
         bool readChunk(void *data, uint64_t frame, const char *name, size_t expected_size, unsigned int cur_n=0);
 
@@ -94,14 +123,48 @@ class PYBIND11_EXPORT GSDReader
         uint64_t m_frame;                                            //!< Cached frame
         std::shared_ptr< SnapshotSystemData<float> > m_snapshot;   //!< The snapshot to read
         gsd_handle m_handle;                                         //!< Handle to the file
+        bool m_distributed;                                          //!< True if the file is read by all ranks
+        unsigned int m_N;                                            //!< Number of particles in the frame
+        bool m_open;                                                 //!< True if this rank opened the file
 
         //! Helper function to read a type list from the file
         std::vector<std::string> readTypes(uint64_t frame, const char *name);
 
+        //! Helper function to read a range of rows of a quantity from the file
+        bool readChunkRange(void *data,
+                            uint64_t frame,
+                            const char *name,
+                            size_t row_size,
+                            uint64_t first,
+                            uint64_t count,
+                            uint64_t cur_n);
+
+        //! Open the file
+        void openFile();
+
+        //! Select and validate the frame
+        void selectFrame(bool from_end);
+
+        //! Read the selected frame into the snapshot
+        void readSelectedFrame();
+
+        //! Throw an error for a failed chunk read
+        void checkRead(int retval);
+
         // helper functions to read sections of the file
         void readHeader();
         void readParticles();
         void readTopology();
+        void readTopologyTypes();
+
+        //! Get the rows of a chunk read by this rank
+        void getSlice(uint64_t N, uint64_t& first, uint64_t& n) const;
+
+        //! Read a type of bonded groups in parallel
+        template<class GroupData>
+        void readGroupsDistributed(std::shared_ptr<GroupData> group_data,
+                                   const std::string& prefix,
+                                   const std::vector<std::string>& type_mapping);
     };
 
 //! Exports GSDReader to python
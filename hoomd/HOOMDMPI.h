@@ -416,6 +416,49 @@ void all_gather_v(const T& in_value, std::vector<T> & out_values, const MPI_Comm
     delete[] rbuf;
     }
 
+//! Wrapper around MPI_Alltoallv for vectors of plain data
+/*! \param in_values Values to send, grouped by destination rank
+    \param send_counts Number of values sent to each rank
+    \param out_values Values received from all ranks, grouped by source rank
+    \param recv_counts Filled with the number of values received from each rank
+    \param mpi_comm The MPI communicator
+
+    Unlike the other wrappers, the values are sent as raw bytes and are not serialized, so \a T must be
+    trivially copyable.
+*/
+template<typename T>
+void all_to_all_v(const std::vector<T>& in_values,
+                  const std::vector<unsigned int>& send_counts,
+                  std::vector<T>& out_values,
+                  std::vector<unsigned int>& recv_counts,
+                  const MPI_Comm mpi_comm)
+    {
+    int size;
+    MPI_Comm_size(mpi_comm, &size);
+    assert(send_counts.size() == (unsigned int) size);
+
+    // exchange the number of values
+    recv_counts.resize(size);
+    MPI_Alltoall((void *)&send_counts[0], 1, MPI_UNSIGNED, &recv_counts[0], 1, MPI_UNSIGNED, mpi_comm);
+
+    // convert to byte counts and displacements
+    std::vector<int> send_bytes(size), send_displs(size), recv_bytes(size), recv_displs(size);
+    unsigned int n_recv = 0;
+    for (unsigned int i = 0; i < (unsigned int) size; ++i)
+        {
+        send_bytes[i] = send_counts[i] * sizeof(T);
+        send_displs[i] = (i > 0) ? send_displs[i-1] + send_bytes[i-1] : 0;
+        recv_bytes[i] = recv_counts[i] * sizeof(T);
+        recv_displs[i] = (i > 0) ? recv_displs[i-1] + recv_bytes[i-1] : 0;
+        n_recv += recv_counts[i];
+        }
+
+    out_values.resize(n_recv);
+    MPI_Alltoallv((void *)in_values.data(), &send_bytes[0], &send_displs[0], MPI_BYTE,
+                  (void *)out_values.data(), &recv_bytes[0], &recv_displs[0], MPI_BYTE,
+                  mpi_comm);
+    }
+
 //! Wrapper around MPI_Send that handles any serializable object
 template<typename T>
 void send(const T& val,const unsigned int dest, const MPI_Comm mpi_comm)
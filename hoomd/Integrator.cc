@@ -310,8 +310,28 @@ Scalar Integrator::computeTotalMomentum(unsigned int timestep)
 void Integrator::computeNetForce(unsigned int timestep)
     {
     std::vector< std::shared_ptr<ForceCompute> >::iterator force_compute;
-    for (force_compute = m_forces.begin(); force_compute != m_forces.end(); ++force_compute)
-        (*force_compute)->compute(timestep);
+
+    #ifdef ENABLE_MPI
+    if (m_comm && m_comm->isGhostUpdatePending())
+        {
+        // compute the forces that overlap the pending ghost update first, then finish the update
+        // for the forces that need the ghost particles
+        for (force_compute = m_forces.begin(); force_compute != m_forces.end(); ++force_compute)
+            if ((*force_compute)->overlapsGhostUpdate())
+                (*force_compute)->compute(timestep);
+
+        m_comm->finishUpdateGhosts(timestep);
+
+        for (force_compute = m_forces.begin(); force_compute != m_forces.end(); ++force_compute)
+            if (!(*force_compute)->overlapsGhostUpdate())
+                (*force_compute)->compute(timestep);
+        }
+    else
+    #endif
+        {
+        for (force_compute = m_forces.begin(); force_compute != m_forces.end(); ++force_compute)
+            (*force_compute)->compute(timestep);
+        }
 
     if (m_prof)
         {
@@ -1193,6 +1193,296 @@ void ParticleData::initializeFromSnapshot(const SnapshotParticleData<Real>& snap
     m_num_types_signal.emit();
     }
 
+//! Initialize from a snapshot distributed over the ranks
+/*! \param snapshot Particles on this rank
+    \param tags Tags of the particles in \a snapshot
+    \param nglobal Global number of particles
+
+    Every rank holds an arbitrary subset of the particles, and the subsets of all ranks together hold
+    each of the tags [0, \a nglobal) exactly once. Each rank places its particles into their domains and
+    sends them directly to their owners, so the system never has to be collected on a single rank.
+    The type mapping of \a snapshot must be the same on all ranks.
+
+    Without a domain decomposition, \a snapshot must hold all of the particles.
+
+    \pre In parallel simulations, the local box size must be set before a call to initializeFromDistributedSnapshot().
+ */
+template <class Real>
+void ParticleData::initializeFromDistributedSnapshot(const SnapshotParticleData<Real>& snapshot,
+                                                     const std::vector<unsigned int>& tags,
+                                                     unsigned int nglobal)
+    {
+    // check that all fields in the snapshot have correct length
+    if (! snapshot.validate() || tags.size() != snapshot.size)
+        {
+        m_exec_conf->msg->error() << "init.*: invalid particle data snapshot."
+                                << std::endl << std::endl;
+        throw std::runtime_error("Error initializing particle data.");
+        }
+
+    for (unsigned int snap_idx = 0; snap_idx < snapshot.size; ++snap_idx)
+        {
+        if (tags[snap_idx] >= nglobal)
+            {
+            m_exec_conf->msg->error() << "init.*: Particle tag " << tags[snap_idx] << " out of bounds!"
+                                      << " The number of particles is " << nglobal << std::endl;
+            throw std::runtime_error("Error initializing ParticleData");
+            }
+        }
+
+    #ifdef ENABLE_MPI
+    if (!m_decomposition)
+    #endif
+        {
+        if (snapshot.size != nglobal)
+            {
+            m_exec_conf->msg->error() << "init.*: distributed particle data must be held by a single rank without "
+                                      << "a domain decomposition." << std::endl;
+            throw std::runtime_error("Error initializing ParticleData");
+            }
+
+        // order the particles by tag
+        SnapshotParticleData<Real> ordered(nglobal);
+        ordered.type_mapping = snapshot.type_mapping;
+        ordered.is_accel_set = snapshot.is_accel_set;
+        std::vector<bool> found(nglobal, false);
+        for (unsigned int snap_idx = 0; snap_idx < snapshot.size; ++snap_idx)
+            {
+            const unsigned int tag = tags[snap_idx];
+            if (found[tag])
+                {
+                m_exec_conf->msg->error() << "init.*: Particle tag " << tag << " was given more than once" << std::endl;
+                throw std::runtime_error("Error initializing ParticleData");
+                }
+            found[tag] = true;
+
+            ordered.pos[tag] = snapshot.pos[snap_idx];
+            ordered.vel[tag] = snapshot.vel[snap_idx];
+            ordered.accel[tag] = snapshot.accel[snap_idx];
+            ordered.type[tag] = snapshot.type[snap_idx];
+            ordered.mass[tag] = snapshot.mass[snap_idx];
+            ordered.charge[tag] = snapshot.charge[snap_idx];
+            ordered.diameter[tag] = snapshot.diameter[snap_idx];
+            ordered.image[tag] = snapshot.image[snap_idx];
+            ordered.body[tag] = snapshot.body[snap_idx];
+            ordered.orientation[tag] = snapshot.orientation[snap_idx];
+            ordered.angmom[tag] = snapshot.angmom[snap_idx];
+            ordered.inertia[tag] = snapshot.inertia[snap_idx];
+            }
+        initializeFromSnapshot(ordered);
+        return;
+        }
+
+    #ifdef ENABLE_MPI
+    m_exec_conf->msg->notice(4) << "ParticleData: initializing from distributed snapshot" << std::endl;
+
+    // remove all ghost particles
+    removeAllGhostParticles();
+
+    // clear set of active tags
+    m_tag_set.clear();
+
+    // clear reservoir of recycled tags
+    while (! m_recycled_tags.empty())
+        m_recycled_tags.pop();
+
+    const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
+    unsigned int n_ranks = m_exec_conf->getNRanks();
+
+    // place the particles into their domains
+    std::vector<unsigned int> send_counts(n_ranks, 0);
+    std::vector<unsigned int> dest(snapshot.size);
+    std::vector<pdata_element> in(snapshot.size);
+        {
+        ArrayHandle<unsigned int> h_cart_ranks(m_decomposition->getCartRanks(), access_location::host, access_mode::read);
+        const Index3D& di = m_decomposition->getDomainIndexer();
+
+        BoxDim global_box = m_global_box;
+
+        for (unsigned int snap_idx = 0; snap_idx < snapshot.size; ++snap_idx)
+            {
+            // determine domain the particle is placed into
+            Scalar3 pos = vec_to_scalar3(snapshot.pos[snap_idx]);
+            Scalar3 f = m_global_box.makeFraction(pos);
+            int i= f.x * ((Scalar)di.getW());
+            int j= f.y * ((Scalar)di.getH());
+            int k= f.z * ((Scalar)di.getD());
+
+            // wrap particles that are exactly on a boundary
+            char3 flags = make_char3(0,0,0);
+            if (i == (int) di.getW())
+                {
+                i = 0;
+                flags.x = 1;
+                }
+
+            if (j == (int) di.getH())
+                {
+                j = 0;
+                flags.y = 1;
+                }
+
+            if (k == (int) di.getD())
+                {
+                k = 0;
+                flags.z = 1;
+                }
+
+            int3 img = snapshot.image[snap_idx];
+
+            // only wrap if the particles is on one of the boundaries
+            uchar3 periodic = make_uchar3(flags.x,flags.y,flags.z);
+            global_box.setPeriodic(periodic);
+            global_box.wrap(pos, img, flags);
+
+            // place particle using actual domain fractions, not global box fraction
+            unsigned int rank = m_decomposition->placeParticle(m_global_box, pos, h_cart_ranks.data);
+
+            if (rank >= n_ranks)
+                {
+                m_exec_conf->msg->error() << "init.*: Particle " << tags[snap_idx] << " out of bounds." << std::endl;
+                m_exec_conf->msg->error() << "Cartesian coordinates: " << std::endl;
+                m_exec_conf->msg->error() << "x: " << pos.x << " y: " << pos.y << " z: " << pos.z << std::endl;
+                m_exec_conf->msg->error() << "Fractional coordinates: " << std::endl;
+                m_exec_conf->msg->error() << "f.x: " << f.x << " f.y: " << f.y << " f.z: " << f.z << std::endl;
+                Scalar3 lo = m_global_box.getLo();
+                Scalar3 hi = m_global_box.getHi();
+                m_exec_conf->msg->error() << "Global box lo: (" << lo.x << ", " << lo.y << ", " << lo.z << ")" << std::endl;
+                m_exec_conf->msg->error() << "           hi: (" << hi.x << ", " << hi.y << ", " << hi.z << ")" << std::endl;
+
+                throw std::runtime_error("Error initializing from snapshot.");
+                }
+
+            pdata_element& p = in[snap_idx];
+            p.pos = make_scalar4(pos.x, pos.y, pos.z, __int_as_scalar(snapshot.type[snap_idx]));
+            p.vel = make_scalar4(snapshot.vel[snap_idx].x, snapshot.vel[snap_idx].y, snapshot.vel[snap_idx].z, snapshot.mass[snap_idx]);
+            p.accel = vec_to_scalar3(snapshot.accel[snap_idx]);
+            p.charge = snapshot.charge[snap_idx];
+            p.diameter = snapshot.diameter[snap_idx];
+            p.image = img;
+            p.body = snapshot.body[snap_idx];
+            p.orientation = quat_to_scalar4(snapshot.orientation[snap_idx]);
+            p.angmom = quat_to_scalar4(snapshot.angmom[snap_idx]);
+            p.inertia = vec_to_scalar3(snapshot.inertia[snap_idx]);
+            p.tag = tags[snap_idx];
+
+            dest[snap_idx] = rank;
+            send_counts[rank]++;
+            }
+        }
+
+    // order the particles by their destination
+    std::vector<pdata_element> sendbuf(snapshot.size);
+        {
+        std::vector<unsigned int> offsets(n_ranks, 0);
+        for (unsigned int i = 1; i < n_ranks; ++i)
+            offsets[i] = offsets[i-1] + send_counts[i-1];
+        for (unsigned int snap_idx = 0; snap_idx < snapshot.size; ++snap_idx)
+            sendbuf[offsets[dest[snap_idx]]++] = in[snap_idx];
+        }
+    in.clear();
+
+    // send the particles directly to their owners
+    std::vector<pdata_element> recvbuf;
+    std::vector<unsigned int> recv_counts;
+    all_to_all_v(sendbuf, send_counts, recvbuf, recv_counts, mpi_comm);
+    sendbuf.clear();
+
+    // check that all particles were distributed
+    unsigned int nrecv_global = recvbuf.size();
+    MPI_Allreduce(MPI_IN_PLACE, &nrecv_global, 1, MPI_UNSIGNED, MPI_SUM, mpi_comm);
+    if (nrecv_global != nglobal)
+        {
+        m_exec_conf->msg->error() << "init.*: expected " << nglobal << " particles but found " << nrecv_global << std::endl;
+        throw std::runtime_error("Error initializing ParticleData");
+        }
+
+    m_type_mapping = snapshot.type_mapping;
+    m_nparticles = recvbuf.size();
+
+    // resize array for reverse-lookup tags
+    m_rtag.resize(nglobal);
+
+        {
+        // reset all reverse lookup tags to NOT_LOCAL flag
+        ArrayHandle<unsigned int> h_rtag(getRTags(), access_location::host, access_mode::overwrite);
+        std::fill(h_rtag.data, h_rtag.data + nglobal, NOT_LOCAL);
+        }
+
+    // update list of active tags
+    for (unsigned int tag = 0; tag < nglobal; tag++)
+        {
+        m_tag_set.insert(tag);
+        }
+
+    // Now that active tag list has changed, invalidate the cache
+    m_invalid_cached_tags = true;
+
+    // resize particle data
+    resize(m_nparticles);
+
+        {
+        // Load particle data
+        ArrayHandle< Scalar4 > h_pos(m_pos, access_location::host, access_mode::overwrite);
+        ArrayHandle< Scalar4 > h_vel(m_vel, access_location::host, access_mode::overwrite);
+        ArrayHandle< Scalar3 > h_accel(m_accel, access_location::host, access_mode::overwrite);
+        ArrayHandle< int3 > h_image(m_image, access_location::host, access_mode::overwrite);
+        ArrayHandle< Scalar > h_charge(m_charge, access_location::host, access_mode::overwrite);
+        ArrayHandle< Scalar > h_diameter(m_diameter, access_location::host, access_mode::overwrite);
+        ArrayHandle< unsigned int > h_body(m_body, access_location::host, access_mode::overwrite);
+        ArrayHandle< Scalar4 > h_orientation(m_orientation, access_location::host, access_mode::overwrite);
+        ArrayHandle< Scalar4 > h_angmom(m_angmom, access_location::host, access_mode::overwrite);
+        ArrayHandle< Scalar3 > h_inertia(m_inertia, access_location::host, access_mode::overwrite);
+        ArrayHandle< unsigned int > h_tag(m_tag, access_location::host, access_mode::overwrite);
+        ArrayHandle< unsigned int > h_comm_flag(m_comm_flags, access_location::host, access_mode::overwrite);
+        ArrayHandle< unsigned int > h_rtag(m_rtag, access_location::host, access_mode::readwrite);
+
+        for (unsigned int idx = 0; idx < m_nparticles; idx++)
+            {
+            const pdata_element& p = recvbuf[idx];
+            if (h_rtag.data[p.tag] != NOT_LOCAL)
+                {
+                m_exec_conf->msg->error() << "init.*: Particle tag " << p.tag << " was given more than once" << std::endl;
+                throw std::runtime_error("Error initializing ParticleData");
+                }
+
+            h_pos.data[idx] = p.pos;
+            h_vel.data[idx] = p.vel;
+            h_accel.data[idx] = p.accel;
+            h_charge.data[idx] = p.charge;
+            h_diameter.data[idx] = p.diameter;
+            h_image.data[idx] = p.image;
+            h_tag.data[idx] = p.tag;
+            h_rtag.data[p.tag] = idx;
+            h_body.data[idx] = p.body;
+            h_orientation.data[idx] = p.orientation;
+            h_angmom.data[idx] = p.angmom;
+            h_inertia.data[idx] = p.inertia;
+
+            h_comm_flag.data[idx] = 0; // initialize with zero
+            }
+        }
+
+    // copy over accel_set flag from snapshot
+    unsigned int accel_set = snapshot.is_accel_set;
+    MPI_Allreduce(MPI_IN_PLACE, &accel_set, 1, MPI_UNSIGNED, MPI_MAX, mpi_comm);
+    m_accel_set = accel_set;
+
+    // set global number of particles
+    setNGlobal(nglobal);
+
+    // notify listeners about resorting of local particles
+    notifyParticleSort();
+
+    // zero the origin
+    m_origin = make_scalar3(0,0,0);
+    m_o_image = make_int3(0,0,0);
+
+    // notify listeners that number of types has changed
+    m_num_types_signal.emit();
+    #endif
+    }
+
 //! take a particle data snapshot
 /* \param snapshot The snapshot to write to
    \returns a map to lookup the snapshot index from a particle tag
@@ -2481,6 +2771,9 @@ template ParticleData::ParticleData(const SnapshotParticleData<double>& snapshot
                                            std::shared_ptr<DomainDecomposition> decomposition
                                           );
 template void ParticleData::initializeFromSnapshot<double>(const SnapshotParticleData<double> & snapshot, bool ignore_bodies);
+template void ParticleData::initializeFromDistributedSnapshot<double>(const SnapshotParticleData<double>& snapshot,
+                                                                     const std::vector<unsigned int>& tags,
+                                                                     unsigned int nglobal);
 template std::map<unsigned int, unsigned int> ParticleData::takeSnapshot<double>(SnapshotParticleData<double> &snapshot);
 
 
@@ -2490,6 +2783,9 @@ template ParticleData::ParticleData(const SnapshotParticleData<float>& snapshot,
                                            std::shared_ptr<DomainDecomposition> decomposition
                                           );
 template void ParticleData::initializeFromSnapshot<float>(const SnapshotParticleData<float> & snapshot, bool ignore_bodies);
+template void ParticleData::initializeFromDistributedSnapshot<float>(const SnapshotParticleData<float>& snapshot,
+                                                                     const std::vector<unsigned int>& tags,
+                                                                     unsigned int nglobal);
 template std::map<unsigned int, unsigned int> ParticleData::takeSnapshot<float>(SnapshotParticleData<float> &snapshot);
 
 
@@ -2866,6 +3162,107 @@ void ParticleData::addParticles(const std::vector<pdata_element>& in)
     notifyParticleSort();
     }
 
+namespace
+{
+//! Find the rank of the particle directory holding a tag
+/*! The directory splits the tags [0, n_tags) into equal contiguous slices, one per rank.
+ */
+unsigned int directory_rank(unsigned int tag, unsigned int n_tags, unsigned int n_ranks)
+    {
+    unsigned int r = uint64_t(tag) * n_ranks / n_tags;
+    while (r+1 < n_ranks && uint64_t(n_tags) * (r+1) / n_ranks <= tag)
+        ++r;
+    while (r > 0 && uint64_t(n_tags) * r / n_ranks > tag)
+        --r;
+    return r;
+    }
+}
+
+/*! \param tags Tags of the particles to look up
+    \param ranks Filled with the rank owning each particle in \a tags
+
+    Each rank may look up the owners of any particles, and the lookups are collective. A directory
+    of the particle owners is distributed over the ranks in equal slices of the tags, so that no rank
+    needs to know the owners of all particles. Tags of particles that do not exist are given the
+    owner NOT_LOCAL.
+ */
+void ParticleData::getOwnerRanks(const std::vector<unsigned int>& tags, std::vector<unsigned int>& ranks)
+    {
+    const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
+    const unsigned int n_ranks = m_exec_conf->getNRanks();
+    const unsigned int my_rank = m_exec_conf->getRank();
+    const unsigned int n_tags = getNGlobal() ? getMaximumTag() + 1 : 0;
+    const unsigned int first_tag = uint64_t(n_tags) * my_rank / n_ranks;
+    const unsigned int last_tag = uint64_t(n_tags) * (my_rank+1) / n_ranks;
+
+    // fill the directory with the tags of the local particles
+    std::vector<unsigned int> directory(last_tag - first_tag, NOT_LOCAL);
+        {
+        ArrayHandle<unsigned int> h_tag(getTags(), access_location::host, access_mode::read);
+
+        std::vector<unsigned int> send_counts(n_ranks, 0);
+        for (unsigned int idx = 0; idx < getN(); ++idx)
+            send_counts[directory_rank(h_tag.data[idx], n_tags, n_ranks)]++;
+
+        std::vector<unsigned int> offsets(n_ranks, 0);
+        for (unsigned int r = 1; r < n_ranks; ++r)
+            offsets[r] = offsets[r-1] + send_counts[r-1];
+        std::vector<unsigned int> sendbuf(getN());
+        for (unsigned int idx = 0; idx < getN(); ++idx)
+            sendbuf[offsets[directory_rank(h_tag.data[idx], n_tags, n_ranks)]++] = h_tag.data[idx];
+
+        std::vector<unsigned int> recvbuf, recv_counts;
+        all_to_all_v(sendbuf, send_counts, recvbuf, recv_counts, mpi_comm);
+
+        unsigned int k = 0;
+        for (unsigned int r = 0; r < n_ranks; ++r)
+            for (unsigned int i = 0; i < recv_counts[r]; ++i, ++k)
+                directory[recvbuf[k] - first_tag] = r;
+        }
+
+    // send the requests to the ranks holding the directory of each tag
+    std::vector<unsigned int> send_counts(n_ranks, 0);
+    std::vector<unsigned int> dest(tags.size());
+    for (unsigned int i = 0; i < tags.size(); ++i)
+        {
+        if (tags[i] >= n_tags)
+            {
+            m_exec_conf->msg->error() << "Particle tag " << tags[i] << " out of bounds" << std::endl;
+            throw std::runtime_error("Error finding particle owners");
+            }
+        dest[i] = directory_rank(tags[i], n_tags, n_ranks);
+        send_counts[dest[i]]++;
+        }
+
+    std::vector<unsigned int> request(tags.size());
+    std::vector<unsigned int> request_pos(tags.size());
+        {
+        std::vector<unsigned int> offsets(n_ranks, 0);
+        for (unsigned int r = 1; r < n_ranks; ++r)
+            offsets[r] = offsets[r-1] + send_counts[r-1];
+        for (unsigned int i = 0; i < tags.size(); ++i)
+            {
+            request_pos[i] = offsets[dest[i]]++;
+            request[request_pos[i]] = tags[i];
+            }
+        }
+
+    std::vector<unsigned int> recv_request, recv_counts;
+    all_to_all_v(request, send_counts, recv_request, recv_counts, mpi_comm);
+
+    // answer the requests in the same order
+    std::vector<unsigned int> answer(recv_request.size());
+    for (unsigned int k = 0; k < recv_request.size(); ++k)
+        answer[k] = directory[recv_request[k] - first_tag];
+
+    std::vector<unsigned int> recv_answer, answer_counts;
+    all_to_all_v(answer, recv_counts, recv_answer, answer_counts, mpi_comm);
+
+    ranks.resize(tags.size());
+    for (unsigned int i = 0; i < tags.size(); ++i)
+        ranks[i] = recv_answer[request_pos[i]];
+    }
+
 #ifdef ENABLE_CUDA
 //! Pack particle data into a buffer (GPU version)
 /*! \note This method may only be used during communication or when
@@ -3220,34 +3617,62 @@ template <class Real>
 void SnapshotParticleData<Real>::replicate(unsigned int nx, unsigned int ny, unsigned int nz,
         const BoxDim& old_box, const BoxDim& new_box)
     {
-    unsigned int old_size = size;
+    // the snapshot holds particles 0..size-1 and all images are generated
+    std::vector<unsigned int> tags(size);
+    for (unsigned int i = 0; i < size; ++i)
+        tags[i] = i;
+
+    replicateImages(nx, ny, nz, make_uint3(0,0,0), make_uint3(nx,ny,nz), old_box, new_box, tags, size);
+    }
+
+/*! The particle with tag \a t in image (\a l, \a m, \a n) gets the tag j*\a old_n + \a t, where
+    j = (\a l * \a ny + \a m) * \a nz + \a n. Replicating any subsets of the particles and images therefore
+    assigns the same tags as replicating the whole system with replicate(). The replicated particles are
+    stored image by image, in the order of the particles in the snapshot.
+*/
+template <class Real>
+void SnapshotParticleData<Real>::replicateImages(unsigned int nx, unsigned int ny, unsigned int nz,
+        const uint3& lo, const uint3& hi,
+        const BoxDim& old_box, const BoxDim& new_box,
+        std::vector<unsigned int>& tags, unsigned int old_n)
+    {
+    assert(tags.size() == size);
+    assert(lo.x <= hi.x && lo.y <= hi.y && lo.z <= hi.z);
 
-    // resize snapshot
-    resize(old_size*nx*ny*nz);
+    // keep a copy of the particles to replicate, the snapshot is overwritten with the images
+    const SnapshotParticleData<Real> src(*this);
+    const std::vector<unsigned int> src_tags(tags);
+    const unsigned int old_size = src.size;
 
+    // fractional coordinates of the unwrapped particles in the old box
+    std::vector< vec3<Real> > frac(old_size);
     for (unsigned int i = 0; i < old_size; ++i)
         {
-        // unwrap position of particle i in old box using image flags
-        vec3<Real> p = pos[i];
-        int3 img = image[i];
-
         // need to cast to a scalar and back because the Box is in Scalars, but we might be in a different type
-        p = vec3<Real>(old_box.shift(vec3<Scalar>(p), img));
-        vec3<Real> f = old_box.makeFraction(p);
+        vec3<Real> p = vec3<Real>(old_box.shift(vec3<Scalar>(src.pos[i]), src.image[i]));
+        frac[i] = old_box.makeFraction(p);
+        }
+
+    unsigned int n_images = (hi.x - lo.x)*(hi.y - lo.y)*(hi.z - lo.z);
+    resize(old_size*n_images);
+    tags.resize(old_size*n_images);
 
-        unsigned int j = 0;
-        for (unsigned int l = 0; l < nx; l++)
-            for (unsigned int m = 0; m < ny; m++)
-                for (unsigned int n = 0; n < nz; n++)
+    unsigned int k = 0;
+    for (unsigned int l = lo.x; l < hi.x; l++)
+        for (unsigned int m = lo.y; m < hi.y; m++)
+            for (unsigned int n = lo.z; n < hi.z; n++)
+                {
+                unsigned int j = (l*ny + m)*nz + n;
+
+                for (unsigned int i = 0; i < old_size; ++i, ++k)
                     {
+                    const vec3<Real>& f = frac[i];
                     Scalar3 f_new;
                     // replicate particle
                     f_new.x = f.x/(Real)nx + (Real)l/(Real)nx;
                     f_new.y = f.y/(Real)ny + (Real)m/(Real)ny;
                     f_new.z = f.z/(Real)nz + (Real)n/(Real)nz;
 
-                    unsigned int k = j*old_size + i;
-
                     // coordinates in new box
                     Scalar3 q = new_box.makeCoordinates(f_new);
 
@@ -3260,26 +3685,26 @@ void SnapshotParticleData<Real>::replicate(unsigned int nx, unsigned int ny, uns
                     new_box.wrap(q,image[k]);
 
                     pos[k] = vec3<Real>(q);
-                    vel[k] = vel[i];
-                    accel[k] = accel[i];
-                    type[k] = type[i];
-                    mass[k] = mass[i];
-                    charge[k] = charge[i];
-                    diameter[k] = diameter[i];
+                    vel[k] = src.vel[i];
+                    accel[k] = src.accel[i];
+                    type[k] = src.type[i];
+                    mass[k] = src.mass[i];
+                    charge[k] = src.charge[i];
+                    diameter[k] = src.diameter[i];
                     // This math also accounts for floppy bodies since body[i]
                     // is already greater than MIN_FLOPPY, so the new body id
                     // body[k] is guaranteed to be so as well. However, we
                     // check to ensure that something that wasn't originally a
                     // floppy body doesn't overflow into the floppy body tags.
-                    body[k] = (body[i] != NO_BODY ? j*old_size + body[i] : NO_BODY);
-                    if (body[i] < MIN_FLOPPY && body[k] >= MIN_FLOPPY)
+                    body[k] = (src.body[i] != NO_BODY ? j*old_n + src.body[i] : NO_BODY);
+                    if (src.body[i] < MIN_FLOPPY && body[k] >= MIN_FLOPPY)
                         throw std::runtime_error("Replication would create more distinct rigid bodies than HOOMD supports!");
-                    orientation[k] = orientation[i];
-                    angmom[k] = angmom[i];
-                    inertia[k] = inertia[i];
-                    j++;
+                    orientation[k] = src.orientation[i];
+                    angmom[k] = src.angmom[i];
+                    inertia[k] = src.inertia[i];
+                    tags[k] = j*old_n + src_tags[i];
                     }
-        }
+                }
     }
 
 /*! \returns a numpy array that wraps the pos data element.
@@ -191,6 +191,22 @@ struct PYBIND11_EXPORT SnapshotParticleData {
     void replicate(unsigned int nx, unsigned int ny, unsigned int nz,
         const BoxDim& old_box, const BoxDim& new_box);
 
+    //! Replicate this snapshot into a range of images
+    /*! \param nx Number of times the system is replicated along the x direction
+     *  \param ny Number of times the system is replicated along the y direction
+     *  \param nz Number of times the system is replicated along the z direction
+     *  \param lo First image along each direction
+     *  \param hi One past the last image along each direction
+     *  \param old_box Old box dimensions
+     *  \param new_box Dimensions of replicated box
+     *  \param tags Tags of the particles in the snapshot, replaced by the tags of the replicated particles
+     *  \param old_n Number of particles in the system that is replicated
+     */
+    void replicateImages(unsigned int nx, unsigned int ny, unsigned int nz,
+        const uint3& lo, const uint3& hi,
+        const BoxDim& old_box, const BoxDim& new_box,
+        std::vector<unsigned int>& tags, unsigned int old_n);
+
     //! Get pos as a Python object
     static pybind11::object getPosNP(pybind11::object self);
     //! Get vel as a Python object
@@ -977,6 +993,12 @@ class PYBIND11_EXPORT ParticleData
         template <class Real>
         void initializeFromSnapshot(const SnapshotParticleData<Real> & snapshot, bool ignore_bodies=false);
 
+        //! Initialize from a snapshot distributed over the ranks
+        template <class Real>
+        void initializeFromDistributedSnapshot(const SnapshotParticleData<Real>& snapshot,
+                                               const std::vector<unsigned int>& tags,
+                                               unsigned int nglobal);
+
         //! Take a snapshot
         template <class Real>
         std::map<unsigned int, unsigned int> takeSnapshot(SnapshotParticleData<Real> &snapshot);
@@ -1029,6 +1051,9 @@ class PYBIND11_EXPORT ParticleData
          */
         void addParticles(const std::vector<pdata_element>& in);
 
+        //! Find the ranks owning particles
+        void getOwnerRanks(const std::vector<unsigned int>& tags, std::vector<unsigned int>& ranks);
+
         #ifdef ENABLE_CUDA
         //! Pack particle data into a buffer (GPU version)
         /*! \param out Buffer into which particle data is packed
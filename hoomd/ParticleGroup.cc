@@ -12,6 +12,10 @@
 #include <cuda_runtime.h>
 #endif
 
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif
+
 #include <algorithm>
 #include <iostream>
 using namespace std;
@@ -44,6 +48,68 @@ std::vector<unsigned int> ParticleSelector::getSelectedTags() const
     return std::vector<unsigned int>();
     }
 
+/*! \param is_selected Array of at least getN() elements, set to 1 for the selected local particles and 0 otherwise
+
+    The base class flags the particles returned by getSelectedTags().
+*/
+void ParticleSelector::selectLocal(unsigned int *is_selected) const
+    {
+    std::vector<unsigned int> member_tags = getSelectedTags();
+
+    const unsigned int N = m_pdata->getN();
+    std::fill(is_selected, is_selected + N, 0);
+
+    ArrayHandle<unsigned int> h_rtag(m_pdata->getRTags(), access_location::host, access_mode::read);
+    for (auto it = member_tags.begin(); it != member_tags.end(); ++it)
+        {
+        unsigned int idx = h_rtag.data[*it];
+        if (idx < N)
+            is_selected[idx] = 1;
+        }
+    }
+
+/*! \param is_selected Flags of the local particles
+    \returns The tags of the flagged local particles
+*/
+static std::vector<unsigned int> getFlaggedTags(std::shared_ptr<ParticleData> pdata,
+                                                const std::vector<unsigned int>& is_selected)
+    {
+    std::vector<unsigned int> member_tags;
+
+    ArrayHandle<unsigned int> h_tag(pdata->getTags(), access_location::host, access_mode::read);
+    for (unsigned int idx = 0; idx < pdata->getN(); ++idx)
+        {
+        if (is_selected[idx])
+            member_tags.push_back(h_tag.data[idx]);
+        }
+
+    return member_tags;
+    }
+
+#ifdef ENABLE_MPI
+/*! \param tags Sorted tags on this rank
+    \param mpi_comm MPI communicator
+    \returns The sorted tags of all ranks
+
+    The tags of different ranks are disjoint, so the sorted lists are merged without removing duplicates.
+*/
+static std::vector<unsigned int> gatherSortedTags(const std::vector<unsigned int>& tags, const MPI_Comm mpi_comm)
+    {
+    std::vector< std::vector<unsigned int> > tags_proc;
+    all_gather_v(tags, tags_proc, mpi_comm);
+
+    std::vector<unsigned int> all_tags;
+    for (auto it = tags_proc.begin(); it != tags_proc.end(); ++it)
+        {
+        const size_t num_merged = all_tags.size();
+        all_tags.insert(all_tags.end(), it->begin(), it->end());
+        std::inplace_merge(all_tags.begin(), all_tags.begin() + num_merged, all_tags.end());
+        }
+
+    return all_tags;
+    }
+#endif
+
 //////////////////////////////////////////////////////////////////////////////
 // ParticleSelectorAll
 
@@ -71,6 +137,13 @@ std::vector<unsigned int> ParticleSelectorAll::getSelectedTags() const
     return member_tags;
     }
 
+/*! \param is_selected Array of at least getN() elements, set to 1 for all local particles
+*/
+void ParticleSelectorAll::selectLocal(unsigned int *is_selected) const
+    {
+    std::fill(is_selected, is_selected + m_pdata->getN(), 1);
+    }
+
 //////////////////////////////////////////////////////////////////////////////
 // ParticleSelectorTag
 
@@ -114,6 +187,29 @@ std::vector<unsigned int> ParticleSelectorTag::getSelectedTags() const
     return member_tags;
     }
 
+/*! \param is_selected Array of at least getN() elements, set to 1 for the selected local particles and 0 otherwise
+*/
+void ParticleSelectorTag::selectLocal(unsigned int *is_selected) const
+    {
+    ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+    const unsigned int N = m_pdata->getN();
+
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
+    for (unsigned int idx=0; idx < N; ++idx)
+    #endif // ENABLE_TBB
+        {
+        unsigned int tag = h_tag.data[idx];
+        is_selected[idx] = (tag >= m_tag_min && tag <= m_tag_max) ? 1 : 0;
+        }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
+    }
+
 //////////////////////////////////////////////////////////////////////////////
 // ParticleSelectorType
 
@@ -154,6 +250,29 @@ std::vector<unsigned int> ParticleSelectorType::getSelectedTags() const
     return member_tags;
     }
 
+/*! \param is_selected Array of at least getN() elements, set to 1 for the selected local particles and 0 otherwise
+*/
+void ParticleSelectorType::selectLocal(unsigned int *is_selected) const
+    {
+    ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+    const unsigned int N = m_pdata->getN();
+
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
+    for (unsigned int idx=0; idx < N; ++idx)
+    #endif // ENABLE_TBB
+        {
+        unsigned int typ = __scalar_as_int(h_postype.data[idx].w);
+        is_selected[idx] = (m_typ_min <= typ && typ <= m_typ_max) ? 1 : 0;
+        }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
+    }
+
 
 //////////////////////////////////////////////////////////////////////////////
 // ParticleSelectorBody
@@ -357,28 +476,200 @@ std::vector<unsigned int> ParticleSelectorCuboid::getSelectedTags() const
     return member_tags;
     }
 
+/*! \param is_selected Array of at least getN() elements, set to 1 for the selected local particles and 0 otherwise
+*/
+void ParticleSelectorCuboid::selectLocal(unsigned int *is_selected) const
+    {
+    ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+    const unsigned int N = m_pdata->getN();
+
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
+    for (unsigned int idx=0; idx < N; ++idx)
+    #endif // ENABLE_TBB
+        {
+        Scalar4 postype = h_postype.data[idx];
+        bool result = (m_min.x <= postype.x && postype.x < m_max.x &&
+                       m_min.y <= postype.y && postype.y < m_max.y &&
+                       m_min.z <= postype.z && postype.z < m_max.z);
+        is_selected[idx] = result ? 1 : 0;
+        }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
+    }
+
+//////////////////////////////////////////////////////////////////////////////
+// ParticleSelectorCharge
+
+/*! \param sysdef System the particles are to be selected from
+*/
+ParticleSelectorCharge::ParticleSelectorCharge(std::shared_ptr<SystemDefinition> sysdef)
+    : ParticleSelector(sysdef)
+    { }
+
+/*! \returns The tags of the local particles with a non-zero charge
+*/
+std::vector<unsigned int> ParticleSelectorCharge::getSelectedTags() const
+    {
+    std::vector<unsigned int> member_tags;
+
+    // loop through local particles and select those that match selection criterion
+    ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
+    for (unsigned int idx = 0; idx < m_pdata->getN(); ++idx)
+        {
+        if (h_charge.data[idx] != Scalar(0.0))
+            member_tags.push_back(h_tag.data[idx]);
+        }
+
+    return member_tags;
+    }
+
+/*! \param is_selected Array of at least getN() elements, set to 1 for the selected local particles and 0 otherwise
+*/
+void ParticleSelectorCharge::selectLocal(unsigned int *is_selected) const
+    {
+    ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
+    const unsigned int N = m_pdata->getN();
+
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
+    for (unsigned int idx=0; idx < N; ++idx)
+    #endif // ENABLE_TBB
+        {
+        is_selected[idx] = (h_charge.data[idx] != Scalar(0.0)) ? 1 : 0;
+        }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
+    }
+
+//////////////////////////////////////////////////////////////////////////////
+// ParticleSelectorGroup
+
+/*! \param sysdef System the particles are to be selected from
+    \param group Group whose members are selected
+*/
+ParticleSelectorGroup::ParticleSelectorGroup(std::shared_ptr<SystemDefinition> sysdef,
+                                             std::shared_ptr<ParticleGroup> group)
+    : ParticleSelector(sysdef), m_group(group)
+    {
+    assert(m_group);
+    }
+
+/*! \returns The tags of the local members of the group
+*/
+std::vector<unsigned int> ParticleSelectorGroup::getSelectedTags() const
+    {
+    std::vector<unsigned int> is_selected(m_pdata->getN());
+    selectLocal(is_selected.data());
+    return getFlaggedTags(m_pdata, is_selected);
+    }
+
+/*! \param is_selected Array of at least getN() elements, set to 1 for the local members of the group and 0 otherwise
+*/
+void ParticleSelectorGroup::selectLocal(unsigned int *is_selected) const
+    {
+    // rebuild the index list of the group before accessing it
+    unsigned int n_members = m_group->getNumMembers();
+
+    std::fill(is_selected, is_selected + m_pdata->getN(), 0);
+
+    ArrayHandle<unsigned int> h_member_idx(m_group->getIndexArray(), access_location::host, access_mode::read);
+    for (unsigned int i = 0; i < n_members; ++i)
+        is_selected[h_member_idx.data[i]] = 1;
+    }
+
+//////////////////////////////////////////////////////////////////////////////
+// ParticleSelectorSetOperation
+
+/*! \param sysdef System the particles are to be selected from
+    \param a First operand
+    \param b Second operand
+    \param op Set operation to apply
+*/
+ParticleSelectorSetOperation::ParticleSelectorSetOperation(std::shared_ptr<SystemDefinition> sysdef,
+                                                           std::shared_ptr<ParticleSelector> a,
+                                                           std::shared_ptr<ParticleSelector> b,
+                                                           operation op)
+    : ParticleSelector(sysdef), m_a(a), m_b(b), m_op(op)
+    {
+    assert(m_a && m_b);
+    }
+
+/*! \returns The tags of the local particles selected by the set operation
+*/
+std::vector<unsigned int> ParticleSelectorSetOperation::getSelectedTags() const
+    {
+    std::vector<unsigned int> is_selected(m_pdata->getN());
+    selectLocal(is_selected.data());
+    return getFlaggedTags(m_pdata, is_selected);
+    }
+
+/*! \param is_selected Array of at least getN() elements, set to 1 for the selected local particles and 0 otherwise
+*/
+void ParticleSelectorSetOperation::selectLocal(unsigned int *is_selected) const
+    {
+    const unsigned int N = m_pdata->getN();
+
+    m_a->selectLocal(is_selected);
+    std::vector<unsigned int> is_selected_b(N);
+    m_b->selectLocal(is_selected_b.data());
+
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
+    for (unsigned int idx=0; idx < N; ++idx)
+    #endif // ENABLE_TBB
+        {
+        unsigned int b = is_selected_b[idx];
+        if (m_op == set_union)
+            is_selected[idx] |= b;
+        else if (m_op == set_intersection)
+            is_selected[idx] &= b;
+        else
+            is_selected[idx] &= !b;
+        }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
+    }
+
 //////////////////////////////////////////////////////////////////////////////
 // ParticleGroup
 
 /*! \param sysdef System definition to build the group from
     \param selector ParticleSelector used to choose the group members
     \param update_tags If true, update tags whenever global particle number changes
+    \param dynamic If true, re-evaluate the selector on the local particles at each call to evaluate()
 
     Particles where criteria falls within the range [min,max] (inclusive) are added to the group.
 */
 ParticleGroup::ParticleGroup(std::shared_ptr<SystemDefinition> sysdef,
     std::shared_ptr<ParticleSelector> selector,
-    bool update_tags)
+    bool update_tags,
+    bool dynamic)
     : m_sysdef(sysdef),
       m_pdata(sysdef->getParticleData()),
       m_exec_conf(m_pdata->getExecConf()),
       m_num_local_members(0),
+      m_num_global_members(0),
       m_particles_sorted(true),
       m_reallocated(false),
       m_global_ptl_num_change(false),
       m_selector(selector),
       m_update_tags(update_tags),
-      m_warning_printed(false)
+      m_warning_printed(false),
+      m_dynamic(dynamic)
     {
     #ifdef ENABLE_CUDA
     if (m_pdata->getExecConf()->isCUDAEnabled())
@@ -411,11 +702,13 @@ ParticleGroup::ParticleGroup(std::shared_ptr<SystemDefinition> sysdef, const std
       m_pdata(sysdef->getParticleData()),
       m_exec_conf(m_pdata->getExecConf()),
       m_num_local_members(0),
+      m_num_global_members(0),
       m_particles_sorted(true),
       m_reallocated(false),
       m_global_ptl_num_change(false),
       m_update_tags(false),
-      m_warning_printed(false)
+      m_warning_printed(false),
+      m_dynamic(false)
     {
     // check input
     unsigned int max_tag = m_pdata->getMaximumTag();
@@ -451,6 +744,7 @@ ParticleGroup::ParticleGroup(std::shared_ptr<SystemDefinition> sysdef, const std
     GlobalArray<unsigned int> member_tags_array(member_tags.size(), m_exec_conf);
     m_member_tags.swap(member_tags_array);
     TAG_ALLOCATION(m_member_tags);
+    m_num_global_members = member_tags.size();
 
         {
         ArrayHandle<unsigned int> h_member_tags(m_member_tags, access_location::host, access_mode::overwrite);
@@ -494,6 +788,16 @@ ParticleGroup::ParticleGroup(std::shared_ptr<SystemDefinition> sysdef, const std
     updateGPUAdvice();
     }
 
+/*! \param sysdef System definition to build the group from
+    \param member_tags Array of particle tags that belong to the group
+
+    The tags are copied directly from the buffer of the array, without converting the elements one by one.
+*/
+ParticleGroup::ParticleGroup(std::shared_ptr<SystemDefinition> sysdef, const tag_array_t& member_tags)
+    : ParticleGroup(sysdef, std::vector<unsigned int>(member_tags.data(), member_tags.data() + member_tags.size()))
+    {
+    }
+
 ParticleGroup::~ParticleGroup()
     {
     // disconnect the sort connection, but only if there was a particle data to connect it to in the first place
@@ -509,7 +813,7 @@ ParticleGroup::~ParticleGroup()
  */
 void ParticleGroup::updateMemberTags(bool force_update) const
     {
-    if (m_selector && !(m_update_tags || force_update) && ! m_warning_printed)
+    if (m_selector && !m_dynamic && !(m_update_tags || force_update) && ! m_warning_printed)
         {
         m_pdata->getExecConf()->msg->warning()
             << "Particle number change but group is static. Create group with update=True if it should be updated."
@@ -524,10 +828,16 @@ void ParticleGroup::updateMemberTags(bool force_update) const
 
         // assign all of the particles that belong to the group
         // for each particle in the (global) data
-        vector<unsigned int> member_tags = m_selector->getSelectedTags();
+        vector<unsigned int> member_tags = m_dynamic ? getSelectedLocalTags() : m_selector->getSelectedTags();
 
         #ifdef ENABLE_MPI
-        if (m_pdata->getDomainDecomposition())
+        if (m_dynamic && m_pdata->getDomainDecomposition())
+            {
+            // the local particles of the ranks are disjoint, merge their sorted tags
+            std::sort(member_tags.begin(), member_tags.end());
+            member_tags = gatherSortedTags(member_tags, m_exec_conf->getMPICommunicator());
+            }
+        else if (m_pdata->getDomainDecomposition())
             {
             // combine lists from all processors
             std::vector< std::vector<unsigned int> > member_tags_proc(m_exec_conf->getNRanks());
@@ -553,6 +863,7 @@ void ParticleGroup::updateMemberTags(bool force_update) const
         GlobalArray<unsigned int> member_tags_array(member_tags.size(), m_pdata->getExecConf());
         m_member_tags.swap(member_tags_array);
         TAG_ALLOCATION(m_member_tags);
+        m_num_global_members = member_tags.size();
 
         // sort member tags
         std::sort(member_tags.begin(), member_tags.end());
@@ -581,6 +892,9 @@ void ParticleGroup::updateMemberTags(bool force_update) const
 
     // now that the tag list is completely set up and all memory is allocated, rebuild the index list
     rebuildIndexList();
+
+    if (m_dynamic)
+        m_membership_change_signal.emit();
     }
 
 void ParticleGroup::reallocate() const
@@ -790,6 +1104,156 @@ std::shared_ptr<ParticleGroup> ParticleGroup::groupDifference(std::shared_ptr<Pa
     return new_group;
     }
 
+/*! \returns The tags of the local particles selected by the selector of a dynamic group
+*/
+std::vector<unsigned int> ParticleGroup::getSelectedLocalTags() const
+    {
+    // evaluate the selector before acquiring the particle data
+    const unsigned int N = m_pdata->getN();
+    std::vector<unsigned int> is_selected(N);
+    m_selector->selectLocal(is_selected.data());
+
+    std::vector<unsigned int> member_tags;
+    ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+    for (unsigned int idx = 0; idx < N; ++idx)
+        {
+        if (is_selected[idx])
+            member_tags.push_back(h_tag.data[idx]);
+        }
+
+    return member_tags;
+    }
+
+/*! The member tags are the same on all ranks, so that every rank drops the same particles and emits the membership
+    change signal together. Particles added to the system join the group at the next evaluation.
+*/
+void ParticleGroup::removeInactiveMembers()
+    {
+    // the number of tags may have changed
+    bool resized = false;
+    if (m_is_member_tag.getNumElements() != m_pdata->getRTags().size())
+        {
+        GlobalArray<unsigned int> is_member_tag(m_pdata->getRTags().size(), m_exec_conf);
+        m_is_member_tag.swap(is_member_tag);
+        TAG_ALLOCATION(m_is_member_tag);
+        resized = true;
+        }
+
+    // compact the member tags in place, recycled tags are not members until the next evaluation
+    unsigned int num_members = 0;
+        {
+        ArrayHandle<unsigned int> h_member_tags(m_member_tags, access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_is_member_tag(m_is_member_tag, access_location::host, access_mode::readwrite);
+        for (unsigned int member = 0; member < m_num_global_members; member++)
+            {
+            const unsigned int tag = h_member_tags.data[member];
+            if (m_pdata->isTagActive(tag))
+                h_member_tags.data[num_members++] = tag;
+            else if (!resized)
+                h_is_member_tag.data[tag] = 0;
+            }
+        }
+
+    bool changed = num_members != m_num_global_members;
+    m_num_global_members = num_members;
+
+    if (resized)
+        buildTagHash();
+    m_particles_sorted = true;
+
+    if (changed)
+        m_membership_change_signal.emit();
+    }
+
+/*! The selector is evaluated on the local particles only, and each rank compares the selection to the current
+    members among its local particles. Only the tags of the particles that joined or left the group are exchanged
+    between the ranks. They are merged into the sorted member tags in place, and only their membership flags are
+    changed. The arrays are reallocated only when the group grows beyond their size, and the index list is only
+    rebuilt on ranks whose local members changed.
+*/
+void ParticleGroup::updateDynamicMembers() const
+    {
+    // the members of the local particles must be up to date with the current particle order
+    checkRebuild();
+
+    // evaluate the selector before acquiring the particle data
+    const unsigned int N = m_pdata->getN();
+    std::vector<unsigned int> is_selected(N);
+    m_selector->selectLocal(is_selected.data());
+
+    std::vector<unsigned int> added_tags;
+    std::vector<unsigned int> removed_tags;
+        {
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_is_member(m_is_member, access_location::host, access_mode::read);
+        for (unsigned int idx = 0; idx < N; ++idx)
+            {
+            if (is_selected[idx] && !h_is_member.data[idx])
+                added_tags.push_back(h_tag.data[idx]);
+            else if (!is_selected[idx] && h_is_member.data[idx])
+                removed_tags.push_back(h_tag.data[idx]);
+            }
+        }
+    std::sort(added_tags.begin(), added_tags.end());
+    std::sort(removed_tags.begin(), removed_tags.end());
+
+    // the local index list only changes if a local particle joined or left the group
+    if (!added_tags.empty() || !removed_tags.empty())
+        m_particles_sorted = true;
+
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+        added_tags = gatherSortedTags(added_tags, m_exec_conf->getMPICommunicator());
+        removed_tags = gatherSortedTags(removed_tags, m_exec_conf->getMPICommunicator());
+        }
+    #endif
+
+    // the members are the same on all ranks, so all ranks return here together
+    if (added_tags.empty() && removed_tags.empty())
+        return;
+
+    const unsigned int num_kept = m_num_global_members - removed_tags.size();
+    const unsigned int num_members = num_kept + added_tags.size();
+    if (num_members > m_member_tags.getNumElements())
+        {
+        m_member_tags.resize(num_members);
+        m_member_idx.resize(num_members);
+        }
+
+        {
+        ArrayHandle<unsigned int> h_member_tags(m_member_tags, access_location::host, access_mode::readwrite);
+        ArrayHandle<unsigned int> h_is_member_tag(m_is_member_tag, access_location::host, access_mode::readwrite);
+
+        // drop the removed tags, both lists are sorted
+        auto removed = removed_tags.begin();
+        unsigned int cur_member = 0;
+        for (unsigned int member = 0; member < m_num_global_members; member++)
+            {
+            const unsigned int tag = h_member_tags.data[member];
+            if (removed != removed_tags.end() && *removed == tag)
+                {
+                h_is_member_tag.data[tag] = 0;
+                ++removed;
+                }
+            else
+                {
+                h_member_tags.data[cur_member++] = tag;
+                }
+            }
+        assert(cur_member == num_kept);
+
+        // merge in the added tags
+        std::copy(added_tags.begin(), added_tags.end(), h_member_tags.data + num_kept);
+        std::inplace_merge(h_member_tags.data, h_member_tags.data + num_kept, h_member_tags.data + num_members);
+        for (auto it = added_tags.begin(); it != added_tags.end(); ++it)
+            h_is_member_tag.data[*it] = 1;
+        }
+    m_num_global_members = num_members;
+
+    m_membership_change_signal.emit();
+    }
+
 /*! Builds the by-tag-lookup table for group membership
  */
 void ParticleGroup::buildTagHash() const
@@ -800,8 +1264,7 @@ void ParticleGroup::buildTagHash() const
     // reset member ship flags
     memset(h_is_member_tag.data, 0, sizeof(unsigned int)*(m_pdata->getRTags().size()));
 
-    unsigned int num_members = m_member_tags.getNumElements();
-    for (unsigned int member = 0; member < num_members; member++)
+    for (unsigned int member = 0; member < m_num_global_members; member++)
         {
         h_is_member_tag.data[h_member_tags.data[member]] = 1;
         }
@@ -846,7 +1309,7 @@ void ParticleGroup::rebuildIndexList() const
             }
 
         m_num_local_members = cur_member;
-        assert(m_num_local_members <= m_member_tags.getNumElements());
+        assert(m_num_local_members <= m_num_global_members);
         }
 
     // index has been rebuilt
@@ -901,7 +1364,7 @@ void ParticleGroup::rebuildIndexListGPU() const
     ScopedAllocation<unsigned int> d_tmp(m_pdata->getExecConf()->getCachedAllocator(), m_pdata->getN());
 
     // reset membership properties
-    if (m_member_tags.getNumElements() > 0)
+    if (m_num_global_members > 0)
         {
         gpu_rebuild_index_list(m_pdata->getN(),
                            d_is_member_tag.data,
@@ -927,9 +1390,11 @@ void ParticleGroup::rebuildIndexListGPU() const
 void export_ParticleGroup(py::module& m)
     {
     py::class_<ParticleGroup, std::shared_ptr<ParticleGroup> >(m,"ParticleGroup")
+            .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<ParticleSelector>, bool, bool >())
             .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<ParticleSelector>, bool >())
             .def(py::init<std::shared_ptr<SystemDefinition>, std::shared_ptr<ParticleSelector> >())
             .def(py::init<std::shared_ptr<SystemDefinition>, const std::vector<unsigned int>& >())
+            .def(py::init<std::shared_ptr<SystemDefinition>, const ParticleGroup::tag_array_t& >())
             .def(py::init<>())
             .def("getNumMembersGlobal", &ParticleGroup::getNumMembersGlobal)
             .def("getMemberTag", &ParticleGroup::getMemberTag)
@@ -939,6 +1404,8 @@ void export_ParticleGroup(py::module& m)
             .def("groupIntersection", &ParticleGroup::groupIntersection)
             .def("groupDifference", &ParticleGroup::groupDifference)
             .def("updateMemberTags", &ParticleGroup::updateMemberTags)
+            .def("evaluate", &ParticleGroup::evaluate)
+            .def("isDynamic", &ParticleGroup::isDynamic)
             ;
 
     py::class_<ParticleSelector, std::shared_ptr<ParticleSelector> >(m,"ParticleSelector")
@@ -978,4 +1445,24 @@ void export_ParticleGroup(py::module& m)
     py::class_<ParticleSelectorRigidCenter, std::shared_ptr<ParticleSelectorRigidCenter> >(m,"ParticleSelectorRigidCenter",py::base<ParticleSelector>())
             .def(py::init< std::shared_ptr<SystemDefinition> >())
         ;
+
+    py::class_<ParticleSelectorCharge, std::shared_ptr<ParticleSelectorCharge> >(m,"ParticleSelectorCharge",py::base<ParticleSelector>())
+            .def(py::init< std::shared_ptr<SystemDefinition> >())
+        ;
+
+    py::class_<ParticleSelectorGroup, std::shared_ptr<ParticleSelectorGroup> >(m,"ParticleSelectorGroup",py::base<ParticleSelector>())
+            .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<ParticleGroup> >())
+        ;
+
+    py::class_<ParticleSelectorSetOperation, std::shared_ptr<ParticleSelectorSetOperation> > set_operation(m,"ParticleSelectorSetOperation",py::base<ParticleSelector>());
+    set_operation.def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<ParticleSelector>,
+                                std::shared_ptr<ParticleSelector>, ParticleSelectorSetOperation::operation >())
+        ;
+
+    py::enum_<ParticleSelectorSetOperation::operation>(set_operation,"operation")
+        .value("set_union", ParticleSelectorSetOperation::set_union)
+        .value("set_intersection", ParticleSelectorSetOperation::set_intersection)
+        .value("set_difference", ParticleSelectorSetOperation::set_difference)
+        .export_values()
+        ;
     }
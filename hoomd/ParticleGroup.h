@@ -18,6 +18,7 @@
 #include <memory>
 #include <vector>
 #include <hoomd/extern/pybind/include/pybind11/pybind11.h>
+#include <hoomd/extern/pybind/include/pybind11/numpy.h>
 
 #include "GlobalArray.h"
 
@@ -46,6 +47,11 @@
 
     The base class getSelectedTags() method will simply return an empty list.
     selection semantics.
+
+    Dynamic groups evaluate the selection through selectLocal(), which flags the local particles by index. The base
+    class implementation marks the particles returned by getSelectedTags(). Selectors that are cheap to evaluate on
+    the current state of the system (positions, types, charges, tags) override it to test the local particles in
+    parallel without building a tag list.
 */
 class PYBIND11_EXPORT ParticleSelector
     {
@@ -57,6 +63,9 @@ class PYBIND11_EXPORT ParticleSelector
         //! Test if a particle meets the selection criteria
         virtual std::vector<unsigned int> getSelectedTags() const;
 
+        //! Flag the local particles that meet the selection criteria
+        virtual void selectLocal(unsigned int *is_selected) const;
+
     protected:
         std::shared_ptr<SystemDefinition> m_sysdef;   //!< The system definition assigned to this selector
         std::shared_ptr<ParticleData> m_pdata;        //!< The particle data from m_sysdef, stored as a convenience
@@ -73,6 +82,9 @@ class PYBIND11_EXPORT ParticleSelectorAll : public ParticleSelector
 
         //! Test if a particle meets the selection criteria
         virtual std::vector<unsigned int> getSelectedTags() const;
+
+        //! Flag the local particles that meet the selection criteria
+        virtual void selectLocal(unsigned int *is_selected) const;
     };
 
 
@@ -86,6 +98,9 @@ class PYBIND11_EXPORT ParticleSelectorTag : public ParticleSelector
 
         //! Test if a particle meets the selection criteria
         virtual std::vector<unsigned int> getSelectedTags() const;
+
+        //! Flag the local particles that meet the selection criteria
+        virtual void selectLocal(unsigned int *is_selected) const;
     protected:
         unsigned int m_tag_min;     //!< Minimum tag to select
         unsigned int m_tag_max;     //!< Maximum tag to select (inclusive)
@@ -101,6 +116,9 @@ class PYBIND11_EXPORT ParticleSelectorType : public ParticleSelector
 
         //! Test if a particle meets the selection criteria
         virtual std::vector<unsigned int> getSelectedTags() const;
+
+        //! Flag the local particles that meet the selection criteria
+        virtual void selectLocal(unsigned int *is_selected) const;
     protected:
         unsigned int m_typ_min;     //!< Minimum type to select
         unsigned int m_typ_max;     //!< Maximum type to select (inclusive)
@@ -116,6 +134,9 @@ class PYBIND11_EXPORT ParticleSelectorCuboid : public ParticleSelector
 
         //! Test if a particle meets the selection criteria
         virtual std::vector<unsigned int> getSelectedTags() const;
+
+        //! Flag the local particles that meet the selection criteria
+        virtual void selectLocal(unsigned int *is_selected) const;
     protected:
         Scalar3 m_min;     //!< Minimum type to select (inclusive)
         Scalar3 m_max;     //!< Maximum type to select (exclusive)
@@ -174,6 +195,75 @@ class PYBIND11_EXPORT ParticleSelectorRigidCenter : public ParticleSelector
         virtual std::vector<unsigned int> getSelectedTags() const;
     };
 
+//! Select particles with a non-zero charge
+class PYBIND11_EXPORT ParticleSelectorCharge : public ParticleSelector
+    {
+    public:
+        //! Constructs the selector
+        ParticleSelectorCharge(std::shared_ptr<SystemDefinition> sysdef);
+        virtual ~ParticleSelectorCharge() {}
+
+        //! Test if a particle meets the selection criteria
+        virtual std::vector<unsigned int> getSelectedTags() const;
+
+        //! Flag the local particles that meet the selection criteria
+        virtual void selectLocal(unsigned int *is_selected) const;
+    };
+
+class ParticleGroup;
+
+//! Select the current members of a particle group
+/*! ParticleSelectorGroup lets a static group take part in the set operations of dynamic groups.
+*/
+class PYBIND11_EXPORT ParticleSelectorGroup : public ParticleSelector
+    {
+    public:
+        //! Constructs the selector
+        ParticleSelectorGroup(std::shared_ptr<SystemDefinition> sysdef, std::shared_ptr<ParticleGroup> group);
+        virtual ~ParticleSelectorGroup() {}
+
+        //! Test if a particle meets the selection criteria
+        virtual std::vector<unsigned int> getSelectedTags() const;
+
+        //! Flag the local particles that meet the selection criteria
+        virtual void selectLocal(unsigned int *is_selected) const;
+    protected:
+        std::shared_ptr<ParticleGroup> m_group; //!< The group to select
+    };
+
+//! Select particles by a set operation on two other selectors
+/*! The set operation is evaluated each time the selection is made, so that the combination of two dynamic
+    selections (e.g. particles of type A in a slab) is itself dynamic. The operands are evaluated one after the
+    other on the local particles.
+*/
+class PYBIND11_EXPORT ParticleSelectorSetOperation : public ParticleSelector
+    {
+    public:
+        //! The set operations
+        enum operation
+            {
+            set_union = 0,
+            set_intersection,
+            set_difference
+            };
+
+        //! Constructs the selector
+        ParticleSelectorSetOperation(std::shared_ptr<SystemDefinition> sysdef,
+                                     std::shared_ptr<ParticleSelector> a,
+                                     std::shared_ptr<ParticleSelector> b,
+                                     operation op);
+        virtual ~ParticleSelectorSetOperation() {}
+
+        //! Test if a particle meets the selection criteria
+        virtual std::vector<unsigned int> getSelectedTags() const;
+
+        //! Flag the local particles that meet the selection criteria
+        virtual void selectLocal(unsigned int *is_selected) const;
+    protected:
+        std::shared_ptr<ParticleSelector> m_a;  //!< First operand
+        std::shared_ptr<ParticleSelector> m_b;  //!< Second operand
+        operation m_op;                         //!< The set operation
+    };
 
 //! Describes a group of particles
 /*! \b Overview
@@ -190,9 +280,9 @@ class PYBIND11_EXPORT ParticleSelectorRigidCenter : public ParticleSelector
 
     Membership in the group is determined through a generic ParticleSelector class. See its documentation for details.
 
-    Group membership is determined once at the instantiation of the group. Thus ParticleGroup only supports static
-    groups where membership does not change over the course of a simulation. Dynamic groups, if they are needed,
-    may require a drastically different design to allow for efficient access.
+    Group membership is determined once at the instantiation of the group, and static groups keep their members over
+    the course of a simulation. A group constructed with \a dynamic = true instead re-evaluates its selector when
+    evaluate() is called, see <b>Dynamic groups</b> below.
 
     In many use-cases, ParticleGroup may be accessed many times within inner loops. Thus, it must not acquire any
     ParticleData arrays within most of the get() calls as the caller must be allowed to leave their ParticleData
@@ -212,6 +302,22 @@ class PYBIND11_EXPORT ParticleSelectorRigidCenter : public ParticleSelector
     For that it needs a list of indices of all the particles in the group. To facilitates this, the list of indices
     in the group will be stored in a GPUArray.
 
+    <b>Dynamic groups</b>
+
+    A group constructed with \a dynamic = true evaluates its selector with ParticleSelector::selectLocal() on the
+    local particles of every rank when evaluate() is called. Each rank compares the selection with the current
+    members among its local particles, and only the tags of the particles that joined or left the group are exchanged
+    and merged into the same sorted global tag list that static groups keep. The member arrays are reused between
+    evaluations and only reallocated when the group outgrows them, and an evaluation that changes no members does no
+    further work. Between evaluations, particle sorts and migrations only rebuild the index list from the tags, so
+    that the membership is the same on all ranks. Particles removed from the system are dropped from the group right
+    away, particles added to the system join the group at the next evaluation. The membership change signal notifies
+    subscribers (e.g. ComputeThermo, which counts the degrees of freedom of the group) after each evaluation that
+    changed the members.
+
+    evaluate() must be called collectively on all ranks, ParticleGroupUpdater calls it periodically. The members are
+    not evaluated on demand when the group is queried, because queries (e.g. getNumMembers()) are not collective.
+
     \ingroup data_structs
 */
 class PYBIND11_EXPORT ParticleGroup
@@ -221,21 +327,50 @@ class PYBIND11_EXPORT ParticleGroup
         // @{
 
         //! Constructs an empty particle group
-        ParticleGroup() : m_num_local_members(0) {};
+        ParticleGroup() : m_num_local_members(0), m_num_global_members(0), m_dynamic(false) {};
 
         //! Constructs a particle group of all particles that meet the given selection
         ParticleGroup(std::shared_ptr<SystemDefinition> sysdef, std::shared_ptr<ParticleSelector> selector,
-            bool update_tags = true);
+            bool update_tags = true, bool dynamic = false);
 
         //! Constructs a particle group given a list of tags
         ParticleGroup(std::shared_ptr<SystemDefinition> sysdef, const std::vector<unsigned int>& member_tags);
 
+        //! Contiguous array of tags accepted from python through the buffer protocol
+        typedef pybind11::array_t<unsigned int, pybind11::array::c_style | pybind11::array::forcecast> tag_array_t;
+
+        //! Constructs a particle group given an array of tags
+        ParticleGroup(std::shared_ptr<SystemDefinition> sysdef, const tag_array_t& member_tags);
+
         //! Destructor
         ~ParticleGroup();
 
         //! Updates the members tags of a particle group according to a selection
         void updateMemberTags(bool force_update) const;
 
+        //! Evaluate the selector of a dynamic group with the current state of the system
+        /*! \note This method must be called collectively on all ranks.
+        */
+        void evaluate() const
+            {
+            if (m_dynamic)
+                updateDynamicMembers();
+            else
+                updateMemberTags(true);
+            }
+
+        //! Get the signal that is emitted when the members of a dynamic group may have changed
+        Nano::Signal<void ()>& getMembershipChangeSignal()
+            {
+            return m_membership_change_signal;
+            }
+
+        //! Test if the group is dynamic
+        bool isDynamic() const
+            {
+            return m_dynamic;
+            }
+
         // @}
         //! \name Accessor methods
         // @{
@@ -247,7 +382,7 @@ class PYBIND11_EXPORT ParticleGroup
             {
             checkRebuild();
 
-            return (unsigned int)m_member_tags.getNumElements();
+            return m_num_global_members;
             }
 
         //! Get the number of members that are present on the local processor
@@ -366,6 +501,7 @@ class PYBIND11_EXPORT ParticleGroup
         mutable GlobalArray<unsigned int> m_member_idx;    //!< List of all particle indices in the group
         mutable GlobalArray<unsigned int> m_member_tags;   //!< Lists the tags of the particle members
         mutable unsigned int m_num_local_members;       //!< Number of members on the local processor
+        mutable unsigned int m_num_global_members;      //!< Number of members on all processors (m_member_tags may be larger)
         mutable bool m_particles_sorted;                //!< True if particle have been sorted since last rebuild
         mutable bool m_reallocated;                     //!< True if particle data arrays have been reallocated
         mutable bool m_global_ptl_num_change;           //!< True if the global particle number changed
@@ -376,6 +512,9 @@ class PYBIND11_EXPORT ParticleGroup
         bool m_update_tags;                             //!< True if tags should be updated when global number of particles changes
         mutable bool m_warning_printed;                         //!< True if warning about static groups has been printed
 
+        bool m_dynamic;                                 //!< True if the membership is re-evaluated by evaluate()
+        mutable Nano::Signal<void ()> m_membership_change_signal; //!< Signal emitted when the members may have changed
+
         #ifdef ENABLE_CUDA
         mutable GPUPartition m_gpu_partition;           //!< A handy struct to store load balancing info for this group's local members
         #endif
@@ -386,6 +525,15 @@ class PYBIND11_EXPORT ParticleGroup
         //! Helper function to rebuild the index lists after the particles have been sorted
         void rebuildIndexList() const;
 
+        //! Helper function to select the tags of the local members of a dynamic group
+        std::vector<unsigned int> getSelectedLocalTags() const;
+
+        //! Helper function to update the members of a dynamic group with the particles that joined or left it
+        void updateDynamicMembers() const;
+
+        //! Helper function to drop the particles that have been removed from the system from a dynamic group
+        void removeInactiveMembers();
+
         //! Helper function to rebuild internal arrays
         void checkRebuild() const
             {
@@ -431,7 +579,11 @@ class PYBIND11_EXPORT ParticleGroup
         //! Helper function to be called when particles are added/removed
         void slotGlobalParticleNumChange()
             {
-            m_global_ptl_num_change = true;
+            // all ranks are notified, update the members of dynamic groups collectively
+            if (m_dynamic)
+                removeInactiveMembers();
+            else
+                m_global_ptl_num_change = true;
             }
 
         //! Helper function to build the 1:1 hash for tag membership
@@ -0,0 +1,48 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+/*! \file ParticleGroupUpdater.cc
+    \brief Defines the ParticleGroupUpdater class
+*/
+
+#include "ParticleGroupUpdater.h"
+
+namespace py = pybind11;
+
+/*! \param sysdef System definition
+    \param group Dynamic group to evaluate
+*/
+ParticleGroupUpdater::ParticleGroupUpdater(std::shared_ptr<SystemDefinition> sysdef,
+                                           std::shared_ptr<ParticleGroup> group)
+    : Updater(sysdef), m_group(group)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing ParticleGroupUpdater" << std::endl;
+
+    if (!group->isDynamic())
+        {
+        m_exec_conf->msg->error() << "group: Only dynamic groups can be updated periodically" << std::endl;
+        throw std::runtime_error("Error initializing ParticleGroupUpdater");
+        }
+    }
+
+ParticleGroupUpdater::~ParticleGroupUpdater()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying ParticleGroupUpdater" << std::endl;
+    }
+
+/*! \param timestep Current time step of the simulation
+*/
+void ParticleGroupUpdater::update(unsigned int timestep)
+    {
+    std::shared_ptr<ParticleGroup> group = m_group.lock();
+    if (group)
+        group->evaluate();
+    }
+
+void export_ParticleGroupUpdater(py::module& m)
+    {
+    py::class_<ParticleGroupUpdater, std::shared_ptr<ParticleGroupUpdater> >(m,"ParticleGroupUpdater",py::base<Updater>())
+    .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<ParticleGroup> >())
+    ;
+    }
@@ -0,0 +1,51 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+/*! \file ParticleGroupUpdater.h
+    \brief Declares an updater that periodically evaluates dynamic particle groups
+*/
+
+#ifdef NVCC
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "Updater.h"
+#include "ParticleGroup.h"
+
+#include <memory>
+#include <hoomd/extern/pybind/include/pybind11/pybind11.h>
+
+#ifndef __PARTICLE_GROUP_UPDATER_H__
+#define __PARTICLE_GROUP_UPDATER_H__
+
+//! Evaluates a dynamic group
+/*! The updater evaluates the selector of the group on all ranks at the time steps it is called, so that the group
+    contains the particles that meet the selection at the last time step that is a multiple of the period.
+
+    The updater keeps only a weak reference to the group, so that it does not keep a group alive that is no longer
+    used. Once the group is destroyed, update() does nothing.
+
+    \ingroup updaters
+*/
+class PYBIND11_EXPORT ParticleGroupUpdater : public Updater
+    {
+    public:
+        //! Constructor
+        ParticleGroupUpdater(std::shared_ptr<SystemDefinition> sysdef,
+                             std::shared_ptr<ParticleGroup> group);
+
+        //! Destructor
+        virtual ~ParticleGroupUpdater();
+
+        //! Evaluate the group membership
+        virtual void update(unsigned int timestep);
+
+    private:
+        std::weak_ptr<ParticleGroup> m_group; //!< The dynamic group to evaluate
+    };
+
+//! Export the ParticleGroupUpdater to python
+void export_ParticleGroupUpdater(pybind11::module& m);
+
+#endif
@@ -0,0 +1,222 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+/*! \file ParticlePartition.cc
+    \brief Defines the ParticlePartition class
+*/
+
+#include "ParticlePartition.h"
+
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif
+
+#include <algorithm>
+#include <stdexcept>
+
+using namespace std;
+namespace py = pybind11;
+
+/*! \param sysdef System definition to partition
+    \param labels Label of each particle tag, NO_LABEL for the particles that belong to no group
+    \param num_groups Number of groups
+
+    \a labels must have one element per tag, up to the maximum tag of the particle data.
+*/
+ParticlePartition::ParticlePartition(std::shared_ptr<SystemDefinition> sysdef,
+                                     const std::vector<unsigned int>& labels,
+                                     unsigned int num_groups)
+    : m_sysdef(sysdef),
+      m_pdata(sysdef->getParticleData()),
+      m_exec_conf(m_pdata->getExecConf()),
+      m_num_groups(num_groups),
+      m_local_labels_stale(true)
+    {
+    std::vector<unsigned int> labels_copy(labels);
+    initialize(labels_copy);
+    }
+
+/*! \param sysdef System definition to partition
+    \param labels Label of each particle tag, negative for the particles that belong to no group
+    \param num_groups Number of groups
+
+    The labels are read directly from the buffer of the array, without converting the elements one by one.
+*/
+ParticlePartition::ParticlePartition(std::shared_ptr<SystemDefinition> sysdef,
+                                     const label_array_t& labels,
+                                     unsigned int num_groups)
+    : m_sysdef(sysdef),
+      m_pdata(sysdef->getParticleData()),
+      m_exec_conf(m_pdata->getExecConf()),
+      m_num_groups(num_groups),
+      m_local_labels_stale(true)
+    {
+    std::vector<unsigned int> labels_copy(labels.size());
+    const int *data = labels.data();
+    for (unsigned int i = 0; i < labels_copy.size(); ++i)
+        labels_copy[i] = (data[i] < 0) ? NO_LABEL : (unsigned int)data[i];
+
+    initialize(labels_copy);
+    }
+
+ParticlePartition::~ParticlePartition()
+    {
+    m_pdata->getParticleSortSignal().disconnect<ParticlePartition, &ParticlePartition::slotParticlesChanged>(this);
+    m_pdata->getMaxParticleNumberChangeSignal().disconnect<ParticlePartition, &ParticlePartition::slotParticlesChanged>(this);
+    m_pdata->getGlobalParticleNumberChangeSignal().disconnect<ParticlePartition, &ParticlePartition::slotParticlesChanged>(this);
+    }
+
+/*! \param labels Label of each particle tag, consumed by this method
+
+    The member lists are built with a counting sort of the tags by label, so the members of each group are
+    sorted by tag.
+*/
+void ParticlePartition::initialize(std::vector<unsigned int>& labels)
+    {
+    // check input
+    unsigned int max_tag = m_pdata->getMaximumTag();
+    if (labels.size() != max_tag+1)
+        {
+        m_exec_conf->msg->error() << "group.partition: Expected " << max_tag+1 << " labels, got " << labels.size()
+                                  << "." << std::endl;
+        throw std::runtime_error("Error creating ParticlePartition\n");
+        }
+
+    for (unsigned int tag = 0; tag < labels.size(); ++tag)
+        {
+        unsigned int label = labels[tag];
+        if (label != NO_LABEL && label >= m_num_groups)
+            {
+            m_exec_conf->msg->error() << "group.partition: Label " << label << " of particle " << tag
+                                      << " is out of range [0, " << m_num_groups << ")." << std::endl;
+            throw std::runtime_error("Error creating ParticlePartition\n");
+            }
+
+        // tags that are not in use belong to no group
+        if (!m_pdata->isTagActive(tag))
+            labels[tag] = NO_LABEL;
+        }
+
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+        // do a simple sanity check
+        unsigned int num_groups = m_num_groups;
+        bcast(num_groups, 0, m_exec_conf->getMPICommunicator());
+
+        if (num_groups != m_num_groups)
+            {
+            m_exec_conf->msg->error() << "group.partition: Number of groups is inconsistent among MPI ranks." << std::endl;
+            throw std::runtime_error("Error creating ParticlePartition\n");
+            }
+        }
+    #endif
+
+    // count the members of each group
+    m_group_offset.assign(m_num_groups+1, 0);
+    for (unsigned int tag = 0; tag < labels.size(); ++tag)
+        {
+        if (labels[tag] != NO_LABEL)
+            m_group_offset[labels[tag]+1]++;
+        }
+
+    for (unsigned int i = 0; i < m_num_groups; ++i)
+        m_group_offset[i+1] += m_group_offset[i];
+
+    // place the tags of each group in tag order
+    m_member_tags.resize(m_group_offset[m_num_groups]);
+    std::vector<unsigned int> fill(m_group_offset.begin(), m_group_offset.end()-1);
+    for (unsigned int tag = 0; tag < labels.size(); ++tag)
+        {
+        if (labels[tag] != NO_LABEL)
+            m_member_tags[fill[labels[tag]]++] = tag;
+        }
+
+    m_labels.swap(labels);
+
+    GlobalArray<unsigned int> local_labels(m_pdata->getMaxN(), m_exec_conf);
+    m_local_labels.swap(local_labels);
+    TAG_ALLOCATION(m_local_labels);
+
+    // the local labels follow the particles when they are sorted, reallocated, added or removed
+    m_pdata->getParticleSortSignal().connect<ParticlePartition, &ParticlePartition::slotParticlesChanged>(this);
+    m_pdata->getMaxParticleNumberChangeSignal().connect<ParticlePartition, &ParticlePartition::slotParticlesChanged>(this);
+    m_pdata->getGlobalParticleNumberChangeSignal().connect<ParticlePartition, &ParticlePartition::slotParticlesChanged>(this);
+    }
+
+/*! \returns The number of particles in each group
+*/
+std::vector<unsigned int> ParticlePartition::getGroupSizes() const
+    {
+    std::vector<unsigned int> sizes(m_num_groups);
+    for (unsigned int i = 0; i < m_num_groups; ++i)
+        sizes[i] = getGroupSize(i);
+    return sizes;
+    }
+
+/*! \param i Index of the group
+    \returns The tags of the particles with label \a i, in increasing order
+*/
+std::vector<unsigned int> ParticlePartition::getMemberTags(unsigned int i) const
+    {
+    if (i >= m_num_groups)
+        {
+        m_exec_conf->msg->error() << "group.partition: Group " << i << " is out of range [0, " << m_num_groups
+                                  << ")." << std::endl;
+        throw std::runtime_error("Error accessing ParticlePartition\n");
+        }
+
+    return std::vector<unsigned int>(m_member_tags.begin() + m_group_offset[i],
+                                     m_member_tags.begin() + m_group_offset[i+1]);
+    }
+
+/*! \param i Index of the group
+    \returns A static ParticleGroup with the particles labeled \a i
+*/
+std::shared_ptr<ParticleGroup> ParticlePartition::getGroup(unsigned int i) const
+    {
+    return std::shared_ptr<ParticleGroup>(new ParticleGroup(m_sysdef, getMemberTags(i)));
+    }
+
+/*! Looks up the label of each local particle by its tag.
+*/
+void ParticlePartition::rebuildLocalLabels() const
+    {
+    if (m_local_labels.getNumElements() < m_pdata->getMaxN())
+        m_local_labels.resize(m_pdata->getMaxN());
+
+    ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_local_labels(m_local_labels, access_location::host, access_mode::overwrite);
+    const unsigned int N = m_pdata->getN();
+
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
+    for (unsigned int idx=0; idx < N; ++idx)
+    #endif // ENABLE_TBB
+        {
+        h_local_labels.data[idx] = getLabel(h_tag.data[idx]);
+        }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
+
+    m_local_labels_stale = false;
+    }
+
+void export_ParticlePartition(py::module& m)
+    {
+    py::class_<ParticlePartition, std::shared_ptr<ParticlePartition> >(m,"ParticlePartition")
+    .def(py::init<std::shared_ptr<SystemDefinition>, const std::vector<unsigned int>&, unsigned int>())
+    .def(py::init<std::shared_ptr<SystemDefinition>, const ParticlePartition::label_array_t&, unsigned int>())
+    .def("getNumGroups", &ParticlePartition::getNumGroups)
+    .def("getGroupSize", &ParticlePartition::getGroupSize)
+    .def("getGroupSizes", &ParticlePartition::getGroupSizes)
+    .def("getLabel", &ParticlePartition::getLabel)
+    .def("getMemberTags", &ParticlePartition::getMemberTags)
+    .def("getGroup", &ParticlePartition::getGroup)
+    ;
+    }
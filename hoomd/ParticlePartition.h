@@ -0,0 +1,139 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+
+/*! \file ParticlePartition.h
+    \brief Declares the ParticlePartition class
+*/
+
+#ifdef NVCC
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "ParticleGroup.h"
+
+#include <memory>
+#include <vector>
+#include <hoomd/extern/pybind/include/pybind11/pybind11.h>
+#include <hoomd/extern/pybind/include/pybind11/numpy.h>
+
+#ifndef __PARTICLE_PARTITION_H__
+#define __PARTICLE_PARTITION_H__
+
+//! Partitions the particles into many disjoint groups
+/*! \b Overview
+
+    A ParticleGroup stores membership flags for all particles, which makes thousands of small groups (one per
+    molecule, or one per bin) expensive to build and to store. ParticlePartition instead defines many disjoint groups
+    with a single label per particle tag: a particle with label \a i belongs to group \a i, and a particle labeled
+    NO_LABEL belongs to no group.
+
+    Computes that operate on all groups at once read the label of each local particle with getLocalLabels(), which
+    lists the labels by particle index, and accumulate their results per group in a single pass over the particles.
+
+    The members of each group are also stored in tag order, grouped by label, so that getMemberTags() and getGroup()
+    return the members of a single group without a pass over all particles.
+
+    Like static ParticleGroups, the labels are defined at construction. Particles added to the system later belong to
+    no group, unless they reuse the tag of a labeled particle.
+
+    \ingroup data_structs
+*/
+class PYBIND11_EXPORT ParticlePartition
+    {
+    public:
+        //! Label of the particles that belong to no group
+        static const unsigned int NO_LABEL = 0xffffffff;
+
+        //! Contiguous array of labels accepted from python through the buffer protocol
+        typedef pybind11::array_t<int, pybind11::array::c_style | pybind11::array::forcecast> label_array_t;
+
+        //! Constructs the partition from a label per tag
+        ParticlePartition(std::shared_ptr<SystemDefinition> sysdef,
+                          const std::vector<unsigned int>& labels,
+                          unsigned int num_groups);
+
+        //! Constructs the partition from an array with a label per tag
+        ParticlePartition(std::shared_ptr<SystemDefinition> sysdef,
+                          const label_array_t& labels,
+                          unsigned int num_groups);
+
+        //! Destructor
+        ~ParticlePartition();
+
+        //! Get the number of groups
+        unsigned int getNumGroups() const
+            {
+            return m_num_groups;
+            }
+
+        //! Get the number of members of a group
+        /*! \param i Index of the group
+            \returns The number of particles with label \a i
+        */
+        unsigned int getGroupSize(unsigned int i) const
+            {
+            assert(i < m_num_groups);
+            return m_group_offset[i+1] - m_group_offset[i];
+            }
+
+        //! Get the number of members of all groups
+        std::vector<unsigned int> getGroupSizes() const;
+
+        //! Get the label of a particle
+        /*! \param tag Tag of the particle
+            \returns The label of the particle, or NO_LABEL
+        */
+        unsigned int getLabel(unsigned int tag) const
+            {
+            return tag < m_labels.size() ? m_labels[tag] : NO_LABEL;
+            }
+
+        //! Get the members of a group
+        std::vector<unsigned int> getMemberTags(unsigned int i) const;
+
+        //! Make a ParticleGroup of the members of a group
+        std::shared_ptr<ParticleGroup> getGroup(unsigned int i) const;
+
+        //! Get the labels of the local particles
+        /*! \returns An array with the label of each local particle, by particle index
+            \note This method CAN access the particle data tag array if the labels are rebuilt.
+                  Hence, the tag array may not be accessed in the same scope in which this method is called.
+        */
+        const GlobalArray<unsigned int>& getLocalLabels() const
+            {
+            if (m_local_labels_stale)
+                rebuildLocalLabels();
+            return m_local_labels;
+            }
+
+    private:
+        std::shared_ptr<SystemDefinition> m_sysdef;                 //!< The system definition
+        std::shared_ptr<ParticleData> m_pdata;                      //!< The particle data
+        std::shared_ptr<const ExecutionConfiguration> m_exec_conf;  //!< The execution configuration
+
+        unsigned int m_num_groups;                  //!< Number of groups
+        std::vector<unsigned int> m_labels;         //!< Label of each tag
+        std::vector<unsigned int> m_group_offset;   //!< Offset of the first member of each group in m_member_tags
+        std::vector<unsigned int> m_member_tags;    //!< Tags of the members, sorted by label and tag
+
+        mutable GlobalArray<unsigned int> m_local_labels;   //!< Label of each local particle, by index
+        mutable bool m_local_labels_stale;                  //!< True if the local labels need to be rebuilt
+
+        //! Check the labels and build the member lists
+        void initialize(std::vector<unsigned int>& labels);
+
+        //! Rebuild the labels of the local particles
+        void rebuildLocalLabels() const;
+
+        //! Helper function to be called when the local particles change
+        void slotParticlesChanged()
+            {
+            m_local_labels_stale = true;
+            }
+    };
+
+//! Exports the ParticlePartition class to python
+void export_ParticlePartition(pybind11::module& m);
+
+#endif
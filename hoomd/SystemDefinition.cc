@@ -11,6 +11,9 @@
 
 #include "SnapshotSystemData.h"
 
+#include <algorithm>
+#include <cmath>
+
 #ifdef ENABLE_MPI
 #include "Communicator.h"
 #endif
@@ -263,6 +266,295 @@ void SystemDefinition::initializeFromSnapshot(std::shared_ptr< SnapshotSystemDat
         }
     }
 
+/*! \param snapshot Snapshot to replicate, which must be the same on all ranks
+    \param nx Number of times to replicate the snapshot along the x direction
+    \param ny Number of times to replicate the snapshot along the y direction
+    \param nz Number of times to replicate the snapshot along the z direction
+
+    The global box is set to the box of \a snapshot replicated \a nx, \a ny, and \a nz times, and the
+    particles are initialized with the replicated particles of \a snapshot. In MPI simulations, every rank
+    only generates the images whose centers lie in its domain, so that the replicated system is never
+    held by a single rank. The tags are the same as with SnapshotSystemData::replicate(). Bonded groups in
+    \a snapshot are ignored.
+
+    This is used to initialize large lattices, where \a snapshot holds the unit cell.
+*/
+template <class Real>
+void SystemDefinition::initializeFromReplicatedSnapshot(std::shared_ptr< SnapshotSystemData<Real> > snapshot,
+                                                        unsigned int nx,
+                                                        unsigned int ny,
+                                                        unsigned int nz)
+    {
+    std::shared_ptr<const ExecutionConfiguration> exec_conf = m_particle_data->getExecConf();
+
+    if (nx == 0 || ny == 0 || nz == 0)
+        {
+        exec_conf->msg->error() << "init.*: Cannot replicate by zero along any direction" << endl;
+        throw runtime_error("Error initializing from snapshot");
+        }
+
+    setNDimensions(snapshot->dimensions);
+
+    // set the replicated box
+    BoxDim old_box = snapshot->global_box;
+    BoxDim new_box = old_box;
+    Scalar3 L = old_box.getL();
+    new_box.setL(make_scalar3(L.x*Scalar(nx), L.y*Scalar(ny), L.z*Scalar(nz)));
+    m_particle_data->setGlobalBox(new_box);
+
+    // images of this rank
+    uint3 lo = make_uint3(0,0,0);
+    uint3 hi = make_uint3(nx,ny,nz);
+    #ifdef ENABLE_MPI
+    std::shared_ptr<DomainDecomposition> decomposition = m_particle_data->getDomainDecomposition();
+    if (decomposition)
+        {
+        // an image belongs to the domain that holds its center
+        uint3 grid_pos = decomposition->getGridPos();
+        unsigned int n[3] = {nx, ny, nz};
+        unsigned int pos[3] = {grid_pos.x, grid_pos.y, grid_pos.z};
+        unsigned int first[3], last[3];
+        for (unsigned int dir = 0; dir < 3; ++dir)
+            {
+            Scalar f_lo = decomposition->getCumulativeFraction(dir, pos[dir]);
+            Scalar f_hi = decomposition->getCumulativeFraction(dir, pos[dir]+1);
+            first[dir] = (unsigned int)std::max(0.0, std::ceil(double(f_lo)*double(n[dir]) - 0.5));
+            last[dir] = (unsigned int)std::max(0.0, std::ceil(double(f_hi)*double(n[dir]) - 0.5));
+            first[dir] = std::min(first[dir], n[dir]);
+            last[dir] = std::min(std::max(last[dir], first[dir]), n[dir]);
+            }
+        lo = make_uint3(first[0], first[1], first[2]);
+        hi = make_uint3(last[0], last[1], last[2]);
+        }
+    #endif
+
+    // generate the particles of this rank
+    SnapshotParticleData<Real> local = snapshot->particle_data;
+    std::vector<unsigned int> tags(local.size);
+    for (unsigned int i = 0; i < local.size; ++i)
+        tags[i] = i;
+    unsigned int old_n = local.size;
+    local.replicateImages(nx, ny, nz, lo, hi, old_box, new_box, tags, old_n);
+
+    m_particle_data->initializeFromDistributedSnapshot(local, tags, old_n*nx*ny*nz);
+    }
+
+/*! \param nx Number of times to replicate the system along the x direction
+    \param ny Number of times to replicate the system along the y direction
+    \param nz Number of times to replicate the system along the z direction
+    \param update_grid If true, reset the cut planes of the processor grid to divide the new box uniformly
+
+    Every rank replicates its own particles and the bonded groups whose first member it owns, and sends
+    the images directly to the ranks whose domains they belong to. The system is never collected on a single
+    rank, and the tags are the same as when a snapshot of the system is replicated with
+    SnapshotSystemData::replicate().
+*/
+void SystemDefinition::replicate(unsigned int nx, unsigned int ny, unsigned int nz, bool update_grid)
+    {
+    std::shared_ptr<const ExecutionConfiguration> exec_conf = m_particle_data->getExecConf();
+
+    if (nx == 0 || ny == 0 || nz == 0)
+        {
+        exec_conf->msg->error() << "system.replicate: Cannot replicate by zero along any direction" << endl;
+        throw runtime_error("Error replicating system");
+        }
+
+    exec_conf->msg->notice(4) << "SystemDefinition: replicating system " << nx << "x" << ny << "x" << nz << endl;
+
+    const unsigned int n = nx*ny*nz;
+
+    // active tags, only needed when particles have been removed
+    std::vector<unsigned int> particle_tags;
+    const unsigned int old_n = m_particle_data->getNGlobal();
+    if (old_n > 0 && m_particle_data->getMaximumTag() + 1 != old_n)
+        {
+        particle_tags.resize(old_n);
+        for (unsigned int i = 0; i < old_n; ++i)
+            particle_tags[i] = m_particle_data->getNthTag(i);
+        }
+
+    // copy the local particles with compact tags
+    const unsigned int N = m_particle_data->getN();
+    SnapshotSystemData<double> snap;
+    snap.particle_data.resize(N);
+    for (unsigned int i = 0; i < m_particle_data->getNTypes(); ++i)
+        snap.particle_data.type_mapping.push_back(m_particle_data->getNameByType(i));
+    std::vector<unsigned int> tags(N);
+
+        {
+        ArrayHandle<Scalar4> h_pos(m_particle_data->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel(m_particle_data->getVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar3> h_accel(m_particle_data->getAccelerations(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_charge(m_particle_data->getCharges(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_diameter(m_particle_data->getDiameters(), access_location::host, access_mode::read);
+        ArrayHandle<int3> h_image(m_particle_data->getImages(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_body(m_particle_data->getBodies(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_orientation(m_particle_data->getOrientationArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_angmom(m_particle_data->getAngularMomentumArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar3> h_inertia(m_particle_data->getMomentsOfInertiaArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_tag(m_particle_data->getTags(), access_location::host, access_mode::read);
+
+        SnapshotParticleData<double>& p = snap.particle_data;
+        for (unsigned int idx = 0; idx < N; ++idx)
+            {
+            unsigned int tag = h_tag.data[idx];
+            if (!particle_tags.empty())
+                tag = std::lower_bound(particle_tags.begin(), particle_tags.end(), tag) - particle_tags.begin();
+            tags[idx] = tag;
+
+            const Scalar4 postype = h_pos.data[idx];
+            p.pos[idx] = vec3<double>(postype.x, postype.y, postype.z);
+            p.type[idx] = __scalar_as_int(postype.w);
+            const Scalar4 velmass = h_vel.data[idx];
+            p.vel[idx] = vec3<double>(velmass.x, velmass.y, velmass.z);
+            p.mass[idx] = velmass.w;
+            p.accel[idx] = vec3<double>(h_accel.data[idx]);
+            p.charge[idx] = h_charge.data[idx];
+            p.diameter[idx] = h_diameter.data[idx];
+            p.image[idx] = h_image.data[idx];
+            p.body[idx] = h_body.data[idx];
+            p.orientation[idx] = quat<double>(h_orientation.data[idx]);
+            p.angmom[idx] = quat<double>(h_angmom.data[idx]);
+            p.inertia[idx] = vec3<double>(h_inertia.data[idx]);
+            }
+        }
+
+    // replicate the bonded groups while the members are still local
+    std::vector<unsigned int> bond_tags, angle_tags, dihedral_tags, improper_tags, constraint_tags, pair_tags;
+    unsigned int n_bonds = replicateGroups(m_bond_data, particle_tags, n, snap.bond_data, bond_tags);
+    unsigned int n_angles = replicateGroups(m_angle_data, particle_tags, n, snap.angle_data, angle_tags);
+    unsigned int n_dihedrals = replicateGroups(m_dihedral_data, particle_tags, n, snap.dihedral_data, dihedral_tags);
+    unsigned int n_impropers = replicateGroups(m_improper_data, particle_tags, n, snap.improper_data, improper_tags);
+    unsigned int n_constraints = replicateGroups(m_constraint_data, particle_tags, n, snap.constraint_data, constraint_tags);
+    unsigned int n_pairs = replicateGroups(m_pair_data, particle_tags, n, snap.pair_data, pair_tags);
+
+    // replicate the particles into the new box
+    BoxDim old_box = m_particle_data->getGlobalBox();
+    BoxDim new_box = old_box;
+    Scalar3 L = old_box.getL();
+    new_box.setL(make_scalar3(L.x*Scalar(nx), L.y*Scalar(ny), L.z*Scalar(nz)));
+    snap.particle_data.replicateImages(nx, ny, nz, make_uint3(0,0,0), make_uint3(nx,ny,nz), old_box, new_box, tags, old_n);
+
+    #ifdef ENABLE_MPI
+    std::shared_ptr<DomainDecomposition> decomposition = m_particle_data->getDomainDecomposition();
+    if (decomposition && update_grid)
+        {
+        uint3 grid = decomposition->getGridSize();
+        unsigned int grid_size[3] = {grid.x, grid.y, grid.z};
+        for (unsigned int dir = 0; dir < 3; ++dir)
+            {
+            std::vector<Scalar> cum_frac(grid_size[dir]+1);
+            for (unsigned int i = 0; i <= grid_size[dir]; ++i)
+                cum_frac[i] = Scalar(i)/Scalar(grid_size[dir]);
+            cum_frac.back() = Scalar(1.0);
+            decomposition->setCumulativeFractions(dir, cum_frac, 0);
+            }
+        }
+    #endif
+
+    m_particle_data->setGlobalBox(new_box);
+    m_particle_data->initializeFromDistributedSnapshot(snap.particle_data, tags, old_n*n);
+
+    // send the bonded groups to the owners of their members
+    if (n_bonds > 0)
+        m_bond_data->initializeFromDistributedSnapshot(snap.bond_data, bond_tags, n_bonds*n);
+    if (n_angles > 0)
+        m_angle_data->initializeFromDistributedSnapshot(snap.angle_data, angle_tags, n_angles*n);
+    if (n_dihedrals > 0)
+        m_dihedral_data->initializeFromDistributedSnapshot(snap.dihedral_data, dihedral_tags, n_dihedrals*n);
+    if (n_impropers > 0)
+        m_improper_data->initializeFromDistributedSnapshot(snap.improper_data, improper_tags, n_impropers*n);
+    if (n_constraints > 0)
+        m_constraint_data->initializeFromDistributedSnapshot(snap.constraint_data, constraint_tags, n_constraints*n);
+    if (n_pairs > 0)
+        m_pair_data->initializeFromDistributedSnapshot(snap.pair_data, pair_tags, n_pairs*n);
+    }
+
+/*! \param group_data Bonded group data to replicate
+    \param particle_tags Sorted active particle tags, or empty if the tags are contiguous
+    \param n Number of images
+    \param snapshot Snapshot to store the replicated groups of this rank in
+    \param tags Tags of the groups in \a snapshot
+    \returns the global number of groups before the replication
+
+    Only the groups whose first member is owned by this rank are replicated, so that every group is
+    replicated by exactly one rank. The member tags and group tags are made compact before the images are
+    generated with the Snapshot::replicate() of the group data.
+*/
+template<class GroupData>
+unsigned int SystemDefinition::replicateGroups(std::shared_ptr<GroupData> group_data,
+                                               const std::vector<unsigned int>& particle_tags,
+                                               unsigned int n,
+                                               typename GroupData::Snapshot& snapshot,
+                                               std::vector<unsigned int>& tags)
+    {
+    typedef typename GroupData::members_t members_t;
+    const unsigned int group_size = GroupData::size;
+
+    const unsigned int nglobal = group_data->getNGlobal();
+    if (nglobal == 0)
+        return 0;
+
+    for (unsigned int i = 0; i < group_data->getNTypes(); ++i)
+        snapshot.type_mapping.push_back(group_data->getNameByType(i));
+
+    // active group tags, only needed when groups have been removed
+    std::vector<unsigned int> group_tags;
+    if (group_data->getMaximumTag() + 1 != nglobal)
+        {
+        group_tags.resize(nglobal);
+        for (unsigned int i = 0; i < nglobal; ++i)
+            group_tags[i] = group_data->getNthTag(i);
+        }
+
+        {
+        ArrayHandle<members_t> h_members(group_data->getMembersArray(), access_location::host, access_mode::read);
+        ArrayHandle<typeval_t> h_typeval(group_data->getTypeValArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_group_tag(group_data->getTags(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_rtag(m_particle_data->getRTags(), access_location::host, access_mode::read);
+
+        const unsigned int N = m_particle_data->getN();
+        for (unsigned int group_idx = 0; group_idx < group_data->getN(); ++group_idx)
+            {
+            members_t members = h_members.data[group_idx];
+
+            // replicate the group on the rank owning its first member
+            unsigned int idx = h_rtag.data[members.tag[0]];
+            if (idx >= N)
+                continue;
+
+            if (!particle_tags.empty())
+                {
+                for (unsigned int j = 0; j < group_size; ++j)
+                    members.tag[j] = std::lower_bound(particle_tags.begin(), particle_tags.end(), members.tag[j])
+                        - particle_tags.begin();
+                }
+
+            snapshot.groups.push_back(members);
+            if (GroupData::typemap_val)
+                snapshot.type_id.push_back(h_typeval.data[group_idx].type);
+            else
+                snapshot.val.push_back(h_typeval.data[group_idx].val);
+
+            unsigned int tag = h_group_tag.data[group_idx];
+            if (!group_tags.empty())
+                tag = std::lower_bound(group_tags.begin(), group_tags.end(), tag) - group_tags.begin();
+            tags.push_back(tag);
+            }
+        }
+    snapshot.size = snapshot.groups.size();
+
+    // groups of image j get the tags j*nglobal + tag
+    const unsigned int old_size = snapshot.size;
+    snapshot.replicate(n, m_particle_data->getNGlobal());
+    tags.resize(old_size*n);
+    for (unsigned int j = n; j-- > 0;)
+        for (unsigned int i = 0; i < old_size; ++i)
+            tags[old_size*j + i] = j*nglobal + tags[i];
+
+    return nglobal;
+    }
+
 // instantiate both float and double methods
 template SystemDefinition::SystemDefinition(std::shared_ptr< SnapshotSystemData<float> > snapshot,
                                                    std::shared_ptr<ExecutionConfiguration> exec_conf,
@@ -276,6 +568,10 @@ template std::shared_ptr< SnapshotSystemData<float> > SystemDefinition::takeSnap
                                                                                               bool integrators,
                                                                                               bool pairs);
 template void SystemDefinition::initializeFromSnapshot<float>(std::shared_ptr< SnapshotSystemData<float> > snapshot);
+template void SystemDefinition::initializeFromReplicatedSnapshot<float>(std::shared_ptr< SnapshotSystemData<float> > snapshot,
+                                                                         unsigned int nx,
+                                                                         unsigned int ny,
+                                                                         unsigned int nz);
 
 template SystemDefinition::SystemDefinition(std::shared_ptr< SnapshotSystemData<double> > snapshot,
                                                    std::shared_ptr<ExecutionConfiguration> exec_conf,
@@ -289,6 +585,10 @@ template std::shared_ptr< SnapshotSystemData<double> > SystemDefinition::takeSna
                                                                                               bool integrators,
                                                                                               bool pairs);
 template void SystemDefinition::initializeFromSnapshot<double>(std::shared_ptr< SnapshotSystemData<double> > snapshot);
+template void SystemDefinition::initializeFromReplicatedSnapshot<double>(std::shared_ptr< SnapshotSystemData<double> > snapshot,
+                                                                          unsigned int nx,
+                                                                          unsigned int ny,
+                                                                          unsigned int nz);
 
 void export_SystemDefinition(py::module& m)
     {
@@ -314,5 +614,8 @@ void export_SystemDefinition(py::module& m)
     .def("takeSnapshot_double", &SystemDefinition::takeSnapshot<double>)
     .def("initializeFromSnapshot", &SystemDefinition::initializeFromSnapshot<float>)
     .def("initializeFromSnapshot", &SystemDefinition::initializeFromSnapshot<double>)
+    .def("initializeFromReplicatedSnapshot", &SystemDefinition::initializeFromReplicatedSnapshot<float>)
+    .def("initializeFromReplicatedSnapshot", &SystemDefinition::initializeFromReplicatedSnapshot<double>)
+    .def("replicate", &SystemDefinition::replicate)
     ;
     }
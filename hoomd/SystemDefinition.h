@@ -158,6 +158,16 @@ class PYBIND11_EXPORT SystemDefinition
         template <class Real>
         void initializeFromSnapshot(std::shared_ptr< SnapshotSystemData<Real> > snapshot);
 
+        //! Initialize the particles by replicating a snapshot, with every rank generating its own domain
+        template <class Real>
+        void initializeFromReplicatedSnapshot(std::shared_ptr< SnapshotSystemData<Real> > snapshot,
+                                              unsigned int nx,
+                                              unsigned int ny,
+                                              unsigned int nz);
+
+        //! Replicate the system in place, with every rank generating the images of its own particles
+        void replicate(unsigned int nx, unsigned int ny, unsigned int nz, bool update_grid=false);
+
     private:
         unsigned int m_n_dimensions;                        //!< Dimensionality of the system
         std::shared_ptr<ParticleData> m_particle_data;    //!< Particle data for the system
@@ -168,6 +178,14 @@ class PYBIND11_EXPORT SystemDefinition
         std::shared_ptr<ConstraintData> m_constraint_data;//!< Improper data for the system
         std::shared_ptr<IntegratorData> m_integrator_data;    //!< Integrator data for the system
         std::shared_ptr<PairData> m_pair_data;            //!< Special pairs data for the system
+
+        //! Copy and replicate the local bonded groups of one kind
+        template<class GroupData>
+        unsigned int replicateGroups(std::shared_ptr<GroupData> group_data,
+                                     const std::vector<unsigned int>& particle_tags,
+                                     unsigned int n,
+                                     typename GroupData::Snapshot& snapshot,
+                                     std::vector<unsigned int>& tags);
     };
 
 //! Exports SystemDefinition to python
@@ -36,3 +36,116 @@ def series(warmup=100000, repeat=20, steps=10000, limit_hours=None):
         tps_list.append(hoomd.context.current.system.getLastTPS());
 
     return tps_list;
+
+def ghost_exchange(warmup=1000, repeat=5, steps=1000, limit_hours=None):
+    R""" Compare the staged and direct exchange of particles between domains.
+
+    Args:
+        warmup (int): Number of time steps to :py:meth:`hoomd.run()` to warm up each exchange mode
+        repeat (int): Number of times to repeat the benchmark *steps* for each exchange mode.
+        steps (int): Number of time steps to :py:meth:`hoomd.run()` at each benchmark point.
+        limit_hours (float): Limit each individual :py:meth:`hoomd.run()` length to this time.
+
+    Returns:
+        A dict with the list of TPS values from :py:func:`series()` for the ``'staged'`` and ``'direct'``
+        exchange modes of :py:class:`hoomd.comm.decomposition`.
+
+    :py:func:`ghost_exchange()` runs :py:func:`series()` on the current system once with each exchange mode, and
+    then restores the mode of the decomposition. It must be called in an MPI simulation on more than one rank.
+    The direct exchange pays off most with few particles per rank, so compare the modes at the system sizes of
+    interest for a strong scaling run.
+
+    Example::
+
+        for n in [10, 20, 40]:
+            with hoomd.context.SimulationContext():
+                hoomd.init.create_lattice(hoomd.lattice.sc(a=1.2), n=n)
+                nl = hoomd.md.nlist.cell()
+                lj = hoomd.md.pair.lj(r_cut=2.5, nlist=nl)
+                lj.pair_coeff.set('A', 'A', epsilon=1.0, sigma=1.0)
+                hoomd.md.integrate.mode_standard(dt=0.005)
+                hoomd.md.integrate.nvt(group=hoomd.group.all(), kT=1.2, tau=0.5)
+
+                tps = hoomd.benchmark.ghost_exchange(warmup=1000, repeat=3, steps=2000)
+                n_per_rank = n**3 / hoomd.comm.get_num_ranks()
+                if hoomd.comm.get_rank() == 0:
+                    print(n_per_rank, max(tps['staged']), max(tps['direct']))
+
+    .. versionadded:: 2.9
+    """
+    # check if initialization has occurred
+    if not hoomd.init.is_initialized():
+        hoomd.context.msg.error("Cannot benchmark the ghost exchange before initialization\n");
+        raise RuntimeError("Error benchmarking the ghost exchange")
+
+    decomposition = hoomd.context.current.decomposition
+    if hoomd.comm.get_num_ranks() == 1 or decomposition is None:
+        hoomd.context.msg.error("benchmark.ghost_exchange: requires a domain decomposition on more than one rank\n");
+        raise RuntimeError("Error benchmarking the ghost exchange")
+
+    old_exchange = decomposition.exchange
+    result = {}
+
+    hoomd.util.quiet_status()
+    for exchange in ('staged', 'direct'):
+        decomposition.set_params(exchange=exchange)
+        result[exchange] = series(warmup=warmup, repeat=repeat, steps=steps, limit_hours=limit_hours)
+
+    decomposition.set_params(exchange=old_exchange)
+    hoomd.util.unquiet_status()
+
+    return result;
+
+def mpcd_cell_list(warmup=1000, repeat=5, steps=1000, limit_hours=None):
+    R""" Compare the compact and padded layouts of the MPCD cell list.
+
+    Args:
+        warmup (int): Number of time steps to :py:meth:`hoomd.run()` to warm up each layout
+        repeat (int): Number of times to repeat the benchmark *steps* for each layout.
+        steps (int): Number of time steps to :py:meth:`hoomd.run()` at each benchmark point.
+        limit_hours (float): Limit each individual :py:meth:`hoomd.run()` length to this time.
+
+    Returns:
+        A dict with the list of TPS values from :py:func:`series()` for the ``'padded'`` and ``'compact'``
+        layouts, and the number of entries in the cell list after each run in ``'padded_entries'`` and
+        ``'compact_entries'``.
+
+    :py:func:`mpcd_cell_list()` runs :py:func:`series()` on the current MPCD system once with each layout of the
+    CPU cell list, and then restores the layout. The compact layout stores one entry per particle, while the padded
+    layout stores :math:`N_{\mathrm{max}}` entries for every cell, where :math:`N_{\mathrm{max}}` is the
+    largest cell occupancy. The difference grows with the density fluctuations in the system, for example near walls
+    or embedded particles. The entries are counted on the current rank.
+
+    The GPU cell list always uses the padded layout, so :py:func:`mpcd_cell_list()` requires a CPU simulation.
+
+    Example::
+
+        tps = hoomd.benchmark.mpcd_cell_list(warmup=1000, repeat=3, steps=2000)
+        if hoomd.comm.get_rank() == 0:
+            print(max(tps['padded']), max(tps['compact']), tps['padded_entries'], tps['compact_entries'])
+
+    .. versionadded:: 2.9
+    """
+    # check if initialization has occurred
+    if not hoomd.init.is_initialized() or hoomd.context.current.mpcd is None:
+        hoomd.context.msg.error("Cannot benchmark the MPCD cell list before MPCD initialization\n");
+        raise RuntimeError("Error benchmarking the MPCD cell list")
+
+    if hoomd.context.exec_conf.isCUDAEnabled():
+        hoomd.context.msg.error("benchmark.mpcd_cell_list: the GPU cell list only has the padded layout\n");
+        raise RuntimeError("Error benchmarking the MPCD cell list")
+
+    cell = hoomd.context.current.mpcd.cell
+    old_compact = cell.compact
+    result = {}
+
+    hoomd.util.quiet_status()
+    for layout in ('padded', 'compact'):
+        cell.compact = (layout == 'compact')
+        result[layout] = series(warmup=warmup, repeat=repeat, steps=steps, limit_hours=limit_hours)
+        result[layout + '_entries'] = cell.getCellListSize()
+
+    cell.compact = old_compact
+    hoomd.util.unquiet_status()
+
+    return result;
@@ -92,6 +92,7 @@ class decomposition(object):
         nx (int): Number of processors to uniformly space in x dimension (if *x* is None)
         ny (int): Number of processors to uniformly space in y dimension (if *y* is None)
         nz (int): Number of processors to uniformly space in z dimension (if *z* is None)
+        exchange (str): How particles are exchanged between domains (``'staged'`` or ``'direct'``)
 
     A single domain decomposition is defined for the simulation.
     A standard domain decomposition divides the simulation box into equal volumes along the Cartesian axes while minimizing
@@ -140,9 +141,20 @@ class decomposition(object):
     Warning:
         Both fractional widths and the number of processors cannot be set simultaneously, and an error will be
         raised if both are set.
+
+    By default, particles are exchanged in three *staged* rounds along *x*, *y*, and *z*, and particles
+    that go to an edge or corner neighbor are forwarded through the intermediate domains. With
+    ``exchange='direct'``, every rank exchanges particles directly with all of its (up to 26) neighbors
+    in a single round of messages. This reduces the latency of the ghost particle updates, and can improve
+    the performance of strong scaling runs with few particles per rank. Use :py:func:`hoomd.benchmark.ghost_exchange`
+    to compare both modes for a given system. Systems with bonds, angles, dihedrals, impropers, constraints, or
+    special pairs always use the staged exchange. The exchange mode only applies to CPU simulations.
+
+    .. versionadded:: 2.9
+       The *exchange* argument.
     """
 
-    def __init__(self, x=None, y=None, z=None, nx=None, ny=None, nz=None):
+    def __init__(self, x=None, y=None, z=None, nx=None, ny=None, nz=None, exchange='staged'):
         hoomd.util.print_status_line()
 
         # check that the context has been initialized though
@@ -168,9 +180,10 @@ class decomposition(object):
             self.uniform_x = True
             self.uniform_y = True
             self.uniform_z = True
+            self.exchange = 'staged'
 
             hoomd.util.quiet_status()
-            self.set_params(x,y,z,nx,ny,nz)
+            self.set_params(x,y,z,nx,ny,nz,exchange)
             hoomd.util.unquiet_status()
 
             # do a one time update of the cuts to the global values if a global is set
@@ -194,7 +207,7 @@ class decomposition(object):
 
             hoomd.context.current.decomposition = self
 
-    def set_params(self,x=None,y=None,z=None,nx=None,ny=None,nz=None):
+    def set_params(self,x=None,y=None,z=None,nx=None,ny=None,nz=None,exchange=None):
         """Set parameters for the decomposition before initialization.
 
         Args:
@@ -204,14 +217,26 @@ class decomposition(object):
             nx (int): Number of processors to uniformly space in x dimension (if *x* is None)
             ny (int): Number of processors to uniformly space in y dimension (if *y* is None)
             nz (int): Number of processors to uniformly space in z dimension (if *z* is None)
+            exchange (str): How particles are exchanged between domains (``'staged'`` or ``'direct'``)
+
+        Unlike the domain widths, the *exchange* mode can also be changed after initialization. It takes
+        effect on the next time step.
 
         Examples::
 
             decomposition.set_params(x=[0.2])
             decomposition.set_params(nx=1, y=[0.3,0.4], nz=2)
+            decomposition.set_params(exchange='direct')
         """
         hoomd.util.print_status_line()
 
+        if exchange is not None:
+            if exchange not in ('staged', 'direct'):
+                hoomd.context.msg.error("comm.decomposition: exchange must be 'staged' or 'direct'\n")
+                raise ValueError("Invalid exchange mode")
+            self.exchange = exchange
+            self._set_exchange()
+
         if (x is not None and nx is not None) or (y is not None and ny is not None) or (z is not None and nz is not None):
             hoomd.context.msg.error("comm.decomposition: cannot set fractions and number of processors simultaneously\n")
             raise RuntimeError("Cannot set fractions and number of processors simultaneously")
@@ -250,6 +275,23 @@ class decomposition(object):
             self.nz = nz
             self.uniform_z = True
 
+    ## \internal
+    # \brief Set the exchange mode of the C++ Communicator (if it exists)
+    def _set_exchange(self):
+        if hoomd.context.current.system is None:
+            return
+
+        cpp_comm = hoomd.context.current.system.getCommunicator()
+        if cpp_comm is None:
+            return
+
+        if hoomd.context.exec_conf.isCUDAEnabled():
+            if self.exchange == 'direct':
+                hoomd.context.msg.warning("comm.decomposition: the direct exchange is not available on the GPU, using the staged exchange\n")
+            return
+
+        cpp_comm.setDirectExchange(self.exchange == 'direct')
+
     ## \internal
     # \brief Delayed construction of the C++ object for this balanced decomposition
     # \param box Global simulation box for decomposition
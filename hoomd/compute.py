@@ -266,6 +266,118 @@ class thermo(_compute):
 
         hoomd.context.current.thermo.append(self)
 
+class thermo_multi(_compute):
+    R""" Compute thermodynamic properties of many groups of particles at once.
+
+    Args:
+        partition (:py:class:`hoomd.group.partition`): Groups to compute thermodynamic properties for.
+        labels (list): Group index of each particle, by tag (used to create a partition when *partition* is None).
+        name (str): Name of the partition created from *labels*.
+
+    :py:class:`thermo_multi` computes the thermodynamic properties of all groups of a
+    :py:class:`hoomd.group.partition` in a single pass over the particles and a single MPI reduction, instead of
+    one :py:class:`thermo` per group. Use it to monitor hundreds or thousands of groups, such as each molecule or
+    each bin of a profile. Either pass an existing *partition*, or the *labels* of the particles (see
+    :py:class:`hoomd.group.partition`).
+
+    The properties are available for logging with :py:class:`hoomd.hdf5.log` as matrix quantities with one row per
+    group (where **name** is replaced with the name of the partition):
+
+    * **num_particles_name** - :math:`N` number of particles in each group
+    * **kinetic_energy_name** - :math:`K` total kinetic energy of each group (in energy units)
+    * **translational_kinetic_energy_name** - translational kinetic energy of each group (in energy units)
+    * **rotational_kinetic_energy_name** - rotational kinetic energy of each group (in energy units)
+    * **temperature_name** - :math:`kT` instantaneous thermal energy of each group (in energy units), calculated
+      from the translational kinetic energy with :math:`D` degrees of freedom per particle:
+
+      .. math::
+
+        kT = 2 \cdot \frac{K_{\mathrm{trans}}}{D N}
+
+    * **potential_energy_name** - :math:`U` potential energy that each group contributes to the system
+      (in energy units)
+    * **momentum_name** - total momentum of each group (3 columns)
+    * **pressure_tensor_name** - contribution of each group to the pressure tensor of the system (6 columns,
+      *xx*, *xy*, *xz*, *yy*, *yz*, and *zz*, in pressure units):
+
+      .. math::
+
+          P_{ij} = \left[  \sum_{k \in g} m_k v_{k,i} v_{k,j} + \sum_{k \in g} W_{k,ij} \right]/V
+
+      where :math:`W_{k,ij}` is the virial of particle :math:`k` and :math:`V` is the volume of the box.
+
+    Rigid body constituent particles are excluded from all sums. Like :py:class:`thermo`, the rotational kinetic
+    energy, potential energy, and pressure tensor are only computed on steps when a logger (such as
+    :py:class:`hoomd.hdf5.log` or :py:class:`hoomd.analyze.log`) executes, and they are NaN on other steps. To read
+    them with :py:meth:`get` after a run, log on a period that includes the last step of the run.
+
+    The properties can also be read directly with :py:meth:`get`.
+
+    Examples::
+
+        molecules = group.partition(name="molecule", labels=numpy.arange(N) // 10)
+        t = compute.thermo_multi(partition=molecules)
+        log = hoomd.hdf5.log(h5file, period=100,
+                             matrix_quantities=['temperature_molecule', 'momentum_molecule'])
+
+        t = compute.thermo_multi(labels=bin_of_particle, name="bin")
+        hoomd.run(1000)
+        kT = t.get('temperature')
+
+    .. versionadded:: 2.9
+    """
+
+    def __init__(self, partition=None, labels=None, name='thermo_multi'):
+        hoomd.util.print_status_line();
+
+        # initialize base class
+        _compute.__init__(self);
+
+        if partition is None:
+            if labels is None:
+                hoomd.context.msg.error("compute.thermo_multi: Specify either a partition or labels\n");
+                raise ValueError('Error creating compute');
+
+            hoomd.util.quiet_status();
+            partition = hoomd.group.partition(name=name, labels=labels);
+            hoomd.util.unquiet_status();
+        elif labels is not None:
+            hoomd.context.msg.error("compute.thermo_multi: Specify either a partition or labels, not both\n");
+            raise ValueError('Error creating compute');
+
+        self.suffix = '_' + partition.name;
+        self.cpp_compute = _hoomd.ComputeThermoMulti(hoomd.context.current.system_definition,
+                                                     partition.cpp_partition,
+                                                     self.suffix);
+
+        hoomd.context.current.system.addCompute(self.cpp_compute, self.compute_name);
+
+        # save the partition for later referencing
+        self.partition = partition;
+
+    def get(self, quantity):
+        R""" Get a property of all groups.
+
+        Args:
+            quantity (str): Name of the property, without the partition name (for example ``temperature``
+                or ``pressure_tensor``).
+
+        Returns:
+            A numpy array with one row per group.
+
+        Note:
+            This method must be called on all ranks.
+
+        Examples::
+
+            kT = t.get('temperature')
+            p = t.get('momentum')
+
+        """
+        self.check_initialization();
+
+        return self.cpp_compute.getLogMatrix(quantity + self.suffix, hoomd.get_step());
+
 ## \internal
 # \brief Returns the previously created compute.thermo with the same group, if created. Otherwise, creates a new
 # compute.thermo
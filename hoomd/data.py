@@ -806,13 +806,14 @@ class system_data(hoomd.meta._metadata):
 
         return cpp_snapshot
 
-    def replicate(self, nx=1, ny=1, nz=1):
+    def replicate(self, nx=1, ny=1, nz=1, update_grid=False):
         R""" Replicates the system along the three spatial dimensions.
 
         Args:
             nx (int): Number of times to replicate the system along the x-direction
             ny (int): Number of times to replicate the system along the y-direction
             nz (int): Number of times to replicate the system along the z-direction
+            update_grid (bool): When True, reset the domain boundaries of the processor grid to divide the new box uniformly
 
         This method replicates particles along all three spatial directions, as
         opposed to replication implied by periodic boundary conditions.
@@ -822,6 +823,11 @@ class system_data(hoomd.meta._metadata):
         other particle properties are replicated as well. Also bonded groups between particles
         are replicated.
 
+        The system is replicated in place: every rank generates the replicas of its own particles and bonded
+        groups and sends them directly to the ranks whose domains they belong to, so that the replicated system
+        is never held by a single rank. The particle and bonded group tags are the same as when a snapshot of the
+        system is replicated with ``replicate()``.
+
         Examples::
 
             system = init.read_xml("some_file.xml")
@@ -832,6 +838,10 @@ class system_data(hoomd.meta._metadata):
             The dimensions of the processor grid are not updated upon replication. For example, if an initially
             cubic box is replicated along only one spatial direction, this could lead to decreased performance
             if the processor grid was optimal for the original box dimensions, but not for the new ones.
+            Set *update_grid* to True to reset domain boundaries that were moved by the load balancer.
+
+        .. versionadded:: 2.9
+            The *update_grid* argument.
 
         """
         hoomd.util.print_status_line()
@@ -848,19 +858,7 @@ class system_data(hoomd.meta._metadata):
             hoomd.context.msg.error("Cannot replicate by zero or by a negative value along any direction.")
             raise RuntimeError("nx, ny, nz need to be positive integers")
 
-        # Take a snapshot
-        hoomd.util.quiet_status()
-        cpp_snapshot = self.take_snapshot(all=True)
-        hoomd.util.unquiet_status()
-
-        if hoomd.comm.get_rank() == 0:
-            # replicate
-            cpp_snapshot.replicate(nx, ny, nz)
-
-        # restore from snapshot
-        hoomd.util.quiet_status()
-        self.restore_snapshot(cpp_snapshot)
-        hoomd.util.unquiet_status()
+        self.sysdef.replicate(nx, ny, nz, bool(update_grid))
 
     def restore_snapshot(self, snapshot):
         R""" Re-initializes the system from a snapshot.
@@ -2321,6 +2319,98 @@ def gsd_snapshot(filename, frame=0):
     reader = _hoomd.GSDReader(hoomd.context.exec_conf, filename, abs(frame), frame < 0);
     return reader.getSnapshot();
 
+class gsd_reader(object):
+    R""" Reusable reader for GSD files.
+
+    Args:
+        filename (str): GSD file to read.
+        distributed (bool): When True, open the file on all MPI ranks to initialize with a parallel read
+            (see :py:func:`hoomd.init.read_gsd`).
+
+    :py:class:`gsd_reader` opens a GSD file once and keeps it open. The index of the file is memory
+    mapped when it is opened, and frames and data chunks are only read when they are requested. Use it
+    to read many frames of a long trajectory without paying for :py:func:`gsd_snapshot` to open the file
+    and load its index again for each frame.
+
+    A :py:class:`gsd_reader` can be passed as the *filename* of :py:func:`hoomd.init.read_gsd` to initialize
+    from any of its frames, and the snapshots returned by :py:meth:`get_snapshot` can be restored into a
+    running simulation with :py:meth:`hoomd.data.system_data.restore_snapshot`.
+
+    Note:
+        The frames written to the file after it is opened are not visible to the reader.
+
+    Examples::
+
+        traj = data.gsd_reader('trajectory.gsd')
+        system = init.read_gsd(filename=traj, frame=-1)
+        ...
+        system.restore_snapshot(traj.get_snapshot(frame=len(traj)//2))
+
+        positions = traj.read_chunk('particles/position', frame=10)
+
+    .. versionadded:: 2.9
+    """
+    def __init__(self, filename, distributed=False):
+        hoomd.context._verify_init();
+
+        self.filename = _hoomd.mpi_bcast_str(filename, hoomd.context.exec_conf);
+        self.distributed = distributed;
+        self.cpp_reader = _hoomd.GSDReader(hoomd.context.exec_conf, self.filename, distributed);
+        self.nframes = self.cpp_reader.getNFrames();
+
+    ## \internal
+    # \brief Get the number of frames
+    def __len__(self):
+        return self.nframes;
+
+    ## \internal
+    # \brief Read a frame into the C++ reader
+    def _read_frame(self, frame):
+        if frame >= self.nframes or frame < -self.nframes:
+            hoomd.context.msg.error("data.gsd_reader: Cannot read frame " + str(frame) + ", " + self.filename +
+                                    " only has " + str(self.nframes) + " frames\n");
+            raise IndexError('Frame index out of range');
+
+        return self.cpp_reader.readFrame(abs(frame), frame < 0);
+
+    def get_snapshot(self, frame=0):
+        R""" Read a snapshot from the file.
+
+        Args:
+            frame (int): Frame to read. Negative values index from the end of the file.
+
+        Returns:
+            A new snapshot of the frame. Like :py:func:`gsd_snapshot`, the snapshot holds the particles
+            on the root rank.
+
+        Note:
+            This method must be called on all ranks.
+
+        """
+        if self.distributed:
+            hoomd.context.msg.error("data.gsd_reader: Cannot read a snapshot from a reader opened in distributed mode\n");
+            raise RuntimeError('Error reading snapshot');
+
+        return self._read_frame(frame);
+
+    def read_chunk(self, name, frame=0):
+        R""" Read a data chunk from the file.
+
+        Args:
+            name (str): Name of the chunk, such as ``particles/position``.
+            frame (int): Frame to read the chunk from. Negative values index from the end of the file.
+
+        Returns:
+            The chunk as a numpy array with one row per entry, or None on ranks that did not open the file.
+
+        Following the HOOMD schema, a chunk that is not present in *frame* is read from frame 0.
+
+        """
+        if frame < 0:
+            frame += self.nframes;
+
+        return self.cpp_reader.readChunkPy(frame, name);
+
 
 # Note: SnapshotParticleData should never be instantiated, it is a placeholder to generate sphinx documentation,
 # as the real SnapshotParticleData lives in c++.
@@ -565,6 +565,8 @@ class gsd(hoomd.analyze._analyzer):
     :py:class:`gsd` can save internal state data for the following hoomd objects:
 
         * :py:class:`HPMC integrators <hoomd.hpmc.integrate.mode_hpmc>`
+        * :py:class:`MPCD particles <hoomd.mpcd.data.system>` (restore with :py:func:`hoomd.mpcd.init.read_gsd`)
+        * :py:class:`MPCD cell fields <hoomd.mpcd.analyze.field>` (written only)
 
     Call :py:meth:`dump_state` with the object as an argument to enable saving its state. State saved in this way
     can be restored after initializing the system with :py:meth:`hoomd.init.read_gsd`.
@@ -728,3 +730,90 @@ class gsd(hoomd.analyze._analyzer):
         .. versionadded:: 2.7
         """
         return self.cpp_analyzer.user_log;
+
+class checkpoint(hoomd.analyze._analyzer):
+    R""" Writes restart checkpoints with all MPI ranks in parallel.
+
+    Args:
+        filename (str): Name of the checkpoint index file, and base name of the parts.
+        period (int): Number of time steps between checkpoints, or None to write a single checkpoint immediately.
+        phase (int): When -1, start on the current time step. When >= 0, execute on steps where *(step + phase) % period == 0*.
+        asynchronous (bool): When True, write the checkpoint files in the background while the simulation continues.
+
+    :py:class:`hoomd.dump.gsd` gathers the whole system on the root rank to write a restart file. For very large
+    MPI simulations, this takes a large fraction of the run time and requires the root rank to hold the full system
+    in memory. :py:class:`checkpoint` instead has every rank write the particles in its domain to its own file
+    (a part), in parallel and without communication. Each part is a GSD file with the ``hoomd-checkpoint`` schema,
+    which stores all particle properties and bonded groups in double precision.
+
+    Read a checkpoint with :py:func:`hoomd.init.read_checkpoint`. A checkpoint can be read on any number of ranks,
+    and with any domain decomposition.
+
+    Checkpoints alternate between two slots: the part of each rank is written to *filename*.\ *slot*.\ *rank*,
+    with *slot* 0 or 1. Once the parts of all ranks are complete, the root rank commits the checkpoint by replacing
+    the small index file *filename*, which references the slot of the last complete checkpoint. When a job is
+    interrupted while writing, the parts in the slot being written may come from different time steps, but the
+    index still references the previous complete checkpoint in the other slot, and
+    :py:func:`hoomd.init.read_checkpoint` reads that one. A new :py:class:`checkpoint` starts in the slot that is
+    not referenced by an existing index file.
+
+    With *asynchronous* set to True, :py:class:`checkpoint` only copies the local particles and writes the part in
+    a background thread. The next checkpoint, :py:meth:`write_restart`, and :py:meth:`wait` wait for the previous
+    write to complete and commit it.
+
+    Note:
+        The state of the integrators is not stored in the checkpoint.
+
+    Warning:
+        A checkpoint written in the background is only committed by the next checkpoint or :py:meth:`wait`. Call
+        :py:meth:`write_restart` at the end of the job to write and commit the final checkpoint.
+
+    Examples::
+
+        if os.path.exists('restart'):
+            system = hoomd.init.read_checkpoint('restart')
+        else:
+            system = hoomd.init.read_gsd('init.gsd')
+
+        ckpt = hoomd.dump.checkpoint('restart', period=100000, asynchronous=True)
+        hoomd.run(1e6)
+        ckpt.write_restart()
+
+    .. versionadded:: 2.9
+    """
+    def __init__(self, filename, period, phase=0, asynchronous=False):
+        hoomd.util.print_status_line();
+
+        # initialize base class
+        hoomd.analyze._analyzer.__init__(self);
+
+        filename = _hoomd.mpi_bcast_str(filename, hoomd.context.exec_conf);
+        self.cpp_analyzer = _hoomd.GSDCheckpointWriter(hoomd.context.current.system_definition, filename, asynchronous);
+
+        if period is not None:
+            self.setupAnalyzer(period, phase);
+        else:
+            self.write_restart();
+
+        # store metadata
+        self.filename = filename
+        self.period = period
+        self.phase = phase
+        self.asynchronous = asynchronous
+        self.metadata_fields = ['filename', 'period', 'phase', 'asynchronous']
+
+    def write_restart(self):
+        """ Write a checkpoint at the current time step and wait for it to complete.
+
+        Call :py:meth:`write_restart` at the end of a simulation to write the final state.
+        """
+
+        time_step = hoomd.context.current.system.getCurrentTimeStep()
+        self.cpp_analyzer.analyze(time_step);
+        self.cpp_analyzer.wait();
+
+    def wait(self):
+        """ Wait for a checkpoint written in the background to complete and commit it.
+        """
+
+        self.cpp_analyzer.wait();
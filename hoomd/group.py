@@ -11,6 +11,7 @@ This package contains various commands for making groups of particles
 from hoomd import _hoomd;
 import hoomd;
 import sys;
+import numpy;
 
 class group(hoomd.meta._metadata):
     R""" Defines a group of particles
@@ -39,6 +40,23 @@ class group(hoomd.meta._metadata):
     * :py:func:`hoomd.group.intersection()`
     * :py:func:`hoomd.group.union()`
 
+    Groups made by :py:func:`hoomd.group.cuboid()`, :py:func:`hoomd.group.tags()`, :py:func:`hoomd.group.type()`
+    and :py:func:`hoomd.group.charged()` are dynamic when they are given a *period*. The membership of a dynamic
+    group is re-evaluated at every time step that is a multiple of *period* from the current state of the system,
+    and computes such as :py:class:`hoomd.compute.thermo` count the degrees of freedom of the new members.
+    Particles removed from the system leave the group right away, particles added to the system join it at the
+    next evaluation. Each evaluation selects the particles on every MPI rank in parallel and only exchanges the
+    particles that joined or left the group. The membership is not re-evaluated when the group is queried
+    between evaluations, call :py:meth:`force_update` to evaluate it immediately. Set operations with a dynamic operand make a dynamic group that re-evaluates the whole
+    expression::
+
+        slab = group.cuboid(name="slab", zmin=-1, zmax=1, period=10)
+        groupA = group.type('A')
+        slabA = group.intersection(name="slab-A", a=slab, b=groupA)
+        hoomd.compute.thermo(group=slabA)
+
+    Dynamic groups cannot be written with :py:class:`hoomd.dump.gsd` or :py:class:`hoomd.dump.dcd`.
+
     Note:
         Groups need to be consistent with the particle data. If a particle member is removed from the simulation,
         it will be temporarily removed from the group as well, that is, even though the group reports that tag as a member,
@@ -96,20 +114,53 @@ class group(hoomd.meta._metadata):
         # support python2
         next = __next__;
 
+    ## \internal
+    # \brief Id counter for the updaters of dynamic groups
+    cur_id = 0
+
     ## \internal
     # \brief Creates a group
     #
     # \param name Name of the group
     # \param cpp_group an instance of _hoomd.ParticleData that defines the group
-    def __init__(self, name, cpp_group):
+    # \param cpp_selector The _hoomd.ParticleSelector of a dynamic group
+    # \param period Period of the re-evaluation of a dynamic group
+    def __init__(self, name, cpp_group, cpp_selector=None, period=None):
         # initialize the group
         self.name = name;
         self.cpp_group = cpp_group;
+        self.cpp_selector = cpp_selector;
+        self.period = period;
 
         # base class constructor
         hoomd.meta._metadata.__init__(self)
         self.metadata_fields = ['name']
 
+        if period is not None:
+            # evaluate the membership every period steps, the updater is removed with the group
+            self.cpp_updater = _hoomd.ParticleGroupUpdater(hoomd.context.current.system_definition, cpp_group);
+            self.updater_name = "group_updater%d" % group.cur_id;
+            group.cur_id += 1;
+            self.cpp_system = hoomd.context.current.system;
+            self.cpp_system.addUpdater(self.cpp_updater, self.updater_name, int(period), 0);
+            self.metadata_fields.append('period')
+
+    ## \internal
+    # \brief Remove the updater of a dynamic group from the system it was added to
+    def __del__(self):
+        if getattr(self, 'cpp_updater', None) is not None:
+            self.cpp_system.removeUpdater(self.updater_name);
+            self.cpp_updater = None;
+
+    ## \internal
+    # \brief Get a selector for the members of the group
+    def _get_selector(self):
+        if self.cpp_selector is not None:
+            return self.cpp_selector;
+
+        # static groups take part with their current members
+        return _hoomd.ParticleSelectorGroup(hoomd.context.current.system_definition, self.cpp_group);
+
     def force_update(self):
         R""" Force an update of the group.
 
@@ -117,10 +168,15 @@ class group(hoomd.meta._metadata):
         member list based on the current state of the system. For example, call :py:meth:`hoomd.group.group.force_update()`
         set set a cuboid group's membership to particles that are currently in the defined region.
 
-        Groups made by a combination (union, intersection, difference) of other groups will not
+        Groups made by a combination (union, intersection, difference) of static groups will not
         update their membership, they are always static.
+
+        A dynamic group is re-evaluated immediately. This must be called on all MPI ranks.
         """
-        self.cpp_group.updateMemberTags(True);
+        if self.period is not None:
+            self.cpp_group.evaluate();
+        else:
+            self.cpp_group.updateMemberTags(True);
 
     ## \internal
     # \brief Get a particle_proxy reference to the i'th particle in the group
@@ -150,6 +206,54 @@ class group(hoomd.meta._metadata):
     def __iter__(self):
         return group.group_iterator(self);
 
+## \internal
+# \brief Create a dynamic group from a set operation
+#
+# \param name Name of the group
+# \param a First group
+# \param b Second group
+# \param op The _hoomd.ParticleSelectorSetOperation.operation
+# \param period Period of the re-evaluation, None to use the smallest period of the operands
+#
+# \returns None when both operands are static and no period is given
+def _make_set_operation(name, a, b, op, period):
+    if period is None:
+        periods = [g.period for g in (a, b) if g.period is not None];
+        if len(periods) == 0:
+            return None;
+        period = min(periods);
+
+    selector = _hoomd.ParticleSelectorSetOperation(hoomd.context.current.system_definition,
+                                                   a._get_selector(),
+                                                   b._get_selector(),
+                                                   op);
+    return _make_group(name, selector, True, period);
+
+## \internal
+# \brief Create a group from a selector
+#
+# \param name Name of the group
+# \param selector The _hoomd.ParticleSelector defining the group
+# \param update Update the static group when particles are added or removed
+# \param period Period of the re-evaluation, None for a static group
+def _make_group(name, selector, update, period):
+    if period is None:
+        cpp_group = _hoomd.ParticleGroup(hoomd.context.current.system_definition, selector, update);
+        result = group(name, cpp_group);
+    else:
+        period = int(period);
+        if period < 1:
+            hoomd.context.msg.error("group: period must be a positive integer\n");
+            raise ValueError('Invalid group period');
+
+        cpp_group = _hoomd.ParticleGroup(hoomd.context.current.system_definition, selector, True, True);
+        result = group(name, cpp_group, selector, period);
+
+    # notify the user of the created group
+    hoomd.context.msg.notice(2, 'Group "' + name + '" created containing ' + str(cpp_group.getNumMembersGlobal()) + ' particles\n');
+
+    return result;
+
 def all():
     R""" Groups all particles.
 
@@ -190,7 +294,7 @@ def all():
     hoomd.context.current.group_all = group(name, cpp_group);
     return hoomd.context.current.group_all;
 
-def cuboid(name, xmin=None, xmax=None, ymin=None, ymax=None, zmin=None, zmax=None):
+def cuboid(name, xmin=None, xmax=None, ymin=None, ymax=None, zmin=None, zmax=None, period=None):
     R""" Groups particles in a cuboid.
 
     Args:
@@ -201,6 +305,7 @@ def cuboid(name, xmin=None, xmax=None, ymin=None, ymax=None, zmin=None, zmax=Non
         ymax (float): (if set) Upper right y-coordinate of the cuboid (in distance units)
         zmin (float): (if set) Lower left z-coordinate of the cuboid (in distance units)
         zmax (float): (if set) Upper right z-coordinate of the cuboid (in distance units)
+        period (int): (if set) Re-evaluate the membership every *period* time steps
 
     If any of the above parameters is not set, it will automatically be placed slightly outside of the simulation box
     dimension, allowing easy specification of slabs.
@@ -209,7 +314,7 @@ def cuboid(name, xmin=None, xmax=None, ymin=None, ymax=None, zmin=None, zmax=Non
     ``xmin <= x < xmax`` (and so forth for y and z) so that directly adjacent cuboids do not have overlapping group members.
 
     Note:
-        Membership in :py:class:`cuboid` is defined at time of group creation. Once created,
+        Without a *period*, membership in :py:class:`cuboid` is defined at time of group creation. Once created,
         any particles added to the system will not be added to the group. Any particles that move
         into the cuboid region will not be added automatically, and any that move out will not be
         removed automatically.
@@ -217,6 +322,9 @@ def cuboid(name, xmin=None, xmax=None, ymin=None, ymax=None, zmin=None, zmax=Non
     Between runs, you can force a group to update its membership with the particles currently
     in the originally defined region using :py:meth:`hoomd.group.group.force_update()`.
 
+    With a *period*, the group is dynamic and contains the particles in the region at the last time step that is
+    a multiple of *period* (see :py:class:`group`).
+
     Examples::
 
         slab = group.cuboid(name="slab", ymin=-3, ymax=3)
@@ -225,6 +333,12 @@ def cuboid(name, xmin=None, xmax=None, ymin=None, ymax=None, zmin=None, zmax=Non
         # Remove particles that left the region and add particles that entered the region.
         cube.force_update()
 
+        # particles currently in the slab, updated every 10 steps
+        slab = group.cuboid(name="slab", zmin=-1, zmax=1, period=10)
+
+    .. versionchanged:: 2.9
+        Added *period*.
+
     """
     hoomd.util.print_status_line();
 
@@ -259,13 +373,7 @@ def cuboid(name, xmin=None, xmax=None, ymin=None, ymax=None, zmin=None, zmax=Non
 
     # create the group
     selector = _hoomd.ParticleSelectorCuboid(hoomd.context.current.system_definition, ll, ur);
-    cpp_group = _hoomd.ParticleGroup(hoomd.context.current.system_definition, selector);
-
-    # notify the user of the created group
-    hoomd.context.msg.notice(2, 'Group "' + name + '" created containing ' + str(cpp_group.getNumMembersGlobal()) + ' particles\n');
-
-    # return it in the wrapper class
-    return group(name, cpp_group);
+    return _make_group(name, selector, True, period);
 
 def rigid_center():
     R""" Groups particles that are center particles of rigid bodies.
@@ -472,7 +580,7 @@ def body():
     # return it in the wrapper class
     return group(name, cpp_group);
 
-def tags(tag_min, tag_max=None, name=None, update=False):
+def tags(tag_min, tag_max=None, name=None, update=False, period=None):
     R""" Groups particles by tag.
 
     Args:
@@ -480,8 +588,10 @@ def tags(tag_min, tag_max=None, name=None, update=False):
         tag_max (int): Last tag in the range to include (inclusive)
         name (str): User-assigned name for this group. If a name is not specified, a default one will be generated.
         update (bool): When True, update list of group members when particles are added to or removed from the simulation.
+        period (int): (if set) Re-evaluate the membership every *period* time steps
 
-    Creates a particle group from particles that match the given tag range.
+    Creates a particle group from particles that match the given tag range. A dynamic group (with a *period*) follows the
+    particles that are added to the simulation at its next evaluation, and those removed from it right away.
 
     The *tag_max* is optional. If it is not specified, then a single particle with ``tag=tag_min`` will be
     added to the group.
@@ -491,6 +601,8 @@ def tags(tag_min, tag_max=None, name=None, update=False):
         half1 = group.tags(name="first-half", tag_min=0, tag_max=999)
         half2 = group.tags(name="second-half", tag_min=1000, tag_max=1999)
 
+    .. versionchanged:: 2.9
+        Added *period*.
     """
     hoomd.util.print_status_line();
 
@@ -512,28 +624,26 @@ def tags(tag_min, tag_max=None, name=None, update=False):
 
     # create the group
     selector = _hoomd.ParticleSelectorTag(hoomd.context.current.system_definition, tag_min, tag_max);
-    cpp_group = _hoomd.ParticleGroup(hoomd.context.current.system_definition, selector, update);
-
-    # notify the user of the created group
-    hoomd.context.msg.notice(2, 'Group "' + name + '" created containing ' + str(cpp_group.getNumMembersGlobal()) + ' particles\n');
-
-    # return it in the wrapper class
-    return group(name, cpp_group);
+    return _make_group(name, selector, update, period);
 
 def tag_list(name, tags):
     R""" Groups particles by tag list.
 
     Args:
-        tags (list): List of particle tags to include in the group
+        tags (list): List or numpy array of particle tags to include in the group
         name (str): User-assigned name for this group.
 
     Creates a particle group from particles with the given tags. Can be used to implement advanced grouping not
     available with existing group commands.
 
+    The tags are converted to a numpy array and passed to the group in a single copy, so large tag lists are best
+    given as integer numpy arrays. To define many disjoint groups at once, use :py:class:`partition`.
+
     Examples::
 
         a = group.tag_list(name="a", tags = [0, 12, 18, 205])
         b = group.tag_list(name="b", tags = range(20,400))
+        c = group.tag_list(name="c", tags = numpy.arange(1000, 2000))
 
     """
     hoomd.util.print_status_line();
@@ -543,13 +653,21 @@ def tag_list(name, tags):
         hoomd.context.msg.error("Cannot create a group before initialization\n");
         raise RuntimeError('Error creating group');
 
-    # build a vector of the tags
-    cpp_list = _hoomd.std_vector_uint();
-    for t in tags:
-        cpp_list.append(t);
+    # convert the tags to an array of unsigned ints without a python loop
+    if not isinstance(tags, numpy.ndarray):
+        tags = numpy.asarray(tags if hasattr(tags, '__len__') else list(tags));
+    if tags.size == 0:
+        tags = numpy.zeros(0, dtype=numpy.int64);
+    if tags.ndim != 1 or tags.dtype.kind not in 'iu':
+        hoomd.context.msg.error("group.tag_list: tags must be a 1D list of integers\n");
+        raise ValueError('Error creating group');
+    if tags.dtype.kind == 'i' and numpy.any(tags < 0):
+        hoomd.context.msg.error("group.tag_list: tags must not be negative\n");
+        raise ValueError('Error creating group');
 
     # create the group
-    cpp_group = _hoomd.ParticleGroup(hoomd.context.current.system_definition, cpp_list);
+    cpp_group = _hoomd.ParticleGroup(hoomd.context.current.system_definition,
+                                     numpy.ascontiguousarray(tags, dtype=numpy.uint32));
 
     # notify the user of the created group
     hoomd.context.msg.notice(2, 'Group "' + name + '" created containing ' + str(cpp_group.getNumMembersGlobal()) + ' particles\n');
@@ -557,13 +675,14 @@ def tag_list(name, tags):
     # return it in the wrapper class
     return group(name, cpp_group);
 
-def type(type, name=None, update=False):
+def type(type, name=None, update=False, period=None):
     R""" Groups particles by type.
 
     Args:
         type (str): Name of the particle type to add to the group.
         name (str): User-assigned name for this group. If a name is not specified, a default one will be generated.
         update (bool): When true, update list of group members when particles are added to or removed from the simulation.
+        period (int): (if set) Re-evaluate the membership every *period* time steps
 
     Creates a particle group from particles that match the given type. The group can then be used by other hoomd
     commands (such as analyze.msd) to specify which particles should be operated on.
@@ -576,12 +695,17 @@ def type(type, name=None, update=False):
     Between runs, you can force a group to update its membership with the particles currently
     in the originally  specified type using :py:meth:`hoomd.group.group.force_update()`.
 
+    With a *period*, the group is dynamic and follows particles that change type (see :py:class:`group`).
+
     Examples::
 
         groupA = group.type(name='a-particles', type='A')
         groupB = group.type(name='b-particles', type='B')
         groupB = group.type(name='b-particles', type='B',update=True)
+        groupB = group.type(name='b-particles', type='B', period=100)
 
+    .. versionchanged:: 2.9
+        Added *period*.
     """
     hoomd.util.print_status_line();
     type = str(type);
@@ -607,7 +731,7 @@ def type(type, name=None, update=False):
     else:
         type_id = hoomd.context.current.system_definition.getParticleData().getTypeByName(type);
         selector = _hoomd.ParticleSelectorType(hoomd.context.current.system_definition, type_id, type_id);
-        cpp_group = _hoomd.ParticleGroup(hoomd.context.current.system_definition, selector, update);
+        return _make_group(name, selector, update, period);
 
     # notify the user of the created group
     hoomd.context.msg.notice(2, 'Group "' + name + '" created containing ' + str(cpp_group.getNumMembersGlobal()) + ' particles\n');
@@ -615,22 +739,26 @@ def type(type, name=None, update=False):
     # return it in the wrapper class
     return group(name, cpp_group);
 
-def charged(name='charged'):
+def charged(name='charged', period=None):
     R""" Groups particles that are charged.
 
     Args:
         name (str): User-assigned name for this group.
+        period (int): (if set) Re-evaluate the membership every *period* time steps
 
     Creates a particle group containing all particles that have a non-zero charge.
 
     Warning:
-        This group currently does not support being updated when the number of particles changes.
+        Without a *period*, this group does not support being updated when the number of particles changes.
 
     Examples::
 
         a = group.charged()
         b = group.charged(name="cp")
+        c = group.charged(period=1000)
 
+    .. versionchanged:: 2.9
+        Added *period*.
     """
     hoomd.util.print_status_line();
 
@@ -639,28 +767,18 @@ def charged(name='charged'):
         hoomd.context.msg.error("Cannot create a group before initialization\n");
         raise RuntimeError('Error creating group');
 
-    hoomd.util.quiet_status();
-
-    # determine the group of particles that are charged
-    charged_tags = [];
-    sysdef = hoomd.context.current.system_definition;
-    pdata = hoomd.data.particle_data(sysdef.getParticleData());
-    for i in range(0,len(pdata)):
-        if pdata[i].charge != 0.0:
-            charged_tags.append(i);
-
-    retval = tag_list(name, charged_tags);
-    hoomd.util.unquiet_status();
-
-    return retval;
+    # create the group
+    selector = _hoomd.ParticleSelectorCharge(hoomd.context.current.system_definition);
+    return _make_group(name, selector, False, period);
 
-def difference(name, a, b):
+def difference(name, a, b, period=None):
     R""" Create a new group from the set difference or complement of two existing groups.
 
     Args:
         name (str): User-assigned name for this group.
         a (:py:class:`group`): First group.
         b (:py:class:`group`): Second group.
+        period (int): (if set) Re-evaluate the membership every *period* time steps
 
     The set difference of *a* and *b* is defined to be the set of particles that are in *a* and not in *b*.
     This can be useful for inverting the sense of a group (see below).
@@ -668,8 +786,12 @@ def difference(name, a, b):
     A new group called *name* is created.
 
     Warning:
-        The group is static and will not update if particles are added to
-        or removed from the system.
+        When *a* and *b* are static and no *period* is given, the group is static and will not update if particles
+        are added to or removed from the system.
+
+    When *a* or *b* is dynamic, or a *period* is given, the group is dynamic and re-evaluates the set operation
+    every *period* time steps (by default, the smallest period of *a* and *b*). Static operands contribute their
+    current members.
 
     Examples::
 
@@ -679,25 +801,34 @@ def difference(name, a, b):
 
     """
 
+    result = _make_set_operation(name, a, b, _hoomd.ParticleSelectorSetOperation.operation.set_difference, period);
+    if result is not None:
+        return result;
+
     new_cpp_group = _hoomd.ParticleGroup.groupDifference(a.cpp_group, b.cpp_group);
     # notify the user of the created group
     hoomd.context.msg.notice(2, 'Group "' + name + '" created containing ' + str(new_cpp_group.getNumMembersGlobal()) + ' particles\n');
     return group(name, new_cpp_group);
 
-def intersection(name, a, b):
+def intersection(name, a, b, period=None):
     R""" Create a new group from the set intersection of two existing groups.
 
     Args:
         name (str): User-assigned name for this group.
         a (:py:class:`group`): First group.
         b (:py:class:`group`): Second group.
+        period (int): (if set) Re-evaluate the membership every *period* time steps
 
     A new group is created that contains all particles of *a* that are also in *b*, and is given the name
     *name*.
 
     Warning:
-        The group is static and will not update if particles are added to
-        or removed from the system.
+        When *a* and *b* are static and no *period* is given, the group is static and will not update if particles
+        are added to or removed from the system.
+
+    When *a* or *b* is dynamic, or a *period* is given, the group is dynamic and re-evaluates the set operation
+    every *period* time steps (by default, the smallest period of *a* and *b*). Static operands contribute their
+    current members.
 
     Examples::
 
@@ -707,25 +838,34 @@ def intersection(name, a, b):
 
     """
 
+    result = _make_set_operation(name, a, b, _hoomd.ParticleSelectorSetOperation.operation.set_intersection, period);
+    if result is not None:
+        return result;
+
     new_cpp_group = _hoomd.ParticleGroup.groupIntersection(a.cpp_group, b.cpp_group);
     # notify the user of the created group
     hoomd.context.msg.notice(2, 'Group "' + name + '" created containing ' + str(new_cpp_group.getNumMembersGlobal()) + ' particles\n');
     return group(name, new_cpp_group);
 
-def union(name, a, b):
+def union(name, a, b, period=None):
     R""" Create a new group from the set union of two existing groups.
 
     Args:
         name (str): User-assigned name for this group.
         a (:py:class:`group`): First group.
         b (:py:class:`group`): Second group.
+        period (int): (if set) Re-evaluate the membership every *period* time steps
 
     A new group is created that contains all particles present in either group *a* or *b*, and is given the
     name *name*.
 
     Warning:
-        The group is static and will not update if particles are added to
-        or removed from the system.
+        When *a* and *b* are static and no *period* is given, the group is static and will not update if particles
+        are added to or removed from the system.
+
+    When *a* or *b* is dynamic, or a *period* is given, the group is dynamic and re-evaluates the set operation
+    every *period* time steps (by default, the smallest period of *a* and *b*). Static operands contribute their
+    current members.
 
     Examples::
 
@@ -734,7 +874,98 @@ def union(name, a, b):
         groupAB = group.union(name="ab-particles", a=groupA, b=groupB)
 
     """
+    result = _make_set_operation(name, a, b, _hoomd.ParticleSelectorSetOperation.operation.set_union, period);
+    if result is not None:
+        return result;
+
     new_cpp_group = _hoomd.ParticleGroup.groupUnion(a.cpp_group, b.cpp_group);
     # notify the user of the created group
     hoomd.context.msg.notice(2, 'Group "' + name + '" created containing ' + str(new_cpp_group.getNumMembersGlobal()) + ' particles\n');
     return group(name, new_cpp_group);
+
+class partition(hoomd.meta._metadata):
+    R""" Partitions particles into many disjoint groups.
+
+    Args:
+        name (str): User-assigned name for the partition.
+        labels (list): Group index of each particle, by tag. Particles with a negative label belong to no group.
+        num_groups (int): Number of groups. If None, it is one more than the largest label.
+
+    :py:class:`partition` defines many disjoint groups with a single label array: group *i* contains all particles
+    whose label is *i*. This is much faster than creating one group per molecule or per bin with
+    :py:func:`tag_list`, and the partition takes one integer per particle instead of one membership list per group.
+    *labels* must have one entry for each tag, from 0 to the largest tag in the system.
+
+    Computes that operate on all groups at once accept the partition directly and process all groups in a single
+    pass over the particles. Individual groups are created on demand by indexing the partition, and they can be used
+    in any command that accepts a :py:class:`group`.
+
+    The membership is defined at the time the partition is created. Particles added to the system later belong to
+    no group.
+
+    Examples::
+
+        # one group per molecule of 10 particles
+        molecules = group.partition(name="molecule", labels=numpy.arange(N) // 10)
+        print(len(molecules))
+        print(molecules.sizes)
+        hoomd.compute.thermo(group=molecules[0])
+
+    .. versionadded:: 2.9
+
+    """
+    def __init__(self, name, labels, num_groups=None):
+        hoomd.util.print_status_line();
+
+        # check if initialization has occurred
+        if not hoomd.init.is_initialized():
+            hoomd.context.msg.error("Cannot create a group before initialization\n");
+            raise RuntimeError('Error creating group');
+
+        labels = numpy.asarray(labels);
+        if labels.ndim != 1 or (labels.size > 0 and labels.dtype.kind not in 'iu'):
+            hoomd.context.msg.error("group.partition: labels must be a 1D list of integers\n");
+            raise ValueError('Error creating partition');
+
+        if num_groups is None:
+            num_groups = int(labels.max()) + 1 if labels.size > 0 else 0;
+            num_groups = max(num_groups, 0);
+
+        # initialize the base class
+        hoomd.meta._metadata.__init__(self)
+
+        self.name = name;
+        self.num_groups = int(num_groups);
+        self.cpp_partition = _hoomd.ParticlePartition(hoomd.context.current.system_definition,
+                                                      numpy.ascontiguousarray(labels, dtype=numpy.int32),
+                                                      self.num_groups);
+        self._groups = {};
+
+        self.metadata_fields = ['name', 'num_groups'];
+
+        # notify the user of the created partition
+        hoomd.context.msg.notice(2, 'Partition "' + name + '" created with ' + str(self.num_groups) + ' groups\n');
+
+    @property
+    def sizes(self):
+        R""" Number of particles in each group, as a numpy array.
+        """
+        return numpy.array(self.cpp_partition.getGroupSizes(), dtype=numpy.uint32);
+
+    ## \internal
+    # \brief Get the number of groups
+    def __len__(self):
+        return self.num_groups;
+
+    ## \internal
+    # \brief Get a group of the partition
+    def __getitem__(self, i):
+        i = int(i);
+        if i < 0:
+            i += self.num_groups;
+        if i < 0 or i >= self.num_groups:
+            raise IndexError('Group index out of range');
+
+        if i not in self._groups:
+            self._groups[i] = group(self.name + '_' + str(i), self.cpp_partition.getGroup(i));
+        return self._groups[i];
@@ -22,6 +22,10 @@
 #include <hoomd/extern/pybind/include/pybind11/pybind11.h>
 #endif
 
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif
+
 namespace hpmc
 {
 
@@ -78,6 +82,9 @@ bool test_scaled_overlap(const vec3<Scalar>& r_ij,
       - Suitably chosen navg results in the average being written out just before a restart - enabling full restart
         capabilities.
       - Fully uses the MPI domain decomposition to compute the SDF fast in large jobs.
+      - With TBB, the loop over local particles is split among threads. Each thread counts into its own histogram,
+        and the thread histograms are summed into the rank histogram at the end of every countHistogram() call.
+        Averaging over *navg* samples only ever keeps the running bin counts, never per-sample data.
 
     \b Storage <br>
 
@@ -141,6 +148,10 @@ class AnalyzerSDF : public Analyzer
         bool m_appending;                       //!< Flag indicating this file is being appended to
         std::vector<unsigned int> m_hist;       //!< Raw histogram data
 
+        #ifdef ENABLE_TBB
+        tbb::enumerable_thread_specific< std::vector<unsigned int> > m_hist_thread; //!< Per-thread histogram counts
+        #endif
+
         unsigned int m_iavg;                    //!< Current count of the number of steps averaged
         Scalar m_last_max_diam;                 //!< Last recorded maximum diameter
 
@@ -191,6 +202,10 @@ AnalyzerSDF<Shape>::AnalyzerSDF(std::shared_ptr<SystemDefinition> sysdef,
     m_hist.resize(lmax / dl);
     zeroHistogram();
 
+    #ifdef ENABLE_TBB
+    m_hist_thread = tbb::enumerable_thread_specific< std::vector<unsigned int> >(std::vector<unsigned int>(m_hist.size(), 0));
+    #endif
+
     Scalar max_diam = m_mc->getMaxCoreDiameter();
     m_last_max_diam = max_diam;
     Scalar extra = lmax * max_diam;
@@ -326,6 +341,9 @@ void AnalyzerSDF<Shape>::zeroHistogram()
     for averaging, and it operates without any communication
       - The integrator performs the ghost exchange (with the ghost width extra that we add)
       - Only on writeOutput() do we need to sum the per-rank histograms into a global histogram
+
+    With TBB, each thread accumulates into its own histogram, which is added to m_hist and reset before returning.
+    The resulting counts do not depend on the number of threads.
 */
 template < class Shape >
 void AnalyzerSDF<Shape>::countHistogram(unsigned int timestep)
@@ -344,9 +362,17 @@ void AnalyzerSDF<Shape>::countHistogram(unsigned int timestep)
     const std::vector<param_type, managed_allocator<param_type> > & params = m_mc->getParams();
 
     // loop through N particles
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, m_pdata->getN()),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    std::vector<unsigned int>& hist = m_hist_thread.local();
+    for (unsigned int i = r.begin(); i != r.end(); ++i)
+    #else
+    std::vector<unsigned int>& hist = m_hist;
     for (unsigned int i = 0; i < m_pdata->getN(); i++)
+    #endif
         {
-        int min_bin = m_hist.size();
+        int min_bin = hist.size();
 
         // read in the current position and orientation
         Scalar4 postype_i = h_postype.data[i];
@@ -408,10 +434,23 @@ void AnalyzerSDF<Shape>::countHistogram(unsigned int timestep)
             } // end loop over images
 
         // record the minimum bin
-        if ((unsigned int)min_bin < m_hist.size())
-            m_hist[min_bin]++;
+        if ((unsigned int)min_bin < hist.size())
+            hist[min_bin]++;
 
         } // end loop over all particles
+    #ifdef ENABLE_TBB
+        });
+
+    // reduce the per-thread histograms into the rank histogram
+    for (auto& thread_hist : m_hist_thread)
+        {
+        for (unsigned int k = 0; k < m_hist.size(); k++)
+            {
+            m_hist[k] += thread_hist[k];
+            thread_hist[k] = 0;
+            }
+        }
+    #endif
     }
 
 /*! \param r_ij Vector pointing from particle i to j (already wrapped into the box)
@@ -25,6 +25,9 @@
 
 #include <hoomd/extern/pybind/include/pybind11/pybind11.h>
 
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif
 
 namespace hpmc
 {
@@ -130,12 +133,14 @@ void ComputeFreeVolume<Shape>::compute(unsigned int timestep)
     }
 
 /*! \return the current free volume estimate by MC integration
+
+    Every test depletant draws from its own random number stream, seeded by the sample index. With TBB, the samples
+    are split among threads and the overlap counts are summed, which gives the same result for any number of threads.
 */
 template<class Shape>
 void ComputeFreeVolume<Shape>::computeFreeVolume(unsigned int timestep)
     {
     unsigned int overlap_count = 0;
-    unsigned int err_count = 0;
 
     this->m_exec_conf->msg->notice(5) << "HPMC computing free volume " << timestep << std::endl;
 
@@ -168,8 +173,17 @@ void ComputeFreeVolume<Shape>::computeFreeVolume(unsigned int timestep)
         n_sample /= this->m_exec_conf->getNRanks();
         #endif
 
+        #ifdef ENABLE_TBB
+        overlap_count = tbb::parallel_reduce(tbb::blocked_range<unsigned int>(0, n_sample),
+            0u,
+            [&](const tbb::blocked_range<unsigned int>& r, unsigned int overlap_count)->unsigned int {
+        for (unsigned int i = r.begin(); i != r.end(); ++i)
+        #else
         for (unsigned int i = 0; i < n_sample; i++)
+        #endif
             {
+            unsigned int err_count = 0;
+
             // select a random particle coordinate in the box
             hoomd::RandomGenerator rng_i(hoomd::RNGIdentifier::ComputeFreeVolume, m_seed, m_exec_conf->getRank(), i, timestep);
 
@@ -252,6 +266,10 @@ void ComputeFreeVolume<Shape>::computeFreeVolume(unsigned int timestep)
                 overlap_count++;
                 }
             } // end loop through all particles
+        #ifdef ENABLE_TBB
+        return overlap_count;
+        }, [](unsigned int x, unsigned int y)->unsigned int { return x+y; } );
+        #endif
 
         } // end lexical scope
 
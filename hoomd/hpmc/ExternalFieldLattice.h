@@ -16,6 +16,7 @@
 
 #ifndef NVCC
 #include <hoomd/extern/pybind/include/pybind11/pybind11.h>
+#include <hoomd/extern/pybind/include/pybind11/numpy.h>
 #endif
 
 namespace hpmc
@@ -64,6 +65,54 @@ inline void python_list_to_vector_scalar4(const pybind11::list& r0, std::vector<
         }
     }
 
+//! Contiguous array of Scalar values accepted from python through the buffer protocol
+typedef pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> reference_array_t;
+
+/*! Copy an (N, ndim) array of reference positions into ret. The data is read directly from the
+    buffer, no per-element conversion of python objects takes place. An empty array clears ret.
+*/
+inline void python_array_to_vector_scalar3(const reference_array_t& r0, std::vector<Scalar3>& ret, unsigned int ndim)
+    {
+    ret.clear();
+    if (r0.size() == 0)
+        return;
+
+    if (r0.ndim() != 2 || r0.shape(1) < ndim || r0.shape(1) > 3)
+        {
+        throw std::runtime_error("dimension of the list does not match the dimension of the simulation.");
+        }
+
+    const size_t n = r0.shape(0);
+    const size_t d = r0.shape(1);
+    const Scalar *data = r0.data();
+    ret.resize(n);
+    for (size_t i = 0; i < n; i++)
+        {
+        ret[i] = make_scalar3(data[d*i], data[d*i+1], d == 3 ? data[d*i+2] : Scalar(0.0));
+        }
+    }
+
+/*! Copy an (N, 4) array of reference orientations into ret. An empty array clears ret.
+*/
+inline void python_array_to_vector_scalar4(const reference_array_t& q0, std::vector<Scalar4>& ret)
+    {
+    ret.clear();
+    if (q0.size() == 0)
+        return;
+
+    if (q0.ndim() != 2 || q0.shape(1) != 4)
+        {
+        throw std::runtime_error("reference orientations must be given as an (N, 4) array.");
+        }
+
+    const size_t n = q0.shape(0);
+    const Scalar *data = q0.data();
+    ret.resize(n);
+    for (size_t i = 0; i < n; i++)
+        {
+        ret[i] = make_scalar4(data[4*i], data[4*i+1], data[4*i+2], data[4*i+3]);
+        }
+    }
 
 template< class ScalarType >
 class LatticeReferenceList
@@ -159,9 +208,9 @@ class ExternalFieldLattice : public ExternalFieldMono<Shape>
     using ExternalFieldMono<Shape>::m_sysdef;
     public:
         ExternalFieldLattice(  std::shared_ptr<SystemDefinition> sysdef,
-                                        pybind11::list r0,
+                                        const reference_array_t& r0,
                                         Scalar k,
-                                        pybind11::list q0,
+                                        const reference_array_t& q0,
                                         Scalar q,
                                         pybind11::list symRotations
                                     ) : ExternalFieldMono<Shape>(sysdef), m_k(k), m_q(q), m_Energy(0)
@@ -290,86 +339,49 @@ class ExternalFieldLattice : public ExternalFieldMono<Shape>
             return new_U - old_U;
             }
 
-        void setReferences(const pybind11::list& r0, const pybind11::list& q0)
+        /*! Set the reference positions and orientations.
+            \param r0 (N, ndim) array of reference positions indexed by particle tag
+            \param q0 (N, 4) array of reference orientations indexed by particle tag
+
+            Empty arrays leave the corresponding references unchanged. With domain decomposition,
+            the arrays are read on the root rank only and the raw buffers are broadcast to the other
+            ranks. Every rank keeps the full reference list because particles migrate between domains.
+        */
+        void setReferences(const reference_array_t& r0, const reference_array_t& q0)
             {
             unsigned int ndim = m_sysdef->getNDimensions();
             std::vector<Scalar3> lattice_positions;
-            std::vector<Scalar> pbuffer;
             std::vector<Scalar4> lattice_orientations;
-            std::vector<Scalar> qbuffer;
             #ifdef ENABLE_MPI
             unsigned int psz = 0, qsz = 0;
 
             if ( this->m_exec_conf->isRoot() )
                 {
-                python_list_to_vector_scalar3(r0, lattice_positions, ndim);
-                python_list_to_vector_scalar4(q0, lattice_orientations);
+                python_array_to_vector_scalar3(r0, lattice_positions, ndim);
+                python_array_to_vector_scalar4(q0, lattice_orientations);
                 psz = lattice_positions.size();
                 qsz = lattice_orientations.size();
                 }
             if( this->m_pdata->getDomainDecomposition())
                 {
-                if(psz)
-                    {
-                    pbuffer.resize(3*psz, 0.0);
-                    for(size_t i = 0; i < psz; i++)
-                        {
-                        pbuffer[3*i] = lattice_positions[i].x;
-                        pbuffer[3*i+1] = lattice_positions[i].y;
-                        pbuffer[3*i+2] = lattice_positions[i].z;
-                        }
-                    }
-                if(qsz)
-                    {
-                    qbuffer.resize(4*qsz, 0.0);
-                    for(size_t i = 0; i < qsz; i++)
-                        {
-                        qbuffer[4*i] = lattice_orientations[i].x;
-                        qbuffer[4*i+1] = lattice_orientations[i].y;
-                        qbuffer[4*i+2] = lattice_orientations[i].z;
-                        qbuffer[4*i+3] = lattice_orientations[i].w;
-                        }
-                    }
+                // Scalar3 and Scalar4 are plain aggregates of Scalar, broadcast them in place
                 MPI_Bcast(&psz, 1, MPI_UNSIGNED, 0, m_exec_conf->getMPICommunicator());
                 if(psz)
                     {
-                    if(!pbuffer.size())
-                        pbuffer.resize(3*psz, 0.0);
-                    MPI_Bcast(&pbuffer.front(), 3*psz, MPI_HOOMD_SCALAR, 0, m_exec_conf->getMPICommunicator());
-                    if(!lattice_positions.size())
-                        {
-                        lattice_positions.resize(psz, make_scalar3(0.0, 0.0, 0.0));
-                        for(size_t i = 0; i < psz; i++)
-                            {
-                            lattice_positions[i].x = pbuffer[3*i];
-                            lattice_positions[i].y = pbuffer[3*i+1];
-                            lattice_positions[i].z = pbuffer[3*i+2];
-                            }
-                        }
+                    lattice_positions.resize(psz);
+                    MPI_Bcast(&lattice_positions.front(), 3*psz, MPI_HOOMD_SCALAR, 0, m_exec_conf->getMPICommunicator());
                     }
                 MPI_Bcast(&qsz, 1, MPI_UNSIGNED, 0, m_exec_conf->getMPICommunicator());
                 if(qsz)
                     {
-                    if(!qbuffer.size())
-                        qbuffer.resize(4*qsz, 0.0);
-                    MPI_Bcast(&qbuffer.front(), 4*qsz, MPI_HOOMD_SCALAR, 0, m_exec_conf->getMPICommunicator());
-                    if(!lattice_orientations.size())
-                        {
-                        lattice_orientations.resize(qsz, make_scalar4(0, 0, 0, 0));
-                        for(size_t i = 0; i < qsz; i++)
-                            {
-                            lattice_orientations[i].x = qbuffer[4*i];
-                            lattice_orientations[i].y = qbuffer[4*i+1];
-                            lattice_orientations[i].z = qbuffer[4*i+2];
-                            lattice_orientations[i].w = qbuffer[4*i+3];
-                            }
-                        }
+                    lattice_orientations.resize(qsz);
+                    MPI_Bcast(&lattice_orientations.front(), 4*qsz, MPI_HOOMD_SCALAR, 0, m_exec_conf->getMPICommunicator());
                     }
                 }
 
             #else
-            python_list_to_vector_scalar3(r0, lattice_positions, ndim);
-            python_list_to_vector_scalar4(q0, lattice_orientations);
+            python_array_to_vector_scalar3(r0, lattice_positions, ndim);
+            python_array_to_vector_scalar4(q0, lattice_orientations);
             #endif
 
             if( lattice_positions.size() )
@@ -579,7 +591,7 @@ template<class Shape>
 void export_LatticeField(pybind11::module& m, std::string name)
     {
    pybind11::class_<ExternalFieldLattice<Shape>, std::shared_ptr< ExternalFieldLattice<Shape> > >(m, name.c_str(), pybind11::base< ExternalFieldMono<Shape> >())
-    .def(pybind11::init< std::shared_ptr<SystemDefinition>, pybind11::list, Scalar, pybind11::list, Scalar, pybind11::list>())
+    .def(pybind11::init< std::shared_ptr<SystemDefinition>, const reference_array_t&, Scalar, const reference_array_t&, Scalar, pybind11::list>())
     .def("setReferences", &ExternalFieldLattice<Shape>::setReferences)
     .def("setParams", &ExternalFieldLattice<Shape>::setParams)
     .def("reset", &ExternalFieldLattice<Shape>::reset)
@@ -21,7 +21,8 @@ IntegratorHPMC::IntegratorHPMC(std::shared_ptr<SystemDefinition> sysdef,
                                unsigned int seed)
     : Integrator(sysdef, 0.005), m_seed(seed),  m_move_ratio(32768), m_nselect(4),
       m_nominal_width(1.0), m_extra_ghost_width(0), m_external_base(NULL), m_patch_log(false),
-      m_past_first_run(false)
+      m_patch_energy_cache(false),
+      m_past_first_run(false), m_tune_max_d(1.0), m_tune_max_a(0.5)
       #ifdef ENABLE_MPI
       ,m_communicator_ghost_width_connected(false),
       m_communicator_flags_connected(false)
@@ -104,6 +105,7 @@ void IntegratorHPMC::slotNumTypesChange()
     - hpmc_a_<typename> (maximum rotation move by type)
     - hpmc_move_ratio (ratio of translation moves to rotate moves)
     - hpmc_overlap_count (count of the number of particle-particle overlaps)
+    - hpmc_tune_active (1 while the move sizes are adapted, 0 otherwise)
 
     \returns a list of provided quantities
 */
@@ -119,6 +121,7 @@ std::vector< std::string > IntegratorHPMC::getProvidedLogQuantities()
     result.push_back("hpmc_a");
     result.push_back("hpmc_move_ratio");
     result.push_back("hpmc_overlap_count");
+    result.push_back("hpmc_tune_active");
     for (unsigned int typ=0; typ<m_pdata->getNTypes();typ++)
       {
       ostringstream tmp_str0;
@@ -171,6 +174,10 @@ Scalar IntegratorHPMC::getLogValue(const std::string& quantity, unsigned int tim
         {
         return countOverlaps(timestep, false);
         }
+    else if (quantity == "hpmc_tune_active")
+        {
+        return m_tuner.isActive() ? 1.0 : 0.0;
+        }
     else
         {
         //loop over per particle move size quantities
@@ -276,12 +283,53 @@ bool IntegratorHPMC::attemptBoxResize(unsigned int timestep, const BoxDim& new_b
     return !this->countOverlaps(timestep, true);
     }
 
-/*! \param mode 0 -> Absolute count, 1 -> relative to the start of the run, 2 -> relative to the last executed step
+/*! \param timestep Current time step
+
+    Translation and rotation move sizes of all types are scaled with the acceptance ratios measured since the last
+    adaptation. Move sizes that are 0 stay disabled.
+*/
+void IntegratorHPMC::adaptMoveSizes(unsigned int timestep)
+    {
+    if (!m_tuner.update(timestep))
+        {
+        if (!m_tuner.isActive())
+            m_exec_conf->msg->notice(2) << "HPMC move size tuning finished at step " << timestep << endl;
+        return;
+        }
+
+    hpmc_counters_t counters = getCounters(3);
+        {
+        ArrayHandle<hpmc_counters_t> h_counters(m_count_total, access_location::host, access_mode::read);
+        m_count_tune_start = h_counters.data[0];
+        }
+
+        {
+        ArrayHandle<Scalar> h_d(m_d, access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar> h_a(m_a, access_location::host, access_mode::readwrite);
+        for (unsigned int typ = 0; typ < m_pdata->getNTypes(); typ++)
+            {
+            h_d.data[typ] = m_tuner.getNewValue(h_d.data[typ],
+                counters.translate_accept_count, counters.translate_reject_count, m_tune_max_d);
+            h_a.data[typ] = m_tuner.getNewValue(h_a.data[typ],
+                counters.rotate_accept_count, counters.rotate_reject_count, m_tune_max_a);
+            }
+        }
+
+    m_exec_conf->msg->notice(6) << "HPMC move size tuning at step " << timestep << ": translate acceptance "
+        << counters.getTranslateAcceptance() << ", rotate acceptance " << counters.getRotateAcceptance() << endl;
+
+    // the maximum move size sets the cell width and the ghost layer
+    updateCellWidth();
+    }
+
+/*! \param mode 0 -> Absolute count, 1 -> relative to the start of the run, 2 -> relative to the last executed step,
+        3 -> relative to the last move size adaptation
     \return The current state of the acceptance counters
 
     IntegratorHPMC maintains a count of the number of accepted and rejected moves since instantiation. getCounters()
     provides the current value. The parameter *mode* controls whether the returned counts are absolute, relative
-    to the start of the run, or relative to the start of the last executed step.
+    to the start of the run, relative to the start of the last executed step, or relative to the last move size
+    adaptation.
 */
 hpmc_counters_t IntegratorHPMC::getCounters(unsigned int mode)
     {
@@ -292,6 +340,8 @@ hpmc_counters_t IntegratorHPMC::getCounters(unsigned int mode)
         result = h_counters.data[0];
     else if (mode == 1)
         result = h_counters.data[0] - m_count_run_start;
+    else if (mode == 3)
+        result = h_counters.data[0] - m_count_tune_start;
     else
         result = h_counters.data[0] - m_count_step_start;
 
@@ -331,6 +381,10 @@ void export_IntegratorHPMC(py::module& m)
     .def("slotNumTypesChange", &IntegratorHPMC::slotNumTypesChange)
     .def("setDeterministic", &IntegratorHPMC::setDeterministic)
     .def("disablePatchEnergyLogOnly", &IntegratorHPMC::disablePatchEnergyLogOnly)
+    .def("setPatchEnergyCache", &IntegratorHPMC::setPatchEnergyCache)
+    .def("getPatchEnergyCache", &IntegratorHPMC::getPatchEnergyCache)
+    .def("setMoveSizeTuning", &IntegratorHPMC::setMoveSizeTuning)
+    .def("getMoveSizeTuningActive", &IntegratorHPMC::getMoveSizeTuningActive)
     ;
 
    py::class_< hpmc_counters_t >(m, "hpmc_counters_t")
@@ -15,6 +15,7 @@
 
 #include "HPMCCounters.h"
 #include "ExternalField.h"
+#include "MoveSizeTuner.h"
 
 #ifndef NVCC
 #include <hoomd/extern/pybind/include/pybind11/pybind11.h>
@@ -90,11 +91,16 @@ class PYBIND11_EXPORT IntegratorHPMC : public Integrator
 
         //! Take one timestep forward
         virtual void update(unsigned int timestep)
+            {
             {
             ArrayHandle<hpmc_counters_t> h_counters(m_count_total, access_location::host, access_mode::read);
             m_count_step_start = h_counters.data[0];
             }
 
+            if (m_tuner.isActive())
+                adaptMoveSizes(timestep);
+            }
+
         //! Change maximum displacement
         /*! \param d new d to set
          *! \param typ type to which d will be set
@@ -227,6 +233,33 @@ class PYBIND11_EXPORT IntegratorHPMC : public Integrator
             m_clock = ClockSource();
             }
 
+        //! Enable or disable adaptive tuning of the trial move sizes
+        /*! \param enable Adapt the move sizes when true
+            \param target Target acceptance ratio for translation and rotation moves
+            \param period Number of time steps between adaptations
+            \param steps Length of the adaptation window in time steps, starting at the next run
+            \param gamma Damping factor
+            \param max_scale Maximum factor by which to scale a move size in one adaptation
+            \param max_d Largest allowed translation move size
+            \param max_a Largest allowed rotation move size
+        */
+        void setMoveSizeTuning(bool enable, Scalar target, unsigned int period, unsigned int steps,
+            Scalar gamma, Scalar max_scale, Scalar max_d, Scalar max_a)
+            {
+            m_tuner.set(enable, target, period, steps, gamma, max_scale);
+            m_tune_max_d = max_d;
+            m_tune_max_a = max_a;
+
+            ArrayHandle<hpmc_counters_t> h_counters(m_count_total, access_location::host, access_mode::read);
+            m_count_tune_start = h_counters.data[0];
+            }
+
+        //! Get whether the move sizes are currently adapted
+        bool getMoveSizeTuningActive()
+            {
+            return m_tuner.isActive();
+            }
+
         //! Get the diameter of the largest circumscribing sphere for objects handled by this integrator
         virtual Scalar getMaxCoreDiameter()
             {
@@ -342,6 +375,20 @@ class PYBIND11_EXPORT IntegratorHPMC : public Integrator
             m_patch_log = log;
             }
 
+        //! Enable caching of the per-particle patch energy
+        /*! \param cache if True, reuse the old-configuration patch energy of a particle between trial moves
+         */
+        void setPatchEnergyCache(bool cache)
+            {
+            m_patch_energy_cache = cache;
+            }
+
+        //! Get whether the per-particle patch energy is cached
+        bool getPatchEnergyCache()
+            {
+            return m_patch_energy_cache;
+            }
+
     protected:
         unsigned int m_seed;                        //!< Random number seed
         unsigned int m_move_ratio;                  //!< Ratio of translation to rotation move attempts (*65535)
@@ -360,8 +407,18 @@ class PYBIND11_EXPORT IntegratorHPMC : public Integrator
 
         std::shared_ptr< PatchEnergy > m_patch;     //!< Patchy Interaction
         bool m_patch_log;                           //!< If true, only use patch energy for logging
+        bool m_patch_energy_cache;                  //!< If true, cache the per-particle patch energy between trial moves
 
         bool m_past_first_run;                      //!< Flag to test if the first run() has started
+
+        MoveSizeTuner m_tuner;                      //!< Adaptive controller for the trial move sizes
+        hpmc_counters_t m_count_tune_start;         //!< Count saved at the last move size adaptation
+        Scalar m_tune_max_d;                        //!< Largest translation move size set by the tuner
+        Scalar m_tune_max_a;                        //!< Largest rotation move size set by the tuner
+
+        //! Adapt the trial move sizes to the acceptance ratios since the last adaptation
+        void adaptMoveSizes(unsigned int timestep);
+
         //! Update the nominal width of the cells
         /*! This method is virtual so that derived classes can set appropriate widths
             (for example, some may want max diameter while others may want a buffer distance).
@@ -31,6 +31,12 @@
 
 #ifndef NVCC
 #include <hoomd/extern/pybind/include/pybind11/pybind11.h>
+#include <hoomd/extern/pybind/include/pybind11/numpy.h>
+#endif
+
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#include <atomic>
 #endif
 
 
@@ -151,6 +157,9 @@ class IntegratorHPMCMono : public IntegratorHPMC
         //! Set the pair parameters for a single type
         virtual void setParam(unsigned int typ, const param_type& param);
 
+        //! Set the pair parameters for many types at once
+        virtual void setParams(pybind11::list typ, pybind11::list params);
+
         //! Set elements of the interaction matrix
         virtual void setOverlapChecks(unsigned int typi, unsigned int typj, bool check_overlaps);
 
@@ -209,6 +218,15 @@ class IntegratorHPMCMono : public IntegratorHPMC
             pybind11::list rij, pybind11::list qi, pybind11::list qj,
             bool use_images, bool exclude_self);
 
+        //! Method to test overlaps for many pairs of particles at once - for python API
+        virtual pybind11::array_t<bool> py_test_overlap_many(
+            pybind11::array_t<unsigned int, pybind11::array::c_style | pybind11::array::forcecast> type_i,
+            pybind11::array_t<unsigned int, pybind11::array::c_style | pybind11::array::forcecast> type_j,
+            pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> rij,
+            pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> qi,
+            pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> qj,
+            bool use_images, bool exclude_self);
+
         //! Return the requested ghost layer width
         virtual Scalar getGhostLayerWidth(unsigned int)
             {
@@ -316,6 +334,21 @@ class IntegratorHPMCMono : public IntegratorHPMC
 
         void invalidateAABBTree(){ m_aabb_tree_invalid = true; }
 
+        //! Enable refitting the AABB tree after box changes instead of rebuilding it
+        /*! \param refit True to enable refitting
+            \param max_cost_ratio Rebuild the tree when the cost of a refit tree exceeds the cost at build time by this factor
+        */
+        void setAABBTreeRefit(bool refit, Scalar max_cost_ratio)
+            {
+            if (max_cost_ratio < Scalar(1.0))
+                {
+                m_exec_conf->msg->error() << "integrate.mode_hpmc: aabb_tree_max_cost_ratio must be at least 1" << std::endl;
+                throw std::runtime_error("Error setting AABB tree refit parameters");
+                }
+            m_aabb_tree_refit = refit;
+            m_aabb_tree_max_cost_ratio = max_cost_ratio;
+            }
+
         //! Method that is called whenever the GSD file is written if connected to a GSD file.
         int slotWriteGSDState(gsd_handle&, std::string name) const;
 
@@ -370,17 +403,53 @@ class IntegratorHPMCMono : public IntegratorHPMC
         detail::AABB* m_aabbs;                      //!< list of AABBs, one per particle
         unsigned int m_aabbs_capacity;              //!< Capacity of m_aabbs list
         bool m_aabb_tree_invalid;                   //!< Flag if the aabb tree has been invalidated
+        bool m_aabb_tree_refit;                     //!< True if the tree may be refit after a box change
+        bool m_aabb_tree_refit_needed;              //!< Flag if the node bounds of the aabb tree are out of date
+        Scalar m_aabb_tree_max_cost_ratio;          //!< Maximum cost of a refit tree relative to the cost at build time
+        Scalar m_aabb_tree_build_cost;              //!< Normalized surface area of the tree after the last full build
+        Scalar m_aabb_tree_cost_ratio;              //!< Current cost of the tree relative to the cost at build time
+        unsigned int m_aabb_tree_builds;            //!< Number of full tree builds since the last stats reset
+        unsigned int m_aabb_tree_refits;            //!< Number of tree refits since the last stats reset
 
         Scalar m_extra_image_width;                 //! Extra width to extend the image list
 
         Index2D m_overlap_idx;                      //!!< Indexer for interaction matrix
 
+        std::vector<double> m_patch_energy;         //!< Cached patch energy of every local particle
+        std::vector<char> m_patch_energy_valid;     //!< Flag if the cached patch energy of a particle is up to date
+
         //! Set the nominal width appropriate for looped moves
         virtual void updateCellWidth();
 
+        //! Test overlap between two shapes, optionally including the periodic images
+        bool testOverlapPair(unsigned int type_i, unsigned int type_j, const vec3<Scalar>& dr,
+            const quat<Scalar>& quat_i, const quat<Scalar>& quat_j, bool use_images, bool exclude_self,
+            unsigned int& err);
+
+        //! Compute the patch energy of a single particle with all of its neighbors
+        double computePatchEnergyParticle(unsigned int i,
+                                          const vec3<Scalar>& pos_i,
+                                          const quat<Scalar>& orientation_i,
+                                          const detail::AABB& aabb_i_local,
+                                          OverlapReal r_cut_patch,
+                                          const Scalar4 *h_postype,
+                                          const Scalar4 *h_orientation,
+                                          const Scalar *h_diameter,
+                                          const Scalar *h_charge);
+
+        //! Invalidate the cached patch energy of all particles interacting with a particle at a given position
+        void invalidatePatchEnergyCache(unsigned int i,
+                                        const vec3<Scalar>& pos_i,
+                                        const detail::AABB& aabb_i_local,
+                                        OverlapReal r_cut_patch,
+                                        const Scalar4 *h_postype);
+
         //! Grow the m_aabbs list
         virtual void growAABBList(unsigned int N);
 
+        //! Compute the AABBs of all local and ghost particles
+        void computeAABBs(unsigned int n_aabb);
+
         //! Limit the maximum move distances
         virtual void limitMoveDistances();
 
@@ -390,14 +459,23 @@ class IntegratorHPMCMono : public IntegratorHPMC
             m_image_list_valid = false;
             // changing the box does not necessarily invalidate the AABB tree - however, practically
             // anything that changes the box (i.e. NPT, box_resize) is also moving the particles,
-            // so use it as a sign to rebuild the AABB tree
-            m_aabb_tree_invalid = true;
+            // so use it as a sign to rebuild (or refit) the AABB tree
+            if (m_aabb_tree_refit)
+                m_aabb_tree_refit_needed = true;
+            else
+                m_aabb_tree_invalid = true;
+
+            // the patch energies change with the particle separations
+            std::fill(m_patch_energy_valid.begin(), m_patch_energy_valid.end(), 0);
             }
 
         //! callback so that the particle sort signal can invalidate the AABB tree
         virtual void slotSorted()
             {
             m_aabb_tree_invalid = true;
+
+            // the cached patch energies are indexed by local particle index
+            std::fill(m_patch_energy_valid.begin(), m_patch_energy_valid.end(), 0);
             }
     };
 
@@ -434,6 +512,13 @@ IntegratorHPMCMono<Shape>::IntegratorHPMCMono(std::shared_ptr<SystemDefinition>
     m_aabbs = NULL;
     m_aabbs_capacity = 0;
     m_aabb_tree_invalid = true;
+    m_aabb_tree_refit = false;
+    m_aabb_tree_refit_needed = false;
+    m_aabb_tree_max_cost_ratio = Scalar(1.5);
+    m_aabb_tree_build_cost = Scalar(0.0);
+    m_aabb_tree_cost_ratio = Scalar(1.0);
+    m_aabb_tree_builds = 0;
+    m_aabb_tree_refits = 0;
     }
 
 
@@ -443,6 +528,9 @@ std::vector< std::string > IntegratorHPMCMono<Shape>::getProvidedLogQuantities()
     // start with the integrator provided quantities
     std::vector< std::string > result = IntegratorHPMC::getProvidedLogQuantities();
     // then add ours
+    result.push_back("hpmc_aabb_tree_cost_ratio");
+    result.push_back("hpmc_aabb_tree_builds");
+    result.push_back("hpmc_aabb_tree_refits");
     if(m_patch)
         {
         result.push_back("hpmc_patch_energy");
@@ -467,6 +555,18 @@ Scalar IntegratorHPMCMono<Shape>::getLogValue(const std::string& quantity, unsig
             throw std::runtime_error("Error getting log value");
             }
         }
+    else if (quantity == "hpmc_aabb_tree_cost_ratio")
+        {
+        return m_aabb_tree_cost_ratio;
+        }
+    else if (quantity == "hpmc_aabb_tree_builds")
+        {
+        return m_aabb_tree_builds;
+        }
+    else if (quantity == "hpmc_aabb_tree_refits")
+        {
+        return m_aabb_tree_refits;
+        }
     else if (quantity == "hpmc_patch_rcut")
         {
         if (m_patch)
@@ -491,6 +591,14 @@ void IntegratorHPMCMono<Shape>::printStats()
     {
     IntegratorHPMC::printStats();
 
+    m_exec_conf->msg->notice(2) << "AABB tree builds:              " << m_aabb_tree_builds << "\n";
+    if (m_aabb_tree_refit)
+        {
+        m_exec_conf->msg->notice(2) << "AABB tree refits:              " << m_aabb_tree_refits << "\n";
+        m_exec_conf->msg->notice(2) << "AABB tree cost ratio:          " << m_aabb_tree_cost_ratio << "\n";
+        }
+    m_exec_conf->msg->notice(2) << std::flush;
+
     /*unsigned int max_height = 0;
     unsigned int total_height = 0;
 
@@ -510,6 +618,8 @@ template <class Shape>
 void IntegratorHPMCMono<Shape>::resetStats()
     {
     IntegratorHPMC::resetStats();
+    m_aabb_tree_builds = 0;
+    m_aabb_tree_refits = 0;
     }
 
 template <class Shape>
@@ -575,6 +685,15 @@ void IntegratorHPMCMono<Shape>::update(unsigned int timestep)
     // access interaction matrix
     ArrayHandle<unsigned int> h_overlaps(m_overlaps, access_location::host, access_mode::read);
 
+    // the per-particle patch energy cache is only valid within a single step, since other updaters
+    // and communication may change the particle configuration in between
+    bool patch_energy_cache = m_patch && !m_patch_log && m_patch_energy_cache;
+    if (patch_energy_cache)
+        {
+        m_patch_energy.resize(m_pdata->getN());
+        m_patch_energy_valid.assign(m_pdata->getN(), 0);
+        }
+
     // loop over local particles nselect times
     for (unsigned int i_nselect = 0; i_nselect < m_nselect; i_nselect++)
         {
@@ -667,6 +786,9 @@ void IntegratorHPMCMono<Shape>::update(unsigned int timestep)
             // patch + field interaction deltaU
             double patch_field_energy_diff = 0;
 
+            // patch energy of the new configuration
+            double patch_energy_new = 0;
+
             // check for overlaps with neighboring particle's positions (also calculate the new energy)
             // All image boxes (including the primary)
             const unsigned int n_images = m_image_list.size();
@@ -734,15 +856,17 @@ void IntegratorHPMCMono<Shape>::update(unsigned int timestep)
                                 else if (m_patch && !m_patch_log && dot(r_ij,r_ij) <= rcut*rcut) // If there is no overlap and m_patch is not NULL, calculate energy
                                     {
                                     // deltaU = U_old - U_new: subtract energy of new configuration
-                                    patch_field_energy_diff -= m_patch->energy(r_ij, typ_i,
-                                                               quat<float>(shape_i.orientation),
-                                                               h_diameter.data[i],
-                                                               h_charge.data[i],
-                                                               typ_j,
-                                                               quat<float>(orientation_j),
-                                                               h_diameter.data[j],
-                                                               h_charge.data[j]
-                                                               );
+                                    float u_ij = m_patch->energy(r_ij, typ_i,
+                                                                 quat<float>(shape_i.orientation),
+                                                                 h_diameter.data[i],
+                                                                 h_charge.data[i],
+                                                                 typ_j,
+                                                                 quat<float>(orientation_j),
+                                                                 h_diameter.data[j],
+                                                                 h_charge.data[j]
+                                                                 );
+                                    patch_field_energy_diff -= u_ij;
+                                    patch_energy_new += u_ij;
                                     }
                                 }
                             }
@@ -764,77 +888,37 @@ void IntegratorHPMCMono<Shape>::update(unsigned int timestep)
             // calculate old patch energy only if m_patch not NULL and no overlaps
             if (m_patch && !m_patch_log && !overlap)
                 {
-                for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
+                double patch_energy_old;
+                if (patch_energy_cache && m_patch_energy_valid[i])
                     {
-                    vec3<Scalar> pos_i_image = pos_old + m_image_list[cur_image];
-                    detail::AABB aabb = aabb_i_local;
-                    aabb.translate(pos_i_image);
+                    patch_energy_old = m_patch_energy[i];
 
-                    // stackless search
-                    for (unsigned int cur_node_idx = 0; cur_node_idx < m_aabb_tree.getNumNodes(); cur_node_idx++)
+                    #ifndef NDEBUG
+                    // verify the cached value against a full recompute
+                    double patch_energy_check = computePatchEnergyParticle(i, pos_old, shape_old.orientation, aabb_i_local,
+                        r_cut_patch, h_postype.data, h_orientation.data, h_diameter.data, h_charge.data);
+                    if (std::abs(patch_energy_check - patch_energy_old) > 1e-4*std::max(1.0, std::abs(patch_energy_check)))
                         {
-                        if (detail::overlap(m_aabb_tree.getNodeAABB(cur_node_idx), aabb))
-                            {
-                            if (m_aabb_tree.isNodeLeaf(cur_node_idx))
-                                {
-                                for (unsigned int cur_p = 0; cur_p < m_aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
-                                    {
-                                    // read in its position and orientation
-                                    unsigned int j = m_aabb_tree.getNodeParticle(cur_node_idx, cur_p);
-
-                                    Scalar4 postype_j;
-                                    Scalar4 orientation_j;
+                        m_exec_conf->msg->error() << "Cached patch energy " << patch_energy_old << " of particle " << i
+                            << " differs from the recomputed value " << patch_energy_check << std::endl;
+                        throw std::runtime_error("Error in HPMC patch energy cache");
+                        }
+                    #endif
+                    }
+                else
+                    {
+                    patch_energy_old = computePatchEnergyParticle(i, pos_old, shape_old.orientation, aabb_i_local,
+                        r_cut_patch, h_postype.data, h_orientation.data, h_diameter.data, h_charge.data);
 
-                                    // handle j==i situations
-                                    if ( j != i )
-                                        {
-                                        // load the position and orientation of the j particle
-                                        postype_j = h_postype.data[j];
-                                        orientation_j = h_orientation.data[j];
-                                        }
-                                    else
-                                        {
-                                        if (cur_image == 0)
-                                            {
-                                            // in the first image, skip i == j
-                                            continue;
-                                            }
-                                        else
-                                            {
-                                            // If this is particle i and we are in an outside image, use the translated position and orientation
-                                            postype_j = make_scalar4(pos_old.x, pos_old.y, pos_old.z, postype_i.w);
-                                            orientation_j = quat_to_scalar4(shape_old.orientation);
-                                            }
-                                        }
+                    if (patch_energy_cache)
+                        {
+                        m_patch_energy[i] = patch_energy_old;
+                        m_patch_energy_valid[i] = 1;
+                        }
+                    }
 
-                                    // put particles in coordinate system of particle i
-                                    vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
-                                    unsigned int typ_j = __scalar_as_int(postype_j.w);
-                                    Shape shape_j(quat<Scalar>(orientation_j), m_params[typ_j]);
-
-                                    Scalar rcut = r_cut_patch + 0.5 * m_patch->getAdditiveCutoff(typ_j);
-
-                                    // deltaU = U_old - U_new: add energy of old configuration
-                                    if (dot(r_ij,r_ij) <= rcut*rcut)
-                                        patch_field_energy_diff += m_patch->energy(r_ij,
-                                                                   typ_i,
-                                                                   quat<float>(orientation_i),
-                                                                   h_diameter.data[i],
-                                                                   h_charge.data[i],
-                                                                   typ_j,
-                                                                   quat<float>(orientation_j),
-                                                                   h_diameter.data[j],
-                                                                   h_charge.data[j]);
-                                    }
-                                }
-                            }
-                        else
-                            {
-                            // skip ahead
-                            cur_node_idx += m_aabb_tree.getNodeSkip(cur_node_idx);
-                            }
-                        }  // end loop over AABB nodes
-                    } // end loop over images
+                // deltaU = U_old - U_new: add energy of old configuration
+                patch_field_energy_diff += patch_energy_old;
                 } // end if (m_patch)
 
             // Add external energetic contribution
@@ -856,6 +940,10 @@ void IntegratorHPMCMono<Shape>::update(unsigned int timestep)
                         counters.rotate_accept_count++;
                     }
 
+                // the energies of the neighbors at the old and new positions change with the move
+                if (patch_energy_cache)
+                    invalidatePatchEnergyCache(i, pos_old, aabb_i_local, r_cut_patch, h_postype.data);
+
                 // update the position of the particle in the tree for future updates
                 detail::AABB aabb = aabb_i_local;
                 aabb.translate(pos_i);
@@ -868,6 +956,13 @@ void IntegratorHPMCMono<Shape>::update(unsigned int timestep)
                     {
                     h_orientation.data[i] = quat_to_scalar4(shape_i.orientation);
                     }
+
+                if (patch_energy_cache)
+                    {
+                    invalidatePatchEnergyCache(i, pos_i, aabb_i_local, r_cut_patch, h_postype.data);
+                    m_patch_energy[i] = patch_energy_new;
+                    m_patch_energy_valid[i] = 1;
+                    }
                 }
             else
                 {
@@ -935,12 +1030,14 @@ void IntegratorHPMCMono<Shape>::update(unsigned int timestep)
 /*! \param timestep current step
     \param early_exit exit at first overlap found if true
     \returns number of overlaps if early_exit=false, 1 if early_exit=true
+
+    With TBB, the particles are split among threads. When \a early_exit is set, the first thread to find an overlap
+    raises a shared flag and all threads stop checking further particles.
 */
 template <class Shape>
 unsigned int IntegratorHPMCMono<Shape>::countOverlaps(unsigned int timestep, bool early_exit)
     {
     unsigned int overlap_count = 0;
-    unsigned int err_count = 0;
 
     m_exec_conf->msg->notice(10) << "HPMCMono count overlaps: " << timestep << std::endl;
 
@@ -965,9 +1062,29 @@ unsigned int IntegratorHPMCMono<Shape>::countOverlaps(unsigned int timestep, boo
     // access parameters and interaction matrix
     ArrayHandle<unsigned int> h_overlaps(m_overlaps, access_location::host, access_mode::read);
 
+    #ifdef ENABLE_TBB
+    // set by the first thread that finds an overlap when exiting early
+    std::atomic<bool> found_overlap(false);
+    #endif
+
     // Loop over all particles
+    #ifdef ENABLE_TBB
+    overlap_count = tbb::parallel_reduce(tbb::blocked_range<unsigned int>(0, m_pdata->getN()),
+        0u,
+        [&](const tbb::blocked_range<unsigned int>& r, unsigned int overlap_count)->unsigned int {
+    for (unsigned int i = r.begin(); i != r.end(); ++i)
+    #else
     for (unsigned int i = 0; i < m_pdata->getN(); i++)
+    #endif
         {
+        #ifdef ENABLE_TBB
+        // stop as soon as any thread has found an overlap
+        if (early_exit && found_overlap.load(std::memory_order_relaxed))
+            break;
+        #endif
+
+        unsigned int err_count = 0;
+
         // read in the current position and orientation
         Scalar4 postype_i = h_postype.data[i];
         Scalar4 orientation_i = h_orientation.data[i];
@@ -1019,6 +1136,10 @@ unsigned int IntegratorHPMCMono<Shape>::countOverlaps(unsigned int timestep, boo
                                 overlap_count++;
                                 if (early_exit)
                                     {
+                                    #ifdef ENABLE_TBB
+                                    found_overlap.store(true, std::memory_order_relaxed);
+                                    #endif
+
                                     // exit early from loop over neighbor particles
                                     break;
                                     }
@@ -1049,6 +1170,13 @@ unsigned int IntegratorHPMCMono<Shape>::countOverlaps(unsigned int timestep, boo
             break;
             }
         } // end loop over particles
+    #ifdef ENABLE_TBB
+    return overlap_count;
+    }, [](unsigned int x, unsigned int y)->unsigned int { return x+y; } );
+
+    if (early_exit && overlap_count > 1)
+        overlap_count = 1;
+    #endif
 
     if (this->m_prof) this->m_prof->pop(this->m_exec_conf);
 
@@ -1205,6 +1333,147 @@ float IntegratorHPMCMono<Shape>::computePatchEnergy(unsigned int timestep)
     }
 
 
+/*! \param i Index of the particle
+    \param pos_i Position of particle i
+    \param orientation_i Orientation of particle i
+    \param aabb_i_local AABB of the patch interaction range of particle i, centered at the origin
+    \param r_cut_patch Patch cutoff of particle i
+    \param h_postype Particle positions and types
+    \param h_orientation Particle orientations
+    \param h_diameter Particle diameters
+    \param h_charge Particle charges
+
+    Periodic images of particle i interact with the particle at its current position in the particle data.
+
+    \returns The sum of patch energies of particle i with all its neighbors
+*/
+template<class Shape>
+double IntegratorHPMCMono<Shape>::computePatchEnergyParticle(unsigned int i,
+                                                             const vec3<Scalar>& pos_i,
+                                                             const quat<Scalar>& orientation_i,
+                                                             const detail::AABB& aabb_i_local,
+                                                             OverlapReal r_cut_patch,
+                                                             const Scalar4 *h_postype,
+                                                             const Scalar4 *h_orientation,
+                                                             const Scalar *h_diameter,
+                                                             const Scalar *h_charge)
+    {
+    double energy = 0.0;
+    unsigned int typ_i = __scalar_as_int(h_postype[i].w);
+
+    const unsigned int n_images = m_image_list.size();
+    for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
+        {
+        vec3<Scalar> pos_i_image = pos_i + m_image_list[cur_image];
+        detail::AABB aabb = aabb_i_local;
+        aabb.translate(pos_i_image);
+
+        // stackless search
+        for (unsigned int cur_node_idx = 0; cur_node_idx < m_aabb_tree.getNumNodes(); cur_node_idx++)
+            {
+            if (detail::overlap(m_aabb_tree.getNodeAABB(cur_node_idx), aabb))
+                {
+                if (m_aabb_tree.isNodeLeaf(cur_node_idx))
+                    {
+                    for (unsigned int cur_p = 0; cur_p < m_aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
+                        {
+                        // read in its position and orientation
+                        unsigned int j = m_aabb_tree.getNodeParticle(cur_node_idx, cur_p);
+
+                        // in the first image, skip i == j
+                        if (cur_image == 0 && i == j)
+                            continue;
+
+                        Scalar4 postype_j = h_postype[j];
+                        Scalar4 orientation_j = h_orientation[j];
+
+                        // put particles in coordinate system of particle i
+                        vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
+                        unsigned int typ_j = __scalar_as_int(postype_j.w);
+
+                        Scalar rcut = r_cut_patch + 0.5 * m_patch->getAdditiveCutoff(typ_j);
+
+                        if (dot(r_ij,r_ij) <= rcut*rcut)
+                            energy += m_patch->energy(r_ij,
+                                                      typ_i,
+                                                      quat<float>(orientation_i),
+                                                      h_diameter[i],
+                                                      h_charge[i],
+                                                      typ_j,
+                                                      quat<float>(orientation_j),
+                                                      h_diameter[j],
+                                                      h_charge[j]);
+                        }
+                    }
+                }
+            else
+                {
+                // skip ahead
+                cur_node_idx += m_aabb_tree.getNodeSkip(cur_node_idx);
+                }
+            }  // end loop over AABB nodes
+        } // end loop over images
+
+    return energy;
+    }
+
+/*! \param i Index of the particle
+    \param pos_i Position of particle i
+    \param aabb_i_local AABB of the patch interaction range of particle i, centered at the origin
+    \param r_cut_patch Patch cutoff of particle i
+    \param h_postype Particle positions and types
+
+    Only the pair distances are checked, no patch energies are evaluated.
+*/
+template<class Shape>
+void IntegratorHPMCMono<Shape>::invalidatePatchEnergyCache(unsigned int i,
+                                                           const vec3<Scalar>& pos_i,
+                                                           const detail::AABB& aabb_i_local,
+                                                           OverlapReal r_cut_patch,
+                                                           const Scalar4 *h_postype)
+    {
+    const unsigned int N = m_pdata->getN();
+
+    const unsigned int n_images = m_image_list.size();
+    for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
+        {
+        vec3<Scalar> pos_i_image = pos_i + m_image_list[cur_image];
+        detail::AABB aabb = aabb_i_local;
+        aabb.translate(pos_i_image);
+
+        // stackless search
+        for (unsigned int cur_node_idx = 0; cur_node_idx < m_aabb_tree.getNumNodes(); cur_node_idx++)
+            {
+            if (detail::overlap(m_aabb_tree.getNodeAABB(cur_node_idx), aabb))
+                {
+                if (m_aabb_tree.isNodeLeaf(cur_node_idx))
+                    {
+                    for (unsigned int cur_p = 0; cur_p < m_aabb_tree.getNodeNumParticles(cur_node_idx); cur_p++)
+                        {
+                        unsigned int j = m_aabb_tree.getNodeParticle(cur_node_idx, cur_p);
+
+                        // ghost particles are never moved and do not need a cached energy
+                        if (j == i || j >= N || !m_patch_energy_valid[j])
+                            continue;
+
+                        vec3<Scalar> r_ij = vec3<Scalar>(h_postype[j]) - pos_i_image;
+                        unsigned int typ_j = __scalar_as_int(h_postype[j].w);
+                        Scalar rcut = r_cut_patch + 0.5 * m_patch->getAdditiveCutoff(typ_j);
+
+                        if (dot(r_ij,r_ij) <= rcut*rcut)
+                            m_patch_energy_valid[j] = 0;
+                        }
+                    }
+                }
+            else
+                {
+                // skip ahead
+                cur_node_idx += m_aabb_tree.getNodeSkip(cur_node_idx);
+                }
+            }  // end loop over AABB nodes
+        } // end loop over images
+    }
+
 template <class Shape>
 Scalar IntegratorHPMCMono<Shape>::getMaxCoreDiameter()
     {
@@ -1262,6 +1531,42 @@ void IntegratorHPMCMono<Shape>::setParam(unsigned int typ,  const param_type& pa
     updateCellWidth();
     }
 
+/*! \param typ List of type ids
+    \param params List of shape parameters, one per entry in \a typ
+
+    setParams() is equivalent to calling setParam() for every type, but it updates the cell width only once.
+*/
+template <class Shape>
+void IntegratorHPMCMono<Shape>::setParams(pybind11::list typ, pybind11::list params)
+    {
+    if (pybind11::len(typ) != pybind11::len(params))
+        {
+        this->m_exec_conf->msg->error() << "integrate.mode_hpmc_?." << ": Number of types and parameters differ!" << std::endl;
+        throw std::runtime_error("Error setting parameters in IntegratorHPMCMono");
+        }
+
+    // validate all input before making any changes
+    std::vector<unsigned int> types(pybind11::len(typ));
+    for (unsigned int i = 0; i < types.size(); i++)
+        {
+        types[i] = pybind11::cast<unsigned int>(typ[i]);
+        if (types[i] >= this->m_pdata->getNTypes())
+            {
+            this->m_exec_conf->msg->error() << "integrate.mode_hpmc_?." << ": Trying to set pair params for a non existent type! "
+                      << types[i] << std::endl;
+            throw std::runtime_error("Error setting parameters in IntegratorHPMCMono");
+            }
+        }
+
+    m_exec_conf->msg->notice(7) << "setParams : " << types.size() << " types" << std::endl;
+    for (unsigned int i = 0; i < types.size(); i++)
+        {
+        m_params[types[i]] = pybind11::cast<const param_type&>(params[i]);
+        }
+
+    updateCellWidth();
+    }
+
 template <class Shape>
 void IntegratorHPMCMono<Shape>::setOverlapChecks(unsigned int typi, unsigned int typj, bool check_overlaps)
     {
@@ -1471,6 +1776,7 @@ void IntegratorHPMCMono<Shape>::updateCellWidth()
     // image list and aabb tree
     m_image_list_valid = false;
     m_aabb_tree_invalid = true;
+    std::fill(m_patch_energy_valid.begin(), m_patch_energy_valid.end(), 0);
     }
 
 template <class Shape>
@@ -1492,6 +1798,35 @@ void IntegratorHPMCMono<Shape>::growAABBList(unsigned int N)
     }
 
 
+/*! \param n_aabb Number of AABBs to compute
+
+    Compute the AABB of every local and ghost particle into m_aabbs, indexed by particle.
+*/
+template <class Shape>
+void IntegratorHPMCMono<Shape>::computeAABBs(unsigned int n_aabb)
+    {
+    ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
+    ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+
+    // grow the AABB list to the needed size
+    growAABBList(n_aabb);
+    for (unsigned int cur_particle = 0; cur_particle < n_aabb; cur_particle++)
+        {
+        unsigned int i = cur_particle;
+        unsigned int typ_i = __scalar_as_int(h_postype.data[i].w);
+        Shape shape(quat<Scalar>(h_orientation.data[i]), m_params[typ_i]);
+
+        if (!this->m_patch)
+            m_aabbs[i] = shape.getAABB(vec3<Scalar>(h_postype.data[i]));
+        else
+            {
+            Scalar radius = std::max(0.5*shape.getCircumsphereDiameter(),
+                0.5*this->m_patch->getAdditiveCutoff(typ_i));
+            m_aabbs[i] = detail::AABB(vec3<Scalar>(h_postype.data[i]), radius);
+            }
+        }
+    }
+
 /*! Call any time an up to date AABB tree is needed. IntegratorHPMCMono internally tracks whether
     the tree needs to be rebuilt or if the current tree can be used.
 
@@ -1501,6 +1836,11 @@ void IntegratorHPMCMono<Shape>::growAABBList(unsigned int N)
     this is on the next timestep. But in some cases (i.e. NPT), the tree may need to be rebuilt several times in a
     single step because of box volume moves.
 
+    When refitting is enabled, box changes only set m_aabb_tree_refit_needed. The node bounds are then recomputed
+    bottom-up without changing the tree topology, which is exact for any particle displacement as long as the
+    number of particles and ghosts is unchanged. The tree is rebuilt from scratch when the surface area cost of the
+    refit tree exceeds the cost after the last full build by more than m_aabb_tree_max_cost_ratio.
+
     Subclasses that override update() or other methods must be user to set m_aabb_tree_invalid appropriately, or
     erroneous simulations will result.
 
@@ -1509,43 +1849,60 @@ void IntegratorHPMCMono<Shape>::growAABBList(unsigned int N)
 template <class Shape>
 const detail::AABBTree& IntegratorHPMCMono<Shape>::buildAABBTree()
     {
+    unsigned int n_aabb = m_pdata->getN()+m_pdata->getNGhosts();
+
+    if (!m_aabb_tree_invalid && m_aabb_tree_refit_needed)
+        {
+        // a refit is only possible with the same set of particles
+        if (n_aabb == 0 || n_aabb != m_aabb_tree.getNumParticles())
+            {
+            m_aabb_tree_invalid = true;
+            }
+        else
+            {
+            m_exec_conf->msg->notice(8) << "Refitting AABB tree: " << m_pdata->getN() << " ptls " << m_pdata->getNGhosts() << " ghosts" << std::endl;
+            if (this->m_prof) this->m_prof->push(this->m_exec_conf, "AABB tree refit");
+
+            computeAABBs(n_aabb);
+            m_aabb_tree.refit(m_aabbs, n_aabb);
+            m_aabb_tree_refits++;
+
+            m_aabb_tree_cost_ratio = Scalar(1.0);
+            if (m_aabb_tree_build_cost > Scalar(0.0))
+                m_aabb_tree_cost_ratio = m_aabb_tree.getNormalizedSurfaceArea() / m_aabb_tree_build_cost;
+
+            // fall back to a full build when the quality of the tree has degraded too much
+            if (m_aabb_tree_cost_ratio > m_aabb_tree_max_cost_ratio)
+                {
+                m_exec_conf->msg->notice(8) << "AABB tree cost ratio " << m_aabb_tree_cost_ratio << " exceeds "
+                                            << m_aabb_tree_max_cost_ratio << ", rebuilding" << std::endl;
+                m_aabb_tree_invalid = true;
+                }
+
+            if (this->m_prof) this->m_prof->pop(this->m_exec_conf);
+            }
+        }
+
     if (m_aabb_tree_invalid)
         {
         m_exec_conf->msg->notice(8) << "Building AABB tree: " << m_pdata->getN() << " ptls " << m_pdata->getNGhosts() << " ghosts" << std::endl;
         if (this->m_prof) this->m_prof->push(this->m_exec_conf, "AABB tree build");
         // build the AABB tree
+        if (n_aabb > 0)
             {
-            ArrayHandle<Scalar4> h_postype(m_pdata->getPositions(), access_location::host, access_mode::read);
-            ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(), access_location::host, access_mode::read);
+            computeAABBs(n_aabb);
+            m_aabb_tree.buildTree(m_aabbs, n_aabb);
+            m_aabb_tree_builds++;
 
-            // grow the AABB list to the needed size
-            unsigned int n_aabb = m_pdata->getN()+m_pdata->getNGhosts();
-            if (n_aabb > 0)
-                {
-                growAABBList(n_aabb);
-                for (unsigned int cur_particle = 0; cur_particle < n_aabb; cur_particle++)
-                    {
-                    unsigned int i = cur_particle;
-                    unsigned int typ_i = __scalar_as_int(h_postype.data[i].w);
-                    Shape shape(quat<Scalar>(h_orientation.data[i]), m_params[typ_i]);
-
-                    if (!this->m_patch)
-                        m_aabbs[i] = shape.getAABB(vec3<Scalar>(h_postype.data[i]));
-                    else
-                        {
-                        Scalar radius = std::max(0.5*shape.getCircumsphereDiameter(),
-                            0.5*this->m_patch->getAdditiveCutoff(typ_i));
-                        m_aabbs[i] = detail::AABB(vec3<Scalar>(h_postype.data[i]), radius);
-                        }
-                    }
-                m_aabb_tree.buildTree(m_aabbs, n_aabb);
-                }
+            m_aabb_tree_build_cost = m_aabb_tree.getNormalizedSurfaceArea();
+            m_aabb_tree_cost_ratio = Scalar(1.0);
             }
 
         if (this->m_prof) this->m_prof->pop(this->m_exec_conf);
         }
 
     m_aabb_tree_invalid = false;
+    m_aabb_tree_refit_needed = false;
     return m_aabb_tree;
     }
 
@@ -1741,6 +2098,9 @@ int IntegratorHPMCMono<Shape>::slotWriteGSDState( gsd_handle& handle, std::strin
         {
         schema.write(handle, "state/hpmc/integrate/a", m_pdata->getNTypes(), h_a.data, GSD_TYPE_DOUBLE);
         }
+    double tune_state[HPMC_TUNER_STATE_SIZE];
+    m_tuner.getState(tune_state);
+    schema.write(handle, "state/hpmc/integrate/tune", HPMC_TUNER_STATE_SIZE, tune_state, GSD_TYPE_DOUBLE);
     retval |= schema_shape.write(handle, name, m_pdata->getNTypes(), m_params);
 
     return retval;
@@ -1777,6 +2137,10 @@ bool IntegratorHPMCMono<Shape>::restoreStateGSD( std::shared_ptr<GSDReader> read
         {
         schema.read(reader, frame, "state/hpmc/integrate/a", m_pdata->getNTypes(), h_a.data, GSD_TYPE_DOUBLE);
         }
+    // files written without a tuner state read as zeros and leave the tuner disabled
+    double tune_state[HPMC_TUNER_STATE_SIZE];
+    schema.read(reader, frame, "state/hpmc/integrate/tune", HPMC_TUNER_STATE_SIZE, tune_state, GSD_TYPE_DOUBLE);
+    m_tuner.setState(tune_state);
     schema_shape.read(reader, frame, name, m_pdata->getNTypes(), m_params);
     return success;
     }
@@ -1800,11 +2164,7 @@ bool IntegratorHPMCMono<Shape>::py_test_overlap(unsigned int type_i, unsigned in
     quat<Scalar> quat_j(pybind11::cast<Scalar>(qj[0]),
         vec3<Scalar>(pybind11::cast<Scalar>(qj[1]), pybind11::cast<Scalar>(qj[2]), pybind11::cast<Scalar>(qj[3])));
 
-    Shape shape_i(quat_i, m_params[type_i]);
-    Shape shape_j(quat_j, m_params[type_j]);
-
     unsigned int err = 0;
-    bool overlap = false;
     if (use_images)
         {
         #ifdef ENABLE_MPI
@@ -1816,7 +2176,38 @@ bool IntegratorHPMCMono<Shape>::py_test_overlap(unsigned int type_i, unsigned in
         #endif
 
         updateImageList();
+        }
+
+    bool overlap = testOverlapPair(type_i, type_j, dr, quat_i, quat_j, use_images, exclude_self, err);
+
+    if (err)
+        m_exec_conf->msg->warning() << "test_overlap() reports an error due to finite numerical precision." << std::endl;
+
+    return overlap;
+    }
+
+/*! \param type_i Type of the first particle
+    \param type_j Type of the second particle
+    \param dr Separation vector r_j - r_i
+    \param quat_i Orientation of the first particle
+    \param quat_j Orientation of the second particle
+    \param use_images Set to true to test all periodic images in m_image_list
+    \param exclude_self Set to true to skip the primary image when \a use_images is set
+    \param err Incremented on numerical precision errors
+
+    testOverlapPair() only reads the shape parameters and the image list, so it may be called from multiple threads.
+    The caller must update the image list beforehand when \a use_images is set.
+*/
+template<class Shape>
+bool IntegratorHPMCMono<Shape>::testOverlapPair(unsigned int type_i, unsigned int type_j, const vec3<Scalar>& dr,
+    const quat<Scalar>& quat_i, const quat<Scalar>& quat_j, bool use_images, bool exclude_self, unsigned int& err)
+    {
+    Shape shape_i(quat_i, m_params[type_i]);
+    Shape shape_j(quat_j, m_params[type_j]);
 
+    bool overlap = false;
+    if (use_images)
+        {
         const unsigned int n_images = m_image_list.size();
         for (unsigned int cur_image = 0; cur_image < n_images; cur_image++)
             {
@@ -1833,10 +2224,98 @@ bool IntegratorHPMCMono<Shape>::py_test_overlap(unsigned int type_i, unsigned in
         overlap = check_circumsphere_overlap(dr, shape_i, shape_j) && test_overlap(dr, shape_i, shape_j, err);
         }
 
-    if (err)
+    return overlap;
+    }
+
+/*! \param type_i Types of the first particles (N)
+    \param type_j Types of the second particles (N)
+    \param rij Separation vectors r_j - r_i (Nx3)
+    \param qi Orientations of the first particles (Nx4)
+    \param qj Orientations of the second particles (Nx4)
+    \param use_images Set to true to test all periodic images
+    \param exclude_self Set to true to skip the primary image when \a use_images is set
+
+    \returns A boolean array with one entry per pair that is true when the pair overlaps
+
+    The pairs are tested in parallel with TBB, and the GIL is released while testing so that other python threads
+    can run concurrently.
+*/
+template<class Shape>
+pybind11::array_t<bool> IntegratorHPMCMono<Shape>::py_test_overlap_many(
+    pybind11::array_t<unsigned int, pybind11::array::c_style | pybind11::array::forcecast> type_i,
+    pybind11::array_t<unsigned int, pybind11::array::c_style | pybind11::array::forcecast> type_j,
+    pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> rij,
+    pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> qi,
+    pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> qj,
+    bool use_images, bool exclude_self)
+    {
+    if (type_i.ndim() != 1 || type_j.ndim() != 1 || type_i.shape(0) != type_j.shape(0))
+        throw std::runtime_error("type_i and type_j need to be 1d arrays of the same length.\n");
+
+    const unsigned int n = type_i.shape(0);
+    if (rij.ndim() != 2 || rij.shape(0) != n || rij.shape(1) != 3)
+        throw std::runtime_error("rij needs to be a Nx3 array.\n");
+    if (qi.ndim() != 2 || qi.shape(0) != n || qi.shape(1) != 4 || qj.ndim() != 2 || qj.shape(0) != n || qj.shape(1) != 4)
+        throw std::runtime_error("qi and qj need to be Nx4 arrays of quaternions.\n");
+
+    const unsigned int *h_type_i = type_i.data();
+    const unsigned int *h_type_j = type_j.data();
+    const Scalar *h_rij = rij.data();
+    const Scalar *h_qi = qi.data();
+    const Scalar *h_qj = qj.data();
+
+    for (unsigned int k = 0; k < n; k++)
+        {
+        if (h_type_i[k] >= m_pdata->getNTypes() || h_type_j[k] >= m_pdata->getNTypes())
+            throw std::runtime_error("test_overlap: invalid particle type.\n");
+        }
+
+    if (use_images)
+        {
+        #ifdef ENABLE_MPI
+        if (m_pdata->getDomainDecomposition())
+            {
+            this->m_exec_conf->msg->error() << "test_overlap does not support MPI parallel jobs with use_images=True" << std::endl;
+            throw std::runtime_error("test_overlap does not support MPI parallel jobs");
+            }
+        #endif
+
+        updateImageList();
+        }
+
+    pybind11::array_t<bool> result(n);
+    bool *h_result = result.mutable_data();
+    unsigned int err_count = 0;
+
+        {
+        pybind11::gil_scoped_release release;
+
+        #ifdef ENABLE_TBB
+        err_count = tbb::parallel_reduce(tbb::blocked_range<unsigned int>(0, n),
+            0u,
+            [&](const tbb::blocked_range<unsigned int>& r, unsigned int err_count)->unsigned int {
+        for (unsigned int k = r.begin(); k != r.end(); ++k)
+        #else
+        for (unsigned int k = 0; k < n; k++)
+        #endif
+            {
+            vec3<Scalar> dr(h_rij[3*k], h_rij[3*k+1], h_rij[3*k+2]);
+            quat<Scalar> quat_i(h_qi[4*k], vec3<Scalar>(h_qi[4*k+1], h_qi[4*k+2], h_qi[4*k+3]));
+            quat<Scalar> quat_j(h_qj[4*k], vec3<Scalar>(h_qj[4*k+1], h_qj[4*k+2], h_qj[4*k+3]));
+
+            h_result[k] = testOverlapPair(h_type_i[k], h_type_j[k], dr, quat_i, quat_j, use_images, exclude_self,
+                err_count);
+            }
+        #ifdef ENABLE_TBB
+        return err_count;
+        }, [](unsigned int x, unsigned int y)->unsigned int { return x+y; } );
+        #endif
+        }
+
+    if (err_count)
         m_exec_conf->msg->warning() << "test_overlap() reports an error due to finite numerical precision." << std::endl;
 
-    return overlap;
+    return result;
     }
 
 //! Export the IntegratorHPMCMono class to python
@@ -1848,6 +2327,7 @@ template < class Shape > void export_IntegratorHPMCMono(pybind11::module& m, con
     pybind11::class_< IntegratorHPMCMono<Shape>, std::shared_ptr< IntegratorHPMCMono<Shape> > >(m, name.c_str(), pybind11::base<IntegratorHPMC>())
           .def(pybind11::init< std::shared_ptr<SystemDefinition>, unsigned int >())
           .def("setParam", &IntegratorHPMCMono<Shape>::setParam)
+          .def("setParams", &IntegratorHPMCMono<Shape>::setParams)
           .def("setOverlapChecks", &IntegratorHPMCMono<Shape>::setOverlapChecks)
           .def("setExternalField", &IntegratorHPMCMono<Shape>::setExternalField)
           .def("setPatchEnergy", &IntegratorHPMCMono<Shape>::setPatchEnergy)
@@ -1856,7 +2336,9 @@ template < class Shape > void export_IntegratorHPMCMono(pybind11::module& m, con
           .def("connectGSDShapeSpec", &IntegratorHPMCMono<Shape>::connectGSDShapeSpec)
           .def("restoreStateGSD", &IntegratorHPMCMono<Shape>::restoreStateGSD)
           .def("py_test_overlap", &IntegratorHPMCMono<Shape>::py_test_overlap)
+          .def("py_test_overlap_many", &IntegratorHPMCMono<Shape>::py_test_overlap_many)
           .def("getTypeShapesPy", &IntegratorHPMCMono<Shape>::getTypeShapesPy)
+          .def("setAABBTreeRefit", &IntegratorHPMCMono<Shape>::setAABBTreeRefit)
           ;
     }
 
@@ -0,0 +1,184 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+// inclusion guard
+#ifndef _HPMC_MOVE_SIZE_TUNER_H_
+#define _HPMC_MOVE_SIZE_TUNER_H_
+
+/*! \file MoveSizeTuner.h
+    \brief Declaration of MoveSizeTuner
+*/
+
+#include "hoomd/HOOMDMath.h"
+
+#include <algorithm>
+#include <stdexcept>
+
+namespace hpmc
+{
+
+//! Number of values stored by MoveSizeTuner::getState()
+#define HPMC_TUNER_STATE_SIZE 6
+
+//! Adaptive controller for HPMC trial move sizes
+/*! MoveSizeTuner rescales trial move sizes toward a target acceptance ratio with the same damped rule as
+    hoomd.hpmc.util.tune:
+
+        scale = (1 + gamma) * acceptance / (target + gamma * acceptance)
+
+    The owner calls update() at the start of every time step. Adaptation starts at the first time step after the
+    tuner is enabled and happens every *period* steps within a window of *steps* time steps. Afterwards the tuner
+    disables itself and the move sizes stay fixed, so that the production run obeys detailed balance.
+
+    The owner keeps its own acceptance counters and passes the counts accumulated since the last adaptation to
+    getNewValue().
+*/
+class MoveSizeTuner
+    {
+    public:
+        //! Constructor
+        MoveSizeTuner()
+            : m_enabled(false), m_target(0.2), m_period(100), m_steps(0), m_gamma(2.0), m_max_scale(2.0),
+              m_started(false), m_start(0), m_last_tune(0), m_timestep(0)
+            {
+            }
+
+        //! Set the tuning parameters
+        /*! \param enabled Enable adaptation
+            \param target Target acceptance ratio
+            \param period Number of time steps between adaptations
+            \param steps Length of the adaptation window in time steps
+            \param gamma Damping factor
+            \param max_scale Maximum factor by which to scale a move size in one adaptation
+        */
+        void set(bool enabled, Scalar target, unsigned int period, unsigned int steps, Scalar gamma, Scalar max_scale)
+            {
+            if (target <= Scalar(0.0) || target >= Scalar(1.0))
+                throw std::runtime_error("Error setting move size tuner: target must be in (0,1)");
+            if (period == 0)
+                throw std::runtime_error("Error setting move size tuner: period must be positive");
+            if (gamma < Scalar(0.0))
+                throw std::runtime_error("Error setting move size tuner: gamma must be non-negative");
+            if (max_scale <= Scalar(1.0))
+                throw std::runtime_error("Error setting move size tuner: max_scale must be greater than 1");
+
+            m_enabled = enabled;
+            m_target = target;
+            m_period = period;
+            m_steps = steps;
+            m_gamma = gamma;
+            m_max_scale = max_scale;
+            m_started = false;
+            }
+
+        //! Test whether the tuner still adapts move sizes
+        bool isActive() const
+            {
+            return m_enabled;
+            }
+
+        //! Advance the tuner to the given time step
+        /*! \param timestep Current time step
+            \returns true when the owner should adapt its move sizes at this step
+        */
+        bool update(unsigned int timestep)
+            {
+            if (!m_enabled)
+                return false;
+
+            m_timestep = timestep;
+            if (!m_started)
+                {
+                m_started = true;
+                m_start = timestep;
+                m_last_tune = timestep;
+                }
+
+            if (timestep - m_start >= m_steps)
+                {
+                // end of the adaptation window, freeze the move sizes
+                m_enabled = false;
+                return false;
+                }
+
+            if (timestep - m_last_tune < m_period)
+                return false;
+
+            m_last_tune = timestep;
+            return true;
+            }
+
+        //! Compute a new move size
+        /*! \param value Current move size
+            \param accept Number of accepted trial moves since the last adaptation
+            \param reject Number of rejected trial moves since the last adaptation
+            \param maximum Largest allowed move size (no limit when 0)
+            \returns The adapted move size
+
+            Move sizes of 0 disable the move type and are left unchanged, as are move sizes for which no trial moves
+            were attempted.
+        */
+        Scalar getNewValue(Scalar value, unsigned long long accept, unsigned long long reject, Scalar maximum) const
+            {
+            if (value == Scalar(0.0) || accept + reject == 0)
+                return value;
+
+            Scalar acceptance = Scalar(accept) / Scalar(accept + reject);
+            Scalar scale = Scalar(0.1);
+            if (acceptance > Scalar(0.0))
+                scale = ((Scalar(1.0) + m_gamma) * acceptance) / (m_target + m_gamma * acceptance);
+            scale = std::min(scale, m_max_scale);
+
+            Scalar new_value = value * scale;
+            if (maximum > Scalar(0.0))
+                new_value = std::min(new_value, maximum);
+            return new_value;
+            }
+
+        //! Write the tuner state into an array of HPMC_TUNER_STATE_SIZE values
+        /*! The state stores the remaining length of the adaptation window so that a restarted simulation adapts for
+            the remaining time steps only.
+        */
+        void getState(double *state) const
+            {
+            unsigned int remaining = m_steps;
+            if (m_started)
+                remaining = (m_timestep - m_start < m_steps) ? m_steps - (m_timestep - m_start) : 0;
+
+            state[0] = (m_enabled && remaining > 0) ? 1.0 : 0.0;
+            state[1] = m_target;
+            state[2] = m_period;
+            state[3] = remaining;
+            state[4] = m_gamma;
+            state[5] = m_max_scale;
+            }
+
+        //! Restore the tuner state from an array written by getState()
+        void setState(const double *state)
+            {
+            if (state[0] == 0.0)
+                {
+                // missing or finished tuner state
+                m_enabled = false;
+                m_started = false;
+                return;
+                }
+            set(true, Scalar(state[1]), (unsigned int)state[2], (unsigned int)state[3], Scalar(state[4]), Scalar(state[5]));
+            }
+
+    private:
+        bool m_enabled;             //!< True while move sizes are adapted
+        Scalar m_target;            //!< Target acceptance ratio
+        unsigned int m_period;      //!< Number of time steps between adaptations
+        unsigned int m_steps;       //!< Length of the adaptation window
+        Scalar m_gamma;             //!< Damping factor
+        Scalar m_max_scale;         //!< Maximum scale factor in one adaptation
+        bool m_started;             //!< True after the first time step of the window
+        unsigned int m_start;       //!< First time step of the adaptation window
+        unsigned int m_last_tune;   //!< Time step of the last adaptation
+        unsigned int m_timestep;    //!< Last time step seen by update()
+    };
+
+} // end namespace hpmc
+
+#endif // _HPMC_MOVE_SIZE_TUNER_H_
@@ -25,6 +25,10 @@
 #include "hoomd/extern/quickhull/QuickHull.hpp"
 #endif
 
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif
+
 namespace hpmc{
 namespace detail{
 
@@ -152,29 +156,89 @@ poly2d_verts make_poly2d_verts(pybind11::list verts, OverlapReal sweep_radius, b
     return result;
     }
 
-//! Helper function to build poly3d_data from python
-inline ShapePolyhedron::param_type make_poly3d_data(pybind11::list verts,pybind11::list face_verts,
+//! Input data for a poly3d_data, extracted from python
+/*! Holding the input in plain C++ containers allows the expensive part of the construction (the convex hull and the
+    OBB tree) to run without the python interpreter, and for many shapes concurrently.
+*/
+struct poly3d_data_input
+    {
+    std::vector< vec3<OverlapReal> > verts;     //!< Vertex coordinates
+    std::vector<unsigned int> face_verts;       //!< Ordered vertex IDs of every face
+    std::vector<unsigned int> face_offs;        //!< Offset of every face in the list of vertices per face
+    std::vector<unsigned int> overlap;          //!< Overlap mask per face
+    OverlapReal sweep_radius;                   //!< Radius of a sweeping sphere
+    bool ignore_stats;                          //!< Flag to ignore statistics
+    unsigned int leaf_capacity;                 //!< Maximum number of faces per OBB tree leaf
+    vec3<OverlapReal> origin;                   //!< A point *inside* the surface
+    unsigned int hull_only;                     //!< If 1, only the hull of the shape is considered for overlaps
+    };
+
+//! Helper function to extract the input of a poly3d_data from python
+inline poly3d_data_input make_poly3d_data_input(pybind11::list verts,pybind11::list face_verts,
                              pybind11::list face_offs,
                              pybind11::list overlap,
                              OverlapReal R, bool ignore_stats,
                              unsigned int leaf_capacity,
                              pybind11::list origin,
-                             unsigned int hull_only,
-                             std::shared_ptr<ExecutionConfiguration> exec_conf)
+                             unsigned int hull_only)
+    {
+    poly3d_data_input input;
+
+    for (unsigned int i = 0; i < len(verts); i++)
+        {
+        pybind11::list v = pybind11::cast<pybind11::list>(verts[i]);
+        vec3<OverlapReal> vert;
+        vert.x = pybind11::cast<OverlapReal>(v[0]);
+        vert.y = pybind11::cast<OverlapReal>(v[1]);
+        vert.z = pybind11::cast<OverlapReal>(v[2]);
+        input.verts.push_back(vert);
+        }
+
+    for (unsigned int i = 0; i < len(face_verts); i++)
+        input.face_verts.push_back(pybind11::cast<unsigned int>(face_verts[i]));
+
+    for (unsigned int i = 0; i < len(face_offs); i++)
+        input.face_offs.push_back(pybind11::cast<unsigned int>(face_offs[i]));
+
+    for (unsigned int i = 0; i < len(overlap); i++)
+        input.overlap.push_back(pybind11::cast<unsigned int>(overlap[i]));
+
+    input.sweep_radius = R;
+    input.ignore_stats = ignore_stats;
+    input.leaf_capacity = leaf_capacity;
+    input.origin = vec3<OverlapReal>(pybind11::cast<OverlapReal>(origin[0]), pybind11::cast<OverlapReal>(origin[1]), pybind11::cast<OverlapReal>(origin[2]));
+    input.hull_only = hull_only;
+
+    return input;
+    }
+
+//! Helper function to build poly3d_data
+/*! \param input Shape definition
+    \param managed Set to true to allocate managed memory
+
+    build_poly3d_data does not access any python objects and may be called from multiple threads.
+*/
+inline ShapePolyhedron::param_type build_poly3d_data(const poly3d_data_input& input, bool managed)
     {
     ShapePolyhedron::param_type result;
 
+    if (input.face_offs.size() == 0)
+        {
+        throw std::runtime_error("List of face offsets must not be empty");
+        }
+
+    unsigned int n_faces = input.face_offs.size()-1;
+
     // compute convex hull of vertices
     typedef quickhull::Vector3<OverlapReal> vec;
 
     std::vector<vec> qh_pts;
-    for (unsigned int i = 0; i < len(verts); i++)
+    for (unsigned int i = 0; i < input.verts.size(); i++)
         {
-        pybind11::list v = pybind11::cast<pybind11::list>(verts[i]);
         vec vert;
-        vert.x = pybind11::cast<OverlapReal>(v[0]);
-        vert.y = pybind11::cast<OverlapReal>(v[1]);
-        vert.z = pybind11::cast<OverlapReal>(v[2]);
+        vert.x = input.verts[i].x;
+        vert.y = input.verts[i].y;
+        vert.z = input.verts[i].z;
         qh_pts.push_back(vert);
         }
 
@@ -182,15 +246,15 @@ inline ShapePolyhedron::param_type make_poly3d_data(pybind11::list verts,pybind1
     auto hull = qh.getConvexHull(qh_pts, true, false);
     auto vertexBuffer = hull.getVertexBuffer();
 
-    result = detail::poly3d_data(len(verts), len(face_offs)-1, len(face_verts), vertexBuffer.size(), exec_conf->isCUDAEnabled());
-    result.ignore = ignore_stats;
-    result.sweep_radius = result.convex_hull_verts.sweep_radius = R;
-    result.n_verts = len(verts);
-    result.n_faces = len(face_offs)-1;
-    result.origin = vec3<OverlapReal>(pybind11::cast<OverlapReal>(origin[0]), pybind11::cast<OverlapReal>(origin[1]), pybind11::cast<OverlapReal>(origin[2]));
-    result.hull_only = hull_only;
+    result = detail::poly3d_data(input.verts.size(), n_faces, input.face_verts.size(), vertexBuffer.size(), managed);
+    result.ignore = input.ignore_stats;
+    result.sweep_radius = result.convex_hull_verts.sweep_radius = input.sweep_radius;
+    result.n_verts = input.verts.size();
+    result.n_faces = n_faces;
+    result.origin = input.origin;
+    result.hull_only = input.hull_only;
 
-    if (len(overlap) != result.n_faces)
+    if (input.overlap.size() != result.n_faces)
         {
         throw std::runtime_error("Number of member overlap flags must be equal to number faces");
         }
@@ -204,33 +268,28 @@ inline ShapePolyhedron::param_type make_poly3d_data(pybind11::list verts,pybind1
         k++;
         }
 
-    for (unsigned int i = 0; i < len(face_offs); i++)
+    for (unsigned int i = 0; i < input.face_offs.size(); i++)
         {
-        unsigned int offs = pybind11::cast<unsigned int>(face_offs[i]);
-        result.face_offs[i] = offs;
+        result.face_offs[i] = input.face_offs[i];
         }
 
     for (unsigned int i = 0; i < result.n_faces; i++)
         {
-        result.face_overlap[i] = pybind11::cast<unsigned int>(overlap[i]);
+        result.face_overlap[i] = input.overlap[i];
         }
 
-    // extract the verts from the python list and compute the radius on the way
+    // copy the verts and compute the radius on the way
     OverlapReal radius_sq = OverlapReal(0.0);
-    for (unsigned int i = 0; i < len(verts); i++)
+    for (unsigned int i = 0; i < input.verts.size(); i++)
         {
-        pybind11::list v = pybind11::cast<pybind11::list>(verts[i]);
-        vec3<OverlapReal> vert;
-        vert.x = pybind11::cast<OverlapReal>(v[0]);
-        vert.y = pybind11::cast<OverlapReal>(v[1]);
-        vert.z = pybind11::cast<OverlapReal>(v[2]);
+        vec3<OverlapReal> vert = input.verts[i];
         result.verts[i] = vert;
         radius_sq = max(radius_sq, dot(vert, vert));
         }
 
-    for (unsigned int i = 0; i < len(face_verts); i++)
+    for (unsigned int i = 0; i < input.face_verts.size(); i++)
         {
-        unsigned int j = pybind11::cast<unsigned int>(face_verts[i]);
+        unsigned int j = input.face_verts[i];
         if (j >= result.n_verts)
             {
             std::ostringstream oss;
@@ -240,11 +299,11 @@ inline ShapePolyhedron::param_type make_poly3d_data(pybind11::list verts,pybind1
         result.face_verts[i] = j;
         }
 
-    hpmc::detail::OBB *obbs = new hpmc::detail::OBB[len(face_offs)];
+    hpmc::detail::OBB *obbs = new hpmc::detail::OBB[input.face_offs.size()];
     std::vector<std::vector<vec3<OverlapReal> > > internal_coordinates;
 
     // construct bounding box tree
-    for (unsigned int i = 0; i < len(face_offs)-1; ++i)
+    for (unsigned int i = 0; i < n_faces; ++i)
         {
         std::vector<vec3<OverlapReal> > face_vec;
 
@@ -263,8 +322,8 @@ inline ShapePolyhedron::param_type make_poly3d_data(pybind11::list verts,pybind1
         }
 
     OBBTree tree;
-    tree.buildTree(obbs, internal_coordinates, result.sweep_radius, len(face_offs)-1, leaf_capacity);
-    result.tree = GPUTree(tree, exec_conf->isCUDAEnabled());
+    tree.buildTree(obbs, internal_coordinates, result.sweep_radius, n_faces, input.leaf_capacity);
+    result.tree = GPUTree(tree, managed);
     delete [] obbs;
 
     // set the diameter
@@ -273,6 +332,81 @@ inline ShapePolyhedron::param_type make_poly3d_data(pybind11::list verts,pybind1
     return result;
     }
 
+//! Helper function to build poly3d_data from python
+inline ShapePolyhedron::param_type make_poly3d_data(pybind11::list verts,pybind11::list face_verts,
+                             pybind11::list face_offs,
+                             pybind11::list overlap,
+                             OverlapReal R, bool ignore_stats,
+                             unsigned int leaf_capacity,
+                             pybind11::list origin,
+                             unsigned int hull_only,
+                             std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    poly3d_data_input input = make_poly3d_data_input(verts, face_verts, face_offs, overlap, R, ignore_stats,
+        leaf_capacity, origin, hull_only);
+    return build_poly3d_data(input, exec_conf->isCUDAEnabled());
+    }
+
+//! Helper function to build many poly3d_data from python at once
+/*! Every argument is a list with one entry per shape, except for the execution configuration. The python input is
+    read first, then the shapes (including their OBB trees) are built in parallel with the GIL released.
+
+    \returns A list of shape parameters, in the order of the input
+*/
+inline std::vector<ShapePolyhedron::param_type> make_poly3d_data_list(pybind11::list verts,
+                             pybind11::list face_verts,
+                             pybind11::list face_offs,
+                             pybind11::list overlap,
+                             pybind11::list R,
+                             pybind11::list ignore_stats,
+                             pybind11::list leaf_capacity,
+                             pybind11::list origin,
+                             pybind11::list hull_only,
+                             std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    unsigned int n = len(verts);
+    if (len(face_verts) != n || len(face_offs) != n || len(overlap) != n || len(R) != n || len(ignore_stats) != n
+        || len(leaf_capacity) != n || len(origin) != n || len(hull_only) != n)
+        {
+        throw std::runtime_error("All shape parameter lists must have the same length");
+        }
+
+    std::vector<poly3d_data_input> input(n);
+    for (unsigned int i = 0; i < n; i++)
+        {
+        input[i] = make_poly3d_data_input(pybind11::cast<pybind11::list>(verts[i]),
+                                          pybind11::cast<pybind11::list>(face_verts[i]),
+                                          pybind11::cast<pybind11::list>(face_offs[i]),
+                                          pybind11::cast<pybind11::list>(overlap[i]),
+                                          pybind11::cast<OverlapReal>(R[i]),
+                                          pybind11::cast<bool>(ignore_stats[i]),
+                                          pybind11::cast<unsigned int>(leaf_capacity[i]),
+                                          pybind11::cast<pybind11::list>(origin[i]),
+                                          pybind11::cast<unsigned int>(hull_only[i]));
+        }
+
+    bool managed = exec_conf->isCUDAEnabled();
+    std::vector<ShapePolyhedron::param_type> result(n);
+
+        {
+        pybind11::gil_scoped_release release;
+
+        #ifdef ENABLE_TBB
+        tbb::parallel_for((unsigned int)0, n, [&](unsigned int i)
+        #else
+        for (unsigned int i = 0; i < n; i++)
+        #endif
+            {
+            result[i] = build_poly3d_data(input[i], managed);
+            }
+        #ifdef ENABLE_TBB
+            );
+        #endif
+        }
+
+    return result;
+    }
+
 //! Helper function to build poly3d_verts from python
 poly3d_verts make_poly3d_verts(pybind11::list verts, OverlapReal sweep_radius, bool ignore_stats,
                                         std::shared_ptr<ExecutionConfiguration> exec_conf)
@@ -69,6 +69,9 @@ UpdaterBoxMC::~UpdaterBoxMC()
     - hpmc_boxmc_shear_acceptance (Ratio of shear trials accepted during logger interval)
     - hpmc_boxmc_aspect_acceptance (Ratio of aspect trials accepted during logger interval)
     - hpmc_boxmc_betaP (Current value of beta*p parameter for the box updater)
+    - hpmc_boxmc_volume_delta, hpmc_boxmc_ln_volume_delta, hpmc_boxmc_aspect_delta (Current move sizes)
+    - hpmc_boxmc_length_delta_{x,y,z}, hpmc_boxmc_shear_delta_{xy,xz,yz} (Current move sizes)
+    - hpmc_boxmc_tune_active (1 while the move sizes are adapted, 0 otherwise)
 
     \returns a list of provided quantities
 */
@@ -84,6 +87,16 @@ std::vector< std::string > UpdaterBoxMC::getProvidedLogQuantities()
     result.push_back("hpmc_boxmc_shear_acceptance");
     result.push_back("hpmc_boxmc_aspect_acceptance");
     result.push_back("hpmc_boxmc_betaP");
+    result.push_back("hpmc_boxmc_volume_delta");
+    result.push_back("hpmc_boxmc_ln_volume_delta");
+    result.push_back("hpmc_boxmc_length_delta_x");
+    result.push_back("hpmc_boxmc_length_delta_y");
+    result.push_back("hpmc_boxmc_length_delta_z");
+    result.push_back("hpmc_boxmc_shear_delta_xy");
+    result.push_back("hpmc_boxmc_shear_delta_xz");
+    result.push_back("hpmc_boxmc_shear_delta_yz");
+    result.push_back("hpmc_boxmc_aspect_delta");
+    result.push_back("hpmc_boxmc_tune_active");
     return result;
     }
 
@@ -134,6 +147,26 @@ Scalar UpdaterBoxMC::getLogValue(const std::string& quantity, unsigned int times
         {
         return m_P->getValue(timestep);
         }
+    else if (quantity == "hpmc_boxmc_volume_delta")
+        return m_Volume_delta;
+    else if (quantity == "hpmc_boxmc_ln_volume_delta")
+        return m_lnVolume_delta;
+    else if (quantity == "hpmc_boxmc_length_delta_x")
+        return m_Length_delta[0];
+    else if (quantity == "hpmc_boxmc_length_delta_y")
+        return m_Length_delta[1];
+    else if (quantity == "hpmc_boxmc_length_delta_z")
+        return m_Length_delta[2];
+    else if (quantity == "hpmc_boxmc_shear_delta_xy")
+        return m_Shear_delta[0];
+    else if (quantity == "hpmc_boxmc_shear_delta_xz")
+        return m_Shear_delta[1];
+    else if (quantity == "hpmc_boxmc_shear_delta_yz")
+        return m_Shear_delta[2];
+    else if (quantity == "hpmc_boxmc_aspect_delta")
+        return m_Aspect_delta;
+    else if (quantity == "hpmc_boxmc_tune_active")
+        return m_tuner.isActive() ? 1.0 : 0.0;
     else
         {
         return Updater::getLogValue(quantity, timestep);
@@ -409,6 +442,9 @@ void UpdaterBoxMC::update(unsigned int timestep)
     m_count_step_start = m_count_total;
     m_exec_conf->msg->notice(10) << "UpdaterBoxMC: " << timestep << std::endl;
 
+    if (m_tuner.isActive())
+        adaptMoveSizes(timestep);
+
     // Create a prng instance for this timestep
     hoomd::RandomGenerator rng(hoomd::RNGIdentifier::UpdaterBoxMC, m_seed, timestep);
 
@@ -476,6 +512,114 @@ void UpdaterBoxMC::update(unsigned int timestep)
     if (m_prof) m_prof->pop();
     }
 
+/*! \param timestep Current time step
+
+    Volume and length moves share the volume acceptance counters. Move sizes that are 0 stay disabled.
+*/
+void UpdaterBoxMC::adaptMoveSizes(unsigned int timestep)
+    {
+    if (!m_tuner.update(timestep))
+        {
+        if (!m_tuner.isActive())
+            m_exec_conf->msg->notice(2) << "UpdaterBoxMC: move size tuning finished at step " << timestep << std::endl;
+        return;
+        }
+
+    hpmc_boxmc_counters_t counters = m_count_total - m_count_tune_start;
+    m_count_tune_start = m_count_total;
+
+    m_Volume_delta = m_tuner.getNewValue(m_Volume_delta,
+        counters.volume_accept_count, counters.volume_reject_count, 0);
+    m_lnVolume_delta = m_tuner.getNewValue(m_lnVolume_delta,
+        counters.ln_volume_accept_count, counters.ln_volume_reject_count, 0);
+    for (unsigned int i = 0; i < 3; i++)
+        {
+        m_Length_delta[i] = m_tuner.getNewValue(m_Length_delta[i],
+            counters.volume_accept_count, counters.volume_reject_count, 0);
+        m_Shear_delta[i] = m_tuner.getNewValue(m_Shear_delta[i],
+            counters.shear_accept_count, counters.shear_reject_count, 0);
+        }
+    m_Aspect_delta = m_tuner.getNewValue(m_Aspect_delta,
+        counters.aspect_accept_count, counters.aspect_reject_count, 0);
+
+    m_exec_conf->msg->notice(6) << "UpdaterBoxMC: move size tuning at step " << timestep << std::endl;
+    }
+
+void UpdaterBoxMC::connectGSDStateSignal(std::shared_ptr<GSDDumpWriter> writer, std::string name)
+    {
+    typedef hoomd::detail::SharedSignalSlot<int(gsd_handle&)> SlotType;
+    auto func = std::bind(&UpdaterBoxMC::slotWriteGSDState, this, std::placeholders::_1, name);
+    std::shared_ptr<hoomd::detail::SignalSlot> pslot( new SlotType(writer->getWriteSignal(), func));
+    addSlot(pslot);
+    }
+
+/*! The box move sizes are written to name + "delta" in the order volume, ln_volume, length (x,y,z),
+    shear (xy,xz,yz), aspect. The tuner state is written to name + "tune".
+*/
+int UpdaterBoxMC::slotWriteGSDState(gsd_handle& handle, std::string name) const
+    {
+    m_exec_conf->msg->notice(10) << "UpdaterBoxMC writing to GSD File to name: "<< name << std::endl;
+    #ifdef ENABLE_MPI
+    bool mpi=(bool)m_pdata->getDomainDecomposition();
+    #else
+    bool mpi=false;
+    #endif
+    gsd_schema_hpmc schema(m_exec_conf, mpi);
+
+    double delta[9] = {m_Volume_delta, m_lnVolume_delta,
+                       m_Length_delta[0], m_Length_delta[1], m_Length_delta[2],
+                       m_Shear_delta[0], m_Shear_delta[1], m_Shear_delta[2],
+                       m_Aspect_delta};
+    double tune_state[HPMC_TUNER_STATE_SIZE];
+    m_tuner.getState(tune_state);
+
+    int retval = 0;
+    retval |= schema.write(handle, name + "delta", 9, delta, GSD_TYPE_DOUBLE);
+    retval |= schema.write(handle, name + "tune", HPMC_TUNER_STATE_SIZE, tune_state, GSD_TYPE_DOUBLE);
+    return retval;
+    }
+
+/*! The move weights are not part of the state and keep their current values.
+*/
+bool UpdaterBoxMC::restoreStateGSD(std::shared_ptr<GSDReader> reader, std::string name)
+    {
+    m_exec_conf->msg->notice(10) << "UpdaterBoxMC from GSD File to name: "<< name << std::endl;
+    uint64_t frame = reader->getFrame();
+    #ifdef ENABLE_MPI
+    bool mpi=(bool)m_pdata->getDomainDecomposition();
+    #else
+    bool mpi=false;
+    #endif
+    gsd_schema_hpmc schema(m_exec_conf, mpi);
+
+    double delta[9];
+    double tune_state[HPMC_TUNER_STATE_SIZE];
+    bool success = schema.read(reader, frame, name + "delta", 9, delta, GSD_TYPE_DOUBLE);
+    schema.read(reader, frame, name + "tune", HPMC_TUNER_STATE_SIZE, tune_state, GSD_TYPE_DOUBLE);
+
+    #ifdef ENABLE_MPI
+    if (mpi)
+        bcast(success, 0, m_exec_conf->getMPICommunicator());
+    #endif
+    if (!success)
+        {
+        m_exec_conf->msg->warning() << "UpdaterBoxMC: no box move sizes found in the GSD file, keeping the current values" << std::endl;
+        return false;
+        }
+
+    m_Volume_delta = delta[0];
+    m_lnVolume_delta = delta[1];
+    for (unsigned int i = 0; i < 3; i++)
+        {
+        m_Length_delta[i] = delta[2+i];
+        m_Shear_delta[i] = delta[5+i];
+        }
+    m_Aspect_delta = delta[8];
+    m_tuner.setState(tune_state);
+    m_count_tune_start = m_count_total;
+    return success;
+    }
+
 void UpdaterBoxMC::update_L(unsigned int timestep, hoomd::RandomGenerator& rng)
     {
     if (m_prof) m_prof->push("UpdaterBoxMC: update_L");
@@ -904,6 +1048,10 @@ void export_UpdaterBoxMC(py::module& m)
 //    .def("getIsotropic", &UpdaterBoxMC::getIsotropic)
     .def("computeAspectRatios", &UpdaterBoxMC::computeAspectRatios)
     .def("getCounters", &UpdaterBoxMC::getCounters)
+    .def("setMoveSizeTuning", &UpdaterBoxMC::setMoveSizeTuning)
+    .def("getMoveSizeTuningActive", &UpdaterBoxMC::getMoveSizeTuningActive)
+    .def("connectGSDStateSignal", &UpdaterBoxMC::connectGSDStateSignal)
+    .def("restoreStateGSD", &UpdaterBoxMC::restoreStateGSD)
     ;
 
    py::class_< hpmc_boxmc_counters_t >(m, "hpmc_boxmc_counters_t")
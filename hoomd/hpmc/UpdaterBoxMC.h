@@ -15,6 +15,8 @@
 #include <cmath>
 
 #include "IntegratorHPMC.h"
+#include "MoveSizeTuner.h"
+#include "GSDHPMCSchema.h"
 
 #ifndef NVCC
 #include <hoomd/extern/pybind/include/pybind11/pybind11.h>
@@ -206,6 +208,36 @@ class UpdaterBoxMC : public Updater
         */
         virtual void update(unsigned int timestep);
 
+        //! Enable or disable adaptive tuning of the box move sizes
+        /*! \param enable Adapt the move sizes when true
+            \param target Target acceptance ratio for all box move types
+            \param period Number of time steps between adaptations
+            \param steps Length of the adaptation window in time steps, starting at the next run
+            \param gamma Damping factor
+            \param max_scale Maximum factor by which to scale a move size in one adaptation
+        */
+        void setMoveSizeTuning(bool enable, Scalar target, unsigned int period, unsigned int steps,
+            Scalar gamma, Scalar max_scale)
+            {
+            m_tuner.set(enable, target, period, steps, gamma, max_scale);
+            m_count_tune_start = m_count_total;
+            }
+
+        //! Get whether the move sizes are currently adapted
+        bool getMoveSizeTuningActive()
+            {
+            return m_tuner.isActive();
+            }
+
+        //! Method that is called whenever the GSD file is written if connected to a GSD file.
+        int slotWriteGSDState(gsd_handle&, std::string name) const;
+
+        //! Method that is called to connect to the gsd write state signal
+        void connectGSDStateSignal(std::shared_ptr<GSDDumpWriter> writer, std::string name);
+
+        //! Method that is called to restore the state from a GSD file
+        bool restoreStateGSD(std::shared_ptr<GSDReader> reader, std::string name);
+
         //! Get the current counter values
         hpmc_boxmc_counters_t getCounters(unsigned int mode=0);
 
@@ -302,6 +334,12 @@ class UpdaterBoxMC : public Updater
 
         unsigned int m_seed;                        //!< Seed for pseudo-random number generator
 
+        MoveSizeTuner m_tuner;                      //!< Adaptive controller for the box move sizes
+        hpmc_boxmc_counters_t m_count_tune_start;     //!< Count saved at the last move size adaptation
+
+        //! Adapt the box move sizes to the acceptance ratios since the last adaptation
+        void adaptMoveSizes(unsigned int timestep);
+
         inline bool is_oversheared();               //!< detect oversheared box
         inline bool remove_overshear();             //!< detect and remove overshear
         inline bool box_resize(Scalar Lx,
@@ -160,13 +160,10 @@ class UpdaterMuVT : public Updater
         hpmc_muvt_counters_t m_count_step_start;     //!< Count saved at the start of the last step
 
         std::vector<std::vector<unsigned int> > m_type_map;   //!< Local list of particle tags per type
+        std::vector<unsigned int> m_type_map_idx;             //!< Position of every local tag in its m_type_map list
+        bool m_type_map_incremental;                          //!< True while this updater adds, removes or retypes a particle
         std::vector<unsigned int> m_transfer_types;  //!< List of types being insert/removed/transferred between boxes
 
-        GPUVector<Scalar4> m_pos_backup;             //!< Backup of particle positions for volume move
-        GPUVector<Scalar4> m_orientation_backup;     //!< Backup of particle orientations for volume move
-        GPUVector<Scalar> m_charge_backup;           //!< Backup of particle charges for volume move
-        GPUVector<Scalar> m_diameter_backup;         //!< Backup of particle diameters for volume move
-
         /*! Check for overlaps of a fictitious particle
          * \param timestep Current time step
          * \param type Type of particle to test
@@ -214,6 +211,20 @@ class UpdaterMuVT : public Updater
         //! Map particles by type
         virtual void mapTypes();
 
+        //! Handle the particle sort signal
+        void slotParticleSort()
+            {
+            // changes made by this updater are applied to the type map incrementally
+            if (!m_type_map_incremental)
+                mapTypes();
+            }
+
+        //! Add a particle to the per-type tag lists, if it is local
+        void addToTypeMap(unsigned int tag, unsigned int type);
+
+        //! Remove a particle from the per-type tag lists, if it is local
+        void removeFromTypeMap(unsigned int tag, unsigned int type);
+
         //! Get the nth particle of a given type
         /*! \param type the requested type of the particle
          *  \param type_offs offset of the particle in the list of particles per type
@@ -223,15 +234,6 @@ class UpdaterMuVT : public Updater
         //! Get number of particles of a given type
         unsigned int getNumParticlesType(unsigned int type);
 
-    private:
-        //! Handle MaxParticleNumberChange signal
-        /*! Resize the m_pos_backup array
-        */
-        void slotMaxNChange()
-            {
-            unsigned int MaxN = m_pdata->getMaxN();
-            m_pos_backup.resize(MaxN);
-            }
     };
 
 //! Export the UpdaterMuVT class to python
@@ -262,7 +264,7 @@ UpdaterMuVT<Shape>::UpdaterMuVT(std::shared_ptr<SystemDefinition> sysdef,
     unsigned int seed,
     unsigned int npartition)
     : Updater(sysdef), m_mc(mc), m_seed(seed), m_npartition(npartition), m_gibbs(false),
-      m_max_vol_rescale(0.1), m_move_ratio(0.5), m_transfer_ratio(1.0), m_gibbs_other(0)
+      m_type_map_incremental(false), m_max_vol_rescale(0.1), m_move_ratio(0.5), m_transfer_ratio(1.0), m_gibbs_other(0)
     {
     // broadcast the seed from rank 0 to all other ranks.
     #ifdef ENABLE_MPI
@@ -274,7 +276,7 @@ UpdaterMuVT<Shape>::UpdaterMuVT(std::shared_ptr<SystemDefinition> sysdef,
     m_type_map.resize(m_pdata->getNTypes());
 
     m_pdata->getNumTypesChangeSignal().template connect<UpdaterMuVT<Shape>, &UpdaterMuVT<Shape>::slotNumTypesChange>(this);
-    m_pdata->getParticleSortSignal().template connect<UpdaterMuVT<Shape>, &UpdaterMuVT<Shape>::mapTypes>(this);
+    m_pdata->getParticleSortSignal().template connect<UpdaterMuVT<Shape>, &UpdaterMuVT<Shape>::slotParticleSort>(this);
 
     if (npartition > 1)
         {
@@ -312,9 +314,6 @@ UpdaterMuVT<Shape>::UpdaterMuVT(std::shared_ptr<SystemDefinition> sysdef,
 
     // initialize list of tags per type
     mapTypes();
-
-    // Connect to the MaxParticleNumberChange signal
-    m_pdata->getMaxParticleNumberChangeSignal().template connect<UpdaterMuVT<Shape>, &UpdaterMuVT<Shape>::slotMaxNChange>(this);
     }
 
 //! Destructor
@@ -322,8 +321,7 @@ template<class Shape>
 UpdaterMuVT<Shape>::~UpdaterMuVT()
     {
     m_pdata->getNumTypesChangeSignal().template disconnect<UpdaterMuVT<Shape>, &UpdaterMuVT<Shape>::slotNumTypesChange>(this);
-    m_pdata->getParticleSortSignal().template disconnect<UpdaterMuVT<Shape>, &UpdaterMuVT<Shape>::mapTypes>(this);
-    m_pdata->getMaxParticleNumberChangeSignal().template disconnect<UpdaterMuVT<Shape>, &UpdaterMuVT<Shape>::slotMaxNChange>(this);
+    m_pdata->getParticleSortSignal().template disconnect<UpdaterMuVT<Shape>, &UpdaterMuVT<Shape>::slotParticleSort>(this);
     }
 
 template<class Shape>
@@ -338,6 +336,8 @@ void UpdaterMuVT<Shape>::mapTypes()
         m_type_map[itype].clear();
         }
 
+    m_type_map_idx.assign(m_pdata->getRTags().size(), UINT_MAX);
+
     unsigned int nptl = m_pdata->getN();
     for (unsigned int idx = 0; idx < nptl; idx++)
         {
@@ -346,10 +346,53 @@ void UpdaterMuVT<Shape>::mapTypes()
 
         // store tag in per-type list
         assert(m_type_map.size() > typei);
+        m_type_map_idx[tag] = m_type_map[typei].size();
         m_type_map[typei].push_back(tag);
         }
     }
 
+/*! \param tag Tag of the particle
+    \param type Type of the particle
+
+    Call after the particle has been added to (or given the type \a type in) the particle data.
+*/
+template<class Shape>
+void UpdaterMuVT<Shape>::addToTypeMap(unsigned int tag, unsigned int type)
+    {
+    if (!m_pdata->isParticleLocal(tag))
+        return;
+
+    if (tag >= m_type_map_idx.size())
+        m_type_map_idx.resize(tag+1, UINT_MAX);
+
+    assert(type < m_type_map.size());
+    m_type_map_idx[tag] = m_type_map[type].size();
+    m_type_map[type].push_back(tag);
+    }
+
+/*! \param tag Tag of the particle
+    \param type Type of the particle in the type map
+
+    The last tag in the list of \a type takes the place of the removed one, so removal takes constant time.
+*/
+template<class Shape>
+void UpdaterMuVT<Shape>::removeFromTypeMap(unsigned int tag, unsigned int type)
+    {
+    if (tag >= m_type_map_idx.size() || m_type_map_idx[tag] == UINT_MAX)
+        return;
+
+    assert(type < m_type_map.size());
+    std::vector<unsigned int>& type_list = m_type_map[type];
+    unsigned int pos = m_type_map_idx[tag];
+    assert(pos < type_list.size() && type_list[pos] == tag);
+
+    unsigned int last_tag = type_list.back();
+    type_list[pos] = last_tag;
+    m_type_map_idx[last_tag] = pos;
+    type_list.pop_back();
+    m_type_map_idx[tag] = UINT_MAX;
+    }
+
 template<class Shape>
 unsigned int UpdaterMuVT<Shape>::getNthTypeTag(unsigned int type, unsigned int type_offs)
     {
@@ -743,7 +786,10 @@ void UpdaterMuVT<Shape>::update(unsigned int timestep)
                         // create a new particle with given type
                         unsigned int tag;
 
+                        m_type_map_incremental = true;
                         tag = m_pdata->addParticle(type);
+                        m_type_map_incremental = false;
+                        addToTypeMap(tag, type);
 
                         // set the position of the particle
 
@@ -885,7 +931,10 @@ void UpdaterMuVT<Shape>::update(unsigned int timestep)
                 if (accept)
                     {
                     // remove particle
+                    removeFromTypeMap(tag, type);
+                    m_type_map_incremental = true;
                     m_pdata->removeParticle(tag);
+                    m_type_map_incremental = false;
                     m_count_total.remove_accept_count++;
                     }
                 else
@@ -1017,10 +1066,14 @@ void UpdaterMuVT<Shape>::update(unsigned int timestep)
                     if (accept)
                         {
                         // update the type
+                        removeFromTypeMap(tag, type);
+                        m_type_map_incremental = true;
                         m_pdata->setType(tag, other_type);
 
                         // we have changed types, notify particle data
                         m_pdata->notifyParticleSort();
+                        m_type_map_incremental = false;
+                        addToTypeMap(tag, other_type);
 
                         m_count_total.exchange_accept_count++;
                         }
@@ -1113,10 +1166,14 @@ void UpdaterMuVT<Shape>::update(unsigned int timestep)
                     if (accept)
                         {
                         // update the type
+                        removeFromTypeMap(tag, other_type);
+                        m_type_map_incremental = true;
                         m_pdata->setType(tag, type);
 
                         // we have changed types, notify particle data
                         m_pdata->notifyParticleSort();
+                        m_type_map_incremental = false;
+                        addToTypeMap(tag, type);
 
                         m_count_total.exchange_accept_count++;
                         }
@@ -20,6 +20,10 @@ The following quantities are provided by the integrator for use in HOOMD-blue's
 - ``hpmc_a`` - Maximum rotation move
 - ``hpmc_move_ratio`` - Probability of making a translation move (1- P(rotate move))
 - ``hpmc_overlap_count`` - Count of the number of particle-particle overlaps in the current system configuration
+- ``hpmc_aabb_tree_cost_ratio`` - Surface area cost of the AABB tree relative to the cost after the last full build
+- ``hpmc_aabb_tree_builds`` - Number of full AABB tree builds since the start of the last run
+- ``hpmc_aabb_tree_refits`` - Number of AABB tree refits since the start of the last run
+- ``hpmc_tune_active`` - 1 while the move sizes are adapted (see :py:meth:`integrate.mode_hpmc.tune_move_sizes`), 0 otherwise
 
 With non-interacting depletant (**implicit=True**), the following log quantities are available:
 
@@ -47,6 +51,10 @@ With patch energies defined, the following quantities are available:
 - ``hpmc_boxmc_shear_acceptance`` - Fraction of shear trials accepted (averaged from the start of the last run)
 - ``hpmc_boxmc_aspect_acceptance`` - Fraction of aspect trials accepted (averaged from the start of the last run)
 - ``hpmc_boxmc_betaP`` Current value of the :math:`\beta p` value of the boxmc updater
+- ``hpmc_boxmc_volume_delta``, ``hpmc_boxmc_ln_volume_delta``, ``hpmc_boxmc_aspect_delta`` - Current move sizes
+- ``hpmc_boxmc_length_delta_x``, ``hpmc_boxmc_length_delta_y``, ``hpmc_boxmc_length_delta_z`` - Current box length move sizes
+- ``hpmc_boxmc_shear_delta_xy``, ``hpmc_boxmc_shear_delta_xz``, ``hpmc_boxmc_shear_delta_yz`` - Current shear move sizes
+- ``hpmc_boxmc_tune_active`` - 1 while the move sizes are adapted (see :py:meth:`update.boxmc.tune_move_sizes`), 0 otherwise
 
 :py:class:`update.muvt` provides the following loggable quantities.
 
@@ -83,6 +83,96 @@ class param_dict(dict):
         for typei in types:
             self.__getitem__(typei).set(**params);
 
+    def set_many(self, types, **params):
+        R""" Sets different parameters for many particle types at once.
+
+        Args:
+            types (list): List of particle type names
+            params: Named parameters, each given as a sequence with one entry per type in *types*
+
+        :py:meth:`set_many` is equivalent to calling :py:meth:`set` for every type in *types* with the corresponding
+        entries of *params*, but it is much faster for systems with many particle types. Shapes with identical
+        parameters are built only once, polyhedra build their bounding volume trees in parallel, and the integrator
+        processes all types in a single call.
+
+        Parameters that are scalars (including ``None``) apply to all types. Every other parameter must be a sequence,
+        such as a list or a NumPy array, with one entry per type.
+
+        Examples::
+
+            mc = hpmc.integrate.convex_spheropolyhedron(seed=10);
+            mc.shape_param.set_many(['A', 'B', 'C'],
+                                    vertices=numpy.array([verts_A, verts_B, verts_C]),
+                                    sweep_radius=[0.1, 0.2, 0.1])
+
+            mc = hpmc.integrate.sphere(seed=10);
+            mc.shape_param.set_many(system.particles.types, diameter=numpy.random.uniform(0.9, 1.1, ntypes))
+
+        """
+        types = hoomd.util.listify(types)
+        if len(types) == 0:
+            return
+
+        # check the input lengths
+        per_type = {}
+        for name, value in params.items():
+            if value is None or numpy.isscalar(value):
+                continue
+            if len(value) != len(types):
+                hoomd.context.msg.error("hpmc: {} has {} entries but {} types were given\n".format(name, len(value), len(types)));
+                raise RuntimeError('Error setting shape parameters')
+            per_type[name] = value
+
+        # look up the parameter proxies, only validating the type names once
+        pdata = hoomd.context.current.system_definition.getParticleData();
+        type_names = set(pdata.getNameByType(i) for i in range(pdata.getNTypes()));
+        for typei in types:
+            if not typei in type_names:
+                raise RuntimeError("{} is not a known particle type".format(typei));
+        if not all(typei in self.keys() for typei in types):
+            self.mc.initialize_shape_params();
+        proxies = [super(param_dict, self).__getitem__(typei) for typei in types];
+
+        # deduplicate identical shapes
+        param_list = []
+        unique_idx = {}
+        shape_idx = []
+        for i in range(len(types)):
+            params_i = dict(params);
+            params_i.update({name: value[i] for name, value in per_type.items()});
+            key = tuple((name, _param_key(params_i[name])) for name in sorted(params_i.keys()));
+            if not key in unique_idx:
+                unique_idx[key] = len(param_list);
+                param_list.append(params_i);
+            shape_idx.append(unique_idx[key]);
+
+        # backwards compatibility
+        ignore_overlaps = [param_list[j].get('ignore_overlaps', None) for j in shape_idx];
+        for params_i in param_list:
+            params_i.pop('ignore_overlaps', None);
+
+        unique_params = proxies[0].make_params(param_list);
+        self.mc.cpp_integrator.setParams([proxy.typid for proxy in proxies],
+                                         [unique_params[j] for j in shape_idx]);
+
+        for i, proxy in enumerate(proxies):
+            proxy.is_set = True;
+            if 'ignore_overlaps' in params:
+                super(_param, proxy).__setattr__('ignore_overlaps', ignore_overlaps[i]);
+            if 'colors' in params and 'colors' in proxy._keys:
+                colors = param_list[shape_idx[i]]['colors'];
+                proxy.colors = None if colors is None else proxy.ensure_list(colors);
+
+def _param_key(value):
+    # hashable representation of a parameter value, used to find identical shapes
+    try:
+        a = numpy.asarray(value);
+    except ValueError:
+        return repr(value);
+    if a.dtype == object:
+        return repr(value);
+    return (a.dtype.str, a.shape, a.tobytes());
+
 
 class _param(object):
     def __init__(self, mc, typid):
@@ -105,6 +195,10 @@ class _param(object):
             raise AttributeError('{} instance has no attribute {!r}'.format(type(self).__name__, name));
         super(_param, self).__setattr__(name, value);
 
+    def make_params(self, param_list):
+        # build the parameters for many shapes, given a list of keyword argument dicts
+        return [self.make_param(**params) for params in param_list];
+
     def set(self, **params):
         self.is_set = True;
 
@@ -232,6 +326,18 @@ class polyhedron_params(_hpmc.polyhedron_param_proxy, _param):
         return string;
 
     def make_param(self, vertices, faces, sweep_radius=0.0, ignore_statistics=False, origin=(0,0,0), capacity=4, hull_only=True, overlap=None, colors=None):
+        self.colors = None if colors is None else self.ensure_list(colors);
+
+        return self.make_fn(*self._make_args(vertices, faces, sweep_radius, ignore_statistics, origin, capacity, hull_only, overlap),
+                            hoomd.context.current.system_definition.getParticleData().getExecConf());
+
+    def make_params(self, param_list):
+        # convert each shape's arguments, then build all shapes in parallel
+        args = [self._make_args(**{k: v for k, v in params.items() if k != 'colors'}) for params in param_list];
+        return _hpmc.make_poly3d_data_list(*[list(a) for a in zip(*args)],
+                                           hoomd.context.current.system_definition.getParticleData().getExecConf());
+
+    def _make_args(self, vertices, faces, sweep_radius=0.0, ignore_statistics=False, origin=(0,0,0), capacity=4, hull_only=True, overlap=None):
         face_offs = []
         face_verts = []
         offs = 0
@@ -248,8 +354,6 @@ class polyhedron_params(_hpmc.polyhedron_param_proxy, _param):
         # end offset
         face_offs.append(offs)
 
-        self.colors = None if colors is None else self.ensure_list(colors);
-
         if overlap is None:
             overlap = [1 for f in faces]
 
@@ -259,16 +363,15 @@ class polyhedron_params(_hpmc.polyhedron_param_proxy, _param):
         if len(origin) != 3:
             hoomd.context.error("Origin must be a coordinate triple.\n")
 
-        return self.make_fn([self.ensure_list(v) for v in vertices],
-                            self.ensure_list(face_verts),
-                            self.ensure_list(face_offs),
-                            self.ensure_list(overlap),
-                            float(sweep_radius),
-                            ignore_statistics,
-                            capacity,
-                            self.ensure_list(origin),
-                            int(hull_only),
-                            hoomd.context.current.system_definition.getParticleData().getExecConf());
+        return ([self.ensure_list(v) for v in vertices],
+                self.ensure_list(face_verts),
+                self.ensure_list(face_offs),
+                self.ensure_list(overlap),
+                float(sweep_radius),
+                bool(ignore_statistics),
+                int(capacity),
+                self.ensure_list(origin),
+                int(hull_only));
 
 class faceted_ellipsoid_params(_hpmc.faceted_ellipsoid_param_proxy, _param):
     def __init__(self, mc, index):
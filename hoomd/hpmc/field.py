@@ -35,8 +35,8 @@ class lattice_field(_external):
 
     Args:
         mc (:py:mod:`hoomd.hpmc.integrate`): MC integrator.
-        position (list): list of positions to restrain each particle (distance units).
-        orientation (list): list of orientations to restrain each particle (quaternions).
+        position (list or numpy.ndarray): (N, 3) positions to restrain each particle (distance units).
+        orientation (list or numpy.ndarray): (N, 4) orientations to restrain each particle (quaternions).
         k (float): translational spring constant.
         q (float): rotational spring constant.
         symmetry (list): list of equivalent quaternions for the shape.
@@ -117,7 +117,7 @@ class lattice_field(_external):
 
         self.compute_name = "lattice_field"
         enlist = hoomd.hpmc.data._param.ensure_list;
-        self.cpp_compute = cls(hoomd.context.current.system_definition, enlist(position), float(k), enlist(orientation), float(q), enlist(symmetry));
+        self.cpp_compute = cls(hoomd.context.current.system_definition, numpy.ascontiguousarray(position), float(k), numpy.ascontiguousarray(orientation), float(q), enlist(symmetry));
         hoomd.context.current.system.addCompute(self.cpp_compute, self.compute_name)
         if not composite:
             mc.set_external(self);
@@ -126,8 +126,11 @@ class lattice_field(_external):
         R""" Reset the reference positions or reference orientations.
 
         Args:
-            position (list): list of positions to restrain each particle.
-            orientation (list): list of orientations to restrain each particle.
+            position (list or numpy.ndarray): (N, 3) positions to restrain each particle.
+            orientation (list or numpy.ndarray): (N, 4) orientations to restrain each particle.
+
+        Both arguments also accept NumPy arrays of shape (N, 3) and (N, 4). Contiguous arrays
+        are read directly without conversion to python lists.
 
         Example::
 
@@ -138,8 +141,7 @@ class lattice_field(_external):
         """
         import numpy
         hoomd.util.print_status_line();
-        enlist = hoomd.hpmc.data._param.ensure_list;
-        self.cpp_compute.setReferences(enlist(position), enlist(orientation));
+        self.cpp_compute.setReferences(numpy.ascontiguousarray(position), numpy.ascontiguousarray(orientation));
 
     def set_params(self, k, q):
         R""" Set the translational and rotational spring constants.
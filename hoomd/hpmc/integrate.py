@@ -8,6 +8,7 @@ from hoomd.integrate import _integrator
 import hoomd
 import sys
 import json
+import numpy
 
 class interaction_matrix:
     R""" Define pairwise interaction matrix
@@ -157,6 +158,7 @@ class mode_hpmc(_integrator):
 
         * Maximum trial move displacement *d*
         * Maximum trial rotation move *a*
+        * State of the move size tuner (see :py:meth:`tune_move_sizes`)
         * Shape parameters for all types.
 
     State data are *not* written by default. You must explicitly request that state data for an mc integrator
@@ -203,6 +205,10 @@ class mode_hpmc(_integrator):
         self.implicit=implicit
         self.depletant_mode=depletant_mode
 
+        # AABB tree refit parameters
+        self.aabb_tree_refit = False
+        self.aabb_tree_max_cost_ratio = 1.5
+
         # setup the shape parameters
         self.shape_param = data.param_dict(self); # must call initialize_shape_params() after the cpp_integrator is created.
 
@@ -391,7 +397,10 @@ class mode_hpmc(_integrator):
                    nR=None,
                    depletant_type=None,
                    ntrial=None,
-                   deterministic=None):
+                   deterministic=None,
+                   patch_energy_cache=None,
+                   aabb_tree_refit=None,
+                   aabb_tree_max_cost_ratio=None):
         R""" Changes parameters of an existing integration mode.
 
         Args:
@@ -404,9 +413,23 @@ class mode_hpmc(_integrator):
             ntrial (int): (if set) **Implicit depletants only**: Number of re-insertion attempts per overlapping depletant.
                 (Only supported with **depletant_mode='circumsphere'**)
             deterministic (bool): (if set) Make HPMC integration deterministic on the GPU by sorting the cell list.
+            patch_energy_cache (bool): (if set) Cache the patch energy of every particle on the CPU, so that the energy
+                of the old configuration is only recomputed when the particle or one of its neighbors has moved.
+            aabb_tree_refit (bool): (if set) Refit the node bounds of the AABB tree after box changes instead of
+                rebuilding it.
+            aabb_tree_max_cost_ratio (float): (if set) Rebuild a refit AABB tree when its surface area cost exceeds
+                the cost after the last full build by this factor (default 1.5).
 
         .. note:: Simulations are only deterministic with respect to the same execution configuration (CPU or GPU) and
                   number of MPI ranks. Simulation output will not be identical if either of these is changed.
+
+        .. note:: **patch_energy_cache** trades memory for speed with expensive patch interactions (e.g.
+                  :py:class:`hoomd.jit.patch.user`). Cached energies are kept for the duration of one time step.
+                  Debug builds verify every cached value against a full recompute.
+
+        .. note:: **aabb_tree_refit** speeds up :py:class:`hoomd.hpmc.update.boxmc`, which changes the box on every
+                  trial. Log ``hpmc_aabb_tree_cost_ratio``, ``hpmc_aabb_tree_builds`` and ``hpmc_aabb_tree_refits``
+                  to monitor the tree quality.
         """
 
         hoomd.util.print_status_line();
@@ -458,6 +481,57 @@ class mode_hpmc(_integrator):
         if deterministic is not None:
             self.cpp_integrator.setDeterministic(deterministic);
 
+        if patch_energy_cache is not None:
+            self.cpp_integrator.setPatchEnergyCache(patch_energy_cache);
+
+        if aabb_tree_refit is not None:
+            self.aabb_tree_refit = aabb_tree_refit;
+
+        if aabb_tree_max_cost_ratio is not None:
+            self.aabb_tree_max_cost_ratio = aabb_tree_max_cost_ratio;
+
+        if aabb_tree_refit is not None or aabb_tree_max_cost_ratio is not None:
+            self.cpp_integrator.setAABBTreeRefit(self.aabb_tree_refit, self.aabb_tree_max_cost_ratio);
+
+    def tune_move_sizes(self, enable=True, target=0.2, period=100, steps=10000, gamma=2.0, max_scale=2.0, max_d=1.0, max_a=0.5):
+        R""" Adapt the trial move sizes inside the integrator.
+
+        Args:
+            enable (bool): Set to False to stop adapting the move sizes.
+            target (float): Target acceptance ratio for translation and rotation moves.
+            period (int): Number of time steps between adaptations.
+            steps (int): Length of the adaptation window in time steps. The window starts with the next
+                :py:func:`hoomd.run()`.
+            gamma (float): Damping factor (>= 0.0), see :py:class:`hoomd.hpmc.util.tune`.
+            max_scale (float): Maximum factor by which to scale a move size in a single adaptation.
+            max_d (float): Largest translation move size the tuner will set.
+            max_a (float): Largest rotation move size the tuner will set.
+
+        Every *period* steps during the adaptation window, the integrator rescales *d* and *a* of all types with
+        the acceptance ratios measured since the last adaptation, using the same rule as
+        :py:class:`hoomd.hpmc.util.tune`. After *steps* time steps the move sizes are frozen, so that the rest of
+        the simulation samples with fixed move sizes and obeys detailed balance. Move sizes that are 0 are not
+        changed.
+
+        Unlike :py:class:`hoomd.hpmc.util.tune`, this runs inside a single :py:func:`hoomd.run()` and does not
+        pay the setup cost of a new run for every adaptation.
+
+        The log quantity ``hpmc_tune_active`` is 1 while the move sizes are adapted. The tuner state is saved with
+        the integrator state in gsd files (see :py:meth:`hoomd.dump.gsd.dump_state`), and a restarted simulation
+        adapts for the remainder of the window.
+
+        Example::
+
+            mc = hpmc.integrate.convex_polyhedron(seed=415236, d=0.1, a=0.1)
+            mc.tune_move_sizes(target=0.3, period=100, steps=20000)
+            run(20000)   # equilibrate and tune
+            run(1e6)     # production with frozen move sizes
+
+        """
+        hoomd.util.print_status_line();
+        self.cpp_integrator.setMoveSizeTuning(bool(enable), float(target), int(period), int(steps),
+                                              float(gamma), float(max_scale), float(max_d), float(max_a));
+
     def map_overlaps(self):
         R""" Build an overlap map of the system
 
@@ -524,6 +598,58 @@ class mode_hpmc(_integrator):
         qj = hoomd.util.listify(qj)
         return self.cpp_integrator.py_test_overlap(ti,tj,rij,qi,qj,use_images,exclude_self)
 
+    def test_overlap_many(self, type_i, type_j, rij, qi, qj, use_images=True, exclude_self=False):
+        R""" Test overlaps between many pairs of particles.
+
+        Args:
+            type_i (list): Types of the first particles (names or type ids), length N
+            type_j (list): Types of the second particles (names or type ids), length N
+            rij (array): Separation vectors **rj**-**ri** between the particle centers, shape (N,3)
+            qi (array): Orientation quaternions of the first particles, shape (N,4)
+            qj (array): Orientation quaternions of the second particles, shape (N,4)
+            use_images (bool): If True, check for overlap between the periodic images of the particles by adding
+                the image vector to the separation vector
+            exclude_self (bool): If both **use_images** and **exclude_self** are true, exclude the primary image
+
+        :py:meth:`test_overlap_many` gives the same results as calling :py:meth:`test_overlap` for every pair, but
+        tests all pairs in one call. The pairs are tested on multiple CPU threads (when HOOMD is built with TBB) and
+        the Python global interpreter lock is released while testing, so other Python threads keep running.
+
+        For two-dimensional shapes, pass the third dimension of **rij** as zero.
+
+        Returns:
+            A boolean NumPy array of length N, True for each pair that overlaps.
+
+        Example::
+
+            rij = numpy.random.uniform(-1, 1, size=(100000, 3))
+            q = numpy.tile([1, 0, 0, 0], (100000, 1))
+            overlaps = mc.test_overlap_many(['A']*100000, ['A']*100000, rij, q, q, use_images=False)
+
+        """
+        self.update_forces()
+
+        pdata = hoomd.context.current.system_definition.getParticleData()
+        type_ids = {}
+        def to_type_ids(types):
+            types = numpy.asarray(types)
+            if numpy.issubdtype(types.dtype, numpy.integer):
+                return types
+            ids = numpy.empty(len(types), dtype=numpy.uint32)
+            for k, t in enumerate(types):
+                if t not in type_ids:
+                    type_ids[t] = pdata.getTypeByName(str(t))
+                ids[k] = type_ids[t]
+            return ids
+
+        return self.cpp_integrator.py_test_overlap_many(to_type_ids(type_i),
+                                                        to_type_ids(type_j),
+                                                        numpy.asarray(rij, dtype=numpy.float64),
+                                                        numpy.asarray(qi, dtype=numpy.float64),
+                                                        numpy.asarray(qj, dtype=numpy.float64),
+                                                        use_images,
+                                                        exclude_self)
+
     def get_translate_acceptance(self):
         R""" Get the average acceptance ratio for translate moves.
 
@@ -94,6 +94,7 @@ PYBIND11_MODULE(_hpmc, m)
 
     m.def("make_poly2d_verts", &make_poly2d_verts);
     m.def("make_poly3d_data", &make_poly3d_data);
+    m.def("make_poly3d_data_list", &make_poly3d_data_list);
     m.def("make_poly3d_verts", &make_poly3d_verts);
     m.def("make_ell_params", &make_ell_params);
     m.def("make_sph_params", &make_sph_params);
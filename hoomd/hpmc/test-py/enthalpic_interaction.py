@@ -339,5 +339,40 @@ class patch_alpha_user_union(unittest.TestCase):
         del self.patch
         context.initialize();
 
+class patch_energy_cache(unittest.TestCase):
+    def setUp(self):
+        self.square_well = """float rsq = dot(r_ij, r_ij);
+                              if (rsq < 2.25f)
+                                  return -1.0f;
+                              else
+                                  return 0.0f;
+                           """
+
+    def run_trajectory(self, cache):
+        system = init.create_lattice(unitcell=lattice.sc(a=1.2), n=4);
+        mc = hpmc.integrate.sphere(seed=123, d=0.1);
+        mc.shape_param.set('A', diameter=1.0);
+        mc.set_params(patch_energy_cache=cache);
+        patch = jit.patch.user(mc=mc, r_cut=1.5, code=self.square_well);
+        log = analyze.log(filename=None, quantities=['hpmc_patch_energy'], period=1, overwrite=True);
+        hoomd.run(20, quiet=True);
+        snap = system.take_snapshot();
+        energy = log.query('hpmc_patch_energy');
+        del patch, log, mc, system
+        context.initialize();
+        return snap, energy
+
+    # the cache must not change the Markov chain
+    def test_cache_trajectory(self):
+        snap_ref, energy_ref = self.run_trajectory(cache=False);
+        snap, energy = self.run_trajectory(cache=True);
+
+        self.assertAlmostEqual(energy, energy_ref, places=4);
+        if hoomd.comm.get_rank() == 0:
+            np.testing.assert_allclose(snap.particles.position, snap_ref.particles.position, atol=1e-5);
+
+    def tearDown(self):
+        context.initialize();
+
 if __name__ == '__main__':
     unittest.main(argv = ['test.py', '-v'])
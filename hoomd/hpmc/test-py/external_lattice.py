@@ -273,5 +273,39 @@ class external_field_lattice(unittest.TestCase):
         self.run_test(latticep=lattice3d, latticeq=latticeq, k=k, kalt=kalt, q=k*10.0, qalt=kalt*10.0, uein=None, snapshot_s=self.snapshot3d_s, eng_check=(eng_check3d+eng_checkq));
         self.tear_down()
 
+    def test_set_references_array(self):
+        # references given as contiguous numpy arrays
+        k = 10.0;
+        dx = np.array([0.1, 0.1, 0.1]);
+        self.system = init.read_snapshot(hoomd.lattice.bcc(a=2.0).get_snapshot());
+        self.system.replicate(nx=4, ny=4, nz=4);
+        N = len(self.system.particles);
+        snap = self.system.take_snapshot(particles=True);
+        lattice = np.zeros(shape=(0,3));
+        orientation = np.zeros(shape=(0,4));
+        if hoomd.comm.get_rank() == 0:
+            lattice = np.array(snap.particles.position, dtype=np.float64);
+            orientation = np.tile(np.array([1.0, 0.0, 0.0, 0.0]), (N, 1));
+
+        self.mc = hpmc.integrate.ellipsoid(seed=2398, d=0.0, a=0.0);
+        self.mc.shape_param.set('A', a=0.5, b=0.54, c=0.35);
+        self.lattice = hpmc.field.lattice_field(self.mc, position=lattice, orientation=orientation, k=k, q=k);
+        self.remove_drift = None;
+        hoomd.run(1, quiet=True);
+        self.assertAlmostEqual(self.lattice.get_energy(), 0.0);
+
+        # shifted single precision references are converted and applied
+        self.lattice.set_references(position=(lattice - dx).astype(np.float32));
+        hoomd.run(1, quiet=True);
+        self.assertAlmostEqual(self.lattice.get_energy(), N*k*dx.dot(dx), places=3);
+
+        # mis-shaped arrays are rejected
+        if hoomd.comm.get_num_ranks() == 1:
+            with self.assertRaises(RuntimeError):
+                self.lattice.set_references(position=lattice[:,:2]);
+            with self.assertRaises(RuntimeError):
+                self.lattice.set_references(orientation=orientation[:,:3]);
+        self.tear_down()
+
 if __name__ == '__main__':
     unittest.main(argv = ['test.py', '-v'])
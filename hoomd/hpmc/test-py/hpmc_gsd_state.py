@@ -371,5 +371,46 @@ class hpmc_gsd_check_restore_state(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.mc = hpmc.integrate.convex_polyhedron(seed=2234, d=0.3, a=0.4, restore_state=True);
 
+class hpmc_gsd_tune_state(unittest.TestCase):
+    def setUp(self):
+        context.initialize()
+        self.system = hoomd.init.create_lattice(hoomd.lattice.sc(a=1.5, type_name='A'), n=3);
+
+    def tearDown(self):
+        del self.system
+        filename = "tune.gsd"
+        if hoomd.comm.get_rank() == 0 and os.path.exists(filename):
+            os.remove(filename);
+        context.initialize()
+
+    def test_tune_state(self):
+        mc = hpmc.integrate.sphere(seed=2398, d=0.1);
+        mc.shape_param.set('A', diameter=1.0);
+        mc.tune_move_sizes(target=0.3, period=10, steps=1000);
+        boxmc = hpmc.update.boxmc(mc, betaP=1.0, seed=1);
+        boxmc.volume(delta=0.1, weight=1);
+        boxmc.tune_move_sizes(target=0.3, period=10, steps=1000);
+        gsd = hoomd.dump.gsd('tune.gsd', period=None, group=hoomd.group.all(), overwrite=True);
+        gsd.dump_state(mc);
+        gsd.dump_state(boxmc);
+        hoomd.run(100);
+        gsd.write_restart();
+        d = mc.get_d();
+        delta = boxmc.volume()['delta'];
+        del gsd, boxmc, mc
+
+        # the restarted tuners continue for the rest of the window
+        context.initialize()
+        self.system = hoomd.init.read_gsd(filename='tune.gsd', frame=-1);
+        mc = hpmc.integrate.sphere(seed=2398, restore_state=True);
+        self.assertAlmostEqual(mc.get_d(), d);
+        self.assertTrue(mc.cpp_integrator.getMoveSizeTuningActive());
+        boxmc = hpmc.update.boxmc(mc, betaP=1.0, seed=1);
+        boxmc.volume(weight=1);
+        boxmc.restore_state();
+        self.assertAlmostEqual(boxmc.volume()['delta'], delta);
+        self.assertTrue(boxmc.cpp_updater.getMoveSizeTuningActive());
+        del boxmc, mc
+
 if __name__ == '__main__':
     unittest.main(argv = ['test.py', '-v'])
@@ -181,6 +181,56 @@ class shape_proxy_sanity_checks (unittest.TestCase):
         del self.snapshot
         context.initialize()
 
+    def test_set_many(self):
+        context.initialize()
+        types = ['A', 'B', 'C', 'D']
+        self.snapshot = data.make_snapshot(N=4, box=data.boxdim(L=10), particle_types=types)
+
+        # sphere
+        diams = np.array([1.0, 1.5, 1.0, 0.5]);
+        self.system = init.read_snapshot(self.snapshot)
+        self.mc = hpmc.integrate.sphere(seed=2398, d=0.0)
+        self.mc.shape_param.set_many(types, diameter=diams)
+        for t,d in zip(types, diams):
+            self.assertAlmostEqual(self.mc.shape_param[t].diameter, d);
+            self.assertTrue(self.mc.shape_param[t].is_set);
+        del self.mc
+        del self.system
+        context.initialize()
+
+        # convex_spheropolyhedron
+        cube = np.array([(1,1,1), (1,-1,1), (-1,-1,1), (-1,1,1),(1,1,-1), (1,-1,-1), (-1,-1,-1), (-1,1,-1)]);
+        v = np.array([cube, 0.5*cube, cube, 2*cube]);
+        r = [0.1, 0.0, 0.1, 0.2];
+        self.system = init.read_snapshot(self.snapshot)
+        self.mc = hpmc.integrate.convex_spheropolyhedron(seed=2398, d=0.1, a=0.1)
+        self.mc.shape_param.set_many(types, vertices=v, sweep_radius=r)
+        for i,t in enumerate(types):
+            diff = (v[i] - np.array(self.mc.shape_param[t].vertices)).flatten();
+            self.assertAlmostEqual(diff.dot(diff), 0);
+            self.assertAlmostEqual(self.mc.shape_param[t].sweep_radius, r[i]);
+        del self.mc
+        del self.system
+        context.initialize()
+
+        # polyhedron
+        faces = [[0,1,2],[0,2,3],[4,6,5],[4,7,6],[0,4,5],[0,5,1],[1,5,6],[1,6,2],[2,6,7],[2,7,3],[3,7,4],[3,4,0]];
+        self.system = init.read_snapshot(self.snapshot)
+        self.mc = hpmc.integrate.polyhedron(seed=2398, d=0.1, a=0.1)
+        self.mc.shape_param.set_many(types, vertices=v, faces=[faces]*len(types))
+        for i,t in enumerate(types):
+            diff = (v[i] - np.array(self.mc.shape_param[t].vertices)).flatten();
+            self.assertAlmostEqual(diff.dot(diff), 0);
+
+        # one entry per type is required
+        with self.assertRaises(RuntimeError):
+            self.mc.shape_param.set_many(types, vertices=v[:2], faces=[faces]*2)
+
+        del self.mc
+        del self.system
+        del self.snapshot
+        context.initialize()
+
     def test_ensurelist(self):
         enlist = hpmc.data._param.ensure_list;
         li = [1,2,3];
@@ -205,6 +205,47 @@ class boxMC_sanity_checks (unittest.TestCase):
             context.initialize()
 
 
+    # This test repeats test_prevents_overlaps with AABB tree refits after box changes
+    def test_prevents_overlaps_refit(self):
+        N=64
+        L=20
+        self.snapshot = data.make_snapshot(N=N, box=data.boxdim(L=L, dimensions=2), particle_types=['A'])
+        self.system = init.read_snapshot(self.snapshot)
+        self.mc = hpmc.integrate.convex_polygon(seed=1, d=0.1, a=0.1)
+        self.mc.set_params(deterministic=True, aabb_tree_refit=True)
+        self.boxMC = hpmc.update.boxmc(self.mc, betaP=1000, seed=1)
+        self.boxMC.volume(delta=0.1, weight=1)
+        self.mc.shape_param.set('A', vertices=[(-1,-1), (1,-1), (1,1), (-1,1)])
+        log = analyze.log(filename=None, quantities=['hpmc_aabb_tree_refits', 'hpmc_aabb_tree_cost_ratio'], period=None)
+
+        # place particles
+        a = L / 8.
+        for k in range(N):
+            i = k % 8
+            j = k // 8 % 8
+            self.system.particles[k].position = (i*a - 9.9, j*a - 9.9, 0)
+
+        run(0)
+        self.assertEqual(self.mc.count_overlaps(), 0)
+        run(1000)
+        overlaps = 0
+        for i in range(100):
+            run(10, quiet=True)
+            overlaps += self.mc.count_overlaps()
+        self.assertEqual(overlaps, 0)
+
+        # the tree is refit on every box trial, unless its quality degraded too much
+        if comm.get_num_ranks() == 1:
+            self.assertGreater(log.query('hpmc_aabb_tree_refits'), 0)
+        self.assertLessEqual(log.query('hpmc_aabb_tree_cost_ratio'), 1.5)
+
+        del log
+        del self.boxMC
+        del self.mc
+        del self.system
+        del self.snapshot
+        context.initialize()
+
 # These tests check the methods for functionality
 class boxMC_test_methods (unittest.TestCase):
     def setUp(self):
@@ -396,6 +396,65 @@ class tune (unittest.TestCase):
         del self.system
         context.initialize()
 
+# Test the move size tuning inside the integrator and box updater
+class tune_move_sizes(unittest.TestCase):
+    def setUp(self):
+        self.system = create_empty(N=2, box=data.boxdim(L=4.5), particle_types=['A'])
+        self.system.particles[1].position = (2.0,0,0)
+        self.mc = hpmc.integrate.convex_polyhedron(seed=1)
+        self.mc.set_params(d=0.1, a=0.1)
+        self.mc.shape_param.set('A', vertices=[ (1,1,1), (1,-1,1), (-1,-1,1), (-1,1,1),
+           (1,1,-1), (1,-1,-1), (-1,-1,-1), (-1,1,-1) ])
+
+    # show that the integrator adapts d and a within one run and then freezes them
+    def test_integrator(self):
+        self.mc.set_params(d=1, a=1, move_ratio=0.5)
+        target = 0.8
+        run(2e2)
+        old_translate_acceptance = self.mc.get_translate_acceptance()
+        old_rotate_acceptance = self.mc.get_rotate_acceptance()
+
+        self.mc.tune_move_sizes(target=target, period=100, steps=1000, gamma=0.0, max_d=2, max_a=2)
+        log = analyze.log(filename=None, quantities=['hpmc_tune_active'], period=None)
+        run(5e2)
+        self.assertEqual(log.query('hpmc_tune_active'), 1)
+        run(6e2)
+        self.assertEqual(log.query('hpmc_tune_active'), 0)
+
+        # move sizes are fixed after the adaptation window
+        d = self.mc.get_d()
+        a = self.mc.get_a()
+        run(2e2)
+        self.assertEqual(d, self.mc.get_d())
+        self.assertEqual(a, self.mc.get_a())
+        self.assertLess(abs(self.mc.get_translate_acceptance() - target), abs(old_translate_acceptance - target))
+        self.assertLess(abs(self.mc.get_rotate_acceptance() - target), abs(old_rotate_acceptance - target))
+
+    # show that the box updater adapts its deltas
+    def test_boxmc(self):
+        self.mc.set_params(d=0.1, a=0.01, move_ratio=0.5)
+        updater = hpmc.update.boxmc(self.mc, betaP=10.0, seed=1)
+        updater.length(delta=(0.5,0.5,0.5), weight=1)
+        updater.tune_move_sizes(target=0.5, period=50, steps=500, gamma=0.0)
+        run(5e2)
+        delta = updater.length()['delta']
+        self.assertNotEqual(delta[0], 0.5)
+        self.assertEqual(delta[0], updater.cpp_updater.get_length_delta()[0])
+        run(1e2)
+        self.assertEqual(delta[0], updater.length()['delta'][0])
+        del updater
+
+    def test_invalid(self):
+        with self.assertRaises(RuntimeError):
+            self.mc.tune_move_sizes(target=1.5)
+        with self.assertRaises(RuntimeError):
+            self.mc.tune_move_sizes(period=0)
+
+    def tearDown(self):
+        del self.mc
+        del self.system
+        context.initialize()
+
 # Test tuning of systems where we specify the type
 class tune_by_type(unittest.TestCase):
     def setUp(self):
@@ -74,5 +74,37 @@ class map_overlaps_test(unittest.TestCase):
         self.assertFalse(self.mc.test_overlap('A','A',rij, qi, qj, use_images=False))
         self.assertFalse(self.mc.test_overlap('A','A',-rij, qj, qi, use_images=False))
 
+    def test_overlap_many(self):
+        self.mc.shape_param.set('A', vertices = [(-0.5,-0.5,-0.5), (0.5,-0.5,-0.5), (0.5,0.5,-0.5), (-0.5,0.5,-0.5),
+            (-0.5,-0.5,0.5), (0.5,-0.5,0.5), (0.5,0.5,0.5), (-0.5,0.5,0.5)])
+
+        # random pairs, compared to the single pair test
+        np.random.seed(10)
+        n = 200
+        rij = np.random.uniform(-2, 2, size=(n,3))
+        rij[:n//2,0] += 10
+        qi = np.random.normal(size=(n,4))
+        qi /= np.linalg.norm(qi, axis=1)[:,np.newaxis]
+        qj = np.random.normal(size=(n,4))
+        qj /= np.linalg.norm(qj, axis=1)[:,np.newaxis]
+        types = ['A']*n
+
+        for use_images in (True, False):
+            result = self.mc.test_overlap_many(types, types, rij, qi, qj, use_images=use_images)
+            self.assertEqual(result.dtype, np.bool_)
+            self.assertEqual(len(result), n)
+            expected = [self.mc.test_overlap('A', 'A', rij[k], qi[k], qj[k], use_images=use_images) for k in range(n)]
+            np.testing.assert_array_equal(result, expected)
+            self.assertTrue(np.any(result))
+            self.assertFalse(np.all(result))
+
+        # type ids are accepted as well
+        result = self.mc.test_overlap_many(np.zeros(n, dtype=np.uint32), np.zeros(n, dtype=np.uint32), rij, qi, qj)
+        np.testing.assert_array_equal(result, self.mc.test_overlap_many(types, types, rij, qi, qj))
+
+        # mismatched input lengths
+        with self.assertRaises(RuntimeError):
+            self.mc.test_overlap_many(types, types, rij[:10], qi, qj)
+
 if __name__ == '__main__':
     unittest.main(argv = ['test.py', '-v'])
@@ -106,3 +106,65 @@ UP_TEST( bigger )
         UP_ASSERT(in(i, hits));
         }
     }
+
+UP_TEST( refit )
+    {
+    const unsigned int N = 1000;
+    hoomd::RandomGenerator rng(2);
+
+    std::vector< vec3<Scalar> > points(N);
+    AABB aabbs[N];
+    for (unsigned int i = 0; i < N; i++)
+        {
+        points[i] = vec3<Scalar>(hoomd::detail::generate_canonical<float>(rng),
+                                  hoomd::detail::generate_canonical<float>(rng),
+                                  hoomd::detail::generate_canonical<float>(rng))
+                                  * Scalar(100);
+        aabbs[i] = AABB(points[i], Scalar(1.0));
+        }
+
+    // build the tree (this reorders aabbs)
+    AABBTree tree;
+    tree.buildTree(aabbs, N);
+    UP_ASSERT_EQUAL(tree.getNumParticles(), N);
+    Scalar build_cost = tree.getNormalizedSurfaceArea();
+    UP_ASSERT(build_cost > Scalar(1.0));
+
+    // scale all points isotropically and refit
+    for (unsigned int i = 0; i < N; i++)
+        {
+        points[i] *= Scalar(2.0);
+        aabbs[i] = AABB(points[i], Scalar(2.0));
+        }
+    tree.refit(aabbs, N);
+
+    // the cost is invariant under isotropic scaling
+    MY_CHECK_CLOSE(tree.getNormalizedSurfaceArea(), build_cost, 1e-3);
+
+    std::vector<unsigned int> hits;
+    for (unsigned int i = 0; i < N; i++)
+        {
+        hits.clear();
+        tree.query(hits, AABB(points[i], Scalar(0.01)));
+        UP_ASSERT(in(i, hits));
+        }
+
+    // randomize the positions, queries must remain exact while the cost increases
+    for (unsigned int i = 0; i < N; i++)
+        {
+        points[i] = vec3<Scalar>(hoomd::detail::generate_canonical<float>(rng),
+                                  hoomd::detail::generate_canonical<float>(rng),
+                                  hoomd::detail::generate_canonical<float>(rng))
+                                  * Scalar(200);
+        aabbs[i] = AABB(points[i], Scalar(2.0));
+        }
+    tree.refit(aabbs, N);
+    UP_ASSERT(tree.getNormalizedSurfaceArea() > build_cost);
+
+    for (unsigned int i = 0; i < N; i++)
+        {
+        hits.clear();
+        tree.query(hits, AABB(points[i], Scalar(0.01)));
+        UP_ASSERT(in(i, hits));
+        }
+    }
@@ -137,6 +137,7 @@ class boxmc(_updater):
         """
         hoomd.util.print_status_line();
         self.check_initialization();
+        self._sync_deltas();
 
         if weight is not None:
             self.volume_weight = float(weight)
@@ -171,6 +172,7 @@ class boxmc(_updater):
         """
         hoomd.util.print_status_line();
         self.check_initialization();
+        self._sync_deltas();
 
         if weight is not None:
             self.ln_volume_weight = float(weight)
@@ -211,6 +213,7 @@ class boxmc(_updater):
         """
         hoomd.util.print_status_line();
         self.check_initialization();
+        self._sync_deltas();
 
         if weight is not None:
             self.length_weight = float(weight)
@@ -255,6 +258,7 @@ class boxmc(_updater):
         """
         hoomd.util.print_status_line();
         self.check_initialization();
+        self._sync_deltas();
 
         if weight is not None:
             self.shear_weight = float(weight)
@@ -298,6 +302,7 @@ class boxmc(_updater):
         """
         hoomd.util.print_status_line();
         self.check_initialization();
+        self._sync_deltas();
 
         if weight is not None:
             self.aspect_weight = float(weight)
@@ -308,6 +313,56 @@ class boxmc(_updater):
         self.cpp_updater.aspect(self.aspect_delta, self.aspect_weight);
         return {'delta': self.aspect_delta, 'weight': self.aspect_weight}
 
+    def _sync_deltas(self):
+        # the move size tuner changes the deltas in C++, read back the current values
+        self.volume_delta = self.cpp_updater.get_volume_delta();
+        self.ln_volume_delta = self.cpp_updater.get_ln_volume_delta();
+        self.length_delta = list(self.cpp_updater.get_length_delta());
+        self.shear_delta = list(self.cpp_updater.get_shear_delta());
+        self.aspect_delta = self.cpp_updater.get_aspect_delta();
+
+    def get_metadata(self):
+        self._sync_deltas();
+        return super(boxmc, self).get_metadata();
+
+    def tune_move_sizes(self, enable=True, target=0.2, period=100, steps=10000, gamma=2.0, max_scale=2.0):
+        R""" Adapt the box move sizes inside the updater.
+
+        Args:
+            enable (bool): Set to False to stop adapting the move sizes.
+            target (float): Target acceptance ratio for all box move types.
+            period (int): Number of time steps between adaptations.
+            steps (int): Length of the adaptation window in time steps. The window starts with the next
+                :py:func:`hoomd.run()`.
+            gamma (float): Damping factor (>= 0.0), see :py:class:`hoomd.hpmc.util.tune`.
+            max_scale (float): Maximum factor by which to scale a move size in a single adaptation.
+
+        Every *period* steps during the adaptation window, the updater rescales the *delta* of every move type
+        with a non-zero delta by the acceptance ratio of that move type since the last adaptation. Volume and
+        length moves both use the volume acceptance. After *steps* time steps the move sizes are frozen to
+        preserve detailed balance.
+
+        The current move sizes and ``hpmc_boxmc_tune_active`` are available as log quantities. The move sizes and
+        the tuner state can be saved to gsd files with :py:meth:`hoomd.dump.gsd.dump_state` and restored with
+        :py:meth:`restore_state`.
+
+        Example::
+
+            boxMC = hpmc.update.boxmc(mc, betaP=10, seed=1)
+            boxMC.length(delta=(0.1, 0.1, 0.1), weight=1)
+            boxMC.tune_move_sizes(target=0.3, period=1000, steps=100000)
+
+        """
+        hoomd.util.print_status_line();
+        self.check_initialization();
+        self.cpp_updater.setMoveSizeTuning(bool(enable), float(target), int(period), int(steps),
+                                           float(gamma), float(max_scale));
+
+    # Declare the GSD state schema.
+    @classmethod
+    def _gsd_state_name(cls):
+        return "state/hpmc/update/boxmc/"
+
     def get_volume_acceptance(self):
         R""" Get the average acceptance ratio for volume changing moves.
 
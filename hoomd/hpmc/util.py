@@ -645,6 +645,10 @@ class tune(object):
     Warning:
         There are some sanity checks that are not performed. For example, you shouldn't try to scale 'd' in a single particle simulation.
 
+    Note:
+        :py:meth:`hoomd.hpmc.integrate.mode_hpmc.tune_move_sizes` and :py:meth:`hoomd.hpmc.update.boxmc.tune_move_sizes`
+        apply the same rule inside a single :py:func:`hoomd.run()` without the overhead of repeated short runs.
+
     Details:
 
     If ``gamma == 0``, each call to :py:meth:`.update` rescales the current
@@ -29,12 +29,13 @@ def is_initialized():
     else:
         return True;
 
-def create_lattice(unitcell, n):
+def create_lattice(unitcell, n, distributed=False):
     R""" Create a lattice.
 
     Args:
         unitcell (:py:class:`hoomd.lattice.unitcell`): The unit cell of the lattice.
         n (list): Number of replicates in each direction.
+        distributed (bool): When True, every MPI rank generates the lattice sites in its own domain.
 
     :py:func:`create_lattice` take a unit cell and replicates it the requested number of times in each direction.
     The resulting simulation box is commensurate with the given unit cell. A generic :py:class:`hoomd.lattice.unitcell`
@@ -46,6 +47,14 @@ def create_lattice(unitcell, n):
     lattice is replicated *n[0]* times in the :math:`\vec{a}_1` direction, *n[1]* times in the :math:`\vec{a}_2`
     direction and *n[2]* times in the :math:`\vec{a}_3` direction.
 
+    By default, the root rank replicates the unit cell and scatters the particles to the other ranks. This
+    requires the root rank to hold the full lattice in memory. With *distributed* set to True, every rank
+    generates only the unit cells whose centers are in its domain, so that no rank holds the whole system.
+    Use this to initialize very large lattices. The particle tags are the same in both modes.
+
+    .. versionadded:: 2.9
+        The *distributed* argument.
+
     Examples::
 
         hoomd.init.create_lattice(unitcell=hoomd.lattice.sc(a=1.0),
@@ -59,6 +68,9 @@ def create_lattice(unitcell, n):
 
         hoomd.init.create_lattice(unitcell=hoomd.lattice.hex(a=1.0),
                                   n=[100,58]);
+
+        hoomd.init.create_lattice(unitcell=hoomd.lattice.fcc(a=1.6),
+                                  n=300, distributed=True);
     """
     hoomd.context._verify_init();
     hoomd.util.print_status_line();
@@ -81,16 +93,51 @@ def create_lattice(unitcell, n):
         hoomd.context.msg.error("n must have length equal to the number of dimensions in the unit cell\n");
         raise RuntimeError("Error initializing");
 
-    if snap.box.dimensions == 3:
-        snap.replicate(n[0],n[1],n[2])
     if snap.box.dimensions == 2:
-        snap.replicate(n[0],n[1],1)
+        n = list(n) + [1];
 
-    read_snapshot(snapshot=snap);
+    if distributed:
+        _create_distributed_lattice(unitcell, snap, n);
+    else:
+        snap.replicate(n[0],n[1],n[2])
+        read_snapshot(snapshot=snap);
 
     hoomd.util.unquiet_status();
     return hoomd.data.system_data(hoomd.context.current.system_definition);
 
+## Initialize the system with a lattice generated in parallel
+# \internal
+# \param unitcell The unit cell of the lattice
+# \param snap Snapshot of the unit cell
+# \param n Number of replicates along each box vector
+def _create_distributed_lattice(unitcell, snap, n):
+    # every rank generates its own unit cells
+    snap._broadcast(0, hoomd.context.exec_conf);
+
+    # the snapshot used to construct the system definition only holds the replicated box and the types
+    box = hoomd.data.boxdim(Lx=snap.box.Lx*n[0],
+                            Ly=snap.box.Ly*n[1],
+                            Lz=snap.box.Lz*n[2],
+                            xy=snap.box.xy,
+                            xz=snap.box.xz,
+                            yz=snap.box.yz,
+                            dimensions=snap.box.dimensions);
+    init_snap = hoomd.data.make_snapshot(N=0, box=box, particle_types=unitcell.get_type_list(), dtype='double');
+
+    my_domain_decomposition = _create_domain_decomposition(init_snap._global_box);
+
+    if my_domain_decomposition is not None:
+        hoomd.context.current.system_definition = _hoomd.SystemDefinition(init_snap, hoomd.context.exec_conf, my_domain_decomposition);
+    else:
+        hoomd.context.current.system_definition = _hoomd.SystemDefinition(init_snap, hoomd.context.exec_conf);
+
+    hoomd.context.current.system_definition.initializeFromReplicatedSnapshot(snap, n[0], n[1], n[2]);
+
+    # initialize the system
+    hoomd.context.current.system = _hoomd.System(hoomd.context.current.system_definition, 0);
+
+    _perform_common_init_tasks();
+
 def read_getar(filename, modes={'any': 'any'}):
     """Initialize a system from a trajectory archive (.tar, .getar,
     .sqlite) file. Returns a HOOMD `system_data` object.
@@ -250,14 +297,15 @@ def read_snapshot(snapshot):
     _perform_common_init_tasks();
     return hoomd.data.system_data(hoomd.context.current.system_definition);
 
-def read_gsd(filename, restart = None, frame = 0, time_step = None):
+def read_gsd(filename, restart = None, frame = 0, time_step = None, distributed = False):
     R""" Read initial system state from an GSD file.
 
     Args:
-        filename (str): File to read.
+        filename (str): File to read, or a :py:class:`hoomd.data.gsd_reader` to read from.
         restart (str): If it exists, read the file *restart* instead of *filename*.
         frame (int): Index of the frame to read from the GSD file. Negative values index from the end of the file.
         time_step (int): (if specified) Time step number to initialize instead of the one stored in the GSD file.
+        distributed (bool): When True, read the file in parallel on all MPI ranks.
 
     All particles, bonds, angles, dihedrals, impropers, constraints, and box information
     are read from the given GSD file at the given frame index. To read and write GSD files
@@ -270,6 +318,23 @@ def read_gsd(filename, restart = None, frame = 0, time_step = None):
     step of the simulation instead of the one read from the GSD file *filename*.
     *time_step* is not applied when the file *restart* is read.
 
+    By default, the root rank reads the whole frame and scatters the particles to the other ranks. This
+    requires the root rank to hold the full system in memory. With *distributed* set to True, every rank
+    opens the file and reads an equal slice of the particles and bonded groups, then sends them directly
+    to the ranks whose domains they belong to. Use this to initialize very large systems. The file must
+    be accessible from all ranks, for example on a shared file system.
+
+    .. versionadded:: 2.9
+        The *distributed* argument.
+
+    To initialize from several frames of the same file, for example in replica exchange workflows, open the
+    file once with :py:class:`hoomd.data.gsd_reader` and pass the reader as *filename*. The reader reuses the
+    index of the file instead of loading it again, and *distributed* is taken from the reader. State restored
+    with ``restore_state`` is read from the frame of the reader that was read most recently.
+
+    .. versionadded:: 2.9
+        *filename* may be a :py:class:`hoomd.data.gsd_reader`.
+
     The result of :py:func:`hoomd.init.read_gsd` can be saved in a variable and later used to read and/or
     change particle properties later in the script. See :py:mod:`hoomd.data` for more information.
 
@@ -284,14 +349,24 @@ def read_gsd(filename, restart = None, frame = 0, time_step = None):
         hoomd.context.msg.error("Cannot initialize more than once\n");
         raise RuntimeError("Error initializing");
 
-    filename = _hoomd.mpi_bcast_str(filename, hoomd.context.exec_conf);
     restart = _hoomd.mpi_bcast_str(restart, hoomd.context.exec_conf);
 
-    if restart is not None and os.path.exists(restart):
-        reader = _hoomd.GSDReader(hoomd.context.exec_conf, restart, abs(frame), frame < 0);
+    if isinstance(filename, hoomd.data.gsd_reader):
+        if restart is not None:
+            hoomd.context.msg.error("init.read_gsd: restart cannot be used with a gsd_reader\n");
+            raise ValueError("Error initializing");
+
+        distributed = filename.distributed;
+        reader = filename.cpp_reader;
+        filename._read_frame(frame);
+        if time_step is None:
+            time_step = reader.getTimeStep();
+    elif restart is not None and os.path.exists(restart):
+        reader = _hoomd.GSDReader(hoomd.context.exec_conf, restart, abs(frame), frame < 0, distributed);
         time_step = reader.getTimeStep();
     else:
-        reader = _hoomd.GSDReader(hoomd.context.exec_conf, filename, abs(frame), frame < 0);
+        filename = _hoomd.mpi_bcast_str(filename, hoomd.context.exec_conf);
+        reader = _hoomd.GSDReader(hoomd.context.exec_conf, filename, abs(frame), frame < 0, distributed);
         if time_step is None:
             time_step = reader.getTimeStep();
 
@@ -306,6 +381,10 @@ def read_gsd(filename, restart = None, frame = 0, time_step = None):
     else:
         hoomd.context.current.system_definition = _hoomd.SystemDefinition(snapshot, hoomd.context.exec_conf);
 
+    # in distributed mode, the snapshot only holds the box and types, read the particles in parallel
+    if distributed:
+        reader.readDistributed(hoomd.context.current.system_definition);
+
     # initialize the system
     hoomd.context.current.system = _hoomd.System(hoomd.context.current.system_definition, time_step);
 
@@ -314,6 +393,56 @@ def read_gsd(filename, restart = None, frame = 0, time_step = None):
     hoomd.context.current.state_reader.clearSnapshot();
     return hoomd.data.system_data(hoomd.context.current.system_definition);
 
+def read_checkpoint(filename, time_step = None):
+    R""" Read the initial system state from a checkpoint.
+
+    Args:
+        filename (str): Name of the checkpoint index file.
+        time_step (int): (if specified) Time step number to initialize instead of the one stored in the checkpoint.
+
+    Read a checkpoint written by :py:class:`hoomd.dump.checkpoint`. The index file *filename* references the last
+    checkpoint whose parts were all complete. Every rank reads a subset of the parts of that checkpoint and sends the particles and bonded groups directly to the ranks whose domains they
+    belong to, so the full system is never held by a single rank. The checkpoint may be read on a different number
+    of ranks than it was written on. The parts must be accessible from all ranks, for example on a shared file system.
+
+    The result of :py:func:`hoomd.init.read_checkpoint` can be saved in a variable and later used to read and/or
+    change particle properties later in the script. See :py:mod:`hoomd.data` for more information.
+
+    .. versionadded:: 2.9
+
+    See Also:
+        :py:class:`hoomd.dump.checkpoint`
+    """
+    hoomd.context._verify_init();
+    hoomd.util.print_status_line();
+
+    # check if initialization has already occurred
+    if is_initialized():
+        hoomd.context.msg.error("Cannot initialize more than once\n");
+        raise RuntimeError("Error initializing");
+
+    filename = _hoomd.mpi_bcast_str(filename, hoomd.context.exec_conf);
+    reader = _hoomd.GSDCheckpointReader(hoomd.context.exec_conf, filename);
+    if time_step is None:
+        time_step = reader.getTimeStep();
+
+    # the snapshot only holds the box and types, the reader already broadcast them to all ranks
+    snapshot = reader.getSnapshot();
+    my_domain_decomposition = _create_domain_decomposition(snapshot._global_box);
+
+    if my_domain_decomposition is not None:
+        hoomd.context.current.system_definition = _hoomd.SystemDefinition(snapshot, hoomd.context.exec_conf, my_domain_decomposition);
+    else:
+        hoomd.context.current.system_definition = _hoomd.SystemDefinition(snapshot, hoomd.context.exec_conf);
+
+    reader.readDistributed(hoomd.context.current.system_definition);
+
+    # initialize the system
+    hoomd.context.current.system = _hoomd.System(hoomd.context.current.system_definition, time_step);
+
+    _perform_common_init_tasks();
+    return hoomd.data.system_data(hoomd.context.current.system_definition);
+
 def restore_getar(filename, modes={'any': 'any'}):
     """Restore a subset of the current system's parameters from a
     trajectory archive (.tar, .zip, .sqlite) file. For a detailed
@@ -363,6 +492,10 @@ def _perform_common_init_tasks():
             # set Communicator in C++ System
             hoomd.context.current.system.setCommunicator(cpp_communicator)
 
+            # select the exchange mode requested with the decomposition
+            if hoomd.context.current.decomposition is not None:
+                hoomd.context.current.decomposition._set_exchange()
+
 ## Create a DomainDecomposition object
 # \internal
 def _create_domain_decomposition(box):
@@ -166,6 +166,9 @@ class _integrator(hoomd.meta._metadata):
             ndof_rot = self.cpp_integrator.getRotationalNDOF(t.group.cpp_group);
             t.cpp_compute.setRotationalNDOF(ndof_rot);
 
+            # dynamic groups count their degrees of freedom again when the members change
+            t.cpp_compute.setIntegrator(self.cpp_integrator);
+
     @classmethod
     def _gsd_state_name(cls):
         raise NotImplementedError("GSD Schema is not implemented for {}".format(cls.__name__));
@@ -16,35 +16,65 @@ import math
 # Multiply two quaternions
 # Apply quaternion multiplication per http://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation
 # (requires numpy)
-# \param q1 quaternion
-# \param q2 quaternion
+# \param q1 quaternion, or array of quaternions (N x 4)
+# \param q2 quaternion, or array of quaternions (N x 4)
 # \returns q1*q2
 def _quatMult(q1, q2):
-    s = q1[0]
-    v = q1[1:]
-    t = q2[0]
-    w = q2[1:]
-    q = numpy.empty((4,), dtype=numpy.float64)
-    q[0] = s*t - numpy.dot(v, w)
-    q[1:] = s*w + t*v + numpy.cross(v,w)
+    q1 = numpy.asarray(q1, dtype=numpy.float64)
+    q2 = numpy.asarray(q2, dtype=numpy.float64)
+    s = q1[...,0:1]
+    v = q1[...,1:]
+    t = q2[...,0:1]
+    w = q2[...,1:]
+    q = numpy.empty(numpy.broadcast(q1, q2).shape, dtype=numpy.float64)
+    q[...,0] = s[...,0]*t[...,0] - numpy.sum(v*w, axis=-1)
+    q[...,1:] = s*w + t*v + numpy.cross(v,w)
     return q
 
 # Rotate a vector by a unit quaternion
 # Quaternion rotation per http://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation
 # (requires numpy)
-# \param q rotation quaternion
-# \param v 3d vector to be rotated
+# \param q rotation quaternion, or array of quaternions (N x 4)
+# \param v 3d vector to be rotated, or array of vectors (N x 3)
 # \returns q*v*q^{-1}
 def _quatRot(q, v):
     v = numpy.asarray(v)
     q = numpy.asarray(q)
     # assume q is a unit quaternion
-    w = q[0]
-    r = q[1:]
-    vnew = numpy.empty((3,), dtype=v.dtype)
+    w = q[...,0:1]
+    r = q[...,1:]
     vnew = v + 2*numpy.cross(r, numpy.cross(r,v) + w*v)
     return vnew
 
+# Wrap positions into a box
+# Wraps by any number of box vectors, using the same convention as boxdim.wrap (positions on the upper
+# boundary are wrapped to the lower one).
+# (requires numpy)
+# \param box hoomd boxdim object
+# \param pos array of positions (N x 3)
+# \returns (pos, img) tuple of the wrapped positions and the image flags
+def _wrap(box, pos):
+    pos = numpy.array(pos, dtype=numpy.float64).reshape(-1, 3)
+    img = numpy.zeros(pos.shape, dtype=numpy.int32)
+
+    # remove whole box vectors, starting with the last one that also shifts the others
+    n = numpy.floor(pos[:,2]/box.Lz + 0.5)
+    pos[:,0] -= n*box.xz*box.Lz
+    pos[:,1] -= n*box.yz*box.Lz
+    pos[:,2] -= n*box.Lz
+    img[:,2] = n
+
+    n = numpy.floor((pos[:,1] - box.yz*pos[:,2])/box.Ly + 0.5)
+    pos[:,0] -= n*box.xy*box.Ly
+    pos[:,1] -= n*box.Ly
+    img[:,1] = n
+
+    n = numpy.floor((pos[:,0] - box.xy*pos[:,1] - (box.xz - box.xy*box.yz)*pos[:,2])/box.Lx + 0.5)
+    pos[:,0] -= n*box.Lx
+    img[:,0] = n
+
+    return pos, img
+
 # Given a set of lattice vectors, rotate to produce an upper triangular right-handed box
 # as a hoomd boxdim object and a rotation quaternion that brings particles in the original coordinate system to the new one.
 # The conversion preserves handedness, so it is left to the user to provide a right-handed set of lattice vectors
@@ -268,10 +298,10 @@ class unitcell(object):
             snap.particles.diameter[:] = self.diameter[:];
             snap.particles.moment_inertia[:] = self.moment_inertia[:];
 
-            for i in range(self.N):
-                snap.particles.position[i] = _quatRot(q, self.position[i])
-                snap.particles.position[i], img = box.wrap(snap.particles.position[i])
-                snap.particles.orientation[i] = _quatMult(q, self.orientation[i])
+            # rotate all particles at once
+            if self.N > 0:
+                snap.particles.position[:], img = _wrap(box, _quatRot(q, self.position))
+                snap.particles.orientation[:] = _quatMult(q, self.orientation)
 
         return snap;
 
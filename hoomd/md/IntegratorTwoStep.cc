@@ -124,7 +124,8 @@ void IntegratorTwoStep::update(unsigned int timestep)
         // b) that forces are calculated correctly, if ghost atom positions are updated every time step
 
         // also updates rigid bodies after ghost updating
-        m_comm->communicate(timestep+1);
+        // on the CPU, the ghost update is finished while the forces are computed
+        m_comm->communicate(timestep+1, true);
         }
     else
 #endif
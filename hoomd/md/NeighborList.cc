@@ -13,6 +13,7 @@
 
 namespace py = pybind11;
 
+#include <algorithm>
 #include <iostream>
 #include <stdexcept>
 
@@ -33,7 +34,7 @@ using namespace std;
 NeighborList::NeighborList(std::shared_ptr<SystemDefinition> sysdef, Scalar _r_cut, Scalar r_buff)
     : Compute(sysdef), m_typpair_idx(m_pdata->getNTypes()), m_rcut_max_max(_r_cut), m_rcut_min(_r_cut),
       m_r_buff(r_buff), m_d_max(1.0), m_filter_body(false), m_diameter_shift(false), m_storage_mode(half),
-      m_rcut_changed(true), m_updates(0), m_forced_updates(0), m_dangerous_updates(0), m_force_update(true),
+      m_n_interior(0), m_interior_split_stale(true), m_rcut_changed(true), m_updates(0), m_forced_updates(0), m_dangerous_updates(0), m_force_update(true),
       m_dist_check(true), m_has_been_updated_once(false)
     {
     m_exec_conf->msg->notice(5) << "Constructing Neighborlist" << endl;
@@ -342,6 +343,12 @@ void NeighborList::compute(unsigned int timestep)
     // check if the list needs to be updated and update it
     if (needsUpdating(timestep))
         {
+        #ifdef ENABLE_MPI
+        // the list is built with the ghost particles, complete a deferred ghost update
+        if (m_comm)
+            m_comm->finishUpdateGhosts(timestep);
+        #endif
+
         // check simulation box size is OK
         checkBoxSize();
 
@@ -368,6 +375,7 @@ void NeighborList::compute(unsigned int timestep)
 
         setLastUpdatedPos();
         m_has_been_updated_once = true;
+        m_interior_split_stale = true;
         }
     if (m_prof) m_prof->pop();
     }
@@ -1566,6 +1574,48 @@ void NeighborList::resetConditions()
     memset(h_conditions.data, 0, sizeof(unsigned int)*m_pdata->getNTypes());
     }
 
+/*! The local particle indices are ordered with the interior particles, which have no ghost particles
+    in their neighbor list, first, followed by the boundary particles. Both groups keep their order.
+*/
+void NeighborList::buildInteriorSplit()
+    {
+    const unsigned int N = m_pdata->getN();
+    if (m_interior_split.getNumElements() < N)
+        {
+        GlobalArray<unsigned int> interior_split(m_pdata->getMaxN(), m_exec_conf);
+        m_interior_split.swap(interior_split);
+        TAG_ALLOCATION(m_interior_split);
+        }
+
+    ArrayHandle<unsigned int> h_n_neigh(m_n_neigh, access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_nlist(m_nlist, access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_head_list(m_head_list, access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_interior_split(m_interior_split, access_location::host, access_mode::overwrite);
+
+    // fill the interior particles from the front and the boundary particles from the back
+    unsigned int n_interior = 0;
+    unsigned int n_boundary = 0;
+    for (unsigned int i = 0; i < N; ++i)
+        {
+        const unsigned int head = h_head_list.data[i];
+        const unsigned int n_neigh = h_n_neigh.data[i];
+        bool interior = true;
+        for (unsigned int k = 0; k < n_neigh && interior; ++k)
+            interior = h_nlist.data[head + k] < N;
+
+        if (interior)
+            h_interior_split.data[n_interior++] = i;
+        else
+            h_interior_split.data[N - (++n_boundary)] = i;
+        }
+
+    // restore the order of the boundary particles
+    std::reverse(h_interior_split.data + n_interior, h_interior_split.data + N);
+
+    m_n_interior = n_interior;
+    m_interior_split_stale = false;
+    }
+
 void NeighborList::growExclusionList()
     {
     unsigned int new_height = m_ex_list_indexer.getH() + 1;
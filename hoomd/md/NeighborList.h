@@ -249,6 +249,25 @@ class PYBIND11_EXPORT NeighborList : public Compute
             return m_head_list;
             }
 
+        //! Get the local particle indices with the interior particles first
+        /*! Interior particles have only local neighbors, and their forces can be computed before the
+            ghost particles are updated. The split is rebuilt lazily after the neighbor list changes.
+        */
+        const GlobalArray<unsigned int>& getInteriorSplit()
+            {
+            if (m_interior_split_stale)
+                buildInteriorSplit();
+            return m_interior_split;
+            }
+
+        //! Get the number of interior particles in the split
+        unsigned int getNInterior()
+            {
+            if (m_interior_split_stale)
+                buildInteriorSplit();
+            return m_n_interior;
+            }
+
         //! Get the number of exclusions array
         const GlobalArray<unsigned int>& getNExArray()
             {
@@ -473,6 +492,9 @@ class PYBIND11_EXPORT NeighborList : public Compute
         Scalar3 m_last_L_local;              //!< Local Box lengths at last update
 
         GlobalArray<unsigned int> m_head_list;     //!< Indexes for particles to read from the neighbor list
+        GlobalArray<unsigned int> m_interior_split; //!< Local particle indices, interior particles first
+        unsigned int m_n_interior;                  //!< Number of interior particles in the split
+        bool m_interior_split_stale;                //!< True if the split needs to be rebuilt
         GlobalArray<unsigned int> m_Nmax;          //!< Holds the maximum number of neighbors for each particle type
         GlobalArray<unsigned int> m_conditions;    //!< Holds the max number of computed particles by type for resizing
 
@@ -578,6 +600,9 @@ class PYBIND11_EXPORT NeighborList : public Compute
         //! Grow the exclusions list memory capacity by one row
         void growExclusionList();
 
+        //! Split the local particles into interior and boundary particles
+        void buildInteriorSplit();
+
         //! Method to be called when the global particle number changes
         void slotGlobalParticleNumberChange()
             {
@@ -133,6 +133,12 @@ class PotentialPair : public ForceCompute
         #ifdef ENABLE_MPI
         //! Get ghost particle fields requested by this pair potential
         virtual CommFlags getRequestedCommFlags(unsigned int timestep);
+
+        //! Computes the interior particles while a ghost update is pending
+        virtual bool overlapsGhostUpdate()
+            {
+            return true;
+            }
         #endif
 
         //! Calculates the energy between two lists of particles.
@@ -400,203 +406,238 @@ void PotentialPair< evaluator >::computeForces(unsigned int timestep)
     // to reduce computations at the cost of memory access complexity: set that flag now
     bool third_law = m_nlist->getStorageMode() == NeighborList::half;
 
-    // access the neighbor list, particle data, and system box
-    ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(), access_location::host, access_mode::read);
-    ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(), access_location::host, access_mode::read);
-//     Index2D nli = m_nlist->getNListIndexer();
-    ArrayHandle<unsigned int> h_head_list(m_nlist->getHeadList(), access_location::host, access_mode::read);
+    // with a pending ghost update, the interior particles (whose neighbors are all local) are computed
+    // while the ghost positions are in flight, and the boundary particles after the update completes
+    unsigned int n_passes = 1;
+    unsigned int n_interior = 0;
+    #ifdef ENABLE_MPI
+    if (m_comm && m_comm->isGhostUpdatePending())
+        {
+        n_passes = 2;
+        n_interior = m_nlist->getNInterior();
+        }
+    #endif
 
-    ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
-    ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(), access_location::host, access_mode::read);
-    ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
+    for (unsigned int pass = 0; pass < n_passes; ++pass)
+        {
+        #ifdef ENABLE_MPI
+        if (pass == 1)
+            m_comm->finishUpdateGhosts(timestep);
+        #endif
 
+        // access the neighbor list, particle data, and system box
+        ArrayHandle<unsigned int> h_n_neigh(m_nlist->getNNeighArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_nlist(m_nlist->getNListArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_head_list(m_nlist->getHeadList(), access_location::host, access_mode::read);
 
-    //force arrays
-    ArrayHandle<Scalar4> h_force(m_force,access_location::host, access_mode::overwrite);
-    ArrayHandle<Scalar>  h_virial(m_virial,access_location::host, access_mode::overwrite);
+        ArrayHandle<Scalar4> h_pos(m_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_diameter(m_pdata->getDiameters(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_charge(m_pdata->getCharges(), access_location::host, access_mode::read);
 
 
-    const BoxDim& box = m_pdata->getGlobalBox();
-    ArrayHandle<Scalar> h_ronsq(m_ronsq, access_location::host, access_mode::read);
-    ArrayHandle<Scalar> h_rcutsq(m_rcutsq, access_location::host, access_mode::read);
-    ArrayHandle<param_type> h_params(m_params, access_location::host, access_mode::read);
+        //force arrays
+        ArrayHandle<Scalar4> h_force(m_force,access_location::host, access_mode::readwrite);
+        ArrayHandle<Scalar>  h_virial(m_virial,access_location::host, access_mode::readwrite);
 
-    PDataFlags flags = this->m_pdata->getFlags();
-    bool compute_virial = flags[pdata_flag::pressure_tensor] || flags[pdata_flag::isotropic_virial];
 
-    // need to start from a zero force, energy and virial
-    memset((void*)h_force.data,0,sizeof(Scalar4)*m_force.getNumElements());
-    memset((void*)h_virial.data,0,sizeof(Scalar)*m_virial.getNumElements());
+        const BoxDim& box = m_pdata->getGlobalBox();
+        ArrayHandle<Scalar> h_ronsq(m_ronsq, access_location::host, access_mode::read);
+        ArrayHandle<Scalar> h_rcutsq(m_rcutsq, access_location::host, access_mode::read);
+        ArrayHandle<param_type> h_params(m_params, access_location::host, access_mode::read);
 
-    // for each particle
-    for (int i = 0; i < (int)m_pdata->getN(); i++)
-        {
-        // access the particle's position and type (MEM TRANSFER: 4 scalars)
-        Scalar3 pi = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
-        unsigned int typei = __scalar_as_int(h_pos.data[i].w);
+        PDataFlags flags = this->m_pdata->getFlags();
+        bool compute_virial = flags[pdata_flag::pressure_tensor] || flags[pdata_flag::isotropic_virial];
 
-        // sanity check
-        assert(typei < m_pdata->getNTypes());
+        // need to start from a zero force, energy and virial
+        if (pass == 0)
+            {
+            memset((void*)h_force.data,0,sizeof(Scalar4)*m_force.getNumElements());
+            memset((void*)h_virial.data,0,sizeof(Scalar)*m_virial.getNumElements());
+            }
 
-        // access diameter and charge (if needed)
-        Scalar di = Scalar(0.0);
-        Scalar qi = Scalar(0.0);
-        if (evaluator::needsDiameter())
-            di = h_diameter.data[i];
-        if (evaluator::needsCharge())
-            qi = h_charge.data[i];
+        // particles to compute in this pass
+        unsigned int first = 0;
+        unsigned int last = m_pdata->getN();
+        std::unique_ptr< ArrayHandle<unsigned int> > h_interior_split;
+        if (n_passes == 2)
+            {
+            first = (pass == 0) ? 0 : n_interior;
+            last = (pass == 0) ? n_interior : m_pdata->getN();
+            h_interior_split.reset(new ArrayHandle<unsigned int>(m_nlist->getInteriorSplit(), access_location::host, access_mode::read));
+            }
 
-        // initialize current particle force, potential energy, and virial to 0
-        Scalar3 fi = make_scalar3(0, 0, 0);
-        Scalar pei = 0.0;
-        Scalar virialxxi = 0.0;
-        Scalar virialxyi = 0.0;
-        Scalar virialxzi = 0.0;
-        Scalar virialyyi = 0.0;
-        Scalar virialyzi = 0.0;
-        Scalar virialzzi = 0.0;
-
-        // loop over all of the neighbors of this particle
-        const unsigned int myHead = h_head_list.data[i];
-        const unsigned int size = (unsigned int)h_n_neigh.data[i];
-        for (unsigned int k = 0; k < size; k++)
+        // for each particle
+        for (int ii = first; ii < (int)last; ii++)
             {
-            // access the index of this neighbor (MEM TRANSFER: 1 scalar)
-            unsigned int j = h_nlist.data[myHead + k];
-            assert(j < m_pdata->getN() + m_pdata->getNGhosts());
+            const int i = h_interior_split ? h_interior_split->data[ii] : ii;
 
-            // calculate dr_ji (MEM TRANSFER: 3 scalars / FLOPS: 3)
-            Scalar3 pj = make_scalar3(h_pos.data[j].x, h_pos.data[j].y, h_pos.data[j].z);
-            Scalar3 dx = pi - pj;
+            // access the particle's position and type (MEM TRANSFER: 4 scalars)
+            Scalar3 pi = make_scalar3(h_pos.data[i].x, h_pos.data[i].y, h_pos.data[i].z);
+            unsigned int typei = __scalar_as_int(h_pos.data[i].w);
 
-            // access the type of the neighbor particle (MEM TRANSFER: 1 scalar)
-            unsigned int typej = __scalar_as_int(h_pos.data[j].w);
-            assert(typej < m_pdata->getNTypes());
+            // sanity check
+            assert(typei < m_pdata->getNTypes());
 
             // access diameter and charge (if needed)
-            Scalar dj = Scalar(0.0);
-            Scalar qj = Scalar(0.0);
+            Scalar di = Scalar(0.0);
+            Scalar qi = Scalar(0.0);
             if (evaluator::needsDiameter())
-                dj = h_diameter.data[j];
+                di = h_diameter.data[i];
             if (evaluator::needsCharge())
-                qj = h_charge.data[j];
-
-            // apply periodic boundary conditions
-            dx = box.minImage(dx);
-
-            // calculate r_ij squared (FLOPS: 5)
-            Scalar rsq = dot(dx, dx);
-
-            // get parameters for this type pair
-            unsigned int typpair_idx = m_typpair_idx(typei, typej);
-            param_type param = h_params.data[typpair_idx];
-            Scalar rcutsq = h_rcutsq.data[typpair_idx];
-            Scalar ronsq = Scalar(0.0);
-            if (m_shift_mode == xplor)
-                ronsq = h_ronsq.data[typpair_idx];
-
-            // design specifies that energies are shifted if
-            // 1) shift mode is set to shift
-            // or 2) shift mode is explor and ron > rcut
-            bool energy_shift = false;
-            if (m_shift_mode == shift)
-                energy_shift = true;
-            else if (m_shift_mode == xplor)
+                qi = h_charge.data[i];
+
+            // initialize current particle force, potential energy, and virial to 0
+            Scalar3 fi = make_scalar3(0, 0, 0);
+            Scalar pei = 0.0;
+            Scalar virialxxi = 0.0;
+            Scalar virialxyi = 0.0;
+            Scalar virialxzi = 0.0;
+            Scalar virialyyi = 0.0;
+            Scalar virialyzi = 0.0;
+            Scalar virialzzi = 0.0;
+
+            // loop over all of the neighbors of this particle
+            const unsigned int myHead = h_head_list.data[i];
+            const unsigned int size = (unsigned int)h_n_neigh.data[i];
+            for (unsigned int k = 0; k < size; k++)
                 {
-                if (ronsq > rcutsq)
+                // access the index of this neighbor (MEM TRANSFER: 1 scalar)
+                unsigned int j = h_nlist.data[myHead + k];
+                assert(j < m_pdata->getN() + m_pdata->getNGhosts());
+
+                // calculate dr_ji (MEM TRANSFER: 3 scalars / FLOPS: 3)
+                Scalar3 pj = make_scalar3(h_pos.data[j].x, h_pos.data[j].y, h_pos.data[j].z);
+                Scalar3 dx = pi - pj;
+
+                // access the type of the neighbor particle (MEM TRANSFER: 1 scalar)
+                unsigned int typej = __scalar_as_int(h_pos.data[j].w);
+                assert(typej < m_pdata->getNTypes());
+
+                // access diameter and charge (if needed)
+                Scalar dj = Scalar(0.0);
+                Scalar qj = Scalar(0.0);
+                if (evaluator::needsDiameter())
+                    dj = h_diameter.data[j];
+                if (evaluator::needsCharge())
+                    qj = h_charge.data[j];
+
+                // apply periodic boundary conditions
+                dx = box.minImage(dx);
+
+                // calculate r_ij squared (FLOPS: 5)
+                Scalar rsq = dot(dx, dx);
+
+                // get parameters for this type pair
+                unsigned int typpair_idx = m_typpair_idx(typei, typej);
+                param_type param = h_params.data[typpair_idx];
+                Scalar rcutsq = h_rcutsq.data[typpair_idx];
+                Scalar ronsq = Scalar(0.0);
+                if (m_shift_mode == xplor)
+                    ronsq = h_ronsq.data[typpair_idx];
+
+                // design specifies that energies are shifted if
+                // 1) shift mode is set to shift
+                // or 2) shift mode is explor and ron > rcut
+                bool energy_shift = false;
+                if (m_shift_mode == shift)
                     energy_shift = true;
-                }
+                else if (m_shift_mode == xplor)
+                    {
+                    if (ronsq > rcutsq)
+                        energy_shift = true;
+                    }
 
-            // compute the force and potential energy
-            Scalar force_divr = Scalar(0.0);
-            Scalar pair_eng = Scalar(0.0);
-            evaluator eval(rsq, rcutsq, param);
-            if (evaluator::needsDiameter())
-                eval.setDiameter(di, dj);
-            if (evaluator::needsCharge())
-                eval.setCharge(qi, qj);
+                // compute the force and potential energy
+                Scalar force_divr = Scalar(0.0);
+                Scalar pair_eng = Scalar(0.0);
+                evaluator eval(rsq, rcutsq, param);
+                if (evaluator::needsDiameter())
+                    eval.setDiameter(di, dj);
+                if (evaluator::needsCharge())
+                    eval.setCharge(qi, qj);
 
-            bool evaluated = eval.evalForceAndEnergy(force_divr, pair_eng, energy_shift);
+                bool evaluated = eval.evalForceAndEnergy(force_divr, pair_eng, energy_shift);
 
-            if (evaluated)
-                {
-                // modify the potential for xplor shifting
-                if (m_shift_mode == xplor)
+                if (evaluated)
                     {
-                    if (rsq >= ronsq && rsq < rcutsq)
+                    // modify the potential for xplor shifting
+                    if (m_shift_mode == xplor)
                         {
-                        // Implement XPLOR smoothing (FLOPS: 16)
-                        Scalar old_pair_eng = pair_eng;
-                        Scalar old_force_divr = force_divr;
-
-                        // calculate 1.0 / (xplor denominator)
-                        Scalar xplor_denom_inv =
-                            Scalar(1.0) / ((rcutsq - ronsq) * (rcutsq - ronsq) * (rcutsq - ronsq));
-
-                        Scalar rsq_minus_r_cut_sq = rsq - rcutsq;
-                        Scalar s = rsq_minus_r_cut_sq * rsq_minus_r_cut_sq *
-                                   (rcutsq + Scalar(2.0) * rsq - Scalar(3.0) * ronsq) * xplor_denom_inv;
-                        Scalar ds_dr_divr = Scalar(12.0) * (rsq - ronsq) * rsq_minus_r_cut_sq * xplor_denom_inv;
-
-                        // make modifications to the old pair energy and force
-                        pair_eng = old_pair_eng * s;
-                        // note: I'm not sure why the minus sign needs to be there: my notes have a +
-                        // But this is verified correct via plotting
-                        force_divr = s * old_force_divr - ds_dr_divr * old_pair_eng;
+                        if (rsq >= ronsq && rsq < rcutsq)
+                            {
+                            // Implement XPLOR smoothing (FLOPS: 16)
+                            Scalar old_pair_eng = pair_eng;
+                            Scalar old_force_divr = force_divr;
+
+                            // calculate 1.0 / (xplor denominator)
+                            Scalar xplor_denom_inv =
+                                Scalar(1.0) / ((rcutsq - ronsq) * (rcutsq - ronsq) * (rcutsq - ronsq));
+
+                            Scalar rsq_minus_r_cut_sq = rsq - rcutsq;
+                            Scalar s = rsq_minus_r_cut_sq * rsq_minus_r_cut_sq *
+                                       (rcutsq + Scalar(2.0) * rsq - Scalar(3.0) * ronsq) * xplor_denom_inv;
+                            Scalar ds_dr_divr = Scalar(12.0) * (rsq - ronsq) * rsq_minus_r_cut_sq * xplor_denom_inv;
+
+                            // make modifications to the old pair energy and force
+                            pair_eng = old_pair_eng * s;
+                            // note: I'm not sure why the minus sign needs to be there: my notes have a +
+                            // But this is verified correct via plotting
+                            force_divr = s * old_force_divr - ds_dr_divr * old_pair_eng;
+                            }
                         }
-                    }
 
-                Scalar force_div2r = force_divr * Scalar(0.5);
-                // add the force, potential energy and virial to the particle i
-                // (FLOPS: 8)
-                fi += dx*force_divr;
-                pei += pair_eng * Scalar(0.5);
-                if (compute_virial)
-                    {
-                    virialxxi += force_div2r*dx.x*dx.x;
-                    virialxyi += force_div2r*dx.x*dx.y;
-                    virialxzi += force_div2r*dx.x*dx.z;
-                    virialyyi += force_div2r*dx.y*dx.y;
-                    virialyzi += force_div2r*dx.y*dx.z;
-                    virialzzi += force_div2r*dx.z*dx.z;
-                    }
-
-                // add the force to particle j if we are using the third law (MEM TRANSFER: 10 scalars / FLOPS: 8)
-                // only add force to local particles
-                if (third_law && j < m_pdata->getN())
-                    {
-                    unsigned int mem_idx = j;
-                    h_force.data[mem_idx].x -= dx.x*force_divr;
-                    h_force.data[mem_idx].y -= dx.y*force_divr;
-                    h_force.data[mem_idx].z -= dx.z*force_divr;
-                    h_force.data[mem_idx].w += pair_eng * Scalar(0.5);
+                    Scalar force_div2r = force_divr * Scalar(0.5);
+                    // add the force, potential energy and virial to the particle i
+                    // (FLOPS: 8)
+                    fi += dx*force_divr;
+                    pei += pair_eng * Scalar(0.5);
                     if (compute_virial)
                         {
-                        h_virial.data[0*m_virial_pitch+mem_idx] += force_div2r*dx.x*dx.x;
-                        h_virial.data[1*m_virial_pitch+mem_idx] += force_div2r*dx.x*dx.y;
-                        h_virial.data[2*m_virial_pitch+mem_idx] += force_div2r*dx.x*dx.z;
-                        h_virial.data[3*m_virial_pitch+mem_idx] += force_div2r*dx.y*dx.y;
-                        h_virial.data[4*m_virial_pitch+mem_idx] += force_div2r*dx.y*dx.z;
-                        h_virial.data[5*m_virial_pitch+mem_idx] += force_div2r*dx.z*dx.z;
+                        virialxxi += force_div2r*dx.x*dx.x;
+                        virialxyi += force_div2r*dx.x*dx.y;
+                        virialxzi += force_div2r*dx.x*dx.z;
+                        virialyyi += force_div2r*dx.y*dx.y;
+                        virialyzi += force_div2r*dx.y*dx.z;
+                        virialzzi += force_div2r*dx.z*dx.z;
+                        }
+
+                    // add the force to particle j if we are using the third law (MEM TRANSFER: 10 scalars / FLOPS: 8)
+                    // only add force to local particles
+                    if (third_law && j < m_pdata->getN())
+                        {
+                        unsigned int mem_idx = j;
+                        h_force.data[mem_idx].x -= dx.x*force_divr;
+                        h_force.data[mem_idx].y -= dx.y*force_divr;
+                        h_force.data[mem_idx].z -= dx.z*force_divr;
+                        h_force.data[mem_idx].w += pair_eng * Scalar(0.5);
+                        if (compute_virial)
+                            {
+                            h_virial.data[0*m_virial_pitch+mem_idx] += force_div2r*dx.x*dx.x;
+                            h_virial.data[1*m_virial_pitch+mem_idx] += force_div2r*dx.x*dx.y;
+                            h_virial.data[2*m_virial_pitch+mem_idx] += force_div2r*dx.x*dx.z;
+                            h_virial.data[3*m_virial_pitch+mem_idx] += force_div2r*dx.y*dx.y;
+                            h_virial.data[4*m_virial_pitch+mem_idx] += force_div2r*dx.y*dx.z;
+                            h_virial.data[5*m_virial_pitch+mem_idx] += force_div2r*dx.z*dx.z;
+                            }
                         }
                     }
                 }
-            }
 
-        // finally, increment the force, potential energy and virial for particle i
-        unsigned int mem_idx = i;
-        h_force.data[mem_idx].x += fi.x;
-        h_force.data[mem_idx].y += fi.y;
-        h_force.data[mem_idx].z += fi.z;
-        h_force.data[mem_idx].w += pei;
-        if (compute_virial)
-            {
-            h_virial.data[0*m_virial_pitch+mem_idx] += virialxxi;
-            h_virial.data[1*m_virial_pitch+mem_idx] += virialxyi;
-            h_virial.data[2*m_virial_pitch+mem_idx] += virialxzi;
-            h_virial.data[3*m_virial_pitch+mem_idx] += virialyyi;
-            h_virial.data[4*m_virial_pitch+mem_idx] += virialyzi;
-            h_virial.data[5*m_virial_pitch+mem_idx] += virialzzi;
+            // finally, increment the force, potential energy and virial for particle i
+            unsigned int mem_idx = i;
+            h_force.data[mem_idx].x += fi.x;
+            h_force.data[mem_idx].y += fi.y;
+            h_force.data[mem_idx].z += fi.z;
+            h_force.data[mem_idx].w += pei;
+            if (compute_virial)
+                {
+                h_virial.data[0*m_virial_pitch+mem_idx] += virialxxi;
+                h_virial.data[1*m_virial_pitch+mem_idx] += virialxyi;
+                h_virial.data[2*m_virial_pitch+mem_idx] += virialxzi;
+                h_virial.data[3*m_virial_pitch+mem_idx] += virialyyi;
+                h_virial.data[4*m_virial_pitch+mem_idx] += virialyzi;
+                h_virial.data[5*m_virial_pitch+mem_idx] += virialzzi;
+                }
             }
         }
 
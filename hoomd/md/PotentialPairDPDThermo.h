@@ -63,6 +63,12 @@ class PotentialPairDPDThermo : public PotentialPair<evaluator>
         #ifdef ENABLE_MPI
         //! Get ghost particle fields requested by this pair potential
         virtual CommFlags getRequestedCommFlags(unsigned int timestep);
+
+        //! The DPD forces are computed after the ghost update completes
+        virtual bool overlapsGhostUpdate()
+            {
+            return false;
+            }
         #endif
 
     protected:
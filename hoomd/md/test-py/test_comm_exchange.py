@@ -0,0 +1,59 @@
+# -*- coding: iso-8859-1 -*-
+
+from hoomd import *
+from hoomd import md
+context.initialize()
+import unittest
+import numpy
+
+# compare the staged and the direct exchange of particles between domains
+class comm_exchange(unittest.TestCase):
+    def run_lj(self, exchange):
+        comm.decomposition(exchange=exchange)
+        snap = lattice.sc(a=1.1).get_snapshot()
+        snap.replicate(10,10,10)
+        if comm.get_rank() == 0:
+            snap.particles.velocity[:] = numpy.random.RandomState(12).uniform(-1.0, 1.0, size=(snap.particles.N, 3))
+        system = init.read_snapshot(snap)
+
+        nl = md.nlist.cell()
+        lj = md.pair.lj(r_cut=2.5, nlist=nl)
+        lj.pair_coeff.set('A', 'A', epsilon=1.0, sigma=1.0)
+        md.integrate.mode_standard(dt=0.005)
+        md.integrate.nve(group=group.all())
+        run(200)
+
+        snap = system.take_snapshot()
+        context.initialize()
+        return snap
+
+    def test_compare(self):
+        if comm.get_num_ranks() == 1:
+            return
+
+        snap_staged = self.run_lj('staged')
+        snap_direct = self.run_lj('direct')
+
+        if comm.get_rank() == 0:
+            numpy.testing.assert_allclose(snap_direct.particles.position, snap_staged.particles.position, atol=1e-5)
+            numpy.testing.assert_allclose(snap_direct.particles.velocity, snap_staged.particles.velocity, atol=1e-5)
+
+    def test_benchmark(self):
+        if comm.get_num_ranks() == 1:
+            return
+
+        init.create_lattice(lattice.sc(a=1.1), n=[10,10,10])
+        nl = md.nlist.cell()
+        lj = md.pair.lj(r_cut=2.5, nlist=nl)
+        lj.pair_coeff.set('A', 'A', epsilon=1.0, sigma=1.0)
+        md.integrate.mode_standard(dt=0.005)
+        md.integrate.nve(group=group.all())
+
+        tps = benchmark.ghost_exchange(warmup=10, repeat=2, steps=10)
+        self.assertEqual(len(tps['staged']), 2)
+        self.assertEqual(len(tps['direct']), 2)
+        self.assertEqual(context.current.decomposition.exchange, 'staged')
+        context.initialize()
+
+if __name__ == '__main__':
+    unittest.main(argv = ['test.py', '-v'])
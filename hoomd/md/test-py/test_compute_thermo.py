@@ -25,7 +25,7 @@ class compute_thermo_tests (unittest.TestCase):
             self.snap.particles.velocity[:] = self.v
             self.snap.particles.mass[:] = self.m
 
-        init.read_snapshot(self.snap)
+        self.s = init.read_snapshot(self.snap)
         context.current.sorter.set_params(grid=8)
 
     # API test: tests basic creation of the compute
@@ -51,7 +51,7 @@ class compute_thermo_tests (unittest.TestCase):
                     'rotational_kinetic_energy_A',
                     'temperature_A'];
 
-        log = analyze.log(filename=None, quantities=quantities, period=None);
+        log = analyze.log(filename=None, quantities=quantities, period=1);
 
         # dummy integrator to apply appropriate degrees of freedom
         md.integrate.mode_standard(dt=0.0);
@@ -74,6 +74,94 @@ class compute_thermo_tests (unittest.TestCase):
         numpy.testing.assert_allclose(log.query('rotational_kinetic_energy_A'), 0, atol=1e-7)
         numpy.testing.assert_allclose(log.query('temperature_A'), 2.0 / (3*self.N-3) * K_ref)
 
+    # Unit test: Validate the temperature of a dynamic group after its members change
+    def test_temperature_dynamic(self):
+        # all particles are at the origin and in the slab
+        slab = group.cuboid(name='slab', xmin=0, period=1)
+        compute.thermo(group=slab);
+
+        log = analyze.log(filename=None, quantities=['num_particles_slab', 'translational_ndof_slab', 'temperature_slab'], period=None);
+
+        md.integrate.mode_standard(dt=0.0);
+        md.integrate.nve(group=group.all());
+
+        m = self.m;
+        v = self.v;
+        K = 1/2 * m * numpy.sum(v**2, axis=1)
+
+        # move the first half of the particles out of the slab, the integrator counted the degrees of freedom of all
+        # particles at the start of the run
+        for i in range(self.N//2):
+            self.s.particles[i].position = (-1,0,0)
+        run(1);
+
+        n = self.N - self.N//2
+        numpy.testing.assert_allclose(log.query('num_particles_slab'), n)
+        numpy.testing.assert_allclose(log.query('translational_ndof_slab'), 3*n-3)
+        numpy.testing.assert_allclose(log.query('temperature_slab'), 2.0 / (3*n-3) * numpy.sum(K[self.N//2:]))
+
+        # move a quarter of the particles back in
+        for i in range(self.N//4):
+            self.s.particles[i].position = (1,0,0)
+        run(1);
+
+        n = self.N - self.N//2 + self.N//4
+        K_ref = numpy.sum(K[:self.N//4]) + numpy.sum(K[self.N//2:])
+        numpy.testing.assert_allclose(log.query('num_particles_slab'), n)
+        numpy.testing.assert_allclose(log.query('translational_ndof_slab'), 3*n-3)
+        numpy.testing.assert_allclose(log.query('temperature_slab'), 2.0 / (3*n-3) * K_ref)
+
+    # Unit test: Validate the properties of many groups computed at once
+    def test_thermo_multi(self):
+        labels = numpy.arange(self.N) % 7
+        labels[:10] = -1
+
+        t = compute.thermo_multi(labels=labels, name='bin')
+        self.assertEqual(len(t.partition), 7)
+
+        # compute.thermo of the same groups, logged on every step so that the optional properties are computed
+        components = ['xx', 'xy', 'xz', 'yy', 'yz', 'zz']
+        quantities = []
+        for i in range(7):
+            g = group.tag_list(name='g%d' % i, tags=numpy.flatnonzero(labels == i))
+            compute.thermo(group=g);
+            quantities += ['translational_kinetic_energy_g%d' % i, 'potential_energy_g%d' % i]
+            quantities += ['pressure_%s_g%d' % (c, i) for c in components]
+        log = analyze.log(filename=None, quantities=quantities, period=None);
+
+        md.integrate.mode_standard(dt=0.0);
+        md.integrate.nve(group=group.all());
+        run(1);
+
+        m = self.m;
+        v = self.v;
+        N_ref = numpy.array([numpy.sum(labels == i) for i in range(7)])
+        K_ref = numpy.array([1/2 * numpy.sum(m[labels == i] * numpy.sum(v[labels == i]**2, axis=1)) for i in range(7)])
+        P_ref = numpy.array([numpy.sum(m[labels == i,numpy.newaxis] * v[labels == i], axis=0) for i in range(7)])
+
+        numpy.testing.assert_allclose(t.get('num_particles'), N_ref)
+        numpy.testing.assert_allclose(t.get('translational_kinetic_energy'), K_ref)
+        numpy.testing.assert_allclose(t.get('temperature'), 2.0 / (3*N_ref) * K_ref)
+        numpy.testing.assert_allclose(t.get('momentum'), P_ref, rtol=1e-5, atol=1e-5)
+
+        # the logger requests the optional properties, so they match compute.thermo
+        K = numpy.array([log.query('translational_kinetic_energy_g%d' % i) for i in range(7)])
+        U = numpy.array([log.query('potential_energy_g%d' % i) for i in range(7)])
+        P = numpy.array([[log.query('pressure_%s_g%d' % (c, i)) for c in components] for i in range(7)])
+        numpy.testing.assert_allclose(t.get('translational_kinetic_energy'), K, rtol=1e-5)
+        numpy.testing.assert_allclose(t.get('potential_energy'), U, atol=1e-7)
+        numpy.testing.assert_allclose(t.get('pressure_tensor'), P, rtol=1e-5, atol=1e-7)
+        self.assertFalse(numpy.any(numpy.isnan(t.get('potential_energy'))))
+        self.assertFalse(numpy.any(numpy.isnan(t.get('pressure_tensor'))))
+
+    # Test the input checks of thermo_multi
+    def test_thermo_multi_errors(self):
+        with self.assertRaises(ValueError):
+            compute.thermo_multi()
+
+        p = group.partition(name='bin', labels=numpy.zeros(self.N, dtype=numpy.int32))
+        with self.assertRaises(ValueError):
+            compute.thermo_multi(partition=p, labels=numpy.zeros(self.N))
 
     def tearDown(self):
         context.initialize();
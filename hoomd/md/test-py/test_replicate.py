@@ -6,6 +6,7 @@ from hoomd import md;
 context.initialize()
 import unittest
 import os
+import numpy
 
 # unit tests for init.create_random
 class replicate(unittest.TestCase):
@@ -32,6 +33,50 @@ class replicate(unittest.TestCase):
         self.assertEqual(self.nl.cpp_nlist.getNumExclusions(1), 8*(2*100+2*10))
         run(100);
 
+    def check_snapshot(self, ref):
+        snap = self.s.take_snapshot(bonds=True, dtype='double')
+        if comm.get_rank() == 0:
+            self.assertEqual(snap.particles.N, ref.particles.N)
+            numpy.testing.assert_allclose(snap.box.Lx, ref.box.Lx)
+            numpy.testing.assert_allclose(snap.box.Ly, ref.box.Ly)
+            numpy.testing.assert_allclose(snap.box.Lz, ref.box.Lz)
+            numpy.testing.assert_allclose(snap.particles.position, ref.particles.position, atol=1e-6)
+            numpy.testing.assert_array_equal(snap.particles.image, ref.particles.image)
+            numpy.testing.assert_array_equal(snap.particles.typeid, ref.particles.typeid)
+            numpy.testing.assert_allclose(snap.particles.velocity, ref.particles.velocity)
+            self.assertEqual(snap.bonds.N, ref.bonds.N)
+            numpy.testing.assert_array_equal(snap.bonds.group, ref.bonds.group)
+            numpy.testing.assert_array_equal(snap.bonds.typeid, ref.bonds.typeid)
+
+    def test_replicate_tags(self):
+        # the in place replication assigns the same tags as replicating a snapshot
+        ref = self.s.take_snapshot(bonds=True, dtype='double')
+        if comm.get_rank() == 0:
+            ref.replicate(2,3,1)
+
+        self.s.replicate(nx=2,ny=3,nz=1)
+        self.check_snapshot(ref)
+
+    def test_replicate_removed(self):
+        # particles and bonds with removed tags are replicated with compact tags
+        self.s.bonds.remove(self.s.bonds[5].tag)
+        t = self.s.particles.add('A')
+        self.s.particles.add('B')
+        self.s.particles.remove(t)
+        ref = self.s.take_snapshot(bonds=True, dtype='double')
+        if comm.get_rank() == 0:
+            ref.replicate(1,2,2)
+
+        self.s.replicate(nx=1,ny=2,nz=2)
+        self.check_snapshot(ref)
+
+    def test_replicate_update_grid(self):
+        self.s.replicate(nx=2,ny=1,nz=1,update_grid=True)
+        self.assertEqual(len(self.s.particles),2*(19*100+4*10))
+        md.integrate.mode_standard(dt=0.005);
+        md.integrate.nve(group.all());
+        run(10)
+
     def tearDown(self):
         del self.harmonic
         del self.pair
@@ -19,6 +19,8 @@ HOOMD_UP_MAIN()
 #include "hoomd/ConstForceCompute.h"
 #include "hoomd/md/TwoStepNVE.h"
 #include "hoomd/md/IntegratorTwoStep.h"
+#include "hoomd/md/NeighborListTree.h"
+#include "hoomd/md/AllPairPotentials.h"
 
 #ifdef ENABLE_CUDA
 #include "hoomd/CommunicatorGPU.h"
@@ -3443,6 +3445,103 @@ void test_communicator_ghosts_per_type(communicator_creator comm_creator, std::s
         }
     }
 
+//! Test that pair forces computed during a pending ghost update match the forces computed after it
+void test_communicator_overlap(communicator_creator comm_creator, std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    unsigned int n = 1000;
+    BoxDim box(4.0);
+    std::shared_ptr<SystemDefinition> sysdef(new SystemDefinition(n,           // number of particles
+                                                             box,         // box dimensions
+                                                             1,           // number of particle types
+                                                             0,           // number of bond types
+                                                             0,           // number of angle types
+                                                             0,           // number of dihedral types
+                                                             0,           // number of dihedral types
+                                                             exec_conf));
+
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+
+    Scalar3 lo = pdata->getBox().getLo();
+    Scalar3 L = pdata->getBox().getL();
+
+    SnapshotParticleData<Scalar> snap(n);
+    snap.type_mapping.push_back("A");
+
+    srand(12345);
+    for (unsigned int i = 0; i < n; ++i)
+        {
+        snap.pos[i] = vec3<Scalar>(lo.x + (Scalar)rand()/(Scalar)RAND_MAX*L.x,
+                                   lo.y + (Scalar)rand()/(Scalar)RAND_MAX*L.y,
+                                   lo.z + (Scalar)rand()/(Scalar)RAND_MAX*L.z);
+        }
+
+    std::shared_ptr<DomainDecomposition> decomposition(new DomainDecomposition(exec_conf, box.getL()));
+    std::shared_ptr<Communicator> comm = comm_creator(sysdef, decomposition);
+
+    pdata->setDomainDecomposition(decomposition);
+    pdata->initializeFromSnapshot(snap);
+
+    // two identical pair potentials sharing the neighbor list
+    std::shared_ptr<NeighborListTree> nlist(new NeighborListTree(sysdef, Scalar(0.3), Scalar(0.1)));
+    std::shared_ptr<PotentialPairLJ> pair(new PotentialPairLJ(sysdef, nlist));
+    std::shared_ptr<PotentialPairLJ> pair_ref(new PotentialPairLJ(sysdef, nlist));
+
+    Scalar epsilon = Scalar(1.0);
+    Scalar sigma = Scalar(0.2);
+    Scalar lj1 = Scalar(4.0) * epsilon * pow(sigma,Scalar(12.0));
+    Scalar lj2 = Scalar(4.0) * epsilon * pow(sigma,Scalar(6.0));
+    pair->setParams(0,0,make_scalar2(lj1,lj2));
+    pair->setRcut(0,0,Scalar(0.3));
+    pair_ref->setParams(0,0,make_scalar2(lj1,lj2));
+    pair_ref->setRcut(0,0,Scalar(0.3));
+
+    nlist->setCommunicator(comm);
+    pair->setCommunicator(comm);
+    pair_ref->setCommunicator(comm);
+    comm->getCommFlagsRequestSignal().connect<comm_flag_request>();
+
+    // distribute the particles and build the neighbor list
+    comm->communicate(0);
+    comm->communicate(1, true);
+    pair->compute(1);
+
+    UP_ASSERT(pair->overlapsGhostUpdate());
+
+    for (unsigned int step = 2; step < 5; ++step)
+        {
+        // move the particles by less than half the buffer so that the neighbor list is not rebuilt
+            {
+            ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::readwrite);
+            for (unsigned int i = 0; i < pdata->getN(); ++i)
+                {
+                h_pos.data[i].x += Scalar(0.01) * Scalar(int(i % 3) - 1);
+                h_pos.data[i].y += Scalar(0.01) * Scalar(int((i+1) % 3) - 1);
+                h_pos.data[i].z += Scalar(0.01) * Scalar(int((i+2) % 3) - 1);
+                }
+            }
+
+        comm->communicate(step, true);
+        UP_ASSERT(comm->isGhostUpdatePending());
+
+        // the interior forces are computed while the ghost positions are in flight
+        pair->compute(step);
+        UP_ASSERT(!comm->isGhostUpdatePending());
+        UP_ASSERT(nlist->getNInterior() <= pdata->getN());
+
+        pair_ref->compute(step);
+
+        ArrayHandle<Scalar4> h_force(pair->getForceArray(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_force_ref(pair_ref->getForceArray(), access_location::host, access_mode::read);
+        for (unsigned int i = 0; i < pdata->getN(); ++i)
+            {
+            MY_CHECK_CLOSE(h_force.data[i].x, h_force_ref.data[i].x, tol_small);
+            MY_CHECK_CLOSE(h_force.data[i].y, h_force_ref.data[i].y, tol_small);
+            MY_CHECK_CLOSE(h_force.data[i].z, h_force_ref.data[i].z, tol_small);
+            MY_CHECK_CLOSE(h_force.data[i].w, h_force_ref.data[i].w, tol_small);
+            }
+        }
+    }
+
 //! Communicator creator for unit tests
 std::shared_ptr<Communicator> base_class_communicator_creator(std::shared_ptr<SystemDefinition> sysdef,
                                                          std::shared_ptr<DomainDecomposition> decomposition)
@@ -3450,6 +3549,15 @@ std::shared_ptr<Communicator> base_class_communicator_creator(std::shared_ptr<Sy
     return std::shared_ptr<Communicator>(new Communicator(sysdef, decomposition) );
     }
 
+//! Communicator creator for the direct exchange
+std::shared_ptr<Communicator> direct_communicator_creator(std::shared_ptr<SystemDefinition> sysdef,
+                                                     std::shared_ptr<DomainDecomposition> decomposition)
+    {
+    std::shared_ptr<Communicator> comm(new Communicator(sysdef, decomposition));
+    comm->setDirectExchange(true);
+    return comm;
+    }
+
 #ifdef ENABLE_CUDA
 std::shared_ptr<Communicator> gpu_communicator_creator(std::shared_ptr<SystemDefinition> sysdef,
                                                   std::shared_ptr<DomainDecomposition> decomposition)
@@ -3666,6 +3774,66 @@ UP_TEST( communicator_ghost_layer_per_type_test)
     test_communicator_ghosts_per_type(communicator_creator_base, exec_conf_cpu,BoxDim(2.0));
     }
 
+UP_TEST( communicator_overlap_test)
+    {
+    if (!exec_conf_cpu)
+        exec_conf_cpu = std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU));
+
+    communicator_creator communicator_creator_base = bind(base_class_communicator_creator, _1, _2);
+    test_communicator_overlap(communicator_creator_base, exec_conf_cpu);
+    }
+
+UP_TEST( communicator_direct_migrate_test)
+    {
+    if (!exec_conf_cpu)
+        exec_conf_cpu = std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU));
+
+    communicator_creator communicator_creator_direct = bind(direct_communicator_creator, _1, _2);
+    // cubic box
+    test_communicator_migrate(communicator_creator_direct, exec_conf_cpu,BoxDim(2.0));
+    // triclinic box
+    test_communicator_migrate(communicator_creator_direct, exec_conf_cpu,BoxDim(1.0,0.5,0.6,0.8));
+    }
+
+UP_TEST( communicator_direct_overlap_test)
+    {
+    if (!exec_conf_cpu)
+        exec_conf_cpu = std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU));
+
+    communicator_creator communicator_creator_direct = bind(direct_communicator_creator, _1, _2);
+    test_communicator_overlap(communicator_creator_direct, exec_conf_cpu);
+    }
+
+//! Compare the staged and the direct exchange
+UP_TEST( communicator_direct_compare_test)
+    {
+    if (!exec_conf_cpu)
+        exec_conf_cpu = std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU));
+
+    communicator_creator communicator_creator_base = bind(base_class_communicator_creator, _1, _2);
+    communicator_creator communicator_creator_direct = bind(direct_communicator_creator, _1, _2);
+
+    // uniform case
+        {
+        BoxDim box(2.0);
+
+        std::shared_ptr<DomainDecomposition> decomposition_1(new DomainDecomposition(exec_conf_cpu,box.getL()));
+        std::shared_ptr<DomainDecomposition> decomposition_2(new DomainDecomposition(exec_conf_cpu,box.getL()));
+        test_communicator_compare(communicator_creator_base, communicator_creator_direct, exec_conf_cpu, exec_conf_cpu, box, decomposition_1, decomposition_2);
+        }
+
+    // balanced case
+        {
+        BoxDim box(2.0);
+        vector<Scalar> fx(1), fy(1), fz(1);
+        fx[0] = 0.55; fy[0] = 0.45; fz[0] = 0.7;
+
+        std::shared_ptr<DomainDecomposition> decomposition_1(new DomainDecomposition(exec_conf_cpu,box.getL(), fx, fy, fz));
+        std::shared_ptr<DomainDecomposition> decomposition_2(new DomainDecomposition(exec_conf_cpu,box.getL(), fx, fy, fz));
+        test_communicator_compare(communicator_creator_base, communicator_creator_direct, exec_conf_cpu, exec_conf_cpu, box, decomposition_1, decomposition_2);
+        }
+    }
+
 UP_SUITE_END();
 
 #ifdef ENABLE_CUDA
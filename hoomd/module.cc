@@ -14,8 +14,10 @@
 #include "Initializers.h"
 #include "GetarInitializer.h"
 #include "GSDReader.h"
+#include "GSDCheckpointReader.h"
 #include "Compute.h"
 #include "ComputeThermo.h"
+#include "ComputeThermoMulti.h"
 #include "CellList.h"
 #include "CellListStencil.h"
 #include "ForceCompute.h"
@@ -26,6 +28,7 @@
 #include "DCDDumpWriter.h"
 #include "GetarDumpWriter.h"
 #include "GSDDumpWriter.h"
+#include "GSDCheckpointWriter.h"
 #include "Logger.h"
 #include "LogPlainTXT.h"
 #include "LogMatrix.h"
@@ -35,6 +38,8 @@
 #include "Integrator.h"
 #include "SFCPackUpdater.h"
 #include "BoxResizeUpdater.h"
+#include "ParticleGroupUpdater.h"
+#include "ParticlePartition.h"
 #include "System.h"
 #include "Variant.h"
 #include "Messenger.h"
@@ -343,11 +348,13 @@ PYBIND11_MODULE(_hoomd, m)
 
     // initializers
     export_GSDReader(m);
+    export_GSDCheckpointReader(m);
     getardump::export_GetarInitializer(m);
 
     // computes
     export_Compute(m);
     export_ComputeThermo(m);
+    export_ComputeThermoMulti(m);
     export_CellList(m);
     export_CellListStencil(m);
     export_ForceCompute(m);
@@ -365,17 +372,20 @@ PYBIND11_MODULE(_hoomd, m)
     export_DCDDumpWriter(m);
     getardump::export_GetarDumpWriter(m);
     export_GSDDumpWriter(m);
+    export_GSDCheckpointWriter(m);
     export_Logger(m);
     export_LogPlainTXT(m);
     export_LogMatrix(m);
     export_LogHDF5(m);
     export_CallbackAnalyzer(m);
     export_ParticleGroup(m);
+    export_ParticlePartition(m);
 
     // updaters
     export_Updater(m);
     export_Integrator(m);
     export_BoxResizeUpdater(m);
+    export_ParticleGroupUpdater(m);
     export_SFCPackUpdater(m);
 #ifdef ENABLE_CUDA
     export_SFCPackUpdaterGPU(m);
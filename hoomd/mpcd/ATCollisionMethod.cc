@@ -12,6 +12,10 @@
 #include "hoomd/RandomNumbers.h"
 #include "hoomd/RNGIdentifiers.h"
 
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif // ENABLE_TBB
+
 mpcd::ATCollisionMethod::ATCollisionMethod(std::shared_ptr<mpcd::SystemData> sysdata,
                                            unsigned int cur_timestep,
                                            unsigned int period,
@@ -83,8 +87,15 @@ void mpcd::ATCollisionMethod::drawVelocities(unsigned int timestep)
         }
 
     // random velocities are drawn for each particle and stored into the "alternate" arrays
+    // each particle has its own random number stream, so the particles can be split over threads
     const Scalar T = m_T->getValue(timestep);
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N_tot),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
     for (unsigned int idx=0; idx < N_tot; ++idx)
+    #endif // ENABLE_TBB
         {
         unsigned int pidx;
         unsigned int tag; Scalar mass;
@@ -118,6 +129,9 @@ void mpcd::ATCollisionMethod::drawVelocities(unsigned int timestep)
             h_alt_vel_embed->data[pidx] = make_scalar4(vel.x, vel.y, vel.z, mass);
             }
         }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
     }
 
 void mpcd::ATCollisionMethod::applyVelocities()
@@ -145,7 +159,13 @@ void mpcd::ATCollisionMethod::applyVelocities()
     ArrayHandle<double4> h_cell_vel(m_thermo->getCellVelocities(), access_location::host, access_mode::read);
     ArrayHandle<double4> h_rand_vel(m_rand_thermo->getCellVelocities(), access_location::host, access_mode::read);
 
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N_tot),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
     for (unsigned int idx=0; idx < N_tot; ++idx)
+    #endif // ENABLE_TBB
         {
         unsigned int cell, pidx;
         Scalar4 vel_rand;
@@ -181,6 +201,9 @@ void mpcd::ATCollisionMethod::applyVelocities()
             h_vel_embed->data[pidx] = make_scalar4(vnew.x, vnew.y, vnew.z, vel_rand.w);
             }
         }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
     }
 
 /*!
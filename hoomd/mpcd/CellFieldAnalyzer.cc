@@ -0,0 +1,385 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+// Maintainer: mphoward
+
+/*!
+ * \file mpcd/CellFieldAnalyzer.cc
+ * \brief Definition of mpcd::CellFieldAnalyzer
+ */
+
+#include "CellFieldAnalyzer.h"
+
+#ifdef ENABLE_MPI
+#include "hoomd/HOOMDMPI.h"
+#endif // ENABLE_MPI
+
+/*!
+ * \param sysdata MPCD system data
+ * \param thermo Cell thermo compute supplying the cell properties
+ * \param keep_x If true, keep the x axis in the bins
+ * \param keep_y If true, keep the y axis in the bins
+ * \param keep_z If true, keep the z axis in the bins
+ * \param temperature If true, also accumulate the cell temperature
+ */
+mpcd::CellFieldAnalyzer::CellFieldAnalyzer(std::shared_ptr<mpcd::SystemData> sysdata,
+                                           std::shared_ptr<mpcd::CellThermoCompute> thermo,
+                                           bool keep_x,
+                                           bool keep_y,
+                                           bool keep_z,
+                                           bool temperature)
+    : Analyzer(sysdata->getSystemDefinition()),
+      m_mpcd_sys(sysdata), m_cl(sysdata->getCellList()), m_thermo(thermo),
+      m_temperature(temperature), m_num_samples(0), m_needs_reduce(true)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing MPCD CellFieldAnalyzer" << std::endl;
+
+    m_keep[0] = keep_x;
+    m_keep[1] = keep_y;
+    m_keep[2] = keep_z;
+
+    m_thermo->getFlagsSignal().connect<mpcd::CellFieldAnalyzer, &mpcd::CellFieldAnalyzer::getRequestedThermoFlags>(this);
+
+    setupBins();
+    }
+
+mpcd::CellFieldAnalyzer::~CellFieldAnalyzer()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying MPCD CellFieldAnalyzer" << std::endl;
+    m_thermo->getFlagsSignal().disconnect<mpcd::CellFieldAnalyzer, &mpcd::CellFieldAnalyzer::getRequestedThermoFlags>(this);
+    for (auto& slot : m_slots)
+        {
+        slot->disconnect();
+        }
+    }
+
+/*!
+ * \param timestep Current timestep
+ *
+ * The cell thermo is brought up to date (it is reused if it was already computed at
+ * \a timestep), and the properties of the cells owned by this rank are added to the bins.
+ * Analyzers run before the collision, so the sample uses the current grid shift. If the
+ * collision then shifts the grid, the cell list and thermo are recomputed for it.
+ */
+void mpcd::CellFieldAnalyzer::analyze(unsigned int timestep)
+    {
+    if (m_prof) m_prof->push("MPCD cell field");
+
+    m_thermo->compute(timestep);
+
+    // the bins are only valid for a fixed cell grid
+    const uint3 global_dim = m_cl->getGlobalDim();
+    if (global_dim.x != m_global_dim.x || global_dim.y != m_global_dim.y || global_dim.z != m_global_dim.z)
+        {
+        if (m_num_samples > 0)
+            {
+            m_exec_conf->msg->error() << "mpcd: cell dimensions changed while averaging fields, reset the analyzer first" << std::endl;
+            throw std::runtime_error("MPCD cell dimensions changed during field averaging");
+            }
+        setupBins();
+        }
+
+    // cells shared with the east, north, and up neighbors are counted by the neighbor
+    const Index3D& ci = m_cl->getCellIndexer();
+    uint3 upper = make_uint3(ci.getW(), ci.getH(), ci.getD());
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+        auto num_comm = m_cl->getNComm();
+        upper.x -= num_comm[static_cast<unsigned int>(mpcd::detail::face::east)];
+        upper.y -= num_comm[static_cast<unsigned int>(mpcd::detail::face::north)];
+        upper.z -= num_comm[static_cast<unsigned int>(mpcd::detail::face::up)];
+        }
+    #endif // ENABLE_MPI
+
+    const Index3D bin_idx(m_bins.x, m_bins.y, m_bins.z);
+    ArrayHandle<double4> h_cell_vel(m_thermo->getCellVelocities(), access_location::host, access_mode::read);
+    ArrayHandle<double3> h_cell_energy(m_thermo->getCellEnergies(), access_location::host, access_mode::read);
+    for (unsigned int k=0; k < upper.z; ++k)
+        {
+        for (unsigned int j=0; j < upper.y; ++j)
+            {
+            for (unsigned int i=0; i < upper.x; ++i)
+                {
+                const int3 global = m_cl->getGlobalCell(make_int3(i,j,k));
+                const unsigned int bin = bin_idx(m_keep[0] ? global.x : 0,
+                                                 m_keep[1] ? global.y : 0,
+                                                 m_keep[2] ? global.z : 0);
+
+                const unsigned int idx = ci(i,j,k);
+                const double4 cell_vel_mass = h_cell_vel.data[idx];
+                const double mass = cell_vel_mass.w;
+                m_mass[bin] += mass;
+                m_momentum[bin].x += mass * cell_vel_mass.x;
+                m_momentum[bin].y += mass * cell_vel_mass.y;
+                m_momentum[bin].z += mass * cell_vel_mass.z;
+
+                if (m_temperature)
+                    {
+                    const double3 cell_energy = h_cell_energy.data[idx];
+                    if (__double_as_int(cell_energy.z) > 1)
+                        {
+                        m_temp[bin] += cell_energy.y;
+                        m_temp_cells[bin] += 1.0;
+                        }
+                    }
+                }
+            }
+        }
+
+    ++m_num_samples;
+    m_needs_reduce = true;
+
+    if (m_prof) m_prof->pop();
+    }
+
+void mpcd::CellFieldAnalyzer::reset()
+    {
+    setupBins();
+    }
+
+void mpcd::CellFieldAnalyzer::setupBins()
+    {
+    m_global_dim = m_cl->getGlobalDim();
+    m_bins = make_uint3(m_keep[0] ? m_global_dim.x : 1,
+                        m_keep[1] ? m_global_dim.y : 1,
+                        m_keep[2] ? m_global_dim.z : 1);
+    const unsigned int nbins = m_bins.x * m_bins.y * m_bins.z;
+
+    m_mass.assign(nbins, 0.0);
+    m_momentum.assign(nbins, make_double3(0.0, 0.0, 0.0));
+    if (m_temperature)
+        {
+        m_temp.assign(nbins, 0.0);
+        m_temp_cells.assign(nbins, 0.0);
+        }
+    m_num_samples = 0;
+    m_needs_reduce = true;
+    }
+
+/*!
+ * The sums are packed into an array of 6 values per bin (mass, momentum, temperature,
+ * and the number of temperature cells) and summed onto the root rank. This method must
+ * be called on all ranks.
+ */
+void mpcd::CellFieldAnalyzer::reduce()
+    {
+    if (!m_needs_reduce) return;
+
+    const unsigned int nbins = m_mass.size();
+    std::vector<double> local(6*nbins, 0.0);
+    for (unsigned int b=0; b < nbins; ++b)
+        {
+        local[6*b] = m_mass[b];
+        local[6*b+1] = m_momentum[b].x;
+        local[6*b+2] = m_momentum[b].y;
+        local[6*b+3] = m_momentum[b].z;
+        if (m_temperature)
+            {
+            local[6*b+4] = m_temp[b];
+            local[6*b+5] = m_temp_cells[b];
+            }
+        }
+
+    #ifdef ENABLE_MPI
+    if (m_pdata->getDomainDecomposition())
+        {
+        m_reduced.resize(m_exec_conf->isRoot() ? local.size() : 0);
+        MPI_Reduce(local.data(),
+                   m_reduced.data(),
+                   local.size(),
+                   MPI_DOUBLE,
+                   MPI_SUM,
+                   0,
+                   m_exec_conf->getMPICommunicator());
+        }
+    else
+    #endif // ENABLE_MPI
+        {
+        m_reduced.swap(local);
+        }
+
+    m_needs_reduce = false;
+    }
+
+/*!
+ * \param quantity Name of the quantity (density, velocity, or temperature)
+ * \param ncomp Number of components of the quantity in each bin
+ * \returns The averages in each bin on the root rank, and an empty vector on the other ranks
+ *
+ * This method must be called on all ranks.
+ */
+std::vector<double> mpcd::CellFieldAnalyzer::computeAverage(const std::string& quantity, unsigned int& ncomp)
+    {
+    if (quantity == "density" || quantity == "velocity")
+        {
+        ncomp = (quantity == "density") ? 1 : 3;
+        }
+    else if (quantity == "temperature")
+        {
+        if (!m_temperature)
+            {
+            m_exec_conf->msg->error() << "mpcd: temperature field requested, but it is not being averaged" << std::endl;
+            throw std::runtime_error("MPCD cell temperature field not available");
+            }
+        ncomp = 1;
+        }
+    else
+        {
+        m_exec_conf->msg->error() << "mpcd: unknown cell field " << quantity << std::endl;
+        throw std::runtime_error("Unknown MPCD cell field");
+        }
+
+    reduce();
+
+    std::vector<double> avg;
+    if (!m_exec_conf->isRoot()) return avg;
+
+    const unsigned int nbins = m_bins.x * m_bins.y * m_bins.z;
+    avg.assign(ncomp*nbins, 0.0);
+    if (m_num_samples == 0) return avg;
+
+    // volume of each bin
+    const Scalar cell_size = m_cl->getCellSize();
+    double bin_volume = (m_sysdef->getNDimensions() == 3) ? cell_size*cell_size*cell_size : cell_size*cell_size;
+    bin_volume *= (double)(m_global_dim.x * m_global_dim.y * m_global_dim.z) / (double)nbins;
+
+    for (unsigned int b=0; b < nbins; ++b)
+        {
+        const double* sums = &m_reduced[6*b];
+        if (quantity == "density")
+            {
+            avg[b] = sums[0] / (bin_volume * m_num_samples);
+            }
+        else if (quantity == "velocity")
+            {
+            if (sums[0] > 0.0)
+                {
+                avg[3*b] = sums[1] / sums[0];
+                avg[3*b+1] = sums[2] / sums[0];
+                avg[3*b+2] = sums[3] / sums[0];
+                }
+            }
+        else if (sums[5] > 0.0)
+            {
+            avg[b] = sums[4] / sums[5];
+            }
+        }
+
+    return avg;
+    }
+
+/*!
+ * \param quantity Name of the quantity (density, velocity, or temperature)
+ * \returns The averaged field on the root rank, and an empty array on the other ranks
+ *
+ * The array has one dimension for each kept axis (in x, y, z order), and an additional
+ * dimension of size 3 for the velocity. This method must be called on all ranks.
+ */
+pybind11::array mpcd::CellFieldAnalyzer::getField(const std::string& quantity)
+    {
+    unsigned int ncomp;
+    std::vector<double> avg = computeAverage(quantity, ncomp);
+    if (!m_exec_conf->isRoot())
+        {
+        return pybind11::array(pybind11::dtype::of<double>(), std::vector<ssize_t>(1,0));
+        }
+
+    // bins are stored with x fastest, which is the reverse of the C order of the array
+    const unsigned int bins[3] = {m_bins.x, m_bins.y, m_bins.z};
+    std::vector<ssize_t> shape;
+    std::vector<ssize_t> strides;
+    ssize_t stride = ncomp * sizeof(double);
+    for (unsigned int d=0; d < 3; ++d)
+        {
+        if (m_keep[d])
+            {
+            shape.push_back(bins[d]);
+            strides.push_back(stride);
+            }
+        stride *= bins[d];
+        }
+    if (ncomp > 1)
+        {
+        shape.push_back(ncomp);
+        strides.push_back(sizeof(double));
+        }
+
+    // copy into a C-ordered array
+    pybind11::array_t<double> strided(shape, strides, avg.data());
+    return pybind11::array_t<double, pybind11::array::c_style | pybind11::array::forcecast>(strided);
+    }
+
+/*!
+ * \param writer GSD writer to connect to
+ * \param name Prefix of the chunk names
+ */
+void mpcd::CellFieldAnalyzer::connectGSDStateSignal(std::shared_ptr<::GSDDumpWriter> writer, std::string name)
+    {
+    typedef hoomd::detail::SharedSignalSlot<int(gsd_handle&)> SlotType;
+    auto func = std::bind(&mpcd::CellFieldAnalyzer::slotWriteGSDState, this, std::placeholders::_1, name);
+    std::shared_ptr<hoomd::detail::SignalSlot> pslot( new SlotType(writer->getWriteSignal(), func));
+    m_slots.push_back(pslot);
+    }
+
+/*!
+ * \param handle Handle to the GSD file
+ * \param name Prefix of the chunk names
+ * \returns Non-zero if writing a chunk failed
+ *
+ * The fields are written with one row per bin, with x varying fastest:
+ *  - name/bins: Number of bins along each axis (uint32, 3)
+ *  - name/samples: Number of samples in the averages (uint32)
+ *  - name/density: Average density (double, nbins)
+ *  - name/velocity: Average velocity (double, nbins x 3)
+ *  - name/temperature: Average temperature (double, nbins), if it is averaged
+ *
+ * This method must be called on all ranks.
+ */
+int mpcd::CellFieldAnalyzer::slotWriteGSDState(gsd_handle& handle, std::string name)
+    {
+    m_exec_conf->msg->notice(10) << "MPCD CellFieldAnalyzer writing to GSD File to name: " << name << std::endl;
+
+    unsigned int ncomp;
+    std::vector<double> density = computeAverage("density", ncomp);
+    std::vector<double> velocity = computeAverage("velocity", ncomp);
+    std::vector<double> temperature;
+    if (m_temperature)
+        temperature = computeAverage("temperature", ncomp);
+
+    int retval = 0;
+    if (m_exec_conf->isRoot())
+        {
+        const unsigned int nbins = m_bins.x * m_bins.y * m_bins.z;
+        uint32_t bins[3] = {m_bins.x, m_bins.y, m_bins.z};
+        uint32_t samples = m_num_samples;
+        retval |= gsd_write_chunk(&handle, (name + "bins").c_str(), GSD_TYPE_UINT32, 3, 1, 0, (void *)bins);
+        retval |= gsd_write_chunk(&handle, (name + "samples").c_str(), GSD_TYPE_UINT32, 1, 1, 0, (void *)&samples);
+        retval |= gsd_write_chunk(&handle, (name + "density").c_str(), GSD_TYPE_DOUBLE, nbins, 1, 0, (void *)&density[0]);
+        retval |= gsd_write_chunk(&handle, (name + "velocity").c_str(), GSD_TYPE_DOUBLE, nbins, 3, 0, (void *)&velocity[0]);
+        if (m_temperature)
+            retval |= gsd_write_chunk(&handle, (name + "temperature").c_str(), GSD_TYPE_DOUBLE, nbins, 1, 0, (void *)&temperature[0]);
+        }
+
+    if (retval != 0)
+        {
+        m_exec_conf->msg->error() << "mpcd: error writing MPCD cell fields to GSD file" << std::endl;
+        throw std::runtime_error("Error writing GSD file");
+        }
+    return retval;
+    }
+
+/*!
+ * \param m Python module to export to
+ */
+void mpcd::detail::export_CellFieldAnalyzer(pybind11::module& m)
+    {
+    namespace py = pybind11;
+    py::class_<mpcd::CellFieldAnalyzer, std::shared_ptr<mpcd::CellFieldAnalyzer> >(m, "CellFieldAnalyzer", py::base<Analyzer>())
+        .def(py::init< std::shared_ptr<mpcd::SystemData>, std::shared_ptr<mpcd::CellThermoCompute>, bool, bool, bool, bool >())
+        .def("reset", &mpcd::CellFieldAnalyzer::reset)
+        .def_property_readonly("num_samples", &mpcd::CellFieldAnalyzer::getNumSamples)
+        .def("getField", &mpcd::CellFieldAnalyzer::getField)
+        .def("connectGSDStateSignal", &mpcd::CellFieldAnalyzer::connectGSDStateSignal)
+        ;
+    }
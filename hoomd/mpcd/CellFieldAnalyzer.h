@@ -0,0 +1,138 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+// Maintainer: mphoward
+
+/*!
+ * \file mpcd/CellFieldAnalyzer.h
+ * \brief Declaration of mpcd::CellFieldAnalyzer
+ */
+
+#ifndef MPCD_CELL_FIELD_ANALYZER_H_
+#define MPCD_CELL_FIELD_ANALYZER_H_
+
+#ifdef NVCC
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "CellThermoCompute.h"
+#include "SystemData.h"
+
+#include "hoomd/Analyzer.h"
+#include "hoomd/GSDDumpWriter.h"
+#include "hoomd/SharedSignal.h"
+#include "hoomd/extern/gsd.h"
+#include "hoomd/extern/pybind/include/pybind11/pybind11.h"
+#include "hoomd/extern/pybind/include/pybind11/numpy.h"
+
+#include <vector>
+
+namespace mpcd
+{
+
+//! Time-averaged fields of the MPCD cell properties
+/*!
+ * The CellFieldAnalyzer samples the cell velocities and masses (and optionally the cell
+ * temperatures) computed by the mpcd::CellThermoCompute each time analyze() is called.
+ * The cells are accumulated into bins of the global cell grid. Each axis of the grid is
+ * either kept, giving one bin per cell along that axis, or reduced, giving a single bin.
+ * Keeping all axes accumulates the full 3D field, while keeping one or two axes accumulates
+ * 1D or 2D profiles.
+ *
+ * Each rank accumulates its own cells in place, skipping the cells it shares with its
+ * neighbors along the east, north, and up faces so that every cell is counted once.
+ * The sums are only reduced onto the root rank when the averaged fields are requested,
+ * so sampling requires no communication beyond the cell thermo itself.
+ *
+ * The averaged quantities in each bin are:
+ *  - density: mass per volume, averaged over the samples
+ *  - velocity: mass-weighted average velocity
+ *  - temperature: average of the kinetic temperature of the cells having more than one particle
+ *
+ * The cell grid is shifted during collisions, so the sampled cells are offset from the
+ * box by at most half a cell, which smooths the fields slightly.
+ */
+class PYBIND11_EXPORT CellFieldAnalyzer : public Analyzer
+    {
+    public:
+        //! Constructor
+        CellFieldAnalyzer(std::shared_ptr<mpcd::SystemData> sysdata,
+                          std::shared_ptr<mpcd::CellThermoCompute> thermo,
+                          bool keep_x,
+                          bool keep_y,
+                          bool keep_z,
+                          bool temperature);
+
+        //! Destructor
+        virtual ~CellFieldAnalyzer();
+
+        //! Sample the cell properties
+        virtual void analyze(unsigned int timestep);
+
+        //! Reset the accumulated averages
+        void reset();
+
+        //! Get the number of samples in the averages
+        unsigned int getNumSamples() const
+            {
+            return m_num_samples;
+            }
+
+        //! Get an averaged field on the root rank
+        pybind11::array getField(const std::string& quantity);
+
+        //! Connect to a GSD writer
+        void connectGSDStateSignal(std::shared_ptr<::GSDDumpWriter> writer, std::string name);
+
+        //! Write the averaged fields into the current frame
+        int slotWriteGSDState(gsd_handle& handle, std::string name);
+
+        //! Get the requested thermo flags
+        mpcd::detail::ThermoFlags getRequestedThermoFlags() const
+            {
+            mpcd::detail::ThermoFlags flags;
+            if (m_temperature)
+                flags[mpcd::detail::thermo_options::energy] = 1;
+            return flags;
+            }
+
+    protected:
+        std::shared_ptr<mpcd::SystemData> m_mpcd_sys;           //!< MPCD system data
+        std::shared_ptr<mpcd::CellList> m_cl;                   //!< MPCD cell list
+        std::shared_ptr<mpcd::CellThermoCompute> m_thermo;      //!< Cell thermo compute
+
+        bool m_keep[3];             //!< Flags for the axes kept in the bins
+        bool m_temperature;         //!< Flag to accumulate the temperature
+        uint3 m_global_dim;         //!< Global cell dimensions when sampling began
+        uint3 m_bins;               //!< Number of bins along each axis
+        unsigned int m_num_samples; //!< Number of samples accumulated
+
+        std::vector<double> m_mass;         //!< Accumulated mass in each bin
+        std::vector<double3> m_momentum;    //!< Accumulated momentum in each bin
+        std::vector<double> m_temp;         //!< Accumulated cell temperature in each bin
+        std::vector<double> m_temp_cells;   //!< Number of cells accumulated into the temperature
+
+        bool m_needs_reduce;                    //!< Flag if the sums need to be reduced again
+        std::vector<double> m_reduced;          //!< Reduced sums on the root rank (6 per bin)
+
+        std::vector< std::shared_ptr<hoomd::detail::SignalSlot> > m_slots; //!< Connections to the GSD writers
+
+        //! Size the bins from the current cell list
+        void setupBins();
+
+        //! Reduce the accumulated sums onto the root rank
+        void reduce();
+
+        //! Compute the averages of a quantity on the root rank
+        std::vector<double> computeAverage(const std::string& quantity, unsigned int& ncomp);
+    };
+
+namespace detail
+{
+//! Export mpcd::CellFieldAnalyzer to python
+void export_CellFieldAnalyzer(pybind11::module& m);
+} // end namespace detail
+
+} // end namespace mpcd
+
+#endif // MPCD_CELL_FIELD_ANALYZER_H_
@@ -18,8 +18,9 @@
 mpcd::CellList::CellList(std::shared_ptr<SystemDefinition> sysdef,
                          std::shared_ptr<mpcd::ParticleData> mpcd_pdata)
         : Compute(sysdef), m_mpcd_pdata(mpcd_pdata),
-          m_cell_size(1.0), m_cell_np_max(4), m_cell_np(m_exec_conf), m_cell_list(m_exec_conf),
-          m_embed_cell_ids(m_exec_conf), m_conditions(m_exec_conf), m_needs_compute_dim(true),
+          m_cell_size(1.0), m_cell_np_max(4), m_cell_np(m_exec_conf), m_cell_offsets(m_exec_conf),
+          m_cell_list(m_exec_conf),
+          m_embed_cell_ids(m_exec_conf), m_conditions(m_exec_conf), m_compact(true), m_needs_compute_dim(true),
           m_particles_sorted(false), m_virtual_change(false)
     {
     assert(m_mpcd_pdata);
@@ -124,12 +125,32 @@ void mpcd::CellList::compute(unsigned int timestep)
     if (m_prof) m_prof->pop(m_exec_conf);
     }
 
+/*!
+ * In the compact (CSR) layout, only the per-cell offsets depend on the number
+ * of cells. The list of members is sized to the number of binned particles when
+ * it is built. In the padded layout, each cell is given getNmax() slots and the
+ * offsets are set to the start of each slot.
+ */
 void mpcd::CellList::reallocate()
     {
+    m_cell_offsets.resize(m_cell_indexer.getNumElements());
+    if (m_compact)
+        {
+        m_exec_conf->msg->notice(6) << "Allocating MPCD cell list offsets for "
+                                    << m_cell_indexer.getNumElements() << " cells." << std::endl;
+        return;
+        }
+
     m_exec_conf->msg->notice(6) << "Allocating MPCD cell list, " << m_cell_np_max
                                 << " particles in " << m_cell_indexer.getNumElements() << " cells." << std::endl;
     m_cell_list_indexer = Index2D(m_cell_np_max, m_cell_indexer.getNumElements());
     m_cell_list.resize(m_cell_list_indexer.getNumElements());
+
+    ArrayHandle<unsigned int> h_cell_offsets(m_cell_offsets, access_location::host, access_mode::overwrite);
+    for (unsigned int cur_cell = 0; cur_cell < m_cell_indexer.getNumElements(); ++cur_cell)
+        {
+        h_cell_offsets.data[cur_cell] = m_cell_list_indexer(0, cur_cell);
+        }
     }
 
 void mpcd::CellList::updateGlobalBox()
@@ -492,15 +513,32 @@ bool mpcd::CellList::isCommunicating(mpcd::detail::face dir)
 #endif // ENABLE_MPI
 
 /*!
- * \param timestep Current simulation timestep
+ * The compact cell list is built in three passes. Particles are first binned and
+ * the number of particles in each cell is counted. An exclusive prefix sum of the
+ * counts gives the offset of each cell, and the particles are then filled
+ * into their cells in order of their index. The resulting list is compact and
+ * never needs to be regrown because of a crowded cell.
+ *
+ * The padded cell list is filled while binning, and the largest occupancy is
+ * flagged when a cell overflows its slots so that the list can be regrown.
  */
 void mpcd::CellList::buildCellList()
     {
     const BoxDim& box = m_pdata->getBox();
     const uchar3 periodic = box.getPeriodic();
 
+    unsigned int N_mpcd = m_mpcd_pdata->getN() + m_mpcd_pdata->getNVirtual();
+    unsigned int N_tot = N_mpcd;
+    if (m_embed_group)
+        N_tot += m_embed_group->getNumMembers();
+
+    // the compact list holds exactly one entry per particle
+    if (m_compact && m_cell_list.size() < N_tot)
+        m_cell_list.resize(N_tot);
+
     ArrayHandle<unsigned int> h_cell_list(m_cell_list, access_location::host, access_mode::overwrite);
     ArrayHandle<unsigned int> h_cell_np(m_cell_np, access_location::host, access_mode::overwrite);
+    ArrayHandle<unsigned int> h_cell_offsets(m_cell_offsets, access_location::host, access_mode::overwrite);
     // zero the cell counter
     memset(h_cell_np.data, 0, sizeof(unsigned int) * m_cell_indexer.getNumElements());
 
@@ -508,8 +546,6 @@ void mpcd::CellList::buildCellList()
 
     ArrayHandle<Scalar4> h_pos(m_mpcd_pdata->getPositions(), access_location::host, access_mode::read);
     ArrayHandle<Scalar4> h_vel(m_mpcd_pdata->getVelocities(), access_location::host, access_mode::readwrite);
-    unsigned int N_mpcd = m_mpcd_pdata->getN() + m_mpcd_pdata->getNVirtual();
-    unsigned int N_tot = N_mpcd;
 
     // we can't modify the velocity of embedded particles, so we only read their position
     std::unique_ptr< ArrayHandle<unsigned int> > h_embed_cell_ids;
@@ -520,7 +556,6 @@ void mpcd::CellList::buildCellList()
         h_embed_cell_ids.reset(new ArrayHandle<unsigned int>(m_embed_cell_ids, access_location::host, access_mode::overwrite));
         h_pos_embed.reset(new ArrayHandle<Scalar4>(m_pdata->getPositions(), access_location::host, access_mode::read));
         h_embed_member_idx.reset(new ArrayHandle<unsigned int>(m_embed_group->getIndexArray(), access_location::host, access_mode::read));
-        N_tot += m_embed_group->getNumMembers();
         }
 
     // total effective number of cells in the global box, optionally padded by
@@ -534,6 +569,7 @@ void mpcd::CellList::buildCellList()
 
     const Scalar3 global_lo = m_pdata->getGlobalBox().getLo();
 
+    // first pass: bin the particles and count the number in each cell
     for (unsigned int cur_p = 0; cur_p < N_tot; ++cur_p)
         {
         Scalar4 postype_i;
@@ -547,67 +583,70 @@ void mpcd::CellList::buildCellList()
             }
         Scalar3 pos_i = make_scalar3(postype_i.x, postype_i.y, postype_i.z);
 
+        // particles that cannot be binned are flagged with an invalid cell and skipped when filling
+        unsigned int bin_idx = 0xffffffff;
         if (std::isnan(pos_i.x) || std::isnan(pos_i.y) || std::isnan(pos_i.z))
             {
             conditions.y = cur_p + 1;
-            continue;
-            }
-
-        // bin particle assuming orthorhombic box (already validated)
-        const Scalar3 delta = (pos_i - m_grid_shift) - global_lo;
-        int3 global_bin = make_int3(std::floor(delta.x / m_cell_size),
-                                    std::floor(delta.y / m_cell_size),
-                                    std::floor(delta.z / m_cell_size));
-
-        // wrap cell back through the boundaries (grid shifting may send +/- 1 outside of range)
-        // this is done using periodic from the "local" box, since this will be periodic
-        // only when there is one rank along the dimension
-        if (periodic.x)
-            {
-            if (global_bin.x == (int)n_global_cells.x)
-                global_bin.x = 0;
-            else if (global_bin.x == -1)
-                global_bin.x = n_global_cells.x - 1;
             }
-        if (periodic.y)
-            {
-            if (global_bin.y == (int)n_global_cells.y)
-                global_bin.y = 0;
-            else if (global_bin.y == -1)
-                global_bin.y = n_global_cells.y - 1;
-            }
-        if (periodic.z)
+        else
             {
-            if (global_bin.z == (int)n_global_cells.z)
-                global_bin.z = 0;
-            else if (global_bin.z == -1)
-                global_bin.z = n_global_cells.z - 1;
-            }
-
-        // compute the local cell
-        int3 bin = make_int3(global_bin.x - m_origin_idx.x,
-                             global_bin.y - m_origin_idx.y,
-                             global_bin.z - m_origin_idx.z);
+            // bin particle assuming orthorhombic box (already validated)
+            const Scalar3 delta = (pos_i - m_grid_shift) - global_lo;
+            int3 global_bin = make_int3(std::floor(delta.x / m_cell_size),
+                                        std::floor(delta.y / m_cell_size),
+                                        std::floor(delta.z / m_cell_size));
+
+            // wrap cell back through the boundaries (grid shifting may send +/- 1 outside of range)
+            // this is done using periodic from the "local" box, since this will be periodic
+            // only when there is one rank along the dimension
+            if (periodic.x)
+                {
+                if (global_bin.x == (int)n_global_cells.x)
+                    global_bin.x = 0;
+                else if (global_bin.x == -1)
+                    global_bin.x = n_global_cells.x - 1;
+                }
+            if (periodic.y)
+                {
+                if (global_bin.y == (int)n_global_cells.y)
+                    global_bin.y = 0;
+                else if (global_bin.y == -1)
+                    global_bin.y = n_global_cells.y - 1;
+                }
+            if (periodic.z)
+                {
+                if (global_bin.z == (int)n_global_cells.z)
+                    global_bin.z = 0;
+                else if (global_bin.z == -1)
+                    global_bin.z = n_global_cells.z - 1;
+                }
 
-        // validate and make sure no particles blew out of the box
-        if ((bin.x < 0 || bin.x >= (int)m_cell_dim.x) ||
-            (bin.y < 0 || bin.y >= (int)m_cell_dim.y) ||
-            (bin.z < 0 || bin.z >= (int)m_cell_dim.z))
-            {
-            conditions.z = cur_p + 1;
-            continue;
-            }
+            // compute the local cell
+            int3 bin = make_int3(global_bin.x - m_origin_idx.x,
+                                 global_bin.y - m_origin_idx.y,
+                                 global_bin.z - m_origin_idx.z);
 
-        unsigned int bin_idx = m_cell_indexer(bin.x, bin.y, bin.z);
-        unsigned int offset = h_cell_np.data[bin_idx];
-        if (offset < m_cell_np_max)
-            {
-            h_cell_list.data[m_cell_list_indexer(offset, bin_idx)] = cur_p;
-            }
-        else
-            {
-            // overflow
-            conditions.x = std::max(conditions.x, offset+1);
+            // validate and make sure no particles blew out of the box
+            if ((bin.x < 0 || bin.x >= (int)m_cell_dim.x) ||
+                (bin.y < 0 || bin.y >= (int)m_cell_dim.y) ||
+                (bin.z < 0 || bin.z >= (int)m_cell_dim.z))
+                {
+                conditions.z = cur_p + 1;
+                }
+            else
+                {
+                bin_idx = m_cell_indexer(bin.x, bin.y, bin.z);
+                if (!m_compact)
+                    {
+                    const unsigned int offset = h_cell_np.data[bin_idx];
+                    if (offset < m_cell_np_max)
+                        h_cell_list.data[m_cell_list_indexer(offset, bin_idx)] = cur_p;
+                    else
+                        conditions.x = std::max(conditions.x, offset+1);
+                    }
+                ++h_cell_np.data[bin_idx];
+                }
             }
 
         // stash the current particle bin into the velocity array
@@ -619,8 +658,38 @@ void mpcd::CellList::buildCellList()
             {
             h_embed_cell_ids->data[cur_p - N_mpcd] = bin_idx;
             }
+        }
+
+    // the padded list is complete after binning
+    if (!m_compact)
+        {
+        m_conditions.resetFlags(conditions);
+        return;
+        }
+
+    // second pass: exclusive prefix sum of the counts gives the first entry of each cell
+    unsigned int max_np = 0;
+    unsigned int offset = 0;
+    for (unsigned int cur_cell = 0; cur_cell < m_cell_indexer.getNumElements(); ++cur_cell)
+        {
+        const unsigned int np = h_cell_np.data[cur_cell];
+        h_cell_offsets.data[cur_cell] = offset;
+        offset += np;
+        if (np > max_np) max_np = np;
+
+        // reset the counter so that it can be used to fill the cells
+        h_cell_np.data[cur_cell] = 0;
+        }
+    m_cell_np_max = max_np;
+
+    // third pass: fill the particles into their cells, which restores the counts
+    for (unsigned int cur_p = 0; cur_p < N_tot; ++cur_p)
+        {
+        const unsigned int bin_idx = (cur_p < N_mpcd) ? __scalar_as_int(h_vel.data[cur_p].w)
+                                                      : h_embed_cell_ids->data[cur_p - N_mpcd];
+        if (bin_idx == 0xffffffff) continue;
 
-        // increment the counter always
+        h_cell_list.data[h_cell_offsets.data[bin_idx] + h_cell_np.data[bin_idx]] = cur_p;
         ++h_cell_np.data[bin_idx];
         }
 
@@ -652,15 +721,17 @@ void mpcd::CellList::sort(unsigned int timestep,
     // iterate through particles in cell list, and update their indexes using reverse mapping
     ArrayHandle<unsigned int> h_rorder(rorder, access_location::host, access_mode::read);
     ArrayHandle<unsigned int> h_cell_np(m_cell_np, access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_cell_offsets(m_cell_offsets, access_location::host, access_mode::read);
     ArrayHandle<unsigned int> h_cell_list(m_cell_list, access_location::host, access_mode::readwrite);
     const unsigned int N_mpcd = m_mpcd_pdata->getN();
 
     for (unsigned int idx=0; idx < getNCells(); ++idx)
         {
         const unsigned int np = h_cell_np.data[idx];
+        const unsigned int first = h_cell_offsets.data[idx];
         for (unsigned int offset = 0; offset < np; ++offset)
             {
-            const unsigned int cl_idx = m_cell_list_indexer(offset,idx);
+            const unsigned int cl_idx = first + offset;
             const unsigned int pid = h_cell_list.data[cl_idx];
             // only update indexes of MPCD particles, not virtual or embedded particles
             if (pid < N_mpcd)
@@ -858,6 +929,8 @@ void mpcd::detail::export_CellList(pybind11::module& m)
     py::class_<mpcd::CellList, std::shared_ptr<mpcd::CellList> >(m, "CellList", py::base<Compute>())
         .def(py::init< std::shared_ptr<SystemDefinition>, std::shared_ptr<mpcd::ParticleData> >())
         .def_property("cell_size", &mpcd::CellList::getCellSize, &mpcd::CellList::setCellSize)
+        .def_property("compact", &mpcd::CellList::getCompact, &mpcd::CellList::setCompact)
+        .def("getCellListSize", &mpcd::CellList::getCellListSize)
         .def("setEmbeddedGroup", &mpcd::CellList::setEmbeddedGroup)
         .def("removeEmbeddedGroup", &mpcd::CellList::removeEmbeddedGroup)
         ;
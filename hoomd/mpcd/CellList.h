@@ -53,12 +53,31 @@ class PYBIND11_EXPORT CellList : public Compute
             return m_cell_list;
             }
 
+        //! Get the number of entries allocated for the cell list
+        unsigned int getCellListSize() const
+            {
+            return m_cell_list.getNumElements();
+            }
+
         //! Get the number of particles per cell
         const GPUArray<unsigned int>& getCellSizeArray() const
             {
             return m_cell_np;
             }
 
+        //! Get the index of the first cell list entry of each cell
+        /*!
+         * The members of cell \a c are stored contiguously in getCellList() from
+         * entry \a offsets[c] up to (but not including) \a offsets[c] + \a np[c].
+         * On the CPU, the cell list is compact (CSR) by default and contains exactly one
+         * entry per binned particle. The GPU cell list, and the CPU cell list when
+         * setCompact() is false, use fixed-width slots of getNmax() entries.
+         */
+        const GPUArray<unsigned int>& getCellOffsets() const
+            {
+            return m_cell_offsets;
+            }
+
         //! Get the total number of cells in the list
         const unsigned int getNCells() const
             {
@@ -78,6 +97,10 @@ class PYBIND11_EXPORT CellList : public Compute
             }
 
         //! Get the cell list indexer
+        /*!
+         * \note The indexer is only valid for the padded layout.
+         *       Use getCellOffsets() to access the cell list independent of the layout.
+         */
         const Index2D& getCellListIndexer() const
             {
             return m_cell_list_indexer;
@@ -110,11 +133,35 @@ class PYBIND11_EXPORT CellList : public Compute
         const int3 wrapGlobalCell(const int3& cell) const;
 
         //! Get the maximum number of particles in a cell
+        /*!
+         * For the padded layout, this is the number of slots per cell. For the
+         * compact layout, this is the largest cell occupancy of the last build.
+         */
         const unsigned int getNmax() const
             {
             return m_cell_np_max;
             }
 
+        //! Set the layout of the CPU cell list
+        /*!
+         * \param compact If true, use the compact (CSR) layout. If false, use
+         *        fixed-width slots of getNmax() entries per cell, which are regrown
+         *        when a cell overflows.
+         * \note Calling forces a resize of the cell list on the next update. The
+         *       GPU cell list always uses the padded layout.
+         */
+        void setCompact(bool compact)
+            {
+            m_compact = compact;
+            m_needs_compute_dim = true;
+            }
+
+        //! Get the layout of the CPU cell list
+        bool getCompact() const
+            {
+            return m_compact;
+            }
+
         //! Set the MPCD cell size
         /*!
          * \param cell_size Grid spacing
@@ -179,6 +226,13 @@ class PYBIND11_EXPORT CellList : public Compute
             }
 
         //! Set the grid shift vector
+        /*!
+         * \param shift Grid shift vector
+         *
+         * If \a shift differs from the current grid shift, the cell list is rebuilt on the
+         * next call to compute(), even if it was already computed at that timestep, and
+         * subscribers to getGridShiftSignal() are notified.
+         */
         void setGridShift(const Scalar3& shift)
             {
             if (std::fabs(shift.x) > m_max_grid_shift ||
@@ -191,7 +245,12 @@ class PYBIND11_EXPORT CellList : public Compute
                 throw std::runtime_error("Error setting MPCD grid shift");
                 }
 
-            m_grid_shift = shift;
+            if (shift.x != m_grid_shift.x || shift.y != m_grid_shift.y || shift.z != m_grid_shift.z)
+                {
+                m_grid_shift = shift;
+                m_force_compute = true;
+                m_shift_signal.emit();
+                }
             }
 
         // Get the grid shift vector
@@ -237,6 +296,16 @@ class PYBIND11_EXPORT CellList : public Compute
             return m_dim_signal;
             }
 
+        //! Get the signal for the grid shift changing
+        /*!
+         * \returns A signal that subscribers can attach to be notified that the
+         *          grid shift has changed, and so any cell properties need to be recomputed.
+         */
+        Nano::Signal<void ()>& getGridShiftSignal()
+            {
+            return m_shift_signal;
+            }
+
     protected:
         std::shared_ptr<mpcd::ParticleData> m_mpcd_pdata;   //!< MPCD particle data
         std::shared_ptr<ParticleGroup> m_embed_group;     //!< Embedded particles
@@ -255,9 +324,11 @@ class PYBIND11_EXPORT CellList : public Compute
         Index2D m_cell_list_indexer;                //!< Indexer into cell list members
         unsigned int m_cell_np_max;                 //!< Maximum number of particles per cell
         GPUVector<unsigned int> m_cell_np;          //!< Number of particles per cell
+        GPUVector<unsigned int> m_cell_offsets;     //!< First cell list entry of each cell
         GPUVector<unsigned int> m_cell_list;        //!< Cell list of particles
         GPUVector<unsigned int> m_embed_cell_ids;   //!< Cell ids of the embedded particles
         GPUFlags<uint3> m_conditions;               //!< Detect conditions that might fail building cell list
+        bool m_compact;                             //!< True if the CPU cell list uses the compact layout
 
         int3 m_origin_idx;                  //!< Origin as a global index
 
@@ -293,6 +364,7 @@ class PYBIND11_EXPORT CellList : public Compute
             }
 
         Nano::Signal<void ()> m_dim_signal; //!< Signal for dimensions changing
+        Nano::Signal<void ()> m_shift_signal;   //!< Signal for the grid shift changing
         //! Notify subscribers that dimensions have changed
         void notifySizeChange()
             {
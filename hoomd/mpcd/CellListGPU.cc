@@ -30,6 +30,27 @@ mpcd::CellListGPU::~CellListGPU()
     {
     }
 
+/*!
+ * The GPU builds the cell list with one thread per particle, so each cell is
+ * given a fixed number of slots that is increased when a cell overflows. The
+ * per-cell offsets are set to the start of each slot so that the cell list can
+ * be accessed in the same way as the compact CPU layout.
+ */
+void mpcd::CellListGPU::reallocate()
+    {
+    m_exec_conf->msg->notice(6) << "Allocating MPCD cell list, " << m_cell_np_max
+                                << " particles in " << m_cell_indexer.getNumElements() << " cells." << std::endl;
+    m_cell_list_indexer = Index2D(m_cell_np_max, m_cell_indexer.getNumElements());
+    m_cell_list.resize(m_cell_list_indexer.getNumElements());
+
+    m_cell_offsets.resize(m_cell_indexer.getNumElements());
+    ArrayHandle<unsigned int> h_cell_offsets(m_cell_offsets, access_location::host, access_mode::overwrite);
+    for (unsigned int cur_cell = 0; cur_cell < m_cell_indexer.getNumElements(); ++cur_cell)
+        {
+        h_cell_offsets.data[cur_cell] = m_cell_list_indexer(0, cur_cell);
+        }
+    }
+
 void mpcd::CellListGPU::buildCellList()
     {
     ArrayHandle<unsigned int> d_cell_list(m_cell_list, access_location::device, access_mode::overwrite);
@@ -48,6 +48,9 @@ class PYBIND11_EXPORT CellListGPU : public mpcd::CellList
             }
 
     protected:
+        //! Allocates the padded cell list used on the GPU
+        virtual void reallocate();
+
         //! Compute the cell list of particles on the GPU
         virtual void buildCellList();
 
@@ -11,6 +11,10 @@
 #include "CellThermoCompute.h"
 #include "ReductionOperators.h"
 
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif // ENABLE_TBB
+
 /*!
  * \param sysdata MPCD system data
  * \param suffix Suffix for logged quantities
@@ -45,12 +49,16 @@ mpcd::CellThermoCompute::CellThermoCompute(std::shared_ptr<mpcd::SystemData> sys
 
     // the thermo properties need to be recomputed if the virtual particles change
     m_mpcd_pdata->getNumVirtualSignal().connect<mpcd::CellThermoCompute, &mpcd::CellThermoCompute::slotNumVirtual>(this);
+
+    // the thermo properties also need to be recomputed if the grid is shifted
+    m_cl->getGridShiftSignal().connect<mpcd::CellThermoCompute, &mpcd::CellThermoCompute::slotGridShift>(this);
     }
 
 mpcd::CellThermoCompute::~CellThermoCompute()
     {
     m_exec_conf->msg->notice(5) << "Destroying MPCD CellThermoCompute" << std::endl;
     m_mpcd_pdata->getNumVirtualSignal().disconnect<mpcd::CellThermoCompute, &mpcd::CellThermoCompute::slotNumVirtual>(this);
+    m_cl->getGridShiftSignal().disconnect<mpcd::CellThermoCompute, &mpcd::CellThermoCompute::slotGridShift>(this);
     }
 
 void mpcd::CellThermoCompute::compute(unsigned int timestep)
@@ -139,7 +147,7 @@ struct CellPropertySum
     /*!
      * \param cell_list_ Cell list
      * \param cell_np_ Number of particles per cell
-     * \param cli_ Cell list indexer
+     * \param cell_offsets_ First cell list entry of each cell
      * \param vel_ MPCD particle velocities
      * \param mass_ MPCD mass
      * \param embed_vel_ Embedded particle velocities
@@ -148,13 +156,13 @@ struct CellPropertySum
      */
     CellPropertySum(const unsigned int *cell_list_,
                     const unsigned int *cell_np_,
-                    const Index2D& cli_,
+                    const unsigned int *cell_offsets_,
                     const Scalar4 *vel_,
                     const Scalar mass_,
                     const Scalar4 *embed_vel_,
                     const unsigned int *embed_idx_,
                     const unsigned int N_mpcd_)
-        : cell_list(cell_list_), cell_np(cell_np_), cli(cli_), vel(vel_), mass(mass_),
+        : cell_list(cell_list_), cell_np(cell_np_), cell_offsets(cell_offsets_), vel(vel_), mass(mass_),
           embed_vel(embed_vel_), embed_idx(embed_idx_), N_mpcd(N_mpcd_)
         {}
 
@@ -166,16 +174,17 @@ struct CellPropertySum
      * \param cell Index of cell to evaluate
      * \param energy If true, then the kinetic energy is evaluated into \a ke
      */
-    inline void compute(double4& momentum, double& ke, unsigned int& np, const unsigned int cell, const bool energy)
+    inline void compute(double4& momentum, double& ke, unsigned int& np, const unsigned int cell, const bool energy) const
         {
         momentum = make_double4(0.0, 0.0, 0.0, 0.0);
         ke = 0.0;
         np = cell_np[cell];
+        const unsigned int *members = cell_list + cell_offsets[cell];
 
         for (unsigned int offset = 0; offset < np; ++offset)
             {
             // Load particle data
-            const unsigned int cur_p = cell_list[cli(offset, cell)];
+            const unsigned int cur_p = members[offset];
             double3 vel_i;
             double mass_i;
             if (cur_p < N_mpcd)
@@ -205,7 +214,7 @@ struct CellPropertySum
 
     const unsigned int *cell_list;  //!< Cell list
     const unsigned int *cell_np;    //!< Number of particles per cell
-    const Index2D cli;              //!< Cell list indexer
+    const unsigned int *cell_offsets;   //!< First cell list entry of each cell
 
     const Scalar4 *vel;             //!< MPCD particle velocities
     const Scalar mass;              //!< MPCD particle mass
@@ -222,7 +231,7 @@ void mpcd::CellThermoCompute::beginOuterCellProperties()
     // Cell list
     ArrayHandle<unsigned int> h_cell_list(m_cl->getCellList(), access_location::host, access_mode::read);
     ArrayHandle<unsigned int> h_cell_np(m_cl->getCellSizeArray(), access_location::host, access_mode::read);
-    const Index2D& cli = m_cl->getCellListIndexer();
+    ArrayHandle<unsigned int> h_cell_offsets(m_cl->getCellOffsets(), access_location::host, access_mode::read);
 
     // MPCD particle data
     ArrayHandle<Scalar4> h_vel(m_mpcd_pdata->getVelocities(), access_location::host, access_mode::read);
@@ -244,7 +253,7 @@ void mpcd::CellThermoCompute::beginOuterCellProperties()
     ArrayHandle<unsigned int> h_cells(m_vel_comm->getCells(), access_location::host, access_mode::read);
     mpcd::detail::CellPropertySum summer(h_cell_list.data,
                                          h_cell_np.data,
-                                         cli,
+                                         h_cell_offsets.data,
                                          h_vel.data,
                                          mpcd_mass,
                                          (m_cl->getEmbeddedGroup()) ? h_embed_vel->data : NULL,
@@ -312,9 +321,9 @@ void mpcd::CellThermoCompute::finishOuterCellProperties()
 void mpcd::CellThermoCompute::calcInnerCellProperties()
     {
     // Cell list
-    const Index2D& cli = m_cl->getCellListIndexer();
     ArrayHandle<unsigned int> h_cell_list(m_cl->getCellList(), access_location::host, access_mode::read);
     ArrayHandle<unsigned int> h_cell_np(m_cl->getCellSizeArray(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_cell_offsets(m_cl->getCellOffsets(), access_location::host, access_mode::read);
 
     // MPCD particle data
     const unsigned int N_mpcd = m_mpcd_pdata->getN() + m_mpcd_pdata->getNVirtual();
@@ -335,7 +344,7 @@ void mpcd::CellThermoCompute::calcInnerCellProperties()
     ArrayHandle<double3> h_cell_energy(m_cell_energy, access_location::host, access_mode::readwrite);
     mpcd::detail::CellPropertySum summer(h_cell_list.data,
                                          h_cell_np.data,
-                                         cli,
+                                         h_cell_offsets.data,
                                          h_vel.data,
                                          mpcd_mass,
                                          (m_cl->getEmbeddedGroup()) ? h_embed_vel->data : NULL,
@@ -364,42 +373,50 @@ void mpcd::CellThermoCompute::calcInnerCellProperties()
         }
 
     // iterate over all of the inner cells and compute average velocity, energy, temperature
+    // each cell is summed independently, so the cells are split over threads by their flattened index, which
+    // also parallelizes 2D and thin boxes
     const bool need_energy = m_flags[mpcd::detail::thermo_options::energy];
-    for (unsigned int k=lo.z; k < hi.z; ++k)
+    const unsigned int ndim = m_sysdef->getNDimensions();
+    const Index3D inner_ci(hi.x - lo.x, hi.y - lo.y, hi.z - lo.z);
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, inner_ci.getNumElements()),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int inner_cell=r.begin(); inner_cell != r.end(); ++inner_cell)
+    #else
+    for (unsigned int inner_cell=0; inner_cell < inner_ci.getNumElements(); ++inner_cell)
+    #endif // ENABLE_TBB
         {
-        for (unsigned int j=lo.y; j < hi.y; ++j)
-            {
-            for (unsigned int i=lo.x; i < hi.x; ++i)
-                {
-                const unsigned int cur_cell = ci(i,j,k);
+        const uint3 cell = inner_ci.getTriple(inner_cell);
+        const unsigned int cur_cell = ci(lo.x + cell.x, lo.y + cell.y, lo.z + cell.z);
 
-                // compute the cell properties
-                double4 momentum; double ke(0.0); unsigned int np(0);
-                summer.compute(momentum, ke, np, cur_cell, need_energy);
+        // compute the cell properties
+        double4 momentum; double ke(0.0); unsigned int np(0);
+        summer.compute(momentum, ke, np, cur_cell, need_energy);
 
-                const double mass = momentum.w;
-                double3 vel_cm = make_double3(0.0,0.0,0.0);
-                if (mass > 0.)
-                    {
-                    vel_cm.x = momentum.x / mass;
-                    vel_cm.y = momentum.y / mass;
-                    vel_cm.z = momentum.z / mass;
-                    }
+        const double mass = momentum.w;
+        double3 vel_cm = make_double3(0.0,0.0,0.0);
+        if (mass > 0.)
+            {
+            vel_cm.x = momentum.x / mass;
+            vel_cm.y = momentum.y / mass;
+            vel_cm.z = momentum.z / mass;
+            }
 
-                h_cell_vel.data[cur_cell] = make_double4(vel_cm.x, vel_cm.y, vel_cm.z, mass);
-                if (need_energy)
-                    {
-                    double temp(0.0);
-                    if (np > 1)
-                        {
-                        const double ke_cm = 0.5 * mass * (vel_cm.x*vel_cm.x + vel_cm.y*vel_cm.y + vel_cm.z*vel_cm.z);
-                        temp = 2. * (ke - ke_cm) / (m_sysdef->getNDimensions() * (np-1));
-                        }
-                    h_cell_energy.data[cur_cell] = make_double3(ke, temp, __int_as_double(np));
-                    }
-                } // i
-            } //j
-        } // k
+        h_cell_vel.data[cur_cell] = make_double4(vel_cm.x, vel_cm.y, vel_cm.z, mass);
+        if (need_energy)
+            {
+            double temp(0.0);
+            if (np > 1)
+                {
+                const double ke_cm = 0.5 * mass * (vel_cm.x*vel_cm.x + vel_cm.y*vel_cm.y + vel_cm.z*vel_cm.z);
+                temp = 2. * (ke - ke_cm) / (ndim * (np-1));
+                }
+            h_cell_energy.data[cur_cell] = make_double3(ke, temp, __int_as_double(np));
+            }
+        }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
     }
 
 void mpcd::CellThermoCompute::computeNetProperties()
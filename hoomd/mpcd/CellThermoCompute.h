@@ -194,6 +194,17 @@ class PYBIND11_EXPORT CellThermoCompute : public Compute
             {
             m_force_compute = true;
             }
+
+        //! Slot for the cell list grid shift changing
+        /*!
+         * The thermo properties may already have been computed at the current timestep on the old
+         * grid (e.g., by an analyzer that runs before the collision), so they must be recomputed
+         * on the shifted grid.
+         */
+        void slotGridShift()
+            {
+            m_force_compute = true;
+            }
     };
 
 namespace detail
@@ -18,6 +18,10 @@
 #include "StreamingMethod.h"
 #include "hoomd/extern/pybind/include/pybind11/pybind11.h"
 
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif // ENABLE_TBB
+
 namespace mpcd
 {
 
@@ -112,7 +116,15 @@ void ConfinedStreamingMethod<Geometry>::stream(unsigned int timestep)
     // acquire polymorphic pointer to the external field
     const mpcd::ExternalField* field = (m_field) ? m_field->get(access_location::host) : nullptr;
 
-    for (unsigned int cur_p = 0; cur_p < m_mpcd_pdata->getN(); ++cur_p)
+    // particles stream independently, so the loop is split over threads when available
+    const unsigned int N_mpcd = m_mpcd_pdata->getN();
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N_mpcd),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int cur_p = r.begin(); cur_p != r.end(); ++cur_p)
+    #else
+    for (unsigned int cur_p = 0; cur_p < N_mpcd; ++cur_p)
+    #endif // ENABLE_TBB
         {
         const Scalar4 postype = h_pos.data[cur_p];
         Scalar3 pos = make_scalar3(postype.x, postype.y, postype.z);
@@ -148,6 +160,9 @@ void ConfinedStreamingMethod<Geometry>::stream(unsigned int timestep)
         h_pos.data[cur_p] = make_scalar4(pos.x, pos.y, pos.z, __int_as_scalar(type));
         h_vel.data[cur_p] = make_scalar4(vel.x, vel.y, vel.z, __int_as_scalar(mpcd::detail::NO_CELL));
         }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
 
     // particles have moved, so the cell cache is no longer valid
     m_mpcd_pdata->invalidateCellCache();
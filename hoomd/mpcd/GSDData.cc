@@ -0,0 +1,302 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+// Maintainer: mphoward
+
+/*!
+ * \file mpcd/GSDData.cc
+ * \brief Definition of mpcd::GSDWriter and helpers to read MPCD data from GSD files
+ */
+
+#include "GSDData.h"
+
+#ifdef ENABLE_MPI
+#include "hoomd/HOOMDMPI.h"
+#endif // ENABLE_MPI
+
+#include <cstring>
+
+/*!
+ * \param sysdata MPCD system data
+ */
+mpcd::GSDWriter::GSDWriter(std::shared_ptr<mpcd::SystemData> sysdata)
+    : m_sysdata(sysdata),
+      m_exec_conf(sysdata->getSystemDefinition()->getParticleData()->getExecConf()),
+      m_stride(1)
+    {
+    m_exec_conf->msg->notice(5) << "Constructing MPCD GSDWriter" << std::endl;
+    }
+
+mpcd::GSDWriter::~GSDWriter()
+    {
+    m_exec_conf->msg->notice(5) << "Destroying MPCD GSDWriter" << std::endl;
+    for (auto& slot : m_slots)
+        {
+        slot->disconnect();
+        }
+    }
+
+/*!
+ * \param writer GSD writer to connect to
+ * \param name Prefix of the chunk names
+ */
+void mpcd::GSDWriter::connectGSDStateSignal(std::shared_ptr<::GSDDumpWriter> writer, std::string name)
+    {
+    typedef hoomd::detail::SharedSignalSlot<int(gsd_handle&)> SlotType;
+    auto func = std::bind(&mpcd::GSDWriter::slotWriteGSDState, this, std::placeholders::_1, name);
+    std::shared_ptr<hoomd::detail::SignalSlot> pslot( new SlotType(writer->getWriteSignal(), func));
+    m_slots.push_back(pslot);
+    }
+
+/*!
+ * \param handle Handle to the GSD file
+ * \param name Prefix of the chunk names
+ * \returns Non-zero if writing a chunk failed
+ *
+ * This method must be called on all ranks.
+ */
+int mpcd::GSDWriter::slotWriteGSDState(gsd_handle& handle, std::string name) const
+    {
+    m_exec_conf->msg->notice(10) << "MPCD GSDWriter writing to GSD File to name: " << name << std::endl;
+
+    std::shared_ptr<mpcd::ParticleData> mpcd_pdata = m_sysdata->getParticleData();
+    const BoxDim& global_box = m_sysdata->getGlobalBox();
+
+    // select the local particles to write, stored in single precision
+    std::vector<unsigned int> tag;
+    std::vector<float> pos, vel;
+    std::vector<unsigned int> type;
+        {
+        ArrayHandle<Scalar4> h_pos(mpcd_pdata->getPositions(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel(mpcd_pdata->getVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_tag(mpcd_pdata->getTags(), access_location::host, access_mode::read);
+
+        const unsigned int N = mpcd_pdata->getN();
+        const unsigned int n_reserve = (m_stride > 1) ? N / m_stride + 1 : N;
+        tag.reserve(n_reserve); type.reserve(n_reserve);
+        pos.reserve(3*n_reserve); vel.reserve(3*n_reserve);
+        for (unsigned int idx = 0; idx < N; ++idx)
+            {
+            const unsigned int tag_i = h_tag.data[idx];
+            if (tag_i % m_stride != 0) continue;
+
+            const Scalar4 postype = h_pos.data[idx];
+            Scalar3 pos_i = make_scalar3(postype.x, postype.y, postype.z);
+            int3 img = make_int3(0,0,0);
+            global_box.wrap(pos_i, img);
+            const Scalar4 vel_i = h_vel.data[idx];
+
+            tag.push_back(tag_i / m_stride);
+            type.push_back(__scalar_as_int(postype.w));
+            pos.push_back(float(pos_i.x)); pos.push_back(float(pos_i.y)); pos.push_back(float(pos_i.z));
+            vel.push_back(float(vel_i.x)); vel.push_back(float(vel_i.y)); vel.push_back(float(vel_i.z));
+            }
+        }
+
+    const unsigned int N_global = mpcd_pdata->getNGlobal();
+    const unsigned int N_write = (N_global + m_stride - 1) / m_stride;
+
+    // gather the selected particles to the root rank
+    std::vector<unsigned int> all_tag, all_type;
+    std::vector<float> all_pos, all_vel;
+    #ifdef ENABLE_MPI
+    if (m_sysdata->getSystemDefinition()->getParticleData()->getDomainDecomposition())
+        {
+        const MPI_Comm mpi_comm = m_exec_conf->getMPICommunicator();
+        const unsigned int n_ranks = m_exec_conf->getNRanks();
+        const bool root = m_exec_conf->isRoot();
+
+        int n_local = tag.size();
+        std::vector<int> counts(root ? n_ranks : 0), displs(root ? n_ranks : 0);
+        MPI_Gather(&n_local, 1, MPI_INT, counts.data(), 1, MPI_INT, 0, mpi_comm);
+
+        std::vector<int> counts3, displs3;
+        if (root)
+            {
+            int offset = 0;
+            for (unsigned int i = 0; i < n_ranks; ++i)
+                {
+                displs[i] = offset;
+                offset += counts[i];
+                }
+            all_tag.resize(offset); all_type.resize(offset);
+            all_pos.resize(3*offset); all_vel.resize(3*offset);
+
+            counts3.resize(n_ranks); displs3.resize(n_ranks);
+            for (unsigned int i = 0; i < n_ranks; ++i)
+                {
+                counts3[i] = 3*counts[i];
+                displs3[i] = 3*displs[i];
+                }
+            }
+
+        MPI_Gatherv(tag.data(), n_local, MPI_UNSIGNED, all_tag.data(), counts.data(), displs.data(), MPI_UNSIGNED, 0, mpi_comm);
+        MPI_Gatherv(type.data(), n_local, MPI_UNSIGNED, all_type.data(), counts.data(), displs.data(), MPI_UNSIGNED, 0, mpi_comm);
+        MPI_Gatherv(pos.data(), 3*n_local, MPI_FLOAT, all_pos.data(), counts3.data(), displs3.data(), MPI_FLOAT, 0, mpi_comm);
+        MPI_Gatherv(vel.data(), 3*n_local, MPI_FLOAT, all_vel.data(), counts3.data(), displs3.data(), MPI_FLOAT, 0, mpi_comm);
+
+        if (!root) return 0;
+        }
+    else
+    #endif // ENABLE_MPI
+        {
+        all_tag.swap(tag);
+        all_type.swap(type);
+        all_pos.swap(pos);
+        all_vel.swap(vel);
+        }
+
+    // put the particles in tag order
+    std::vector<float> out_pos(3*N_write), out_vel(3*N_write);
+    std::vector<uint32_t> out_type(N_write);
+    for (unsigned int i = 0; i < all_tag.size(); ++i)
+        {
+        const unsigned int out_idx = all_tag[i];
+        if (out_idx >= N_write)
+            {
+            m_exec_conf->msg->error() << "mpcd: MPCD particle tags are not contiguous, cannot write GSD file" << std::endl;
+            throw std::runtime_error("Error writing GSD file");
+            }
+        std::copy(&all_pos[3*i], &all_pos[3*i] + 3, &out_pos[3*out_idx]);
+        std::copy(&all_vel[3*i], &all_vel[3*i] + 3, &out_vel[3*out_idx]);
+        out_type[out_idx] = all_type[i];
+        }
+
+    // type names are stored as null terminated strings of the same length
+    const std::vector<std::string>& type_mapping = mpcd_pdata->getTypeNames();
+    unsigned int max_len = 0;
+    for (const auto& type_name : type_mapping)
+        max_len = std::max(max_len, (unsigned int)type_name.size());
+    max_len += 1;
+    std::vector<char> types(max_len * type_mapping.size(), 0);
+    for (unsigned int i = 0; i < type_mapping.size(); ++i)
+        strncpy(&types[max_len*i], type_mapping[i].c_str(), max_len);
+
+    const uint32_t N_out = N_write;
+    const uint32_t stride = m_stride;
+    const float mass = mpcd_pdata->getMass();
+
+    int retval = 0;
+    retval |= gsd_write_chunk(&handle, (name + "N").c_str(), GSD_TYPE_UINT32, 1, 1, 0, (void *)&N_out);
+    retval |= gsd_write_chunk(&handle, (name + "stride").c_str(), GSD_TYPE_UINT32, 1, 1, 0, (void *)&stride);
+    retval |= gsd_write_chunk(&handle, (name + "types").c_str(), GSD_TYPE_UINT8, type_mapping.size(), max_len, 0, (void *)&types[0]);
+    retval |= gsd_write_chunk(&handle, (name + "mass").c_str(), GSD_TYPE_FLOAT, 1, 1, 0, (void *)&mass);
+    if (N_out > 0)
+        {
+        retval |= gsd_write_chunk(&handle, (name + "position").c_str(), GSD_TYPE_FLOAT, N_out, 3, 0, (void *)&out_pos[0]);
+        retval |= gsd_write_chunk(&handle, (name + "velocity").c_str(), GSD_TYPE_FLOAT, N_out, 3, 0, (void *)&out_vel[0]);
+        retval |= gsd_write_chunk(&handle, (name + "typeid").c_str(), GSD_TYPE_UINT32, N_out, 1, 0, (void *)&out_type[0]);
+        }
+
+    if (retval != 0)
+        {
+        m_exec_conf->msg->error() << "mpcd: error writing MPCD particles to GSD file" << std::endl;
+        throw std::runtime_error("Error writing GSD file");
+        }
+    return retval;
+    }
+
+/*!
+ * \param reader GSD reader for the frame to read
+ * \param snapshot MPCD system snapshot to fill
+ * \param name Prefix of the chunk names
+ * \returns True if MPCD particles were found in the frame
+ *
+ * The particles are read on the root rank into \a snapshot, which can then be used to
+ * initialize the MPCD system. This method must be called on all ranks.
+ */
+bool mpcd::detail::read_gsd_snapshot(std::shared_ptr<::GSDReader> reader,
+                                     std::shared_ptr<mpcd::SystemDataSnapshot> snapshot,
+                                     const std::string& name)
+    {
+    auto exec_conf = snapshot->getExecutionConfiguration();
+    const uint64_t frame = reader->getFrame();
+
+    bool success = true;
+    bool subsampled = false;
+    if (exec_conf->isRoot())
+        {
+        uint32_t N = 0;
+        uint32_t stride = 1;
+        success = reader->readChunk(&N, frame, (name + "N").c_str(), sizeof(uint32_t));
+        reader->readChunk(&stride, frame, (name + "stride").c_str(), sizeof(uint32_t));
+
+        // the error is raised on all ranks below
+        if (success && stride != 1)
+            {
+            exec_conf->msg->error() << "mpcd: cannot initialize from a subsampled GSD frame (stride " << stride << ")" << std::endl;
+            subsampled = true;
+            }
+
+        if (success && !subsampled)
+            {
+            auto particles = snapshot->particles;
+            particles->resize(N);
+
+            float mass = 1.0f;
+            reader->readChunk(&mass, frame, (name + "mass").c_str(), sizeof(float));
+            particles->mass = mass;
+
+            // read the type names, defaulting to a single type A
+            particles->type_mapping.clear();
+            gsd_handle handle = reader->getHandle();
+            const struct gsd_index_entry* entry = gsd_find_chunk(&handle, frame, (name + "types").c_str());
+            if (entry == NULL && frame != 0)
+                entry = gsd_find_chunk(&handle, 0, (name + "types").c_str());
+            if (entry != NULL && entry->N > 0)
+                {
+                std::vector<char> types(entry->N * entry->M);
+                reader->readChunk(&types[0], frame, (name + "types").c_str(), types.size());
+                for (unsigned int i = 0; i < entry->N; ++i)
+                    particles->type_mapping.push_back(std::string(&types[i*entry->M]));
+                }
+            else
+                {
+                particles->type_mapping.push_back("A");
+                }
+
+            if (N > 0)
+                {
+                std::vector<float> pos(3*N, 0.0f), vel(3*N, 0.0f);
+                std::vector<uint32_t> type(N, 0);
+                reader->readChunk(&pos[0], frame, (name + "position").c_str(), 3*N*sizeof(float), N);
+                reader->readChunk(&vel[0], frame, (name + "velocity").c_str(), 3*N*sizeof(float), N);
+                reader->readChunk(&type[0], frame, (name + "typeid").c_str(), N*sizeof(uint32_t), N);
+                for (unsigned int i = 0; i < N; ++i)
+                    {
+                    particles->position[i] = vec3<Scalar>(pos[3*i], pos[3*i+1], pos[3*i+2]);
+                    particles->velocity[i] = vec3<Scalar>(vel[3*i], vel[3*i+1], vel[3*i+2]);
+                    particles->type[i] = type[i];
+                    }
+                }
+            }
+        }
+
+    #ifdef ENABLE_MPI
+    if (exec_conf->getNRanks() > 1)
+        {
+        bcast(success, 0, exec_conf->getMPICommunicator());
+        bcast(subsampled, 0, exec_conf->getMPICommunicator());
+        }
+    #endif // ENABLE_MPI
+
+    if (subsampled)
+        throw std::runtime_error("Error reading MPCD particles from GSD file");
+
+    return success;
+    }
+
+/*!
+ * \param m Python module to export to
+ */
+void mpcd::detail::export_GSDData(pybind11::module& m)
+    {
+    namespace py = pybind11;
+    py::class_<mpcd::GSDWriter, std::shared_ptr<mpcd::GSDWriter> >(m, "GSDWriter")
+        .def(py::init< std::shared_ptr<mpcd::SystemData> >())
+        .def_property("stride", &mpcd::GSDWriter::getStride, &mpcd::GSDWriter::setStride)
+        .def("connectGSDStateSignal", &mpcd::GSDWriter::connectGSDStateSignal)
+        ;
+
+    m.def("read_gsd_snapshot", &mpcd::detail::read_gsd_snapshot);
+    }
@@ -0,0 +1,104 @@
+// Copyright (c) 2009-2019 The Regents of the University of Michigan
+// This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+// Maintainer: mphoward
+
+/*!
+ * \file mpcd/GSDData.h
+ * \brief Declaration of mpcd::GSDWriter and helpers to read MPCD data from GSD files
+ */
+
+#ifndef MPCD_GSD_DATA_H_
+#define MPCD_GSD_DATA_H_
+
+#ifdef NVCC
+#error This header cannot be compiled by nvcc
+#endif
+
+#include "SystemData.h"
+#include "SystemDataSnapshot.h"
+
+#include "hoomd/GSDDumpWriter.h"
+#include "hoomd/GSDReader.h"
+#include "hoomd/SharedSignal.h"
+#include "hoomd/extern/gsd.h"
+#include "hoomd/extern/pybind/include/pybind11/pybind11.h"
+
+namespace mpcd
+{
+
+//! Writes MPCD particle data into GSD files
+/*!
+ * GSDWriter connects to the write signal of a ::GSDDumpWriter and adds the MPCD particles
+ * to every frame written by it. The chunks are prefixed by a name, which is mpcd/ by default:
+ *
+ *  - name/N: Number of MPCD particles in the frame (uint32)
+ *  - name/stride: Subsampling stride (uint32)
+ *  - name/types: MPCD type names (uint8, NT x max length)
+ *  - name/mass: MPCD particle mass (float)
+ *  - name/position: Positions wrapped into the global box (float, N x 3)
+ *  - name/velocity: Velocities (float, N x 3)
+ *  - name/typeid: Type ids (uint32, N)
+ *
+ * Every particle is written when the stride is 1, and the frame can be used to restart a
+ * simulation. With a stride \a k > 1, only particles whose tag is a multiple of \a k are
+ * written (in tag order), which reduces the size of production trajectories.
+ *
+ * GSD files have a single writer, so the selected particles are gathered to the root rank
+ * in MPI simulations. The data is sent directly from the particle arrays in single precision,
+ * and no global snapshot is assembled. With a stride \a k, each rank only sends its selected
+ * particles.
+ */
+class PYBIND11_EXPORT GSDWriter
+    {
+    public:
+        //! Constructor
+        GSDWriter(std::shared_ptr<mpcd::SystemData> sysdata);
+
+        //! Destructor
+        ~GSDWriter();
+
+        //! Set the subsampling stride
+        void setStride(unsigned int stride)
+            {
+            if (stride == 0)
+                {
+                m_exec_conf->msg->error() << "mpcd: GSD stride must be positive" << std::endl;
+                throw std::runtime_error("MPCD GSD stride must be positive");
+                }
+            m_stride = stride;
+            }
+
+        //! Get the subsampling stride
+        unsigned int getStride() const
+            {
+            return m_stride;
+            }
+
+        //! Connect to a GSD writer
+        void connectGSDStateSignal(std::shared_ptr<::GSDDumpWriter> writer, std::string name);
+
+        //! Write the MPCD particles into the current frame
+        int slotWriteGSDState(gsd_handle& handle, std::string name) const;
+
+    private:
+        std::shared_ptr<mpcd::SystemData> m_sysdata;                    //!< MPCD system data
+        std::shared_ptr<const ExecutionConfiguration> m_exec_conf;      //!< Execution configuration
+        unsigned int m_stride;                                          //!< Subsampling stride
+        std::vector< std::shared_ptr<hoomd::detail::SignalSlot> > m_slots; //!< Connections to the GSD writers
+    };
+
+namespace detail
+{
+//! Read the MPCD particles in a GSD frame into a snapshot
+bool read_gsd_snapshot(std::shared_ptr<::GSDReader> reader,
+                       std::shared_ptr<mpcd::SystemDataSnapshot> snapshot,
+                       const std::string& name);
+
+//! Export mpcd::GSDWriter and the GSD reading helpers to python
+void export_GSDData(pybind11::module& m);
+} // end namespace detail
+
+} // end namespace mpcd
+
+#endif // MPCD_GSD_DATA_H_
@@ -19,7 +19,8 @@
  * \param deltaT Fundamental integration timestep
  */
 mpcd::Integrator::Integrator(std::shared_ptr<mpcd::SystemData> sysdata, Scalar deltaT)
-    : IntegratorTwoStep(sysdata->getSystemDefinition(), deltaT), m_mpcd_sys(sysdata)
+    : IntegratorTwoStep(sysdata->getSystemDefinition(), deltaT), m_mpcd_sys(sysdata),
+      m_overlap(false), m_prepared(false)
     {
     assert(m_mpcd_sys);
     m_exec_conf->msg->notice(5) << "Constructing MPCD Integrator" << std::endl;
@@ -68,6 +69,7 @@ void mpcd::Integrator::update(unsigned int timestep)
         m_exec_conf->msg->warning() << "mpcd.integrate: No integration methods are set." << std::endl;
         m_gave_warning = true;
         }
+    m_prepared = false;
 
     // remove any leftover virtual particles
     if (checkCollide(timestep))
@@ -116,19 +118,34 @@ void mpcd::Integrator::update(unsigned int timestep)
         updateRigidBodies(timestep+1);
         }
 
-    // execute the MPCD streaming step now that MD particles are communicated onto their final domains
-    if (m_stream)
+    #ifdef ENABLE_TBB
+    if (m_overlap && !m_exec_conf->isCUDAEnabled() && !m_prof)
         {
-        m_stream->stream(timestep);
-        }
+        // stream the MPCD particles (and prepare the next collision) on other threads while the MD forces are computed
+        tbb::task_group mpcd_tasks;
+        mpcd_tasks.run([&]{ streamAndPrepare(timestep); });
+        computeNetForce(timestep+1);
 
-    // compute the net force on the MD particles
-#ifdef ENABLE_CUDA
-    if (m_exec_conf->isCUDAEnabled())
-        computeNetForceGPU(timestep+1);
+        // synchronize before the MD particles are updated
+        mpcd_tasks.wait();
+        }
     else
-#endif
-        computeNetForce(timestep+1);
+    #endif // ENABLE_TBB
+        {
+        // execute the MPCD streaming step now that MD particles are communicated onto their final domains
+        if (m_stream)
+            {
+            m_stream->stream(timestep);
+            }
+
+        // compute the net force on the MD particles
+    #ifdef ENABLE_CUDA
+        if (m_exec_conf->isCUDAEnabled())
+            computeNetForceGPU(timestep+1);
+        else
+    #endif
+            computeNetForce(timestep+1);
+        }
 
     // perform the second step of the MD integration
     if (m_prof) m_prof->push("Integrate");
@@ -137,6 +154,60 @@ void mpcd::Integrator::update(unsigned int timestep)
     if (m_prof) m_prof->pop();
     }
 
+/*!
+ * \param timestep Current time step of the simulation
+ *
+ * The MPCD particles are streamed to \a timestep+1. If the next step is a collision step,
+ * the grid shift is drawn, the particles are sorted, and the cell list is built for it, so
+ * that this work also overlaps with the MD forces. The cell list is only prepared ahead when
+ * it does not depend on the MD particles or on other ranks: there must be no embedded particles,
+ * no virtual particle fillers, and no MPCD communicator. Otherwise, the collision step
+ * prepares the cell list itself after the MD particles have been updated.
+ *
+ * This method runs concurrently with the MD force computation, so it must not touch the
+ * MD particle data.
+ */
+void mpcd::Integrator::streamAndPrepare(unsigned int timestep)
+    {
+    if (m_stream)
+        {
+        m_stream->stream(timestep);
+        }
+
+    auto cl = m_mpcd_sys->getCellList();
+    bool prepare = checkCollide(timestep+1) && m_fillers.empty() && !cl->getEmbeddedGroup();
+    #ifdef ENABLE_MPI
+    prepare = prepare && !m_mpcd_comm;
+    #endif // ENABLE_MPI
+    if (prepare)
+        {
+        m_collide->drawGridShift(timestep+1);
+        if (m_sorter)
+            m_sorter->update(timestep+1);
+        cl->compute(timestep+1);
+        m_prepared = true;
+        }
+    }
+
+/*!
+ * \param overlap If true, overlap MPCD work with the MD force computation
+ *
+ * MPCD streaming, sorting, and cell list builds are independent of the MD forces unless
+ * the cell list contains embedded particles. When \a overlap is enabled, this work is done
+ * on separate threads while the MD forces are computed. This requires TBB and is only used
+ * on the CPU without profiling.
+ */
+void mpcd::Integrator::setOverlap(bool overlap)
+    {
+    #ifndef ENABLE_TBB
+    if (overlap)
+        {
+        m_exec_conf->msg->warning() << "mpcd.integrate: overlapping MPCD work with MD forces requires TBB, ignoring" << std::endl;
+        }
+    #endif // ENABLE_TBB
+    m_overlap = overlap;
+    }
+
 /*!
  * \param deltaT new deltaT to set
  * \post \a deltaT is also set on all contained integration methods
@@ -170,6 +241,13 @@ void mpcd::Integrator::prepRun(unsigned int timestep)
         m_mpcd_comm->communicate(timestep);
         }
     #endif // ENABLE_MPI
+
+    // the particles may have changed between runs, so rebuild a cell list prepared at the end of the last run
+    if (m_prepared)
+        {
+        m_mpcd_sys->getCellList()->forceCompute(timestep);
+        m_prepared = false;
+        }
     }
 
 /*! \param enable Enable/disable autotuning
@@ -221,6 +299,7 @@ void mpcd::detail::export_Integrator(pybind11::module& m)
         .def("removeSorter", &mpcd::Integrator::removeSorter)
         .def("addFiller", &mpcd::Integrator::addFiller)
         .def("removeAllFillers", &mpcd::Integrator::removeAllFillers)
+        .def("setOverlap", &mpcd::Integrator::setOverlap)
         #ifdef ENABLE_MPI
         .def("setMPCDCommunicator", &mpcd::Integrator::setMPCDCommunicator)
         #endif // ENABLE_MPI
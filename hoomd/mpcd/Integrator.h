@@ -26,6 +26,11 @@
 #endif // ENABLE_MPI
 
 #include "hoomd/md/IntegratorTwoStep.h"
+
+#ifdef ENABLE_TBB
+#include <tbb/task_group.h>
+#endif // ENABLE_TBB
+
 #include "hoomd/extern/pybind/include/pybind11/pybind11.h"
 
 namespace mpcd
@@ -151,6 +156,15 @@ class PYBIND11_EXPORT Integrator : public ::IntegratorTwoStep
             m_fillers.clear();
             }
 
+        //! Set whether MPCD work overlaps with the MD force computation
+        void setOverlap(bool overlap);
+
+        //! Get whether MPCD work overlaps with the MD force computation
+        bool getOverlap() const
+            {
+            return m_overlap;
+            }
+
     protected:
         std::shared_ptr<mpcd::SystemData> m_mpcd_sys;   //!< MPCD system
         std::shared_ptr<mpcd::CollisionMethod> m_collide;   //!< MPCD collision rule
@@ -162,6 +176,13 @@ class PYBIND11_EXPORT Integrator : public ::IntegratorTwoStep
         #endif // ENABLE_MPI
 
         std::vector<std::shared_ptr<mpcd::VirtualParticleFiller>> m_fillers; //!< MPCD virtual particle fillers
+
+        bool m_overlap;     //!< If true, overlap MPCD work with the MD forces
+        bool m_prepared;    //!< If true, the cell list for the next collision was built during the last step
+
+        //! Stream the MPCD particles and prepare the cell list for the next collision
+        void streamAndPrepare(unsigned int timestep);
+
     private:
         //! Check if a collision will occur at the current timestep
         bool checkCollide(unsigned int timestep)
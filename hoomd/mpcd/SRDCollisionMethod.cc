@@ -12,6 +12,10 @@
 #include "hoomd/RandomNumbers.h"
 #include "hoomd/RNGIdentifiers.h"
 
+#ifdef ENABLE_TBB
+#include <tbb/tbb.h>
+#endif // ENABLE_TBB
+
 mpcd::SRDCollisionMethod::SRDCollisionMethod(std::shared_ptr<mpcd::SystemData> sysdata,
                                              unsigned int cur_timestep,
                                              unsigned int period,
@@ -73,50 +77,54 @@ void mpcd::SRDCollisionMethod::drawRotationVectors(unsigned int timestep)
         T_set = m_T->getValue(timestep);
         }
 
-    for (unsigned int k=0; k < ci.getD(); ++k)
+    // each cell has its own random number stream, so the cells can be split over threads by their index
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, ci.getNumElements()),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int idx=r.begin(); idx != r.end(); ++idx)
+    #else
+    for (unsigned int idx=0; idx < ci.getNumElements(); ++idx)
+    #endif // ENABLE_TBB
         {
-        for (unsigned int j=0; j < ci.getH(); ++j)
+        const uint3 cell = ci.getTriple(idx);
+        const int3 global_cell = m_cl->getGlobalCell(make_int3(cell.x, cell.y, cell.z));
+        const unsigned int global_idx = global_ci(global_cell.x, global_cell.y, global_cell.z);
+
+        // Initialize the PRNG using the current cell index, timestep, and seed for the hash
+        hoomd::RandomGenerator rng(hoomd::RNGIdentifier::SRDCollisionMethod, m_seed, global_idx, timestep);
+
+        // draw rotation vector off the surface of the sphere
+        double3 rotvec;
+        hoomd::SpherePointGenerator<double> sphgen;
+        sphgen(rng, rotvec);
+        h_rotvec.data[idx] = rotvec;
+
+        if (use_thermostat)
             {
-            for (unsigned int i=0; i < ci.getW(); ++i)
+            const double3 cell_energy = h_cell_energy->data[idx];
+            const unsigned int np = __double_as_int(cell_energy.z);
+            double factor = 1.0;
+            if (np > 1)
                 {
-                const int3 global_cell = m_cl->getGlobalCell(make_int3(i,j,k));
-                const unsigned int global_idx = global_ci(global_cell.x, global_cell.y, global_cell.z);
-                const unsigned int idx = ci(i,j,k);
-
-                // Initialize the PRNG using the current cell index, timestep, and seed for the hash
-                hoomd::RandomGenerator rng(hoomd::RNGIdentifier::SRDCollisionMethod, m_seed, global_idx, timestep);
-
-                // draw rotation vector off the surface of the sphere
-                double3 rotvec;
-                hoomd::SpherePointGenerator<double> sphgen;
-                sphgen(rng, rotvec);
-                h_rotvec.data[idx] = rotvec;
-
-                if (use_thermostat)
-                    {
-                    const double3 cell_energy = h_cell_energy->data[idx];
-                    const unsigned int np = __double_as_int(cell_energy.z);
-                    double factor = 1.0;
-                    if (np > 1)
-                        {
-                        // the total number of degrees of freedom in the cell divided by 2
-                        const double alpha = m_sysdef->getNDimensions()*(np-1)/(double)2.;
-
-                        // draw a random kinetic energy for the cell at the set temperature
-                        hoomd::GammaDistribution<double> gamma_gen(alpha,T_set);
-                        const double rand_ke = gamma_gen(rng);
-
-                        // generate the scale factor from the current temperature
-                        // (don't use the kinetic energy of this cell, since this
-                        // is total not relative to COM)
-                        const double cur_ke = alpha * cell_energy.y;
-                        factor = (cur_ke > 0.) ? fast::sqrt(rand_ke/cur_ke) : 1.;
-                        }
-                    h_factors->data[idx] = factor;
-                    }
+                // the total number of degrees of freedom in the cell divided by 2
+                const double alpha = m_sysdef->getNDimensions()*(np-1)/(double)2.;
+
+                // draw a random kinetic energy for the cell at the set temperature
+                hoomd::GammaDistribution<double> gamma_gen(alpha,T_set);
+                const double rand_ke = gamma_gen(rng);
+
+                // generate the scale factor from the current temperature
+                // (don't use the kinetic energy of this cell, since this
+                // is total not relative to COM)
+                const double cur_ke = alpha * cell_energy.y;
+                factor = (cur_ke > 0.) ? fast::sqrt(rand_ke/cur_ke) : 1.;
                 }
+            h_factors->data[idx] = factor;
             }
         }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
     }
 
 void mpcd::SRDCollisionMethod::rotate(unsigned int timestep)
@@ -154,7 +162,13 @@ void mpcd::SRDCollisionMethod::rotate(unsigned int timestep)
         h_factors.reset(new ArrayHandle<double>(m_factors, access_location::host, access_mode::read));
         }
 
+    #ifdef ENABLE_TBB
+    tbb::parallel_for(tbb::blocked_range<unsigned int>(0, N_tot),
+        [&](const tbb::blocked_range<unsigned int>& r) {
+    for (unsigned int cur_p = r.begin(); cur_p != r.end(); ++cur_p)
+    #else
     for (unsigned int cur_p = 0; cur_p < N_tot; ++cur_p)
+    #endif // ENABLE_TBB
         {
         double3 vel;
         unsigned int cell;
@@ -222,6 +236,9 @@ void mpcd::SRDCollisionMethod::rotate(unsigned int timestep)
             h_vel_embed->data[idx] = make_scalar4(new_vel.x, new_vel.y, new_vel.z, mass);
             }
         }
+    #ifdef ENABLE_TBB
+        });
+    #endif // ENABLE_TBB
     }
 
 /*!
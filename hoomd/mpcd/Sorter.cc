@@ -10,6 +10,8 @@
 
 #include "Sorter.h"
 
+#include <algorithm>
+
 /*!
  * \param sysdata MPCD system data
  */
@@ -24,7 +26,10 @@ mpcd::Sorter::Sorter(std::shared_ptr<mpcd::SystemData> sysdata,
       m_cl(m_mpcd_sys->getCellList()),
       m_order(m_exec_conf),
       m_rorder(m_exec_conf),
-      m_period(period)
+      m_period(period),
+      m_auto(false),
+      m_threshold(0.5),
+      m_locality(1.0)
     {
     assert(m_mpcd_sys);
     m_exec_conf->msg->notice(5) << "Constructing MPCD Sorter" << std::endl;
@@ -41,11 +46,19 @@ mpcd::Sorter::~Sorter()
  * \param timestep Current simulation timestep
  *
  * This method is just a driver for the computeOrder() and applyOrder() methods.
+ * In automatic mode, the particles are only sorted if their locality has dropped
+ * below the threshold.
  */
 void mpcd::Sorter::update(unsigned int timestep)
     {
     if (!shouldSort(timestep)) return;
 
+    if (m_auto)
+        {
+        m_locality = computeLocality(timestep);
+        if (m_locality >= m_threshold) return;
+        }
+
     if (m_prof) m_prof->push(m_exec_conf, "MPCD sort");
 
     // resize the sorted order vector to the current number of particles
@@ -78,7 +91,7 @@ void mpcd::Sorter::computeOrder(unsigned int timestep)
 
     ArrayHandle<unsigned int> h_cell_list(m_cl->getCellList(), access_location::host, access_mode::read);
     ArrayHandle<unsigned int> h_cell_np(m_cl->getCellSizeArray(), access_location::host, access_mode::read);
-    const Index2D& cli = m_cl->getCellListIndexer();
+    ArrayHandle<unsigned int> h_cell_offsets(m_cl->getCellOffsets(), access_location::host, access_mode::read);
 
     // loop through the cell list to generate the sorting order for MPCD particles
     ArrayHandle<unsigned int> h_order(m_order, access_location::host, access_mode::overwrite);
@@ -88,9 +101,10 @@ void mpcd::Sorter::computeOrder(unsigned int timestep)
     for (unsigned int idx=0; idx < m_cl->getNCells(); ++idx)
         {
         const unsigned int np = h_cell_np.data[idx];
+        const unsigned int first = h_cell_offsets.data[idx];
         for (unsigned int offset = 0; offset < np; ++offset)
             {
-            const unsigned int pid = h_cell_list.data[cli(offset, idx)];
+            const unsigned int pid = h_cell_list.data[first + offset];
             // only count MPCD particles, and skip embedded particles
             if (pid < N_mpcd)
                 {
@@ -102,6 +116,66 @@ void mpcd::Sorter::computeOrder(unsigned int timestep)
         }
     }
 
+/*!
+ * \param timestep Current timestep
+ * \returns Fraction of neighboring particles in a cell that are also close in memory
+ *
+ * The members of each cell are ordered by their index, and each pair of consecutive
+ * members is counted as local if their indexes differ by no more than the average number
+ * of particles in a row of cells along x. Particles that are sorted in cell list order are
+ * therefore all local, while the members of cells that only neighbor each other along y or z
+ * are not. The locality is the fraction of local pairs, which decreases from 1 as the
+ * particles diffuse away from their sorted order.
+ *
+ * The cell list built at \a timestep is reused by the collision method, so measuring the
+ * locality only costs one pass through the cell list.
+ */
+Scalar mpcd::Sorter::computeLocality(unsigned int timestep)
+    {
+    m_cl->compute(timestep);
+
+    const unsigned int N_mpcd = m_mpcd_pdata->getN();
+    if (N_mpcd == 0) return Scalar(1.0);
+
+    // particles in a row of cells are close in memory after sorting
+    const uint3 dim = m_cl->getDim();
+    const unsigned int window = std::max(1u, N_mpcd / (dim.y * dim.z));
+
+    ArrayHandle<unsigned int> h_cell_list(m_cl->getCellList(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_cell_np(m_cl->getCellSizeArray(), access_location::host, access_mode::read);
+    ArrayHandle<unsigned int> h_cell_offsets(m_cl->getCellOffsets(), access_location::host, access_mode::read);
+
+    unsigned long long num_pairs = 0;
+    unsigned long long num_local = 0;
+    std::vector<unsigned int> members;
+    for (unsigned int idx=0; idx < m_cl->getNCells(); ++idx)
+        {
+        const unsigned int np = h_cell_np.data[idx];
+        const unsigned int first = h_cell_offsets.data[idx];
+
+        // only count MPCD particles, and skip embedded particles
+        members.clear();
+        for (unsigned int offset = 0; offset < np; ++offset)
+            {
+            const unsigned int pid = h_cell_list.data[first + offset];
+            if (pid < N_mpcd)
+                members.push_back(pid);
+            }
+        if (members.size() < 2) continue;
+
+        // the cell list is not guaranteed to be ordered on the GPU
+        std::sort(members.begin(), members.end());
+        for (unsigned int m = 1; m < members.size(); ++m)
+            {
+            ++num_pairs;
+            if (members[m] - members[m-1] <= window)
+                ++num_local;
+            }
+        }
+
+    return (num_pairs > 0) ? Scalar(num_local) / Scalar(num_pairs) : Scalar(1.0);
+    }
+
 /*!
  * Loop through the ordered set of particles, and apply the sorted order. This is
  * intentionally broken out from computeOrder() so that other sorting rules could
@@ -178,5 +252,7 @@ void mpcd::detail::export_Sorter(pybind11::module& m)
     py::class_<mpcd::Sorter, std::shared_ptr<mpcd::Sorter> >(m, "Sorter")
         .def(py::init<std::shared_ptr<mpcd::SystemData>, unsigned int, unsigned int>())
         .def("setPeriod", &mpcd::Sorter::setPeriod)
+        .def("setAutoSort", &mpcd::Sorter::setAutoSort)
+        .def_property_readonly("locality", &mpcd::Sorter::getLocality)
         ;
     }
@@ -31,6 +31,13 @@ namespace mpcd
  * must set the map from old particle index to new particle index, and the
  * reverse mapping.
  *
+ * By default, the Sorter reorders the particles every \a period steps. In automatic mode,
+ * the Sorter only checks the locality of the particles every \a period steps and sorts
+ * when it drops below a threshold. The locality is measured from the cell list that is built
+ * for the collisions anyway (see computeLocality()), so no separate spatial hash or offline
+ * tuning of the period is required. Each rank makes this decision for its own particles
+ * because sorting is a local operation.
+ *
  * When there are virtual particles in the mpcd::ParticleData, the Sorter will ignore
  * the virtual particles and leave them in place at the end of the arrays. This is
  * because they cannot be removed easily if they are sorted with the rest of the particles,
@@ -75,6 +82,37 @@ class PYBIND11_EXPORT Sorter
             m_next_timestep = multiple * m_period;
             }
 
+        //! Set the automatic sorting parameters
+        /*!
+         * \param enable If true, only sort when the locality drops below \a threshold
+         * \param threshold Locality below which particles are sorted
+         */
+        void setAutoSort(bool enable, Scalar threshold)
+            {
+            if (threshold <= Scalar(0.0) || threshold > Scalar(1.0))
+                {
+                m_exec_conf->msg->error() << "mpcd: sorting threshold must be in (0,1]" << std::endl;
+                throw std::runtime_error("Invalid MPCD sorting threshold");
+                }
+            m_auto = enable;
+            m_threshold = threshold;
+            }
+
+        //! Check if automatic sorting is enabled
+        bool getAutoSort() const
+            {
+            return m_auto;
+            }
+
+        //! Get the locality measured at the last check (automatic mode only)
+        Scalar getLocality() const
+            {
+            return m_locality;
+            }
+
+        //! Compute the locality of the particles in memory
+        virtual Scalar computeLocality(unsigned int timestep);
+
     protected:
         std::shared_ptr<mpcd::SystemData> m_mpcd_sys;       //!< MPCD system data
         std::shared_ptr<SystemDefinition> m_sysdef;         //!< HOOMD system definition
@@ -91,6 +129,10 @@ class PYBIND11_EXPORT Sorter
         unsigned int m_period;          //!< Sorting period
         unsigned int m_next_timestep;   //!< Next step to apply sorting
 
+        bool m_auto;            //!< If true, only sort when the locality degrades
+        Scalar m_threshold;     //!< Locality below which particles are sorted
+        Scalar m_locality;      //!< Locality measured at the last check
+
         //! Compute the sorting order at the current timestep
         virtual void computeOrder(unsigned int timestep);
 
@@ -98,8 +98,10 @@ import hoomd
 from hoomd import _hoomd
 from hoomd.md import _md
 
+from hoomd.mpcd import analyze
 from hoomd.mpcd import collide
 from hoomd.mpcd import data
+from hoomd.mpcd import dump
 from hoomd.mpcd import force
 from hoomd.mpcd import init
 from hoomd.mpcd import integrate
@@ -130,6 +132,7 @@ class integrator(hoomd.integrate._integrator):
                     advance the real time of the system forward by *dt* (in time units).
         aniso (bool): Whether to integrate rotational degrees of freedom (bool),
                       default None (autodetect).
+        overlap (bool): If True, overlap MPCD work with the MD force computation.
 
     The MPCD integrator enables the MPCD algorithm concurrently with standard
     MD :py:mod:`~hoomd.md.integrate` methods. An integrator must be created
@@ -154,13 +157,30 @@ class integrator(hoomd.integrate._integrator):
     The MD particles can be read at any time step because their positions
     are updated every step.
 
+    When *overlap* is True, the MPCD streaming step runs on separate CPU threads while
+    the forces on the MD particles are computed. The streaming of the MPCD particles does not
+    depend on these forces. If the next step is a collision step, the MPCD particles are also
+    sorted and binned into cells during this time, unless the cells have to include embedded
+    particles, virtual particles, or particles from other ranks. The threads are synchronized
+    before the MD particles are updated, so collisions with embedded particles always see
+    their current positions. The results are identical to running without overlap.
+
+    .. note::
+
+        Overlapping requires HOOMD to be built with TBB, and it is only used on the CPU
+        when the simulation is not being profiled.
+
     Examples::
 
         mpcd.integrator(dt=0.1)
         mpcd.integrator(dt=0.01, aniso=True)
+        mpcd.integrator(dt=0.1, overlap=True)
+
+    .. versionchanged:: 2.9
+        Added *overlap*.
 
     """
-    def __init__(self, dt, aniso=None):
+    def __init__(self, dt, aniso=None, overlap=False):
         # check system is initialized
         if hoomd.context.current.mpcd is None:
             hoomd.context.msg.error('mpcd.integrate: an MPCD system must be initialized before the integrator\n')
@@ -171,13 +191,15 @@ class integrator(hoomd.integrate._integrator):
         self.supports_methods = True
         self.dt = dt
         self.aniso = aniso
-        self.metadata_fields = ['dt','aniso']
+        self.overlap = overlap
+        self.metadata_fields = ['dt','aniso','overlap']
 
         # configure C++ integrator
         self.cpp_integrator = _mpcd.Integrator(hoomd.context.current.mpcd.data, self.dt)
         if hoomd.context.current.mpcd.comm is not None:
             self.cpp_integrator.setMPCDCommunicator(hoomd.context.current.mpcd.comm)
         hoomd.context.current.system.setIntegrator(self.cpp_integrator)
+        self.cpp_integrator.setOverlap(overlap)
 
         if self.aniso is not None:
             hoomd.util.quiet_status()
@@ -189,17 +211,19 @@ class integrator(hoomd.integrate._integrator):
         True: _md.IntegratorAnisotropicMode.Anisotropic,
         False: _md.IntegratorAnisotropicMode.Isotropic}
 
-    def set_params(self, dt=None, aniso=None):
+    def set_params(self, dt=None, aniso=None, overlap=None):
         """ Changes parameters of an existing integration mode.
 
         Args:
             dt (float): New time step delta (if set) (in time units).
             aniso (bool): Anisotropic integration mode (bool), default None (autodetect).
+            overlap (bool): If True, overlap MPCD work with the MD force computation.
 
         Examples::
 
             integrator.set_params(dt=0.007)
             integrator.set_params(dt=0.005, aniso=False)
+            integrator.set_params(overlap=True)
 
         """
         hoomd.util.print_status_line()
@@ -219,6 +243,10 @@ class integrator(hoomd.integrate._integrator):
             self.aniso = aniso
             self.cpp_integrator.setAnisotropicMode(anisoMode)
 
+        if overlap is not None:
+            self.overlap = overlap
+            self.cpp_integrator.setOverlap(overlap)
+
     def update_methods(self):
         self.check_initialization()
 
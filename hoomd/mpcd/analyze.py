@@ -0,0 +1,192 @@
+# Copyright (c) 2009-2019 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+# Maintainer: mphoward
+
+R""" MPCD analyzers
+
+Analyze the MPCD particles during the simulation.
+
+"""
+
+import hoomd
+
+from . import _mpcd
+
+class field(hoomd.analyze._analyzer):
+    R""" Time-averaged fields of the MPCD cell properties.
+
+    Args:
+        period (int): Sample the cell properties every *period* time steps.
+        axes (str): Axes of the cell grid to keep in the fields (any combination of ``x``, ``y``, and ``z``).
+        temperature (bool): If True, also average the cell temperature.
+        phase (int): When -1, start on the current time step. When >= 0, execute on steps where *(step + phase) % period == 0*.
+
+    :py:class:`field` accumulates time averages of the properties of the MPCD collision
+    cells. The cell properties along each axis in *axes* are kept, while the cells are
+    averaged along the other axes. Use ``axes='xyz'`` to average the full 3D field of
+    the cells, ``axes='z'`` to average a 1D profile along *z*, or ``axes='xz'`` to average
+    a 2D profile in the *xz* plane.
+
+    The following fields are averaged:
+
+    * ``density``: mass per volume
+    * ``velocity``: mass-weighted average velocity
+    * ``temperature``: average kinetic temperature of cells having more than one particle
+      (only if *temperature* is True)
+
+    Each rank accumulates its own cells, and the averages are only reduced onto the root
+    rank when they are requested with :py:meth:`get` or written to a file.
+
+    Analyzers run at the start of a time step, before the collision on that step, so the
+    cell properties are sampled on the grid of the previous collision. On steps where a
+    collision shifts the grid, the cell list and cell properties are computed again for
+    the collision. Each sample can therefore cost up to one extra cell property calculation,
+    so choose *period* no smaller than needed to converge the averages.
+
+    The averaged fields can be written to a GSD file by passing the analyzer to
+    :py:meth:`hoomd.dump.gsd.dump_state`. The fields are written to the ``mpcd/field/``
+    chunks with one row per bin and the *x* index varying fastest:
+
+    * ``mpcd/field/bins``: number of bins along *x*, *y*, and *z*
+    * ``mpcd/field/samples``: number of samples in the averages
+    * ``mpcd/field/density``: average density
+    * ``mpcd/field/velocity``: average velocity
+    * ``mpcd/field/temperature``: average temperature
+
+    The fields can also be written to an HDF5 file with :py:meth:`log_hdf5`.
+
+    The averages accumulate from the creation of the analyzer. Call :py:meth:`reset` to
+    start new averages, for example after equilibrating the flow.
+
+    Note:
+        The cell grid is randomly shifted by at most half a cell during collisions,
+        which smooths the averaged fields slightly.
+
+    Examples::
+
+        f = mpcd.analyze.field(period=10, axes='z')
+        hoomd.run(10000)
+        vel = f.get('velocity')
+
+        gsd = hoomd.dump.gsd(filename='fields.gsd', period=10000, group=hoomd.group.all())
+        gsd.dump_state(mpcd.analyze.field(period=10, axes='xz', temperature=True))
+
+    .. versionadded:: 2.9
+
+    """
+    def __init__(self, period, axes='xyz', temperature=False, phase=0):
+        hoomd.util.print_status_line()
+
+        if hoomd.context.current.mpcd is None:
+            hoomd.context.msg.error('mpcd.analyze: an MPCD system must be initialized before the field analyzer\n')
+            raise RuntimeError('MPCD system not initialized')
+
+        axes = str(axes)
+        if len(axes) == 0 or any(a not in 'xyz' for a in axes):
+            hoomd.context.msg.error('mpcd.analyze: axes must be a combination of x, y, and z\n')
+            raise ValueError('Invalid field axes')
+
+        # initialize base class
+        hoomd.analyze._analyzer.__init__(self)
+
+        system = hoomd.context.current.mpcd
+        self.cpp_analyzer = _mpcd.CellFieldAnalyzer(system.data,
+                                                    system._thermo,
+                                                    'x' in axes,
+                                                    'y' in axes,
+                                                    'z' in axes,
+                                                    temperature)
+        self.setupAnalyzer(period, phase)
+
+        self.period = period
+        self.axes = ''.join(a for a in 'xyz' if a in axes)
+        self.temperature = temperature
+        self.metadata_fields = ['period', 'axes', 'temperature']
+
+    @classmethod
+    def _gsd_state_name(cls):
+        return "mpcd/field/"
+
+    @property
+    def num_samples(self):
+        R""" Number of samples in the averages.
+        """
+        return self.cpp_analyzer.num_samples
+
+    def get(self, quantity):
+        R""" Get an averaged field.
+
+        Args:
+            quantity (str): Name of the field (``density``, ``velocity``, or ``temperature``)
+
+        Returns:
+            The averaged field as a numpy array on the root rank, and None on the other ranks.
+
+        The array has one dimension for each kept axis in *x*, *y*, *z* order. The
+        velocity has an additional last dimension for its components.
+
+        Note:
+            This method must be called on all ranks.
+
+        Examples::
+
+            rho = f.get('density')
+
+        """
+        self.check_initialization()
+
+        field = self.cpp_analyzer.getField(quantity)
+        if hoomd.comm.get_rank() != 0:
+            return None
+        return field
+
+    def reset(self):
+        R""" Reset the averages.
+
+        Examples::
+
+            f.reset()
+
+        """
+        hoomd.util.print_status_line()
+        self.check_initialization()
+
+        self.cpp_analyzer.reset()
+
+    def log_hdf5(self, log, prefix='mpcd_field_'):
+        R""" Write the averaged fields with an HDF5 log.
+
+        Args:
+            log (:py:class:`hoomd.hdf5.log`): HDF5 log to write the fields with.
+            prefix (str): Prefix for the names of the data sets.
+
+        The averaged fields are added to the matrix quantities of *log*, and they are
+        written to the data sets *prefix* + ``density``, *prefix* + ``velocity``, and
+        *prefix* + ``temperature`` every time *log* writes.
+
+        Examples::
+
+            with hoomd.hdf5.File('fields.h5', 'w') as h5file:
+                log = hoomd.hdf5.log(h5file, period=10000)
+                f.log_hdf5(log)
+                hoomd.run(100000)
+
+        """
+        hoomd.util.print_status_line()
+        self.check_initialization()
+
+        quantities = ['density', 'velocity']
+        if self.temperature:
+            quantities.append('temperature')
+
+        logged = list(log.cpp_analyzer.getLoggedMatrixQuantities())
+        for q in quantities:
+            name = prefix + q
+            log.register_callback(name, lambda timestep, q=q: self.cpp_analyzer.getField(q), matrix=True)
+            if name not in logged:
+                logged.append(name)
+
+        hoomd.util.quiet_status()
+        log.set_params(matrix_quantities=logged)
+        hoomd.util.unquiet_status()
@@ -215,6 +215,9 @@ class system(hoomd.meta._metadata):
         # no collision rule by default
         self._collide = None
 
+        # writers adding the MPCD particles to GSD files
+        self._gsd_writers = []
+
     @property
     def particles(self):
         return self.data.getParticleData()
@@ -260,6 +263,16 @@ class system(hoomd.meta._metadata):
         if cell is not None:
             self.cell.cell_size = cell
 
+    @classmethod
+    def _gsd_state_name(cls):
+        return "mpcd/"
+
+    def _connect_gsd(self, gsd):
+        # This is an internal method, and should not be called directly. See gsd.dump_state() instead
+        writer = _mpcd.GSDWriter(self.data)
+        writer.connectGSDStateSignal(gsd.cpp_analyzer, self._gsd_state_name())
+        self._gsd_writers.append(writer)
+
     def take_snapshot(self, particles=True):
         R""" Takes a snapshot of the current state of the MPCD system
 
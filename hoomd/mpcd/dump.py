@@ -0,0 +1,97 @@
+# Copyright (c) 2009-2019 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+# Maintainer: mphoward
+
+R""" MPCD particle output
+
+Writes MPCD particles to files.
+
+"""
+
+import hoomd
+
+from . import _mpcd
+
+class gsd(hoomd.dump.gsd):
+    R""" Writes MPCD particles to a GSD file.
+
+    Args:
+        filename (str): File name to write.
+        period (int): Number of time steps between file writes.
+        group (:py:mod:`hoomd.group`): Group of MD particles to write to the file.
+        overwrite (bool): When False (the default), any existing GSD file will be appended to. When True, an existing
+                          file *filename* will be overwritten.
+        truncate (bool): When False (the default), frames are appended to the GSD file. When True, truncate the file and
+                         write a new frame 0 every time.
+        phase (int): When -1, start on the current time step. When >= 0, execute on steps where *(step + phase) % period == 0*.
+        dynamic (list): A list of quantity categories of the MD particles to save every frame.
+        stride (int): Write only every *stride*-th MPCD particle.
+
+    :py:class:`gsd` writes the same frames as :py:class:`hoomd.dump.gsd` and adds the MPCD particles of the current
+    MPCD system (see :py:mod:`hoomd.mpcd.init`) in ``mpcd/`` chunks:
+
+    * ``mpcd/N``: number of MPCD particles in the frame
+    * ``mpcd/stride``: subsampling stride
+    * ``mpcd/types``: MPCD type names
+    * ``mpcd/mass``: MPCD particle mass
+    * ``mpcd/position``: positions
+    * ``mpcd/velocity``: velocities
+    * ``mpcd/typeid``: type ids
+
+    When *stride* is 1, every MPCD particle is written in tag order and the file can be used to restart the
+    simulation with :py:func:`hoomd.mpcd.init.read_gsd`. Set *truncate* to True to write restart files. A *stride*
+    larger than 1 writes only the particles whose tag is a multiple of *stride*, which keeps the size of production
+    trajectories manageable. Subsampled frames cannot be used to restart a simulation.
+
+    The MPCD particles can also be added to an existing :py:class:`hoomd.dump.gsd` file writer with
+    :py:meth:`hoomd.dump.gsd.dump_state`.
+
+    Note:
+        In MPI simulations, the selected MPCD particles are gathered to the root rank in single precision. Use
+        a *stride* to reduce the amount of data that is communicated.
+
+    Examples::
+
+        mpcd.dump.gsd(filename="restart.gsd", period=10000, group=hoomd.group.all(), truncate=True)
+        mpcd.dump.gsd(filename="trajectory.gsd", period=1000, group=hoomd.group.all(), stride=100)
+
+    .. versionadded:: 2.9
+
+    """
+    def __init__(self,
+                 filename,
+                 period,
+                 group,
+                 overwrite=False,
+                 truncate=False,
+                 phase=0,
+                 dynamic=None,
+                 stride=1):
+        hoomd.util.print_status_line()
+
+        if hoomd.context.current.mpcd is None:
+            hoomd.context.msg.error('mpcd.dump: an MPCD system must be initialized before writing GSD files\n')
+            raise RuntimeError('MPCD system not initialized')
+
+        if period is None:
+            hoomd.context.msg.error('mpcd.dump: period must be set, use write_restart() to write a single frame\n')
+            raise ValueError('mpcd.dump.gsd requires a period')
+
+        hoomd.util.quiet_status()
+        hoomd.dump.gsd.__init__(self,
+                                filename=filename,
+                                period=period,
+                                group=group,
+                                overwrite=overwrite,
+                                truncate=truncate,
+                                phase=phase,
+                                dynamic=dynamic)
+        hoomd.util.unquiet_status()
+
+        self._mpcd_writer = _mpcd.GSDWriter(hoomd.context.current.mpcd.data)
+        self._mpcd_writer.stride = int(stride)
+        self._mpcd_writer.connectGSDStateSignal(self.cpp_analyzer, hoomd.context.current.mpcd._gsd_state_name())
+
+        self.stride = stride
+        self.metadata_fields.append('stride')
@@ -5,8 +5,9 @@
 
 R""" MPCD system initialization
 
-Commands to initialize the MPCD system data. Currently, random initialization
-and snapshot initialization (see :py:mod:`hoomd.mpcd.data`) are supported.
+Commands to initialize the MPCD system data. Currently, random initialization,
+snapshot initialization (see :py:mod:`hoomd.mpcd.data`), and initialization
+from GSD files are supported.
 Random initialization is useful for large systems where a snapshot is impractical.
 Snapshot initialization is useful when you require fine control over the particle
 properties and initial configuration.
@@ -111,3 +112,59 @@ def read_snapshot(snapshot):
 
     hoomd.context.current.mpcd = data.system(_mpcd.SystemData(snapshot.sys_snap))
     return hoomd.context.current.mpcd
+
+def read_gsd(filename=None, frame=0):
+    R"""Initialize from a GSD file
+
+    Args:
+        filename (str): Name of the GSD file to read. If None, read the file used to
+            initialize the HOOMD system with :py:func:`hoomd.init.read_gsd`.
+        frame (int): Index of the frame to read from the file (only used when
+            *filename* is given). Negative values index from the end of the file.
+
+    Returns:
+        Initialized MPCD system data (:py:class:`hoomd.mpcd.data.system`)
+
+    The MPCD particles are read from the ``mpcd/`` chunks written by
+    :py:class:`hoomd.mpcd.dump.gsd` or :py:meth:`hoomd.dump.gsd.dump_state`.
+    An MPCD system can be initialized from a GSD file **after** the HOOMD system
+    is first initialized (see :py:mod:`hoomd.init`). The system can only be
+    initialized one time. Frames written with a subsampling stride cannot be used
+    for initialization.
+
+    Examples::
+
+        hoomd.init.read_gsd(filename='init.gsd', restart='restart.gsd')
+        mpcd_sys = mpcd.init.read_gsd()
+
+        mpcd_sys = mpcd.init.read_gsd(filename='trajectory.gsd', frame=-1)
+
+    .. versionadded:: 2.9
+
+    """
+    hoomd.util.print_status_line()
+
+    if not hoomd.init.is_initialized():
+        hoomd.context.msg.error("mpcd: HOOMD system must be initialized before mpcd\n")
+        raise RuntimeError("HOOMD system not initialized")
+
+    if hoomd.context.current.mpcd is not None:
+        hoomd.context.msg.error("mpcd: system is already initialized, cannot reinitialize\n")
+        raise RuntimeError("mpcd system already initialized")
+
+    if filename is None:
+        reader = hoomd.context.current.state_reader
+        if reader is None:
+            hoomd.context.msg.error("mpcd: HOOMD system was not initialized from a GSD file, specify a filename\n")
+            raise RuntimeError("No GSD file to read")
+    else:
+        reader = hoomd._hoomd.GSDReader(hoomd.context.exec_conf, filename, abs(frame), frame < 0)
+        reader.clearSnapshot()
+
+    snap = data.make_snapshot()
+    if not _mpcd.read_gsd_snapshot(reader, snap.sys_snap, data.system._gsd_state_name()):
+        hoomd.context.msg.error("mpcd: no MPCD particles found in the GSD file\n")
+        raise RuntimeError("Error reading MPCD particles from GSD file")
+
+    hoomd.context.current.mpcd = data.system(_mpcd.SystemData(snap.sys_snap))
+    return hoomd.context.current.mpcd
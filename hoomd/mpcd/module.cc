@@ -12,10 +12,12 @@
 #endif // ENABLE_CUDA
 #include "SystemData.h"
 #include "SystemDataSnapshot.h"
+#include "GSDData.h"
 
 // cell list
 #include "CellList.h"
 #include "CellThermoCompute.h"
+#include "CellFieldAnalyzer.h"
 #ifdef ENABLE_CUDA
 #include "CellListGPU.h"
 #include "CellThermoComputeGPU.h"
@@ -117,9 +119,11 @@ PYBIND11_MODULE(_mpcd, m)
     #endif // ENABLE_CUDA
     mpcd::detail::export_SystemData(m);
     mpcd::detail::export_SystemDataSnapshot(m);
+    mpcd::detail::export_GSDData(m);
 
     mpcd::detail::export_CellList(m);
     mpcd::detail::export_CellThermoCompute(m);
+    mpcd::detail::export_CellFieldAnalyzer(m);
     #ifdef ENABLE_CUDA
     mpcd::detail::export_CellListGPU(m);
     mpcd::detail::export_CellThermoComputeGPU(m);
@@ -0,0 +1,113 @@
+# Copyright (c) 2009-2019 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+# Maintainer: mphoward
+
+import unittest
+import numpy as np
+import hoomd
+from hoomd import mpcd
+
+# unit tests for mpcd cell field analyzer
+class mpcd_analyze_field(unittest.TestCase):
+    def setUp(self):
+        hoomd.context.initialize()
+        hoomd.init.read_snapshot(hoomd.data.make_snapshot(N=0, box=hoomd.data.boxdim(L=4.)))
+
+        # two particles in the center of each cell, with x velocities centered on the z index of the cell
+        snap = mpcd.data.make_snapshot(N=128)
+        if hoomd.comm.get_rank() == 0:
+            idx = np.arange(64)
+            i = idx % 4
+            j = (idx // 4) % 4
+            k = idx // 16
+            pos = np.column_stack((i,j,k)) - 1.5
+            snap.particles.position[:] = np.concatenate((pos, pos))
+            vel = np.zeros((128,3))
+            vel[:64,0] = k + 1.
+            vel[64:,0] = k - 1.
+            snap.particles.velocity[:] = vel
+        self.s = mpcd.init.read_snapshot(snap)
+
+    # test the 1d profile along z
+    def test_profile(self):
+        f = mpcd.analyze.field(period=1, axes='z', temperature=True)
+        hoomd.run(1)
+        self.assertEqual(f.num_samples, 1)
+
+        rho = f.get('density')
+        vel = f.get('velocity')
+        temp = f.get('temperature')
+        if hoomd.comm.get_rank() == 0:
+            np.testing.assert_array_almost_equal(rho, [2.,2.,2.,2.])
+            np.testing.assert_array_almost_equal(vel, [[0.,0.,0.],[1.,0.,0.],[2.,0.,0.],[3.,0.,0.]])
+            np.testing.assert_array_almost_equal(temp, [2./3.,2./3.,2./3.,2./3.])
+        else:
+            self.assertIsNone(rho)
+
+    # test the full field is averaged over samples
+    def test_field(self):
+        f = mpcd.analyze.field(period=1)
+        hoomd.run(3)
+        self.assertEqual(f.num_samples, 3)
+
+        rho = f.get('density')
+        vel = f.get('velocity')
+        if hoomd.comm.get_rank() == 0:
+            self.assertEqual(rho.shape, (4,4,4))
+            self.assertEqual(vel.shape, (4,4,4,3))
+            np.testing.assert_array_almost_equal(rho, 2.*np.ones((4,4,4)))
+            for k in range(4):
+                np.testing.assert_array_almost_equal(vel[:,:,k,0], k*np.ones((4,4)))
+
+        # reset the averages
+        f.reset()
+        self.assertEqual(f.num_samples, 0)
+
+    # test a 2d profile keeps the axes in order
+    def test_plane(self):
+        f = mpcd.analyze.field(period=1, axes='zx')
+        self.assertEqual(f.axes, 'xz')
+        hoomd.run(1)
+
+        vel = f.get('velocity')
+        if hoomd.comm.get_rank() == 0:
+            self.assertEqual(vel.shape, (4,4,3))
+            np.testing.assert_array_almost_equal(vel[2,:,0], [0.,1.,2.,3.])
+
+    # test sampling on collision steps with sorting does not use stale cell properties in the collisions
+    def test_collide_sort(self):
+        mpcd.integrator(dt=0.1)
+        mpcd.stream.bulk(period=5)
+        mpcd.collide.srd(seed=42, period=5, angle=130.)
+        self.s.sorter.set_period(period=5)
+
+        snap = self.s.take_snapshot()
+        if hoomd.comm.get_rank() == 0:
+            mom = np.sum(snap.particles.velocity, axis=0)
+
+        # the field is computed before the collision on the same step, and the collision draws a new grid shift
+        f = mpcd.analyze.field(period=5)
+        hoomd.run(50)
+        self.assertEqual(f.num_samples, 10)
+
+        # momentum is only conserved if the collisions use the cell properties on the shifted grid
+        snap = self.s.take_snapshot()
+        if hoomd.comm.get_rank() == 0:
+            np.testing.assert_array_almost_equal(np.sum(snap.particles.velocity, axis=0), mom)
+
+    # test for errors in the quantities and axes
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            mpcd.analyze.field(period=1, axes='w')
+        f = mpcd.analyze.field(period=1)
+        with self.assertRaises(RuntimeError):
+            f.get('temperature')
+        with self.assertRaises(RuntimeError):
+            f.get('pressure')
+
+    def tearDown(self):
+        del self.s
+
+if __name__ == '__main__':
+    unittest.main(argv = ['test.py', '-v'])
@@ -0,0 +1,100 @@
+# Copyright (c) 2009-2019 The Regents of the University of Michigan
+# This file is part of the HOOMD-blue project, released under the BSD 3-Clause License.
+
+# Maintainer: mphoward
+
+import unittest
+import tempfile
+import os
+import numpy as np
+import hoomd
+from hoomd import mpcd
+
+# unit tests for writing and reading mpcd particles in gsd files
+class mpcd_dump_gsd(unittest.TestCase):
+    def setUp(self):
+        hoomd.context.initialize()
+        hoomd.init.read_snapshot(hoomd.data.make_snapshot(N=0, box=hoomd.data.boxdim(L=10.)))
+
+        if hoomd.comm.get_rank() == 0:
+            tmp = tempfile.mkstemp(suffix='.test.gsd')
+            self.tmp_file = tmp[1]
+        else:
+            self.tmp_file = "invalid"
+
+        snap = mpcd.data.make_snapshot(N=4)
+        if hoomd.comm.get_rank() == 0:
+            snap.particles.types = ['A','B']
+            snap.particles.position[:] = [[-4.,-4.,-4.],[-1.,-1.,-1.],[1.,1.,1.],[4.,4.,4.]]
+            snap.particles.velocity[:] = [[1.,2.,3.],[4.,5.,6.],[7.,8.,9.],[10.,11.,12.]]
+            snap.particles.typeid[:] = [0,1,1,0]
+            snap.particles.mass = 2.5
+        self.s = mpcd.init.read_snapshot(snap)
+        self.ref = snap
+
+    # test that a written frame restores the same particles
+    def test_round_trip(self):
+        mpcd.dump.gsd(filename=self.tmp_file, period=1, group=hoomd.group.all(), overwrite=True, truncate=True)
+        hoomd.run(1)
+
+        hoomd.context.initialize()
+        hoomd.init.read_snapshot(hoomd.data.make_snapshot(N=0, box=hoomd.data.boxdim(L=10.)))
+        s = mpcd.init.read_gsd(filename=self.tmp_file)
+        self.assertEqual(s.particles.N_global, 4)
+
+        snap = s.take_snapshot()
+        if hoomd.comm.get_rank() == 0:
+            self.assertEqual(snap.particles.types, ['A','B'])
+            self.assertAlmostEqual(snap.particles.mass, 2.5)
+            np.testing.assert_array_almost_equal(snap.particles.position, self.ref.particles.position)
+            np.testing.assert_array_almost_equal(snap.particles.velocity, self.ref.particles.velocity)
+            np.testing.assert_array_equal(snap.particles.typeid, self.ref.particles.typeid)
+
+    # test restarting from the file used to initialize the hoomd system
+    def test_restart(self):
+        d = hoomd.dump.gsd(filename=self.tmp_file, period=100, group=hoomd.group.all(), overwrite=True, truncate=True)
+        d.dump_state(self.s)
+        d.write_restart()
+
+        hoomd.context.initialize()
+        hoomd.init.read_gsd(filename=self.tmp_file)
+        s = mpcd.init.read_gsd()
+        self.assertEqual(s.particles.N_global, 4)
+
+        snap = s.take_snapshot()
+        if hoomd.comm.get_rank() == 0:
+            np.testing.assert_array_almost_equal(snap.particles.position, self.ref.particles.position)
+            np.testing.assert_array_almost_equal(snap.particles.velocity, self.ref.particles.velocity)
+
+    # test that subsampled frames cannot be used for initialization
+    def test_stride(self):
+        d = mpcd.dump.gsd(filename=self.tmp_file, period=1, group=hoomd.group.all(), overwrite=True, stride=2)
+        self.assertEqual(d.stride, 2)
+        hoomd.run(1)
+
+        hoomd.context.initialize()
+        hoomd.init.read_snapshot(hoomd.data.make_snapshot(N=0, box=hoomd.data.boxdim(L=10.)))
+        with self.assertRaises(RuntimeError):
+            mpcd.init.read_gsd(filename=self.tmp_file)
+
+    # test for error when the file has no mpcd particles
+    def test_missing(self):
+        hoomd.dump.gsd(filename=self.tmp_file, period=None, group=hoomd.group.all(), overwrite=True)
+
+        hoomd.context.initialize()
+        hoomd.init.read_snapshot(hoomd.data.make_snapshot(N=0, box=hoomd.data.boxdim(L=10.)))
+        with self.assertRaises(RuntimeError):
+            mpcd.init.read_gsd(filename=self.tmp_file)
+
+    # test for error when the stride is invalid
+    def test_bad_stride(self):
+        with self.assertRaises(RuntimeError):
+            mpcd.dump.gsd(filename=self.tmp_file, period=1, group=hoomd.group.all(), overwrite=True, stride=0)
+
+    def tearDown(self):
+        del self.s
+        if hoomd.comm.get_rank() == 0:
+            os.remove(self.tmp_file)
+
+if __name__ == '__main__':
+    unittest.main(argv = ['test.py', '-v'])
@@ -54,6 +54,37 @@ class mpcd_integrator_test(unittest.TestCase):
         self.assertAlmostEqual(ig.dt, 0.005)
         self.assertEqual(ig.aniso, True)
 
+    # test overlapping mpcd work with md forces
+    def test_overlap(self):
+        ig = mpcd.integrator(dt=0.001)
+        self.assertFalse(ig.overlap)
+
+        ig.set_params(overlap=True)
+        self.assertTrue(ig.overlap)
+
+        ig = mpcd.integrator(dt=0.001, overlap=True)
+        self.assertTrue(ig.overlap)
+
+    # test that overlapping mpcd work with md forces gives the same trajectory
+    def test_overlap_trajectory(self):
+        def run(overlap):
+            hoomd.context.initialize()
+            if hoomd.comm.get_num_ranks() > 1:
+                hoomd.comm.decomposition(nz=2)
+            hoomd.init.read_snapshot(hoomd.data.make_snapshot(N=2, box=hoomd.data.boxdim(L=20.)))
+            s = mpcd.init.make_random(N=1000, kT=1.0, seed=7)
+            mpcd.integrator(dt=0.1, overlap=overlap)
+            mpcd.stream.bulk(period=1)
+            mpcd.collide.srd(seed=42, period=2, angle=130., kT=1.0)
+            hoomd.run(10)
+            return s.take_snapshot()
+
+        ref = run(False)
+        snap = run(True)
+        if hoomd.comm.get_rank() == 0:
+            np.testing.assert_array_almost_equal(snap.particles.position, ref.particles.position)
+            np.testing.assert_array_almost_equal(snap.particles.velocity, ref.particles.velocity)
+
     # test updating integration methods
     def test_update_methods(self):
         ig = mpcd.integrator(dt=0.001)
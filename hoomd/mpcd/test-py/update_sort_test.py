@@ -51,6 +51,34 @@ class mpcd_update_sort_test(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             mpcd.update.sort(self.s)
 
+    # test automatic sorting
+    def test_auto(self):
+        self.assertFalse(self.s.sorter.auto)
+
+        self.s.sorter.set_params(auto=True, threshold=0.75)
+        self.assertTrue(self.s.sorter.auto)
+        self.assertAlmostEqual(self.s.sorter.threshold, 0.75)
+
+        self.s.sorter.set_params(threshold=0.5)
+        self.assertTrue(self.s.sorter.auto)
+        self.assertAlmostEqual(self.s.sorter.threshold, 0.5)
+
+        # a single particle is always local
+        self.s.sorter.set_period(period=1)
+        mpcd.integrator(dt=0.1)
+        hoomd.run(1)
+        self.assertAlmostEqual(self.s.sorter.locality, 1.0)
+
+        self.s.sorter.set_params(auto=False)
+        self.assertFalse(self.s.sorter.auto)
+
+    # test for errors in the threshold
+    def test_bad_threshold(self):
+        with self.assertRaises(RuntimeError):
+            self.s.sorter.set_params(threshold=0.0)
+        with self.assertRaises(RuntimeError):
+            self.s.sorter.set_params(threshold=1.5)
+
     def test_tune(self):
         self.s.sorter.tune(start=5, stop=10, step=2, tsteps=1)
         self.s.sorter.tune(start=5, stop=7, step=5, tsteps=2, quiet=True)
@@ -46,11 +46,8 @@ void celllist_dimension_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
     unsigned int Nmax = cl->getNmax();
     CHECK_EQUAL_UINT(Nmax, 4);    // Default is 4 particles per cell, ensure this happens if there's only one
 
-    Index2D cli = cl->getCellListIndexer();
-    CHECK_EQUAL_UINT(cli.getNumElements(), 6*8*10*Nmax);    // Cell list indexer has Nmax entries per cell
-
-    // Cell list uses amortized sizing, so must only be at least this big
-    UP_ASSERT(cl->getCellList().getNumElements() >= 6*8*10*Nmax);
+    // Each cell has one offset into the cell list
+    UP_ASSERT(cl->getCellOffsets().getNumElements() >= 6*8*10);
 
     /*******************/
     // Change the cell size, and ensure everything stays up to date
@@ -67,11 +64,8 @@ void celllist_dimension_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
     CHECK_EQUAL_UINT(cell_indexer.getNumElements(), 3*4*5);
     UP_ASSERT(cl->getCellSizeArray().getNumElements() >= 3*4*5);    // Each cell has one number
 
-    cli = cl->getCellListIndexer();
-    CHECK_EQUAL_UINT(cli.getNumElements(), 3*4*5*Nmax);    // Cell list indexer has Nmax entries per cell
-
-    // Cell list uses amortized sizing, so must only be at least this big
-    UP_ASSERT(cl->getCellList().getNumElements() >= 3*4*5*Nmax);
+    // Each cell has one offset into the cell list
+    UP_ASSERT(cl->getCellOffsets().getNumElements() >= 3*4*5);
 
     /*******************/
     // Change the cell size to something that does not evenly divide a side, and check for an exception
@@ -136,17 +130,17 @@ void celllist_small_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         CHECK_EQUAL_UINT( h_cell_np.data[ci(1,1,1)], 1 );
 
         // check the particle ids in each cell
-        Index2D cli = cl->getCellListIndexer();
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,0,0))], 0 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(1, ci(0,0,0))], 8 );
-
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,0,1))], 4 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,1,0))], 2 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,1,1))], 6 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,0,0))], 1 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,0,1))], 5 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,1,0))], 3 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,1,1))], 7 );
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,0)]], 0 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,0)] + 1], 8 );
+
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,1)]], 4 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,1,0)]], 2 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,1,1)]], 6 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,0,0)]], 1 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,0,1)]], 5 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,1,0)]], 3 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,1,1)]], 7 );
 
         ArrayHandle<Scalar4> h_vel(pdata_9->getVelocities(), access_location::host, access_mode::read);
         CHECK_EQUAL_UINT( __scalar_as_int(h_vel.data[0].w), ci(0,0,0) );
@@ -193,12 +187,12 @@ void celllist_small_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         CHECK_EQUAL_UINT( h_cell_np.data[ci(1,1,0)], 0);
 
         // check the particle ids in each cell
-        Index2D cli = cl->getCellListIndexer();
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
             {
             std::vector<unsigned int> pids(5,0);
             for (unsigned int i=0; i < 5; ++i)
                 {
-                pids[i] = h_cell_list.data[cli(i, ci(0,0,0))];
+                pids[i] = h_cell_list.data[h_cell_offsets.data[ci(0,0,0)] + i];
                 }
             sort(pids.begin(), pids.end());
             unsigned int check_pids[] = {0,2,4,6,8};
@@ -208,7 +202,7 @@ void celllist_small_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
             std::vector<unsigned int> pids(4,0);
             for (unsigned int i=0; i < 4; ++i)
                 {
-                pids[i] = h_cell_list.data[cli(i, ci(1,1,1))];
+                pids[i] = h_cell_list.data[h_cell_offsets.data[ci(1,1,1)] + i];
                 }
             sort(pids.begin(), pids.end());
             unsigned int check_pids[] = {1,3,5,7};
@@ -396,15 +390,15 @@ void celllist_embed_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         CHECK_EQUAL_UINT( h_cell_np.data[ci(1,1,1)], 1 );
 
         // check the particle ids in each cell
-        Index2D cli = cl->getCellListIndexer();
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,0,0))], 0 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,0,1))], 4 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,1,0))], 2 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,1,1))], 6 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,0,0))], 1 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,0,1))], 5 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,1,0))], 3 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,1,1))], 7 );
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,0)]], 0 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,1)]], 4 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,1,0)]], 2 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,1,1)]], 6 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,0,0)]], 1 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,0,1)]], 5 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,1,0)]], 3 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,1,1)]], 7 );
 
         ArrayHandle<Scalar4> h_vel(pdata_8->getVelocities(), access_location::host, access_mode::read);
         CHECK_EQUAL_UINT( __scalar_as_int(h_vel.data[0].w), ci(0,0,0) );
@@ -442,40 +436,40 @@ void celllist_embed_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         CHECK_EQUAL_UINT( h_cell_np.data[ci(1,1,1)], 2 );
 
         // check the particle ids in each cell
-        Index2D cli = cl->getCellListIndexer();
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,0,0))], 0 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,0,1))], 4 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,1,0))], 2 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,1,1))], 6 );
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,0)]], 0 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,1)]], 4 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,1,0)]], 2 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,1,1)]], 6 );
         // check two particles in cell (1,0,0)
             {
             std::vector<unsigned int> result(2);
-            result[0] = h_cell_list.data[cli(0,ci(1,0,0))];
-            result[1] = h_cell_list.data[cli(1,ci(1,0,0))];
+            result[0] = h_cell_list.data[h_cell_offsets.data[ci(1,0,0)]];
+            result[1] = h_cell_list.data[h_cell_offsets.data[ci(1,0,0)] + 1];
             sort(result.begin(), result.end());
             UP_ASSERT_EQUAL(result, std::vector<unsigned int>{1,8});
             }
         // check two particles in cell (1,0,1)
             {
             std::vector<unsigned int> result(2);
-            result[0] = h_cell_list.data[cli(0,ci(1,0,1))];
-            result[1] = h_cell_list.data[cli(1,ci(1,0,1))];
+            result[0] = h_cell_list.data[h_cell_offsets.data[ci(1,0,1)]];
+            result[1] = h_cell_list.data[h_cell_offsets.data[ci(1,0,1)] + 1];
             sort(result.begin(), result.end());
             UP_ASSERT_EQUAL(result, std::vector<unsigned int>{5,10});
             }
         // check two particles in cell (1,1,0)
             {
             std::vector<unsigned int> result(2);
-            result[0] = h_cell_list.data[cli(0,ci(1,1,0))];
-            result[1] = h_cell_list.data[cli(1,ci(1,1,0))];
+            result[0] = h_cell_list.data[h_cell_offsets.data[ci(1,1,0)]];
+            result[1] = h_cell_list.data[h_cell_offsets.data[ci(1,1,0)] + 1];
             sort(result.begin(), result.end());
             UP_ASSERT_EQUAL(result, std::vector<unsigned int>{3,9});
             }
         // check two particles in cell (1,1,1)
             {
             std::vector<unsigned int> result(2);
-            result[0] = h_cell_list.data[cli(0,ci(1,1,1))];
-            result[1] = h_cell_list.data[cli(1,ci(1,1,1))];
+            result[0] = h_cell_list.data[h_cell_offsets.data[ci(1,1,1)]];
+            result[1] = h_cell_list.data[h_cell_offsets.data[ci(1,1,1)] + 1];
             sort(result.begin(), result.end());
             UP_ASSERT_EQUAL(result, std::vector<unsigned int>{7,11});
             }
@@ -531,34 +525,34 @@ void celllist_embed_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         CHECK_EQUAL_UINT( h_cell_np.data[ci(1,1,1)], 2 );
 
         // check the particle ids in each cell
-        Index2D cli = cl->getCellListIndexer();
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,0,0))], 0 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,0,1))], 4 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,1,0))], 2 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(1,0,0))], 1 );
-        CHECK_EQUAL_UINT( h_cell_list.data[cli(0, ci(0,1,1))], 6 );
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,0)]], 0 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,0,1)]], 4 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,1,0)]], 2 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(1,0,0)]], 1 );
+        CHECK_EQUAL_UINT( h_cell_list.data[h_cell_offsets.data[ci(0,1,1)]], 6 );
         // check two particles in cell (1,0,1)
             {
             std::vector<unsigned int> result(2);
-            result[0] = h_cell_list.data[cli(0,ci(1,0,1))];
-            result[1] = h_cell_list.data[cli(1,ci(1,0,1))];
+            result[0] = h_cell_list.data[h_cell_offsets.data[ci(1,0,1)]];
+            result[1] = h_cell_list.data[h_cell_offsets.data[ci(1,0,1)] + 1];
             sort(result.begin(), result.end());
             UP_ASSERT_EQUAL(result, std::vector<unsigned int>{5,10});
             }
         // check two particles in cell (1,1,0)
             {
             std::vector<unsigned int> result(3);
-            result[0] = h_cell_list.data[cli(0,ci(1,1,0))];
-            result[1] = h_cell_list.data[cli(1,ci(1,1,0))];
-            result[2] = h_cell_list.data[cli(2,ci(1,1,0))];
+            result[0] = h_cell_list.data[h_cell_offsets.data[ci(1,1,0)]];
+            result[1] = h_cell_list.data[h_cell_offsets.data[ci(1,1,0)] + 1];
+            result[2] = h_cell_list.data[h_cell_offsets.data[ci(1,1,0)] + 2];
             sort(result.begin(), result.end());
             UP_ASSERT_EQUAL(result, std::vector<unsigned int>{3,8,9});
             }
         // check two particles in cell (1,1,1)
             {
             std::vector<unsigned int> result(2);
-            result[0] = h_cell_list.data[cli(0,ci(1,1,1))];
-            result[1] = h_cell_list.data[cli(1,ci(1,1,1))];
+            result[0] = h_cell_list.data[h_cell_offsets.data[ci(1,1,1)]];
+            result[1] = h_cell_list.data[h_cell_offsets.data[ci(1,1,1)] + 1];
             sort(result.begin(), result.end());
             UP_ASSERT_EQUAL(result, std::vector<unsigned int>{7,11});
             }
@@ -592,6 +586,108 @@ void celllist_embed_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         }
     }
 
+//! Test the compact and padded layouts of the CPU cell list
+void celllist_compact_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    std::shared_ptr< SnapshotSystemData<Scalar> > snap( new SnapshotSystemData<Scalar>() );
+    snap->global_box = BoxDim(6.0);
+    snap->particle_data.type_mapping.push_back("A");
+    std::shared_ptr<SystemDefinition> sysdef(new SystemDefinition(snap, exec_conf));
+
+    // crowd 16 particles into one cell, and spread 4 more over other cells
+    auto mpcd_snap = std::make_shared<mpcd::ParticleDataSnapshot>(20);
+    for (unsigned int i=0; i < 16; ++i)
+        mpcd_snap->position[i] = vec3<Scalar>(0.5, 0.5, 0.5);
+    mpcd_snap->position[16] = vec3<Scalar>(-2.5, -2.5, -2.5);
+    mpcd_snap->position[17] = vec3<Scalar>(2.5, -2.5, -2.5);
+    mpcd_snap->position[18] = vec3<Scalar>(-2.5, 2.5, -2.5);
+    mpcd_snap->position[19] = vec3<Scalar>(-2.5, -2.5, 2.5);
+    auto pdata = std::make_shared<mpcd::ParticleData>(mpcd_snap, snap->global_box, exec_conf);
+
+    std::shared_ptr<mpcd::CellList> cl(new mpcd::CellList(sysdef, pdata));
+    cl->compute(0);
+
+    // the largest cell is tracked, but the cell list only holds one entry per particle
+    CHECK_EQUAL_UINT(cl->getNmax(), 16);
+    UP_ASSERT(cl->getCellList().getNumElements() < cl->getNCells() * cl->getNmax());
+
+        {
+        ArrayHandle<unsigned int> h_cell_np(cl->getCellSizeArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_cell_list(cl->getCellList(), access_location::host, access_mode::read);
+
+        // offsets are the exclusive prefix sum of the cell sizes
+        unsigned int offset = 0;
+        for (unsigned int cur_cell=0; cur_cell < cl->getNCells(); ++cur_cell)
+            {
+            CHECK_EQUAL_UINT(h_cell_offsets.data[cur_cell], offset);
+            offset += h_cell_np.data[cur_cell];
+            }
+        CHECK_EQUAL_UINT(offset, 20);
+
+        // each particle appears once, in ascending order within its cell
+        Index3D ci = cl->getCellIndexer();
+        const unsigned int crowded = ci(3,3,3);
+        CHECK_EQUAL_UINT(h_cell_np.data[crowded], 16);
+        for (unsigned int i=0; i < 16; ++i)
+            {
+            CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[crowded] + i], i);
+            }
+        CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[ci(0,0,0)]], 16);
+        CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[ci(5,0,0)]], 17);
+        CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[ci(0,5,0)]], 18);
+        CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[ci(0,0,5)]], 19);
+        }
+
+    // spreading the particles out keeps the list compact without any reallocation of the cells
+        {
+        ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::overwrite);
+        for (unsigned int i=0; i < 16; ++i)
+            h_pos.data[i] = make_scalar4(-2.5 + (i % 4), -2.5 + (i / 4), 0.5, __int_as_scalar(0));
+        }
+    cl->compute(1);
+    CHECK_EQUAL_UINT(cl->getNmax(), 1);
+        {
+        ArrayHandle<unsigned int> h_cell_np(cl->getCellSizeArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_cell_list(cl->getCellList(), access_location::host, access_mode::read);
+        Index3D ci = cl->getCellIndexer();
+        for (unsigned int i=0; i < 16; ++i)
+            {
+            const unsigned int cell = ci(i % 4, i / 4, 3);
+            CHECK_EQUAL_UINT(h_cell_np.data[cell], 1);
+            CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[cell]], i);
+            }
+        }
+
+    // the padded layout regrows the slots of every cell to hold the crowded cell
+        {
+        ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::overwrite);
+        for (unsigned int i=0; i < 16; ++i)
+            h_pos.data[i] = make_scalar4(0.5, 0.5, 0.5, __int_as_scalar(0));
+        }
+    cl->setCompact(false);
+    cl->compute(2);
+    CHECK_EQUAL_UINT(cl->getNmax(), 16);
+    CHECK_EQUAL_UINT(cl->getCellList().getNumElements(), cl->getNCells() * 16);
+        {
+        ArrayHandle<unsigned int> h_cell_np(cl->getCellSizeArray(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
+        ArrayHandle<unsigned int> h_cell_list(cl->getCellList(), access_location::host, access_mode::read);
+        Index3D ci = cl->getCellIndexer();
+        Index2D cli = cl->getCellListIndexer();
+        const unsigned int crowded = ci(3,3,3);
+        CHECK_EQUAL_UINT(h_cell_np.data[crowded], 16);
+        CHECK_EQUAL_UINT(h_cell_offsets.data[crowded], cli(0, crowded));
+        for (unsigned int i=0; i < 16; ++i)
+            {
+            CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[crowded] + i], i);
+            }
+        CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[ci(0,0,0)]], 16);
+        CHECK_EQUAL_UINT(h_cell_list.data[h_cell_offsets.data[ci(5,0,0)]], 17);
+        }
+    }
+
 //! dimension test case for MPCD CellList class
 UP_TEST( mpcd_cell_list_dimensions )
     {
@@ -616,6 +712,12 @@ UP_TEST( mpcd_cell_list_embed_test )
     celllist_embed_test<mpcd::CellList>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
     }
 
+//! compact layout test case for MPCD CellList class
+UP_TEST( mpcd_cell_list_compact_test )
+    {
+    celllist_compact_test(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
+    }
+
 #ifdef ENABLE_CUDA
 //! dimension test case for MPCD CellListGPU class
 UP_TEST( mpcd_cell_list_gpu_dimensions )
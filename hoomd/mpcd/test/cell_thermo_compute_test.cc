@@ -311,6 +311,61 @@ void cell_thermo_embed_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         }
     }
 
+#ifdef ENABLE_TBB
+//! Test that threaded and serial calculations of the cell properties agree in a thin box
+void cell_thermo_threads_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    // the box is a single cell thick in z, so the cells can only be split over threads in x and y
+    const BoxDim box(10.0, 10.0, 1.0);
+    auto sysdef = std::make_shared<::SystemDefinition>(0, box, 1, 0, 0, 0, 0, exec_conf);
+    auto pdata = std::make_shared<mpcd::ParticleData>(1000, box, 1.0, 42, 3, exec_conf);
+    auto mpcd_sys = std::make_shared<mpcd::SystemData>(sysdef, pdata);
+
+    std::shared_ptr<mpcd::CellList> cl = mpcd_sys->getCellList();
+    std::shared_ptr<mpcd::CellThermoCompute> thermo = std::make_shared<mpcd::CellThermoCompute>(mpcd_sys);
+    AllThermoRequest thermo_req(thermo);
+
+    // compute the cell properties in serial and save them
+    exec_conf->setNumThreads(1);
+    thermo->compute(0);
+    std::vector<double4> ref_vel;
+    std::vector<double3> ref_energy;
+        {
+        ArrayHandle<double4> h_avg_vel(thermo->getCellVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<double3> h_cell_energy(thermo->getCellEnergies(), access_location::host, access_mode::read);
+        const unsigned int ncells = cl->getCellIndexer().getNumElements();
+        ref_vel.assign(h_avg_vel.data, h_avg_vel.data + ncells);
+        ref_energy.assign(h_cell_energy.data, h_cell_energy.data + ncells);
+        }
+    const Scalar3 ref_mom = thermo->getNetMomentum();
+    const Scalar ref_net_energy = thermo->getNetEnergy();
+    const Scalar ref_temp = thermo->getTemperature();
+
+    // recompute with multiple threads, and every cell should be the same
+    exec_conf->setNumThreads(4);
+    thermo->compute(1);
+        {
+        ArrayHandle<double4> h_avg_vel(thermo->getCellVelocities(), access_location::host, access_mode::read);
+        ArrayHandle<double3> h_cell_energy(thermo->getCellEnergies(), access_location::host, access_mode::read);
+        for (unsigned int i=0; i < ref_vel.size(); ++i)
+            {
+            CHECK_CLOSE(h_avg_vel.data[i].x, ref_vel[i].x, tol_small);
+            CHECK_CLOSE(h_avg_vel.data[i].y, ref_vel[i].y, tol_small);
+            CHECK_CLOSE(h_avg_vel.data[i].z, ref_vel[i].z, tol_small);
+            CHECK_CLOSE(h_avg_vel.data[i].w, ref_vel[i].w, tol_small);
+            CHECK_CLOSE(h_cell_energy.data[i].x, ref_energy[i].x, tol_small);
+            CHECK_CLOSE(h_cell_energy.data[i].y, ref_energy[i].y, tol_small);
+            UP_ASSERT_EQUAL(__double_as_int(h_cell_energy.data[i].z), __double_as_int(ref_energy[i].z));
+            }
+        }
+    CHECK_CLOSE(thermo->getNetMomentum().x, ref_mom.x, tol_small);
+    CHECK_CLOSE(thermo->getNetMomentum().y, ref_mom.y, tol_small);
+    CHECK_CLOSE(thermo->getNetMomentum().z, ref_mom.z, tol_small);
+    CHECK_CLOSE(thermo->getNetEnergy(), ref_net_energy, tol_small);
+    CHECK_CLOSE(thermo->getTemperature(), ref_temp, tol_small);
+    }
+#endif // ENABLE_TBB
+
 UP_TEST( mpcd_cell_thermo_basic )
     {
     cell_thermo_basic_test<mpcd::CellThermoCompute>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
@@ -320,6 +375,13 @@ UP_TEST( mpcd_cell_thermo_embed )
     cell_thermo_embed_test<mpcd::CellThermoCompute>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
     }
 
+#ifdef ENABLE_TBB
+UP_TEST( mpcd_cell_thermo_threads )
+    {
+    cell_thermo_threads_test(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
+    }
+#endif // ENABLE_TBB
+
 #ifdef ENABLE_CUDA
 UP_TEST( mpcd_cell_thermo_basic_gpu )
     {
@@ -143,7 +143,7 @@ void sorter_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         ArrayHandle<unsigned int> h_cl(cl->getCellList(), access_location::host, access_mode::read);
         ArrayHandle<unsigned int> h_np(cl->getCellSizeArray(), access_location::host, access_mode::read);
         const Index3D& ci = cl->getCellIndexer();
-        const Index2D& cli = cl->getCellListIndexer();
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
 
         // all cells should have one particle, except the first cell, which has the embedded one
         UP_ASSERT_EQUAL(h_np.data[ci(0,0,0)], 2);
@@ -156,15 +156,15 @@ void sorter_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         UP_ASSERT_EQUAL(h_np.data[ci(1,1,1)], 1);
 
         // the particles should be in ascending order
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(1,0,0))], 1);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(0,1,0))], 2);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(1,1,0))], 3);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(0,0,1))], 4);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(1,0,1))], 5);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(0,1,1))], 6);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(1,1,1))], 7);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(1,0,0)]], 1);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(0,1,0)]], 2);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(1,1,0)]], 3);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(0,0,1)]], 4);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(1,0,1)]], 5);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(0,1,1)]], 6);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(1,1,1)]], 7);
         // do first cell separately, since it needs to be a sorted list
-        std::vector<unsigned int> cell_0 = {h_cl.data[cli(0,ci(0,0,0))], h_cl.data[cli(1,ci(0,0,0))]};
+        std::vector<unsigned int> cell_0 = {h_cl.data[h_cell_offsets.data[ci(0,0,0)]], h_cl.data[h_cell_offsets.data[ci(0,0,0)] + 1]};
         std::sort(cell_0.begin(), cell_0.end());
         UP_ASSERT_EQUAL(cell_0, std::vector<unsigned int>{0,8});
         }
@@ -304,7 +304,7 @@ void sorter_virtual_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         ArrayHandle<unsigned int> h_cl(cl->getCellList(), access_location::host, access_mode::read);
         ArrayHandle<unsigned int> h_np(cl->getCellSizeArray(), access_location::host, access_mode::read);
         const Index3D& ci = cl->getCellIndexer();
-        const Index2D& cli = cl->getCellListIndexer();
+        ArrayHandle<unsigned int> h_cell_offsets(cl->getCellOffsets(), access_location::host, access_mode::read);
 
         // all cells should have one particle
         UP_ASSERT_EQUAL(h_np.data[ci(0,0,0)], 1);
@@ -317,17 +317,84 @@ void sorter_virtual_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
         UP_ASSERT_EQUAL(h_np.data[ci(1,1,1)], 1);
 
         // the particles should be in ascending order, with VPs interleaved unsorted
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(0,0,0))], 0);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(1,0,0))], 6);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(0,1,0))], 1);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(1,1,0))], 7);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(0,0,1))], 2);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(1,0,1))], 3);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(0,1,1))], 4);
-        UP_ASSERT_EQUAL(h_cl.data[cli(0,ci(1,1,1))], 5);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(0,0,0)]], 0);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(1,0,0)]], 6);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(0,1,0)]], 1);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(1,1,0)]], 7);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(0,0,1)]], 2);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(1,0,1)]], 3);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(0,1,1)]], 4);
+        UP_ASSERT_EQUAL(h_cl.data[h_cell_offsets.data[ci(1,1,1)]], 5);
         }
     }
 
+//! Test for automatic MPCD sorting based on the particle locality
+template<class T>
+void sorter_auto_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    std::shared_ptr< SnapshotSystemData<Scalar> > snap( new SnapshotSystemData<Scalar>() );
+    snap->global_box = BoxDim(2.0);
+    snap->particle_data.type_mapping.push_back("A");
+    std::shared_ptr<SystemDefinition> sysdef(new SystemDefinition(snap, exec_conf));
+
+    // place two particles per cell, filling the cells in reverse order so that members of a cell are adjacent
+    auto mpcd_sys_snap = std::make_shared<mpcd::SystemDataSnapshot>(sysdef);
+        {
+        auto mpcd_snap = mpcd_sys_snap->particles;
+        mpcd_snap->resize(16);
+        for (unsigned int i=0; i < 16; ++i)
+            {
+            const unsigned int cell = 7 - i/2;
+            mpcd_snap->position[i] = vec3<Scalar>(Scalar(cell % 2) - 0.5, Scalar((cell/2) % 2) - 0.5, Scalar(cell/4) - 0.5);
+            }
+        }
+    auto mpcd_sys = std::make_shared<mpcd::SystemData>(mpcd_sys_snap);
+    std::shared_ptr<mpcd::ParticleData> pdata = mpcd_sys->getParticleData();
+
+    std::shared_ptr<T> sorter = std::make_shared<T>(mpcd_sys,0,1);
+    sorter->setAutoSort(true, 0.5);
+    UP_ASSERT(sorter->getAutoSort());
+
+    // the particles are local, so they should not be sorted even though they are not in cell order
+    sorter->update(0);
+    CHECK_CLOSE(sorter->getLocality(), 1.0, tol_small);
+        {
+        ArrayHandle<unsigned int> h_tag(pdata->getTags(), access_location::host, access_mode::read);
+        for (unsigned int i=0; i < 16; ++i)
+            UP_ASSERT_EQUAL(h_tag.data[i], i);
+        }
+
+    // interleave the particles so that members of a cell are far apart in memory
+        {
+        ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::readwrite);
+        for (unsigned int i=0; i < 16; ++i)
+            {
+            const unsigned int cell = i % 8;
+            h_pos.data[i].x = Scalar(cell % 2) - 0.5;
+            h_pos.data[i].y = Scalar((cell/2) % 2) - 0.5;
+            h_pos.data[i].z = Scalar(cell/4) - 0.5;
+            }
+        }
+
+    // now the locality is too low, and the particles are sorted into cell order
+    sorter->update(1);
+    CHECK_SMALL(sorter->getLocality(), tol_small);
+        {
+        ArrayHandle<unsigned int> h_tag(pdata->getTags(), access_location::host, access_mode::read);
+        for (unsigned int cell=0; cell < 8; ++cell)
+            {
+            std::vector<unsigned int> members = {h_tag.data[2*cell], h_tag.data[2*cell+1]};
+            std::sort(members.begin(), members.end());
+            UP_ASSERT_EQUAL(members, std::vector<unsigned int>({cell, cell+8}));
+            }
+        }
+    CHECK_CLOSE(sorter->computeLocality(2), 1.0, tol_small);
+
+    // threshold must be in (0,1]
+    UP_ASSERT_EXCEPTION(std::runtime_error, [&]{ sorter->setAutoSort(true, 0.0); });
+    UP_ASSERT_EXCEPTION(std::runtime_error, [&]{ sorter->setAutoSort(true, 1.5); });
+    }
+
 //! basic test case for MPCD sorter
 UP_TEST( mpcd_sorter_test )
     {
@@ -338,6 +405,11 @@ UP_TEST( mpcd_sorter_virtual_test )
     {
     sorter_virtual_test<mpcd::Sorter>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
     }
+//! test case for automatic MPCD sorting
+UP_TEST( mpcd_sorter_auto_test )
+    {
+    sorter_auto_test<mpcd::Sorter>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::CPU)));
+    }
 #ifdef ENABLE_CUDA
 UP_TEST( mpcd_sorter_test_gpu )
     {
@@ -347,4 +419,8 @@ UP_TEST( mpcd_sorter_virtual_test_gpu )
     {
     sorter_virtual_test<mpcd::SorterGPU>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::GPU)));
     }
+UP_TEST( mpcd_sorter_auto_test_gpu )
+    {
+    sorter_auto_test<mpcd::SorterGPU>(std::shared_ptr<ExecutionConfiguration>(new ExecutionConfiguration(ExecutionConfiguration::GPU)));
+    }
 #endif // ENABLE_CUDA
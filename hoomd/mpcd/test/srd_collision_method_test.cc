@@ -367,6 +367,47 @@ void srd_collision_method_thermostat_test(std::shared_ptr<ExecutionConfiguration
         }
     }
 
+#ifdef ENABLE_TBB
+//! Test that threaded and serial collisions give the same velocities in a thin box
+void srd_collision_method_threads_test(std::shared_ptr<ExecutionConfiguration> exec_conf)
+    {
+    // the box is a single cell thick in z, so the cells can only be split over threads in x and y
+    const BoxDim box(10.0, 10.0, 1.0);
+
+    // run a few thermostatted collisions with the given number of threads and return the final velocities
+    auto collide_with_threads = [&](unsigned int num_threads)
+        {
+        exec_conf->setNumThreads(num_threads);
+        auto sysdef = std::make_shared<::SystemDefinition>(0, box, 1, 0, 0, 0, 0, exec_conf);
+        auto pdata = std::make_shared<mpcd::ParticleData>(1000, box, 1.0, 42, 3, exec_conf);
+        auto mpcd_sys = std::make_shared<mpcd::SystemData>(sysdef, pdata);
+
+        auto thermo = std::make_shared<mpcd::CellThermoCompute>(mpcd_sys);
+        std::shared_ptr<mpcd::SRDCollisionMethod> collide = std::make_shared<mpcd::SRDCollisionMethod>(mpcd_sys, 0, 1, -1, 827, thermo);
+        collide->setTemperature(std::make_shared<::VariantConst>(2.0));
+        for (unsigned int timestep=0; timestep < 3; ++timestep)
+            collide->collide(timestep);
+
+        ArrayHandle<unsigned int> h_tag(pdata->getTags(), access_location::host, access_mode::read);
+        ArrayHandle<Scalar4> h_vel(pdata->getVelocities(), access_location::host, access_mode::read);
+        std::vector<Scalar3> vel(pdata->getN());
+        for (unsigned int i=0; i < pdata->getN(); ++i)
+            vel[h_tag.data[i]] = make_scalar3(h_vel.data[i].x, h_vel.data[i].y, h_vel.data[i].z);
+        return vel;
+        };
+
+    const std::vector<Scalar3> ref_vel = collide_with_threads(1);
+    const std::vector<Scalar3> vel = collide_with_threads(4);
+    UP_ASSERT_EQUAL(vel.size(), ref_vel.size());
+    for (unsigned int i=0; i < ref_vel.size(); ++i)
+        {
+        CHECK_CLOSE(vel[i].x, ref_vel[i].x, tol_small);
+        CHECK_CLOSE(vel[i].y, ref_vel[i].y, tol_small);
+        CHECK_CLOSE(vel[i].z, ref_vel[i].z, tol_small);
+        }
+    }
+#endif // ENABLE_TBB
+
 //! basic test case for MPCD SRDCollisionMethod class
 UP_TEST( srd_collision_method_basic )
     {
@@ -386,6 +427,13 @@ UP_TEST( srd_collision_method_thermostat )
     {
     srd_collision_method_thermostat_test<mpcd::SRDCollisionMethod>(std::make_shared<ExecutionConfiguration>(ExecutionConfiguration::CPU));
     }
+#ifdef ENABLE_TBB
+//! test that threaded and serial collisions agree for the MPCD SRDCollisionMethod class
+UP_TEST( srd_collision_method_threads )
+    {
+    srd_collision_method_threads_test(std::make_shared<ExecutionConfiguration>(ExecutionConfiguration::CPU));
+    }
+#endif // ENABLE_TBB
 #ifdef ENABLE_CUDA
 //! basic test case for MPCD SRDCollisionMethodGPU class
 UP_TEST( srd_collision_method_basic_gpu )
@@ -36,6 +36,15 @@ class sort(hoomd.meta._metadata):
         The *period* should be no smaller than the MPCD collision period, or unnecessary
         cell list builds will occur.
 
+    Instead of sorting at a fixed period, the sorter can decide itself when to sort.
+    With ``auto=True`` (see :py:meth:`set_params`), the *locality* of the particles is
+    checked every *period* time steps from the cell list built for the collisions, and
+    the particles are only sorted when it drops below a *threshold*. The locality is the
+    fraction of consecutive members of a cell (in memory order) that are also close in memory.
+    It is 1 right after sorting, and it decreases as the particles diffuse. In this mode, set
+    the *period* to the collision period so that the locality is checked whenever the cell list
+    is built. No offline tuning of the sorting period is required.
+
     Essentially all MPCD systems benefit from sorting, and so a sorter is created by
     default with the MPCD system. To disable it or modify parameters, save the system
     and access the sorter through it::
@@ -65,9 +74,11 @@ class sort(hoomd.meta._metadata):
             cpp_class = _mpcd.SorterGPU
         self._cpp = cpp_class(system.data, hoomd.context.current.system.getCurrentTimeStep(), period)
 
-        self.metadata_fields = ['period','enabled']
+        self.metadata_fields = ['period','enabled','auto','threshold']
         self.period = period
         self.enabled = True
+        self.auto = False
+        self.threshold = 0.5
 
     def disable(self):
         hoomd.util.print_status_line()
@@ -98,6 +109,42 @@ class sort(hoomd.meta._metadata):
         self.period = period
         self._cpp.setPeriod(hoomd.context.current.system.getCurrentTimeStep(), self.period)
 
+    def set_params(self, auto=None, threshold=None):
+        """ Set parameters for automatic sorting.
+
+        Args:
+            auto (bool): If True, only sort when the locality drops below *threshold*.
+            threshold (float): Locality below which the particles are sorted (between 0 and 1).
+
+        Examples::
+
+            sorter.set_params(auto=True)
+            sorter.set_params(threshold=0.75)
+            sorter.set_params(auto=False)
+
+        .. versionadded:: 2.9
+
+        """
+        hoomd.util.print_status_line()
+
+        if auto is None:
+            auto = self.auto
+        if threshold is None:
+            threshold = self.threshold
+        self._cpp.setAutoSort(bool(auto), float(threshold))
+
+        self.auto = bool(auto)
+        self.threshold = float(threshold)
+
+    @property
+    def locality(self):
+        R""" Locality of the particles on this rank at the last check in automatic mode.
+
+        .. versionadded:: 2.9
+
+        """
+        return self._cpp.locality
+
     def tune(self, start, stop, step, tsteps, quiet=False):
         """ Tune the sorting period.
 
@@ -121,6 +168,10 @@ class sort(hoomd.meta._metadata):
         are also reported as output, and the fastest sorting period is also
         returned.
 
+        Note:
+            Automatic sorting (see :py:meth:`set_params`) chooses when to sort during
+            the simulation without tuning runs.
+
         Note:
             A short warmup run is **required** before calling :py:meth:`tune()`
             in order to ensure the runtime autotuners have found optimal
@@ -0,0 +1,156 @@
+# -*- coding: iso-8859-1 -*-
+
+from hoomd import *
+import hoomd;
+import unittest
+import os
+import numpy
+import tempfile
+import shutil
+import glob
+
+# unit tests for dump.checkpoint and init.read_checkpoint
+class checkpoint_tests (unittest.TestCase):
+    def setUp(self):
+        context.initialize()
+        if comm.get_rank() == 0:
+            self.tmp_dir = tempfile.mkdtemp();
+            self.tmp_file = os.path.join(self.tmp_dir, 'restart');
+        else:
+            self.tmp_file = "invalid";
+
+        self.snapshot = data.make_snapshot(N=6, box=data.boxdim(L=10), dtype='double');
+        if comm.get_rank() == 0:
+            self.snapshot.particles.types = ['p1', 'p2'];
+            self.snapshot.particles.position[:] = [[0,1,2], [1,2,3], [0,-1,-2], [-1,-2,-3], [4,-4,4], [-4,4,-4]];
+            self.snapshot.particles.velocity[:] = numpy.arange(18).reshape(6,3);
+            self.snapshot.particles.orientation[:] = [[1,0,0,0], [0,1,0,0], [0,0,1,0], [0,0,0,1], [1,0,0,0], [0,1,0,0]];
+            self.snapshot.particles.typeid[:] = [0,0,1,1,0,1];
+            self.snapshot.particles.mass[:] = [33, 34, 35, 36, 37, 38];
+            self.snapshot.particles.charge[:] = [44, 45, 46, 47, 48, 49];
+            self.snapshot.particles.diameter[:] = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0];
+            self.snapshot.particles.image[:] = [[1,0,0], [0,1,0], [0,0,1], [-1,0,0], [0,-1,0], [0,0,-1]];
+            self.snapshot.particles.moment_inertia[:] = [[1,2,3]]*6;
+
+            self.snapshot.bonds.types = ['b1', 'b2'];
+            self.snapshot.bonds.resize(3);
+            self.snapshot.bonds.typeid[:] = [0, 1, 1];
+            self.snapshot.bonds.group[:] = [[0, 1], [2, 4], [4, 5]];
+
+            self.snapshot.angles.types = ['a1'];
+            self.snapshot.angles.resize(1);
+            self.snapshot.angles.group[0] = [0, 1, 2];
+
+            self.snapshot.constraints.resize(1);
+            self.snapshot.constraints.group[0] = [4, 5];
+            self.snapshot.constraints.value[0] = 2.5;
+
+        self.s = init.read_snapshot(self.snapshot);
+
+    # checks that the particles and groups of snap match the reference snapshot
+    # with ordered=False, the particles are matched by position and the groups are compared as sets
+    def check_snapshot(self, snap, ref, ordered=True):
+        if comm.get_rank() == 0:
+            self.assertEqual(snap.particles.N, ref.particles.N);
+            self.assertEqual(snap.particles.types, ref.particles.types);
+
+            order = numpy.arange(ref.particles.N);
+            if not ordered:
+                order = numpy.array([numpy.flatnonzero(numpy.all(snap.particles.position == p, axis=1))[0] for p in ref.particles.position]);
+            rank = numpy.argsort(order);
+
+            numpy.testing.assert_array_equal(snap.particles.typeid[order], ref.particles.typeid);
+            numpy.testing.assert_array_equal(snap.particles.position[order], ref.particles.position);
+            numpy.testing.assert_array_equal(snap.particles.velocity[order], ref.particles.velocity);
+            numpy.testing.assert_array_equal(snap.particles.orientation[order], ref.particles.orientation);
+            numpy.testing.assert_array_equal(snap.particles.mass[order], ref.particles.mass);
+            numpy.testing.assert_array_equal(snap.particles.charge[order], ref.particles.charge);
+            numpy.testing.assert_array_equal(snap.particles.diameter[order], ref.particles.diameter);
+            numpy.testing.assert_array_equal(snap.particles.image[order], ref.particles.image);
+            numpy.testing.assert_array_equal(snap.particles.moment_inertia[order], ref.particles.moment_inertia);
+
+            # groups as sorted rows of type (or value) and members in the order of ref
+            def rows(groups, values, index):
+                return sorted(zip(values.tolist(), index[groups].tolist()));
+
+            self.assertEqual(snap.bonds.types, ref.bonds.types);
+            self.assertEqual(rows(snap.bonds.group, snap.bonds.typeid, rank), rows(ref.bonds.group, ref.bonds.typeid, numpy.arange(ref.particles.N)));
+            self.assertEqual(snap.angles.types, ref.angles.types);
+            self.assertEqual(rows(snap.angles.group, snap.angles.typeid, rank), rows(ref.angles.group, ref.angles.typeid, numpy.arange(ref.particles.N)));
+            self.assertEqual(rows(snap.constraints.group, snap.constraints.value, rank), rows(ref.constraints.group, ref.constraints.value, numpy.arange(ref.particles.N)));
+
+    # tests a checkpoint written and read at the current time step
+    def test_write_read(self):
+        dump.checkpoint(filename=self.tmp_file, period=None);
+        ref = self.s.take_snapshot(all=True, dtype='double');
+        context.initialize();
+
+        s = init.read_checkpoint(filename=self.tmp_file);
+        self.check_snapshot(s.take_snapshot(all=True, dtype='double'), ref);
+
+    # tests an asynchronous checkpoint written during a run
+    def test_async(self):
+        ckpt = dump.checkpoint(filename=self.tmp_file, period=5, asynchronous=True);
+        run(11);
+        ckpt.wait();
+        ckpt.write_restart();
+        ref = self.s.take_snapshot(all=True, dtype='double');
+        step = get_step();
+        context.initialize();
+
+        s = init.read_checkpoint(filename=self.tmp_file);
+        self.assertEqual(get_step(), step);
+        self.check_snapshot(s.take_snapshot(all=True, dtype='double'), ref);
+
+    # tests a checkpoint of a system with removed particles
+    def test_removed(self):
+        # particle 3 is not in a bonded group
+        self.s.particles.remove(3);
+        dump.checkpoint(filename=self.tmp_file, period=None);
+        ref = self.s.take_snapshot(all=True, dtype='double');
+        context.initialize();
+
+        # the tags are compacted rank by rank
+        s = init.read_checkpoint(filename=self.tmp_file);
+        self.check_snapshot(s.take_snapshot(all=True, dtype='double'), ref, ordered=False);
+
+    # tests that a checkpoint interrupted while writing falls back to the previous complete checkpoint
+    def test_interrupted(self):
+        ckpt = dump.checkpoint(filename=self.tmp_file, period=None);
+        if comm.get_rank() == 0:
+            old_dir = os.path.join(self.tmp_dir, 'old');
+            os.mkdir(old_dir);
+            for f in glob.glob(self.tmp_file + '.0.*'):
+                shutil.copy(f, old_dir);
+
+        run(5);
+        self.s.particles[0].position = (0, 1, 1);
+        ckpt.write_restart();
+        ref = self.s.take_snapshot(all=True, dtype='double');
+        step = get_step();
+        if comm.get_rank() == 0:
+            shutil.copy(self.tmp_file, os.path.join(old_dir, 'index'));
+
+        run(5);
+        self.s.particles[0].position = (0, 1, 0);
+        ckpt.write_restart();
+
+        # the job stops after part 0 of the third checkpoint is written, before it is committed
+        if comm.get_rank() == 0:
+            shutil.copy(os.path.join(old_dir, os.path.basename(self.tmp_file) + '.0.0'), self.tmp_file + '.0.0');
+            shutil.copy(os.path.join(old_dir, 'index'), self.tmp_file);
+        comm.barrier_all();
+        context.initialize();
+
+        s = init.read_checkpoint(filename=self.tmp_file);
+        self.assertEqual(get_step(), step);
+        self.check_snapshot(s.take_snapshot(all=True, dtype='double'), ref);
+
+    def tearDown(self):
+        if comm.get_rank() == 0:
+            shutil.rmtree(self.tmp_dir);
+        comm.barrier_all();
+        context.initialize();
+
+if __name__ == '__main__':
+    unittest.main(argv = ['test.py', '-v'])
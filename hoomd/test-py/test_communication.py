@@ -418,6 +418,27 @@ class decomposition_tests (unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 dd.set_params(z=0.2, nz=4)
 
+    ## Test the exchange mode
+    def test_exchange(self):
+        if comm.get_num_ranks() > 1:
+            dd = comm.decomposition(nx=2, exchange='direct')
+            self.assertEqual(dd.exchange, 'direct')
+
+            with self.assertRaises(ValueError):
+                dd.set_params(exchange='diagonal')
+
+            # the mode is applied to the communicator on initialization
+            init.create_lattice(lattice.sc(a=1.0), n=[8,8,8])
+            cpp_comm = context.current.system.getCommunicator()
+            if not context.exec_conf.isCUDAEnabled():
+                self.assertTrue(cpp_comm.getDirectExchange())
+
+                # and can be changed during the simulation
+                dd.set_params(exchange='staged')
+                self.assertFalse(cpp_comm.getDirectExchange())
+
+            context.initialize()
+
 ## Test for MPI barriers
 class barrier_tests(unittest.TestCase):
     def test_barrier(self):
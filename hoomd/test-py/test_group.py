@@ -162,6 +162,44 @@ class pair_group_tests (unittest.TestCase):
         tags = [(x.tag) for x in g]
         self.assertEqual(tags, [0,5,9])
 
+    def test_tag_list_numpy(self):
+        import numpy
+        g = group.tag_list(name='a', tags=numpy.array([9, 0, 5], dtype=numpy.int64));
+        tags = [(x.tag) for x in g]
+        self.assertEqual(tags, [0,5,9])
+
+        g = group.tag_list(name='b', tags=range(2, 5));
+        self.assertEqual([(x.tag) for x in g], [2,3,4])
+
+        g = group.tag_list(name='c', tags=[]);
+        self.assertEqual(len(g), 0)
+
+        with self.assertRaises(ValueError):
+            group.tag_list(name='d', tags=numpy.array([0, -1]));
+        with self.assertRaises(ValueError):
+            group.tag_list(name='d', tags=[0.5]);
+
+    def test_partition(self):
+        import numpy
+        labels = numpy.array([0, 1, 2, 0, 1, 2, 0, 1, 2, -1, 0])
+        p = group.partition(name='p', labels=labels)
+        self.assertEqual(len(p), 3)
+        numpy.testing.assert_array_equal(p.sizes, [4, 3, 3])
+        self.assertEqual([(x.tag) for x in p[0]], [0, 3, 6, 10])
+        self.assertEqual([(x.tag) for x in p[-1]], [2, 5, 8])
+        self.assertEqual(p[1].name, 'p_1')
+        self.assertIs(p[1], p[1])
+
+        p = group.partition(name='q', labels=labels, num_groups=5)
+        numpy.testing.assert_array_equal(p.sizes, [4, 3, 3, 0, 0])
+
+        with self.assertRaises(IndexError):
+            p[5]
+        with self.assertRaises(RuntimeError):
+            group.partition(name='r', labels=labels[:5])
+        with self.assertRaises(RuntimeError):
+            group.partition(name='r', labels=labels, num_groups=2)
+
     def test_union(self):
         A = group.type(type='A')
         B = group.type(type='B')
@@ -214,6 +252,138 @@ class pair_group_tests (unittest.TestCase):
         tags = [(x.tag) for x in B]
         self.assertEqual(tags, [1, 2, 6, 8, 9, 10])
 
+    def test_cuboid_dynamic(self):
+        g = group.cuboid(name='test', xmin=0.99, period=10)
+        tags = [(x.tag) for x in g]
+        self.assertEqual(tags, [1,2,5])
+
+        # move one particle out and another in, without leaving the domain
+        self.s.particles[5].position = (0.5,0,0);
+        self.s.particles[9].position = (1.5,-2,0);
+
+        # the membership is kept until the next period
+        tags = [(x.tag) for x in g]
+        self.assertEqual(tags, [1,2,5])
+
+        run(1);
+        tags = [(x.tag) for x in g]
+        self.assertEqual(tags, [1,2,9])
+
+        self.s.particles[9].position = (0.5,-2,0);
+        run(5);
+        tags = [(x.tag) for x in g]
+        self.assertEqual(tags, [1,2,9])
+
+        run(5);
+        tags = [(x.tag) for x in g]
+        self.assertEqual(tags, [1,2])
+
+        # a forced update re-evaluates the group immediately
+        self.s.particles[5].position = (2,0,0);
+        g.force_update();
+        tags = [(x.tag) for x in g]
+        self.assertEqual(tags, [1,2,5])
+
+    def test_type_dynamic(self):
+        B = group.type(type='B', period=1)
+        tags = [(x.tag) for x in B]
+        self.assertEqual(tags, [1, 2, 5, 8, 9, 10])
+
+        self.s.particles[5].type = 'A';
+        self.s.particles[6].type = 'B';
+        run(1);
+        tags = [(x.tag) for x in B]
+        self.assertEqual(tags, [1, 2, 6, 8, 9, 10])
+
+        # added particles join the group at the next evaluation
+        self.s.particles.add('B')
+        tags = [(x.tag) for x in B]
+        self.assertEqual(tags, [1, 2, 6, 8, 9, 10])
+
+        run(1);
+        tags = [(x.tag) for x in B]
+        self.assertEqual(tags, [1, 2, 6, 8, 9, 10, 11])
+
+        # removed particles leave the group right away
+        self.s.particles.remove(11)
+        tags = [(x.tag) for x in B]
+        self.assertEqual(tags, [1, 2, 6, 8, 9, 10])
+
+    # test that the updater of a dynamic group is removed with the group
+    def test_dynamic_delete(self):
+        B = group.type(type='B', period=1)
+        name = B.updater_name
+        context.current.system.getUpdater(name)
+
+        del B
+        gc.collect()
+        with self.assertRaises(RuntimeError):
+            context.current.system.getUpdater(name)
+        run(1);
+
+    def test_charged_dynamic(self):
+        self.s.particles[3].charge = 1.0;
+        self.s.particles[7].charge = -1.0;
+
+        static = group.charged(name='static');
+        dynamic = group.charged(name='dynamic', period=1);
+        self.assertEqual([(x.tag) for x in static], [3, 7])
+        self.assertEqual([(x.tag) for x in dynamic], [3, 7])
+
+        self.s.particles[3].charge = 0.0;
+        run(1);
+        self.assertEqual([(x.tag) for x in static], [3, 7])
+        self.assertEqual([(x.tag) for x in dynamic], [7])
+
+    def test_set_operation_dynamic(self):
+        slab = group.cuboid(name='slab', xmin=0.99, period=1)
+        A = group.type(type='A')
+        B = group.type(type='B')
+
+        isect = group.intersection(name='isect', a=slab, b=B)
+        self.assertEqual(isect.period, 1)
+        self.assertEqual([(x.tag) for x in isect], [1, 2, 5])
+
+        diff = group.difference(name='diff', a=B, b=slab)
+        self.assertEqual([(x.tag) for x in diff], [8, 9, 10])
+
+        union = group.union(name='union', a=A, b=isect)
+        self.assertEqual([(x.tag) for x in union], [0, 1, 2, 3, 4, 5, 6, 7])
+
+        # set operations of static groups are static unless a period is given
+        static = group.union(name='static', a=A, b=B)
+        self.assertEqual(static.period, None)
+        ab = group.intersection(name='ab', a=A, b=B, period=5)
+        self.assertEqual(ab.period, 5)
+        self.assertEqual([(x.tag) for x in ab], [])
+
+        self.s.particles[5].position = (0.5,0,0);
+        self.s.particles[9].position = (1.5,-2,0);
+        run(1);
+        self.assertEqual([(x.tag) for x in isect], [1, 2, 9])
+        self.assertEqual([(x.tag) for x in diff], [5, 8, 10])
+        self.assertEqual([(x.tag) for x in union], [0, 1, 2, 3, 4, 6, 7, 9])
+
+    def test_thermo_dynamic(self):
+        g = group.cuboid(name='slab', xmin=0.99, period=1)
+        compute.thermo(group=g)
+        log = analyze.log(filename=None, quantities=['num_particles_slab'], period=1)
+
+        run(1);
+        self.assertEqual(log.query('num_particles_slab'), 3)
+
+        self.s.particles[5].position = (0.5,0,0);
+        run(1);
+        self.assertEqual(log.query('num_particles_slab'), 2)
+
+    def test_dynamic_errors(self):
+        with self.assertRaises(ValueError):
+            group.cuboid(name='test', xmin=0.99, period=0)
+
+        g = group.cuboid(name='test', xmin=0.99, period=1)
+        with self.assertRaises(RuntimeError):
+            dump.gsd(filename='test.gsd', group=g, period=1)
+
     def tearDown(self):
         del self.s
         context.initialize();
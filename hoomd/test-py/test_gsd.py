@@ -445,6 +445,72 @@ class gsd_read_tests (unittest.TestCase):
 
         init.read_gsd(filename=self.tmp_file, frame=-1);
 
+    # tests init.read_gsd with a distributed read
+    def test_read_gsd_distributed(self):
+        dump.gsd(filename=self.tmp_file, group=group.all(), period=None, overwrite=True);
+        context.initialize();
+
+        s = init.read_gsd(filename=self.tmp_file, distributed=True);
+        snap = s.take_snapshot(all=True);
+        if comm.get_rank() == 0:
+            self.assertEqual(snap.particles.N, self.snapshot.particles.N);
+            self.assertEqual(snap.particles.types, self.snapshot.particles.types);
+            numpy.testing.assert_array_equal(snap.particles.typeid, self.snapshot.particles.typeid);
+            numpy.testing.assert_array_equal(snap.particles.mass, self.snapshot.particles.mass);
+            numpy.testing.assert_array_equal(snap.particles.position, self.snapshot.particles.position);
+            numpy.testing.assert_array_equal(snap.particles.velocity, self.snapshot.particles.velocity);
+            numpy.testing.assert_array_equal(snap.particles.image, self.snapshot.particles.image);
+            numpy.testing.assert_array_equal(snap.particles.orientation, self.snapshot.particles.orientation);
+
+            self.assertEqual(snap.bonds.types, self.snapshot.bonds.types);
+            numpy.testing.assert_array_equal(snap.bonds.typeid, self.snapshot.bonds.typeid);
+            numpy.testing.assert_array_equal(snap.bonds.group, self.snapshot.bonds.group);
+
+            numpy.testing.assert_array_equal(snap.angles.typeid, self.snapshot.angles.typeid);
+            numpy.testing.assert_array_equal(snap.angles.group, self.snapshot.angles.group);
+            numpy.testing.assert_array_equal(snap.dihedrals.group, self.snapshot.dihedrals.group);
+            numpy.testing.assert_array_equal(snap.impropers.group, self.snapshot.impropers.group);
+
+            numpy.testing.assert_array_equal(snap.constraints.group, self.snapshot.constraints.group);
+            numpy.testing.assert_array_equal(snap.constraints.value, self.snapshot.constraints.value);
+
+            self.assertEqual(snap.pairs.types, self.snapshot.pairs.types);
+            numpy.testing.assert_array_equal(snap.pairs.group, self.snapshot.pairs.group);
+
+    # tests data.gsd_reader
+    def test_gsd_reader(self):
+        dump.gsd(filename=self.tmp_file, group=group.all(), period=1, overwrite=True);
+        run(1);
+        self.s.particles[0].position = (3, 4, 1);
+        run(1);
+
+        reader = data.gsd_reader(self.tmp_file);
+        self.assertEqual(len(reader), 2);
+
+        step = reader.read_chunk('configuration/step', frame=-1);
+        pos = reader.read_chunk('particles/position', frame=0);
+        snap0 = reader.get_snapshot(frame=0);
+        snap1 = reader.get_snapshot(frame=1);
+        if comm.get_rank() == 0:
+            self.assertEqual(step[0], 1);
+            self.assertEqual(pos.shape, (4, 3));
+            numpy.testing.assert_array_equal(pos[0], [0, 1, 2]);
+            numpy.testing.assert_array_equal(snap0.particles.position[0], [0, 1, 2]);
+            numpy.testing.assert_array_equal(snap1.particles.position[0], [3, 4, 1]);
+
+        with self.assertRaises(IndexError):
+            reader.get_snapshot(frame=2);
+
+        # restore a frame mid-run
+        self.s.restore_snapshot(snap0);
+        self.assertEqual(self.s.particles[0].position, (0, 1, 2));
+
+        # initialize from the same reader
+        context.initialize();
+        s = init.read_gsd(filename=reader, frame=1);
+        self.assertEqual(s.particles[0].position, (3, 4, 1));
+        self.assertEqual(get_step(), 1);
+
     def tearDown(self):
         if comm.get_rank() == 0:
             os.remove(self.tmp_file);
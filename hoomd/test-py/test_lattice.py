@@ -164,5 +164,69 @@ class lattice_unitcell_test (unittest.TestCase):
     def tearDown(self):
         context.initialize();
 
+# unit tests for distributed lattice generation
+class lattice_distributed_test (unittest.TestCase):
+    def check_lattice(self, uc, n):
+        ref = init.create_lattice(unitcell=uc, n=n).take_snapshot(dtype='double');
+        context.initialize();
+
+        sysdef = init.create_lattice(unitcell=uc, n=n, distributed=True);
+        snap = sysdef.take_snapshot(dtype='double');
+        if comm.get_rank() == 0:
+            self.assertEqual(snap.particles.N, ref.particles.N);
+            self.assertEqual(snap.particles.types, ref.particles.types);
+            numpy.testing.assert_allclose(snap.box.Lx, ref.box.Lx);
+            numpy.testing.assert_allclose(snap.box.Ly, ref.box.Ly);
+            numpy.testing.assert_allclose(snap.box.Lz, ref.box.Lz);
+            numpy.testing.assert_allclose(snap.box.xy, ref.box.xy);
+            self.assertEqual(snap.box.dimensions, ref.box.dimensions);
+            numpy.testing.assert_allclose(snap.particles.position, ref.particles.position, atol=1e-6);
+            numpy.testing.assert_array_equal(snap.particles.image, ref.particles.image);
+            numpy.testing.assert_array_equal(snap.particles.typeid, ref.particles.typeid);
+            numpy.testing.assert_allclose(snap.particles.orientation, ref.particles.orientation);
+            numpy.testing.assert_allclose(snap.particles.diameter, ref.particles.diameter);
+
+    def test_fcc(self):
+        self.check_lattice(lattice.fcc(a=1.5), n=[4,3,5]);
+
+    def test_hex(self):
+        self.check_lattice(lattice.hex(a=1.0, type_name='B'), n=[6,5]);
+
+    def test_unitcell(self):
+        uc = hoomd.lattice.unitcell(N = 2,
+                                    a1 = [1,0,0],
+                                    a2 = [0.2,1.2,0],
+                                    a3 = [-0.2,0, 1.0],
+                                    dimensions = 3,
+                                    position = [[0,0,0], [0.5, 0.5, 0.5]],
+                                    type_name = ['A', 'B'],
+                                    diameter = [1.0, 1.3],
+                                    orientation = [[0.707, 0, 0, 0.707], [1.0, 0, 0, 0]]);
+        self.check_lattice(uc, n=3);
+
+    def tearDown(self):
+        context.initialize();
+
+# unit tests for the unit cell snapshot
+class lattice_unitcell_snapshot_test (unittest.TestCase):
+    def test_rotated(self):
+        # a1 along y, the cell is rotated by 90 degrees about z
+        uc = hoomd.lattice.unitcell(N = 2,
+                                    a1 = [0,2,0],
+                                    a2 = [-2,0,0],
+                                    a3 = [0,0,2],
+                                    dimensions = 3,
+                                    position = [[0,0.5,0], [-1.5,1,0.25]],
+                                    orientation = [[1,0,0,0], [1,0,0,0]]);
+        snap = uc.get_snapshot();
+        if comm.get_rank() == 0:
+            numpy.testing.assert_allclose(snap.box.Lx, 2.0);
+            numpy.testing.assert_allclose(snap.box.Ly, 2.0);
+            numpy.testing.assert_allclose(snap.particles.position, [[0.5,0,0], [-1,-0.5,0.25]], atol=1e-6);
+            numpy.testing.assert_allclose(snap.particles.orientation, [[math.sqrt(0.5),0,0,-math.sqrt(0.5)]]*2, atol=1e-6);
+
+    def tearDown(self):
+        context.initialize();
+
 if __name__ == '__main__':
     unittest.main(argv = ['test.py', '-v'])
@@ -12,10 +12,12 @@
 
 
 #include <iostream>
+#include <algorithm>
 
 #include "hoomd/ParticleData.h"
 #include "hoomd/Initializers.h"
 #include "hoomd/ParticleGroup.h"
+#include "hoomd/ParticlePartition.h"
 
 using namespace std;
 
@@ -379,6 +381,163 @@ UP_TEST( ParticleGroup_cuboid_test )
     CHECK_EQUAL_UINT(tags2.getMemberTag(2), 2);
     }
 
+//! Checks that dynamic groups keep their members until they are evaluated
+UP_TEST( ParticleGroup_dynamic_test )
+    {
+    std::shared_ptr<SystemDefinition> sysdef = create_sysdef();
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+
+    // create a dynamic group of the particles in a cuboid around the origin (only particle 0)
+    std::shared_ptr<ParticleSelector> selector0(new ParticleSelectorCuboid(sysdef,
+                                                                      make_scalar3(-0.5, -0.5, -0.5),
+                                                                      make_scalar3( 0.5,  0.5,  0.5)));
+    ParticleGroup cuboid(sysdef, selector0, true, true);
+    UP_ASSERT(cuboid.isDynamic());
+    CHECK_EQUAL_UINT(cuboid.getNumMembers(), 1);
+    CHECK_EQUAL_UINT(cuboid.getNumMembersGlobal(), 1);
+    CHECK_EQUAL_UINT(cuboid.getMemberTag(0), 0);
+    CHECK_EQUAL_UINT(cuboid.getMemberIndex(0), 0);
+
+    // move particle 1 into the cuboid and reverse the order of the particles
+    {
+    ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::readwrite);
+    ArrayHandle<unsigned int> h_tag(pdata->getTags(), access_location::host, access_mode::readwrite);
+    ArrayHandle<unsigned int> h_rtag(pdata->getRTags(), access_location::host, access_mode::readwrite);
+
+    h_pos.data[1].x = Scalar(0.1); h_pos.data[1].y = Scalar(0.1); h_pos.data[1].z = Scalar(0.1);
+    std::reverse(h_pos.data, h_pos.data + pdata->getN());
+    for (unsigned int i = 0; i < pdata->getN(); i++)
+        {
+        h_tag.data[i] = pdata->getN() - 1 - i;
+        h_rtag.data[i] = pdata->getN() - 1 - i;
+        }
+    }
+
+    pdata->notifyParticleSort();
+
+    // the membership is kept, but the index follows the sort
+    CHECK_EQUAL_UINT(cuboid.getNumMembers(), 1);
+    CHECK_EQUAL_UINT(cuboid.getNumMembersGlobal(), 1);
+    CHECK_EQUAL_UINT(cuboid.getMemberTag(0), 0);
+    CHECK_EQUAL_UINT(cuboid.getMemberIndex(0), 9);
+    UP_ASSERT(cuboid.isMember(9));
+    UP_ASSERT(!cuboid.isMember(8));
+
+    // re-evaluate the selector
+    cuboid.evaluate();
+    CHECK_EQUAL_UINT(cuboid.getNumMembers(), 2);
+    CHECK_EQUAL_UINT(cuboid.getNumMembersGlobal(), 2);
+    CHECK_EQUAL_UINT(cuboid.getMemberTag(0), 0);
+    CHECK_EQUAL_UINT(cuboid.getMemberTag(1), 1);
+    CHECK_EQUAL_UINT(cuboid.getMemberIndex(0), 8);
+    CHECK_EQUAL_UINT(cuboid.getMemberIndex(1), 9);
+
+    // move particle 0 out of the cuboid, only the particle that left is removed
+    {
+    ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::readwrite);
+    h_pos.data[9].x = Scalar(1.0);
+    }
+    cuboid.evaluate();
+    CHECK_EQUAL_UINT(cuboid.getNumMembers(), 1);
+    CHECK_EQUAL_UINT(cuboid.getNumMembersGlobal(), 1);
+    CHECK_EQUAL_UINT(cuboid.getMemberTag(0), 1);
+    CHECK_EQUAL_UINT(cuboid.getMemberIndex(0), 8);
+    UP_ASSERT(!cuboid.isMember(9));
+
+    // evaluating again without changes keeps the members
+    cuboid.evaluate();
+    CHECK_EQUAL_UINT(cuboid.getNumMembersGlobal(), 1);
+    CHECK_EQUAL_UINT(cuboid.getMemberTag(0), 1);
+
+    // move particle 0 back, the arrays are reused for the larger group
+    {
+    ArrayHandle<Scalar4> h_pos(pdata->getPositions(), access_location::host, access_mode::readwrite);
+    h_pos.data[9].x = Scalar(0.0);
+    }
+    cuboid.evaluate();
+    CHECK_EQUAL_UINT(cuboid.getNumMembersGlobal(), 2);
+    CHECK_EQUAL_UINT(cuboid.getMemberTag(0), 0);
+    CHECK_EQUAL_UINT(cuboid.getMemberTag(1), 1);
+    CHECK_EQUAL_UINT(cuboid.getMemberIndex(0), 8);
+    CHECK_EQUAL_UINT(cuboid.getMemberIndex(1), 9);
+
+    // set operations of selectors are evaluated with the current state
+    std::shared_ptr<ParticleSelector> selector_type0(new ParticleSelectorType(sysdef, 0, 0));
+    std::shared_ptr<ParticleSelector> selector_diff(new ParticleSelectorSetOperation(sysdef,
+        selector_type0, selector0, ParticleSelectorSetOperation::set_difference));
+    ParticleGroup diff(sysdef, selector_diff, true, true);
+    CHECK_EQUAL_UINT(diff.getNumMembersGlobal(), 3);
+    CHECK_EQUAL_UINT(diff.getMemberTag(0), 2);
+    CHECK_EQUAL_UINT(diff.getMemberTag(1), 5);
+    CHECK_EQUAL_UINT(diff.getMemberTag(2), 8);
+
+    std::shared_ptr<ParticleSelector> selector_union(new ParticleSelectorSetOperation(sysdef,
+        selector0, selector_type0, ParticleSelectorSetOperation::set_union));
+    ParticleGroup union_group(sysdef, selector_union, true, true);
+    CHECK_EQUAL_UINT(union_group.getNumMembersGlobal(), 5);
+    }
+
+//! Checks that ParticlePartition defines disjoint groups from the labels
+UP_TEST( ParticlePartition_test )
+    {
+    std::shared_ptr<SystemDefinition> sysdef = create_sysdef();
+    std::shared_ptr<ParticleData> pdata = sysdef->getParticleData();
+
+    // label particles by tag modulo 3, except particle 9
+    std::vector<unsigned int> labels(pdata->getN());
+    for (unsigned int tag = 0; tag < labels.size(); ++tag)
+        labels[tag] = tag % 3;
+    labels[9] = ParticlePartition::NO_LABEL;
+
+    ParticlePartition partition(sysdef, labels, 4);
+    CHECK_EQUAL_UINT(partition.getNumGroups(), 4);
+    CHECK_EQUAL_UINT(partition.getGroupSize(0), 3);
+    CHECK_EQUAL_UINT(partition.getGroupSize(1), 3);
+    CHECK_EQUAL_UINT(partition.getGroupSize(2), 3);
+    CHECK_EQUAL_UINT(partition.getGroupSize(3), 0);
+    CHECK_EQUAL_UINT(partition.getLabel(4), 1);
+    CHECK_EQUAL_UINT(partition.getLabel(9), ParticlePartition::NO_LABEL);
+
+    std::vector<unsigned int> tags = partition.getMemberTags(1);
+    UP_ASSERT_EQUAL(tags.size(), 3);
+    CHECK_EQUAL_UINT(tags[0], 1);
+    CHECK_EQUAL_UINT(tags[1], 4);
+    CHECK_EQUAL_UINT(tags[2], 7);
+
+    std::shared_ptr<ParticleGroup> group2 = partition.getGroup(2);
+    CHECK_EQUAL_UINT(group2->getNumMembersGlobal(), 3);
+    CHECK_EQUAL_UINT(group2->getMemberTag(0), 2);
+    CHECK_EQUAL_UINT(group2->getMemberTag(2), 8);
+
+        {
+        ArrayHandle<unsigned int> h_local_labels(partition.getLocalLabels(), access_location::host, access_mode::read);
+        CHECK_EQUAL_UINT(h_local_labels.data[0], 0);
+        CHECK_EQUAL_UINT(h_local_labels.data[5], 2);
+        CHECK_EQUAL_UINT(h_local_labels.data[9], ParticlePartition::NO_LABEL);
+        }
+
+    // reverse the order of the particles
+    {
+    ArrayHandle<unsigned int> h_tag(pdata->getTags(), access_location::host, access_mode::readwrite);
+    ArrayHandle<unsigned int> h_rtag(pdata->getRTags(), access_location::host, access_mode::readwrite);
+    for (unsigned int i = 0; i < pdata->getN(); i++)
+        {
+        h_tag.data[i] = pdata->getN() - 1 - i;
+        h_rtag.data[i] = pdata->getN() - 1 - i;
+        }
+    }
+
+    pdata->notifyParticleSort();
+
+    // the local labels follow the sort
+        {
+        ArrayHandle<unsigned int> h_local_labels(partition.getLocalLabels(), access_location::host, access_mode::read);
+        CHECK_EQUAL_UINT(h_local_labels.data[0], ParticlePartition::NO_LABEL);
+        CHECK_EQUAL_UINT(h_local_labels.data[1], 2);
+        CHECK_EQUAL_UINT(h_local_labels.data[9], 0);
+        }
+    }
+
 //! Checks that the ParticleGroup boolean operation work correctly
 UP_TEST( ParticleGroup_boolean_tests)
     {